@@ -3,6 +3,7 @@ ProjektKraken Launcher.
 Entry point for PyInstaller to ensure correct package resolution.
 """
 
+import multiprocessing
 import os
 import sys
 
@@ -12,4 +13,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "src"
 from src.app.main import main
 
 if __name__ == "__main__":
+    # Spawned worker processes (e.g. the web server's render pool) re-run
+    # the frozen executable; this returns control to multiprocessing there
+    multiprocessing.freeze_support()
     main()
@@ -3,16 +3,20 @@ AISearchManager - Handles AI search and semantic indexing for MainWindow.
 
 This module contains all AI search and semantic indexing functionality extracted
 from MainWindow to reduce its size and improve maintainability.
+
+Queries and index rebuilds run on a SearchWorker in its own thread, so the
+window stays responsive while the embedding provider works.
 """
 
 import datetime
 import os
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
-from PySide6.QtCore import QObject, QSettings, Slot
+from PySide6.QtCore import QMetaObject, QObject, QSettings, Qt, QThread, Slot
 
 from src.app.constants import WINDOW_SETTINGS_APP, WINDOW_SETTINGS_KEY
 from src.core.logging_config import get_logger
+from src.services.search_worker import SearchWorker
 
 if TYPE_CHECKING:
     from src.app.main_window import MainWindow
@@ -27,7 +31,7 @@ class AISearchManager(QObject):
     This class encapsulates all functionality related to:
     - AI settings dialog management
     - Semantic search queries
-    - Search index rebuilding
+    - Search index rebuilding (with progress and cancellation)
     - Search result handling
     - Index status monitoring
     """
@@ -41,6 +45,10 @@ class AISearchManager(QObject):
         """
         super().__init__()
         self.window = main_window
+        self.search_thread: Optional[QThread] = None
+        self.search_worker: Optional[SearchWorker] = None
+        self._latest_search_id = 0
+        self._rebuilding = False
 
     @Slot()
     def show_ai_settings_dialog(self) -> None:
@@ -55,6 +63,12 @@ class AISearchManager(QObject):
             self.window.ai_settings_dialog.index_status_requested.connect(
                 self.refresh_search_index_status
             )
+            self.window.ai_settings_dialog.rebuild_cancel_requested.connect(
+                self.cancel_rebuild
+            )
+            # Saved settings may change the embedding provider
+            self.window.ai_settings_dialog.accepted.connect(self._reset_search_service)
+            self.window.ai_settings_dialog.set_rebuild_running(self._rebuilding)
             # Initial status update
             self.refresh_search_index_status()
 
@@ -62,110 +76,218 @@ class AISearchManager(QObject):
         self.window.ai_settings_dialog.raise_()
         self.window.ai_settings_dialog.activateWindow()
 
+    @Slot()
+    def _reset_search_service(self) -> None:
+        """Makes the search worker recreate its SearchService."""
+        if self.search_worker is not None:
+            QMetaObject.invokeMethod(
+                self.search_worker, "reset_service", Qt.ConnectionType.QueuedConnection
+            )
+
     @Slot(str)
     def on_ai_settings_rebuild_requested(self, object_type: str) -> None:
         """Handle rebuild request from dialog."""
         self.rebuild_search_index(object_type)
 
+    def _get_search_worker(self) -> Optional[SearchWorker]:
+        """
+        Returns the background search worker, starting its thread on first use.
+
+        Returns:
+            The worker, or None if the database is not ready yet.
+        """
+        db_path = getattr(self.window, "db_path", None)
+        if not db_path or not hasattr(self.window, "gui_db_service"):
+            return None
+        if self.search_worker is not None and self.search_worker.db_path == db_path:
+            return self.search_worker
+        self.shutdown()
+
+        self.search_thread = QThread()
+        self.search_worker = SearchWorker(db_path)
+        self.search_worker.moveToThread(self.search_thread)
+
+        self.search_worker.results_ready.connect(self.on_search_results)
+        self.search_worker.search_failed.connect(self.on_search_failed)
+        self.search_worker.rebuild_progress.connect(self.on_rebuild_progress)
+        self.search_worker.rebuild_finished.connect(self.on_rebuild_finished)
+        self.search_worker.rebuild_failed.connect(self.on_rebuild_failed)
+        self.search_thread.started.connect(self.search_worker.initialize_db)
+
+        self.search_thread.start()
+        return self.search_worker
+
+    def shutdown(self) -> None:
+        """Cancels any rebuild and stops the search worker thread."""
+        if self.search_worker is None or self.search_thread is None:
+            return
+        self.search_worker.cancel_rebuild()
+        if self.search_thread.isRunning():
+            QMetaObject.invokeMethod(
+                self.search_worker,
+                "cleanup",
+                Qt.ConnectionType.BlockingQueuedConnection,
+            )
+            self.search_thread.quit()
+            if not self.search_thread.wait(2000):
+                logger.warning("Search thread did not quit in time. Terminating...")
+                self.search_thread.terminate()
+                self.search_thread.wait()
+        self.search_worker = None
+        self.search_thread = None
+        self._rebuilding = False
+
     @Slot(str, str, int)
     def perform_semantic_search(
         self, query: str, object_type_filter: str, top_k: int
     ) -> None:
         """
-        Perform semantic search and display results.
+        Queue a semantic search on the search worker.
+
+        Rapid successive searches are coalesced: only the latest query that
+        has not started yet runs, and results of superseded queries are
+        ignored.
 
         Args:
             query: Search query text.
             object_type_filter: Filter by 'entity' or 'event', or empty for all.
             top_k: Number of results to return.
         """
-        try:
-            if not hasattr(self.window, "gui_db_service"):
-                logger.warning("GUI DB Service not ready for search.")
-                return
-
-            self.window.ai_search_panel.set_searching(True)
-
-            # Import search service
-            from src.services.search_service import create_search_service
-
-            # Create search service with GUI thread connection
-            assert self.window.gui_db_service._connection is not None
-            search_service = create_search_service(
-                self.window.gui_db_service._connection
-            )
+        worker = self._get_search_worker()
+        if worker is None:
+            logger.warning("GUI DB Service not ready for search.")
+            return
+
+        self.window.ai_search_panel.set_searching(True)
+        self._latest_search_id = worker.submit_search(
+            query, object_type_filter or None, top_k
+        )
+
+    @Slot(int, list)
+    def on_search_results(self, request_id: int, results: list) -> None:
+        """
+        Display the results of the latest search.
 
-            # Perform query
-            results = search_service.query(
-                text=query,
-                object_type=object_type_filter if object_type_filter else None,
-                top_k=top_k,
-            )
+        Args:
+            request_id: ID of the search request.
+            results: Search result dicts.
+        """
+        if request_id != self._latest_search_id:
+            return
+        self.window.ai_search_panel.set_results(results)
+        self.window.ai_search_panel.set_searching(False)
 
-            # Display results
-            self.window.ai_search_panel.set_results(results)
-            self.window.ai_search_panel.set_searching(False)
+    @Slot(int, str)
+    def on_search_failed(self, request_id: int, message: str) -> None:
+        """
+        Report a failed search, unless it was superseded.
 
-        except Exception as e:
-            logger.error(f"Semantic search failed: {e}")
-            self.window.ai_search_panel.set_status(f"Search failed: {e}")
-            self.window.ai_search_panel.set_searching(False)
+        Args:
+            request_id: ID of the search request.
+            message: Error description.
+        """
+        if request_id != self._latest_search_id:
+            return
+        self.window.ai_search_panel.set_status(f"Search failed: {message}")
+        self.window.ai_search_panel.set_searching(False)
 
     @Slot(str)
     def rebuild_search_index(self, object_type: str) -> None:
         """
-        Rebuild the semantic search index.
+        Start rebuilding the semantic search index in the background.
 
         Args:
             object_type: Type to rebuild ('all', 'entity', 'event').
         """
-        try:
-            if not hasattr(self.window, "gui_db_service"):
-                logger.warning("GUI DB Service not ready for rebuild.")
-                return
+        worker = self._get_search_worker()
+        if worker is None:
+            logger.warning("GUI DB Service not ready for rebuild.")
+            return
+        if self._rebuilding:
+            self.window.status_bar.showMessage("Index rebuild already running", 3000)
+            return
+
+        # Determine object types to rebuild
+        if object_type == "all":
+            types = ["entity", "event"]
+        else:
+            types = [object_type]
+
+        # Get excluded attributes from QSettings
+        settings = QSettings(WINDOW_SETTINGS_KEY, WINDOW_SETTINGS_APP)
+        excluded_text = settings.value("ai_search_excluded_attrs", "", type=str)
+        excluded = [attr.strip() for attr in excluded_text.split(",") if attr.strip()]
+
+        self._rebuilding = True
+        self.window.status_bar.showMessage(f"Rebuilding {object_type} index...", 0)
+        if self.window.ai_settings_dialog:
+            self.window.ai_settings_dialog.set_rebuild_running(True)
+        worker.start_rebuild(types, excluded)
 
-            self.window.status_bar.showMessage(f"Rebuilding {object_type} index...", 0)
-
-            # Import search service
-            from src.services.search_service import create_search_service
-
-            # Create search service with GUI thread connection
-            assert self.window.gui_db_service._connection is not None
-            search_service = create_search_service(
-                self.window.gui_db_service._connection
-            )
+    @Slot()
+    def cancel_rebuild(self) -> None:
+        """Cancel the running index rebuild."""
+        if self.search_worker is not None and self._rebuilding:
+            self.search_worker.cancel_rebuild()
+            self.window.status_bar.showMessage("Cancelling index rebuild...", 0)
+
+    @Slot(int, int, float, float)
+    def on_rebuild_progress(
+        self, done: int, total: int, rate: float, eta: float
+    ) -> None:
+        """
+        Show rebuild progress.
 
-            # Determine object types to rebuild
-            if object_type == "all":
-                types = ["entity", "event"]
-            else:
-                types = [object_type]
-
-            # Get excluded attributes from QSettings
-            settings = QSettings(WINDOW_SETTINGS_KEY, WINDOW_SETTINGS_APP)
-            excluded_text = settings.value("ai_search_excluded_attrs", "", type=str)
-            excluded = [
-                attr.strip() for attr in excluded_text.split(",") if attr.strip()
-            ]
-
-            # Rebuild index
-            counts = search_service.rebuild_index(
-                object_types=types, excluded_attributes=excluded
-            )
+        Args:
+            done: Objects processed so far.
+            total: Objects to process.
+            rate: Objects processed per second.
+            eta: Estimated seconds remaining.
+        """
+        msg = (
+            f"Rebuilding index: {done}/{total} ({rate:.1f} objects/sec, ETA {eta:.0f}s)"
+        )
+        self.window.status_bar.showMessage(msg, 0)
+        if self.window.ai_settings_dialog:
+            self.window.ai_settings_dialog.update_rebuild_progress(msg)
+
+    @Slot(dict, bool)
+    def on_rebuild_finished(self, counts: dict, cancelled: bool) -> None:
+        """
+        Report a finished or cancelled rebuild.
 
-            # Show results
-            total = sum(counts.values())
+        Args:
+            counts: Objects visited per type.
+            cancelled: Whether the rebuild was cancelled.
+        """
+        total = sum(counts.values())
+        if cancelled:
+            msg = f"Index rebuild cancelled after {total} objects"
+        else:
             msg = f"Rebuilt index: {total} objects indexed"
-            self.window.status_bar.showMessage(msg, 5000)
-            self.window.ai_search_panel.set_status(msg)
+        self._finish_rebuild(msg)
 
-            # Refresh index status
-            self.refresh_search_index_status()
+        # Refresh index status
+        self.refresh_search_index_status()
 
-        except Exception as e:
-            logger.error(f"Index rebuild failed: {e}")
-            self.window.status_bar.showMessage(f"Rebuild failed: {e}", 5000)
-            self.window.ai_search_panel.set_status(f"Rebuild failed: {e}")
+    @Slot(str)
+    def on_rebuild_failed(self, message: str) -> None:
+        """
+        Report a failed rebuild.
+
+        Args:
+            message: Error description.
+        """
+        self._finish_rebuild(f"Rebuild failed: {message}")
+
+    def _finish_rebuild(self, msg: str) -> None:
+        """Shows the rebuild outcome and re-enables the rebuild controls."""
+        self._rebuilding = False
+        self.window.status_bar.showMessage(msg, 5000)
+        self.window.ai_search_panel.set_status(msg)
+        if self.window.ai_settings_dialog:
+            self.window.ai_settings_dialog.set_rebuild_running(False)
+            self.window.ai_settings_dialog.update_rebuild_progress(msg)
 
     @Slot(str, str)
     def on_search_result_selected(self, object_type: str, object_id: str) -> None:
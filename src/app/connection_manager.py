@@ -150,6 +150,24 @@ class ConnectionManager:
         ):
             failed_count += 1
 
+        if not self._connect_signal_safe(
+            dh, "events_patched", self.window._on_events_patched, "DataHandler"
+        ):
+            failed_count += 1
+
+        if not self._connect_signal_safe(
+            dh, "entities_patched", self.window._on_entities_patched, "DataHandler"
+        ):
+            failed_count += 1
+
+        if not self._connect_signal_safe(
+            dh,
+            "marker_labels_changed",
+            self.window.map_handler.on_marker_labels_changed,
+            "DataHandler",
+        ):
+            failed_count += 1
+
         if not self._connect_signal_safe(
             dh,
             "suggestions_update_requested",
@@ -297,7 +315,7 @@ class ConnectionManager:
             failed_count += 1
 
         logger.debug(
-            f"DataHandler connections: {23 - failed_count}/23 succeeded, "
+            f"DataHandler connections: {26 - failed_count}/26 succeeded, "
             f"{failed_count} failed"
         )
         return failed_count
@@ -6,11 +6,12 @@ Separates data management logic from the main window class.
 """
 
 import logging
-from typing import Any, List, Optional, Tuple
+from bisect import insort
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from PySide6.QtCore import QObject, Signal, Slot
 
-from src.commands.base_command import CommandResult
+from src.commands.base_command import ChangeSet, CommandResult
 from src.core.entities import Entity
 from src.core.events import Event
 
@@ -35,6 +36,9 @@ class DataHandler(QObject):
     # Signals for data updates
     events_ready = Signal(list)  # Emitted when events are processed
     entities_ready = Signal(list)  # Emitted when entities are processed
+    events_patched = Signal(list, list, list)  # (all events, upserted, deleted_ids)
+    entities_patched = Signal(list, list, list)  # (all, upserted, deleted_ids)
+    marker_labels_changed = Signal(list)  # List of marker label dicts
     suggestions_update_requested = Signal(list)  # (items: list of tuples)
     event_details_ready = Signal(object, list, list)  # (event, relations, incoming)
     entity_details_ready = Signal(object, list, list)  # (entity, relations, incoming)
@@ -62,6 +66,7 @@ class DataHandler(QObject):
     reload_entity_details = Signal(str)  # (entity_id)
     reload_longform = Signal()
     reload_active_editor_relations = Signal()  # Reload relations for active editor
+    changes_requested = Signal(object)  # (ChangeSet) fetch only changed rows
 
     def __init__(self) -> None:
         """
@@ -88,11 +93,7 @@ class DataHandler(QObject):
         self.events_ready.emit(events)
         self.status_message.emit(f"Loaded {len(events)} events.")
         self._update_editor_suggestions()
-
-        if self._pending_select_type == "event" and self._pending_select_id:
-            self.selection_requested.emit("event", self._pending_select_id)
-            self._pending_select_type = None
-            self._pending_select_id = None
+        self._emit_pending_selection("event")
 
     @Slot(list)
     def on_entities_loaded(self, entities: List[Entity]) -> None:
@@ -106,9 +107,94 @@ class DataHandler(QObject):
         self.entities_ready.emit(entities)
         self.status_message.emit(f"Loaded {len(entities)} entities.")
         self._update_editor_suggestions()
+        self._emit_pending_selection("entity")
+
+    @Slot(object)
+    def on_changes_loaded(self, changes: Dict[str, list]) -> None:
+        """
+        Patches the cached events and entities with the rows a command touched.
+
+        Emits patch signals carrying the full updated list together with the
+        changed objects, so widgets can update only the affected items.
+
+        Args:
+            changes: Dict from DatabaseWorker.load_changes with "events",
+                "entities", "deleted_events" and "deleted_entities" keys.
+        """
+        events = changes.get("events", [])
+        entities = changes.get("entities", [])
+        deleted_events = changes.get("deleted_events", [])
+        deleted_entities = changes.get("deleted_entities", [])
+
+        if events or deleted_events:
+            self._cached_events = self._patch_sorted(
+                self._cached_events, events, deleted_events, lambda e: e.lore_date
+            )
+            self.events_patched.emit(self._cached_events, events, deleted_events)
+
+        if entities or deleted_entities:
+            self._cached_entities = self._patch_sorted(
+                self._cached_entities, entities, deleted_entities, lambda e: e.name
+            )
+            self.entities_patched.emit(
+                self._cached_entities, entities, deleted_entities
+            )
+
+        labels = [
+            self._marker_label_data(kind, obj.id, obj)
+            for kind, objs in (("event", events), ("entity", entities))
+            for obj in objs
+        ]
+        labels.extend(
+            self._marker_label_data(kind, object_id, None)
+            for kind, ids in (("event", deleted_events), ("entity", deleted_entities))
+            for object_id in ids
+        )
+        if labels:
+            self.marker_labels_changed.emit(labels)
+
+        count = (
+            len(events) + len(entities) + len(deleted_events) + len(deleted_entities)
+        )
+        self.status_message.emit(f"Updated {count} items.")
+        self._update_editor_suggestions()
+        self._emit_pending_selection("event")
+        self._emit_pending_selection("entity")
+
+    @staticmethod
+    def _patch_sorted(
+        cached: List[Any],
+        upserted: List[Any],
+        deleted_ids: List[str],
+        key: Callable[[Any], Any],
+    ) -> List[Any]:
+        """
+        Returns a copy of a sorted list with objects replaced or removed.
+
+        Args:
+            cached: The currently cached objects, sorted by key.
+            upserted: New or modified objects to place in sort order.
+            deleted_ids: IDs of objects to drop.
+            key: Sort key matching the database ordering.
+
+        Returns:
+            List[Any]: The patched list, still sorted by key.
+        """
+        stale = set(deleted_ids) | {obj.id for obj in upserted}
+        patched = [obj for obj in cached if obj.id not in stale]
+        for obj in upserted:
+            insort(patched, obj, key=key)
+        return patched
 
-        if self._pending_select_type == "entity" and self._pending_select_id:
-            self.selection_requested.emit("entity", self._pending_select_id)
+    def _emit_pending_selection(self, item_type: str) -> None:
+        """
+        Requests selection of a newly created item once it has been loaded.
+
+        Args:
+            item_type: "event" or "entity", the kind that just finished loading.
+        """
+        if self._pending_select_type == item_type and self._pending_select_id:
+            self.selection_requested.emit(item_type, self._pending_select_id)
             self._pending_select_type = None
             self._pending_select_id = None
 
@@ -204,51 +290,67 @@ class DataHandler(QObject):
             markers: List of Marker objects.
         """
         # Process markers to add labels from cached data
+        lookup = {
+            "event": {e.id: e for e in self._cached_events},
+            "entity": {e.id: e for e in self._cached_entities},
+        }
         processed_markers = []
         for marker in markers:
-            # Determine label and description from cached data
-            label = "Unknown"
-            description = ""
-            lore_date = None
-
-            if marker.object_type == "entity" and self._cached_entities:
-                if entity := next(
-                    (e for e in self._cached_entities if e.id == marker.object_id),
-                    None,
-                ):
-                    label = getattr(entity, "name", "Unknown Entity")
-                    description = getattr(entity, "description", "") or ""
-                    # Entities don't have a single specific date usually,
-                    # but could check attributes if needed. For now None.
-                    lore_date = None
-
-            elif marker.object_type == "event" and self._cached_events:
-                if event := next(
-                    (e for e in self._cached_events if e.id == marker.object_id),
-                    None,
-                ):
-                    label = getattr(event, "name", "Unknown Event")
-                    description = getattr(event, "description", "") or ""
-                    lore_date = getattr(event, "lore_date", None)
-
-            # Create marker data dict
-            processed_markers.append(
+            target = lookup.get(marker.object_type, {}).get(marker.object_id)
+            marker_data = self._marker_label_data(
+                marker.object_type, marker.object_id, target
+            )
+            marker_data.update(
                 {
                     "id": marker.id,
-                    "object_id": marker.object_id,
-                    "object_type": marker.object_type,
-                    "label": label,
-                    "description": description,
                     "x": marker.x,
                     "y": marker.y,
                     "icon": marker.attributes.get("icon"),
                     "color": marker.attributes.get("color"),
-                    "lore_date": lore_date,
                 }
             )
+            processed_markers.append(marker_data)
 
         self.markers_ready.emit(map_id, processed_markers)
 
+    @staticmethod
+    def _marker_label_data(
+        object_type: str, object_id: str, target: Optional[Any]
+    ) -> Dict[str, Any]:
+        """
+        Builds the display fields of a marker from the object it points at.
+
+        Args:
+            object_type: "event" or "entity".
+            object_id: ID of the object the marker represents.
+            target: The Event or Entity, or None if it is not loaded/deleted.
+
+        Returns:
+            Dict[str, Any]: object_id, object_type, label, description and
+            lore_date keys.
+        """
+        label = "Unknown"
+        description = ""
+        lore_date = None
+
+        if target is not None and object_type == "entity":
+            label = getattr(target, "name", "Unknown Entity")
+            description = getattr(target, "description", "") or ""
+            # Entities don't have a single specific date usually,
+            # but could check attributes if needed. For now None.
+        elif target is not None and object_type == "event":
+            label = getattr(target, "name", "Unknown Event")
+            description = getattr(target, "description", "") or ""
+            lore_date = getattr(target, "lore_date", None)
+
+        return {
+            "object_id": object_id,
+            "object_type": object_type,
+            "label": label,
+            "description": description,
+            "lore_date": lore_date,
+        }
+
     @Slot(list)
     def on_trajectories_loaded(self, trajectories: List[Any]) -> None:
         """
@@ -302,14 +404,18 @@ class DataHandler(QObject):
                 logger.debug("[DataHandler] Emitting reload_markers_for_current_map")
                 self.reload_markers_for_current_map.emit()
 
-            if "Event" in command_name:
+            # Event/Entity commands report exactly what they touched, so only
+            # those rows are fetched and patched into the views.
+            patched = self._request_changes(result.changes)
+
+            if "Event" in command_name and not patched:
                 logger.debug("[DataHandler] Emitting reload_events (Event command)")
                 self.reload_events.emit()
                 self.reload_markers_for_current_map.emit()
                 # Also reload longform as it might contain this event
                 self.reload_longform.emit()
 
-            if "Entity" in command_name:
+            if "Entity" in command_name and not patched:
                 logger.debug("[DataHandler] Emitting reload_entities (Entity command)")
                 self.reload_entities.emit()
                 self.reload_markers_for_current_map.emit()
@@ -332,6 +438,28 @@ class DataHandler(QObject):
         except Exception as e:
             logger.error(f"[DataHandler] Exception in on_command_finished: {e}")
 
+    def _request_changes(self, changes: Optional[ChangeSet]) -> bool:
+        """
+        Requests an incremental refresh for a command's change set.
+
+        Args:
+            changes: The ChangeSet reported by the command, if any.
+
+        Returns:
+            bool: True if the change set was handled incrementally, False if
+            the caller must fall back to full reloads.
+        """
+        if changes is None or not changes.kinds <= {"event", "entity"}:
+            return False
+        if changes.is_empty():
+            return True
+
+        logger.debug("[DataHandler] Emitting changes_requested")
+        self.changes_requested.emit(changes)
+        # Longform might contain the changed items
+        self.reload_longform.emit()
+        return True
+
     @Slot(str, dict)
     def on_entity_state_resolved(self, entity_id: str, attributes: dict) -> None:
         """
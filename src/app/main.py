@@ -8,6 +8,8 @@ This module has been refactored:
 This shim preserves backward compatibility for existing imports.
 """
 
+import multiprocessing
+
 # Re-export MainWindow for backward compatibility
 # Re-export classes that tests may patch
 # These imports maintain backward compatibility with existing test mocks
@@ -41,4 +43,5 @@ from src.services.worker import DatabaseWorker  # noqa: F401
 
 # Support direct execution
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()
@@ -93,6 +93,7 @@ from src.gui.widgets.longform_editor import LongformEditorWidget
 from src.gui.widgets.map_widget import MapWidget
 from src.gui.widgets.timeline import TimelineWidget
 from src.gui.widgets.unified_list import UnifiedListWidget
+from src.services.wiki_render_service import shutdown_wiki_render_service
 
 logger = get_logger(__name__)
 
@@ -983,6 +984,12 @@ class MainWindow(QMainWindow, LayoutGuardMixin):
         if self.backup_service is not None:
             self.backup_service.stop_auto_backup()
 
+        # Stop background search (cancels a running index rebuild)
+        self.ai_search_manager.shutdown()
+
+        # Drop queued background renders of wiki text
+        shutdown_wiki_render_service()
+
         # Cleanup Worker
         QMetaObject.invokeMethod(
             self.worker, "cleanup", Qt.ConnectionType.BlockingQueuedConnection
@@ -1169,6 +1176,43 @@ class MainWindow(QMainWindow, LayoutGuardMixin):
         # Refresh graph to reflect changes (debounced)
         self._schedule_graph_refresh()
 
+    @Slot(list, list, list)
+    def _on_events_patched(
+        self, events: list, upserted: list, deleted_ids: list
+    ) -> None:
+        """
+        Handle incremental event changes from DataHandler.
+
+        Args:
+            events: Full, sorted list of Event objects after the change.
+            upserted: Created or modified Event objects.
+            deleted_ids: IDs of deleted events.
+        """
+        self._cached_events = events
+        self.unified_list.apply_changes("event", events, upserted, deleted_ids)
+        self.timeline.apply_event_changes(upserted, deleted_ids)
+
+        # Refresh graph to reflect changes (debounced)
+        self._schedule_graph_refresh()
+
+    @Slot(list, list, list)
+    def _on_entities_patched(
+        self, entities: list, upserted: list, deleted_ids: list
+    ) -> None:
+        """
+        Handle incremental entity changes from DataHandler.
+
+        Args:
+            entities: Full, sorted list of Entity objects after the change.
+            upserted: Created or modified Entity objects.
+            deleted_ids: IDs of deleted entities.
+        """
+        self._cached_entities = entities
+        self.unified_list.apply_changes("entity", entities, upserted, deleted_ids)
+
+        # Refresh graph to reflect changes (debounced)
+        self._schedule_graph_refresh()
+
     def _schedule_graph_refresh(self) -> None:
         """Schedules a debounced graph refresh to avoid double-loading."""
         if self._graph_reload_timer is None:
@@ -2018,7 +2062,7 @@ class MainWindow(QMainWindow, LayoutGuardMixin):
             self,
             "Select Backup File",
             str(self.backup_service.config.backup_dir or ""),
-            "Kraken Database (*.kraken)",
+            "Kraken Backups (*.kraken *.kmanifest)",
         )
 
         if not backup_file:
@@ -2149,6 +2193,7 @@ class MainWindow(QMainWindow, LayoutGuardMixin):
             BACKUP_DAILY_RETENTION_KEY,
             BACKUP_ENABLED_KEY,
             BACKUP_EXTERNAL_PATH_KEY,
+            BACKUP_INCREMENTAL_KEY,
             BACKUP_MANUAL_RETENTION_KEY,
             BACKUP_VACUUM_BEFORE_KEY,
             BACKUP_VERIFY_AFTER_KEY,
@@ -2192,6 +2237,9 @@ class MainWindow(QMainWindow, LayoutGuardMixin):
                 vacuum_before_backup=settings.value(
                     BACKUP_VACUUM_BEFORE_KEY, False, type=bool
                 ),
+                incremental_backup=settings.value(
+                    BACKUP_INCREMENTAL_KEY, False, type=bool
+                ),
                 backup_dir=Path(custom_dir) if custom_dir else None,
                 external_backup_path=Path(external_path) if external_path else None,
             )
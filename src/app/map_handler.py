@@ -162,6 +162,9 @@ class MapHandler(QObject):
             QMessageBox.warning(self.window, "Error", f"Failed to copy image: {e}")
             return
 
+        # Pre-generate tiles for large maps while the map is being created
+        self.window.map_widget.build_tile_pyramid(str(dest_path))
+
         # Store relative path
         relative_path = str(dest_path.relative_to(project_dir))
 
@@ -440,6 +443,25 @@ class MapHandler(QObject):
             # Store mapping for later updates (object_id -> marker.id)
             self._marker_object_to_id[marker_data["object_id"]] = marker_data["id"]
 
+    @Slot(list)
+    def on_marker_labels_changed(self, labels: list) -> None:
+        """
+        Handle marker label updates after events or entities changed.
+
+        Args:
+            labels: List of dicts with object_id, label, description and
+                lore_date keys.
+        """
+        for label_data in labels:
+            if label_data["object_id"] not in self._marker_object_to_id:
+                continue
+            self.window.map_widget.update_marker_label(
+                label_data["object_id"],
+                label_data["label"],
+                label_data.get("description", ""),
+                label_data.get("lore_date"),
+            )
+
     @Slot(list)
     def on_trajectories_ready(self, trajectories: list) -> None:
         """
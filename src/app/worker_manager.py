@@ -127,6 +127,9 @@ class WorkerManager(QObject):
         self.window.worker.entities_loaded.connect(
             self.window.data_handler.on_entities_loaded
         )
+        self.window.worker.changes_loaded.connect(
+            self.window.data_handler.on_changes_loaded
+        )
         self.window.worker.event_details_loaded.connect(
             self.window.data_handler.on_event_details_loaded
         )
@@ -178,6 +181,9 @@ class WorkerManager(QObject):
 
         # Connect MainWindow signal for sending commands to worker thread
         self.window.command_requested.connect(self.window.worker.run_command)
+        self.window.data_handler.changes_requested.connect(
+            self.window.worker.load_changes
+        )
         self.window.load_graph_data_requested.connect(
             self.window.worker.load_graph_data
         )
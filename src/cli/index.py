@@ -8,20 +8,36 @@ the semantic search index.
 Usage:
     python -m src.cli.index rebuild --database world.kraken
     python -m src.cli.index rebuild --database world.kraken --type entity
+    python -m src.cli.index rebuild --database world.kraken --batch-size 64
+    python -m src.cli.index rebuild --database world.kraken --workers 4
     python -m src.cli.index query --database world.kraken \
         --text "find the wizard"
     python -m src.cli.index index-object --database world.kraken \
         --type entity --id <uuid>
+    python -m src.cli.index build-ann --database world.kraken
+    python -m src.cli.index ann-benchmark --database world.kraken --probes 1,4,8
 """
 
 import argparse
 import json
 import logging
+import sqlite3
 import sys
+import time
+from pathlib import Path
+from typing import Optional, Tuple
 
 from src.cli.utils import validate_database_path
+from src.services.ann_index import IVFIndex, index_path
 from src.services.db_service import DatabaseService
-from src.services.search_service import create_search_service
+from src.services.search_service import (
+    DEFAULT_EMBED_BATCH_SIZE,
+    DEFAULT_EMBED_WORKERS,
+    EmbeddingMatrix,
+    create_search_service,
+    default_index_dir,
+    embeddings_fingerprint,
+)
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
@@ -63,18 +79,39 @@ def rebuild_index(args: argparse.Namespace) -> int:
         # Create search service
         assert db_service._connection is not None, "Database not connected"
         search_service = create_search_service(
-            db_service._connection, provider_name=args.provider, model=args.model
+            db_service._connection,
+            provider_name=args.provider,
+            model=args.model,
+            index_dir=args.index_dir,
         )
 
+        def report_progress(done: int, total: int) -> None:
+            print(f"\r  {done}/{total} objects processed", end="", flush=True)
+
         # Rebuild index
         counts = search_service.rebuild_index(
-            object_types=object_types, excluded_attributes=excluded
+            object_types=object_types,
+            excluded_attributes=excluded,
+            batch_size=args.batch_size,
+            progress_callback=report_progress,
+            max_workers=args.workers,
         )
 
-        print("\n✓ Index rebuild complete:")
+        print("\n\n✓ Index rebuild complete:")
         for obj_type, count in counts.items():
             print(f"  {obj_type}: {count} objects indexed")
 
+        stats = search_service.last_rebuild_stats
+        if stats is not None:
+            print(
+                f"  embedded: {stats.embedded}, skipped (unchanged): "
+                f"{stats.skipped}, failed: {stats.failed}"
+            )
+            print(
+                f"  throughput: {stats.objects_per_second:.1f} objects/sec "
+                f"({stats.elapsed:.2f}s)"
+            )
+
         return 0
 
     except Exception as e:
@@ -152,7 +189,10 @@ def index_object(args: argparse.Namespace) -> int:
         # Create search service
         assert db_service._connection is not None, "Database not connected"
         search_service = create_search_service(
-            db_service._connection, provider_name=args.provider, model=args.model
+            db_service._connection,
+            provider_name=args.provider,
+            model=args.model,
+            index_dir=args.index_dir,
         )
 
         excluded = None
@@ -210,7 +250,10 @@ def query_index(args: argparse.Namespace) -> int:
         # Create search service
         assert db_service._connection is not None, "Database not connected"
         search_service = create_search_service(
-            db_service._connection, provider_name=args.provider, model=args.model
+            db_service._connection,
+            provider_name=args.provider,
+            model=args.model,
+            index_dir=args.index_dir,
         )
 
         # Query
@@ -249,6 +292,182 @@ def query_index(args: argparse.Namespace) -> int:
             db_service.close()
 
 
+def _resolve_stored_model(
+    conn: sqlite3.Connection, model: Optional[str]
+) -> Optional[Tuple[str, int]]:
+    """
+    Determine which stored embedding model and dimension to use.
+
+    Args:
+        conn: SQLite database connection.
+        model: Stored model name (e.g. 'lmstudio:nomic'), or None to use the
+            model with the most embeddings.
+
+    Returns:
+        Tuple of (model, dimension), or None if no embeddings match.
+    """
+    sql = "SELECT model, vector_dim, COUNT(*) AS n FROM embeddings"
+    params = []
+    if model:
+        sql += " WHERE model = ?"
+        params.append(model)
+    sql += " GROUP BY model, vector_dim ORDER BY n DESC LIMIT 1"
+
+    row = conn.execute(sql, params).fetchone()
+    if row is None:
+        return None
+    return row[0], row[1]
+
+
+def _get_ann_index_path(args: argparse.Namespace, model: str) -> Path:
+    """
+    Get the ANN index path for a model from CLI arguments.
+
+    Args:
+        args: Command-line arguments.
+        model: Stored model name.
+
+    Returns:
+        Path: Index directory path.
+    """
+    index_dir = (
+        Path(args.index_dir) if args.index_dir else default_index_dir(args.database)
+    )
+    return index_path(index_dir, model)
+
+
+def build_ann(args: argparse.Namespace) -> int:
+    """
+    Build the on-disk ANN index from stored embeddings.
+
+    Args:
+        args: Command-line arguments.
+
+    Returns:
+        int: Exit code (0 for success, 1 for failure).
+    """
+    db_service = None
+    try:
+        db_service = DatabaseService(args.database)
+        db_service.connect()
+        assert db_service._connection is not None, "Database not connected"
+        conn = db_service._connection
+
+        resolved = _resolve_stored_model(conn, args.model)
+        if resolved is None:
+            print("✗ No embeddings found. Run 'rebuild' first.")
+            return 1
+        model, dimension = resolved
+
+        print(f"Building ANN index for model: {model} (dim {dimension})")
+        start = time.perf_counter()
+
+        fingerprint = embeddings_fingerprint(conn, model)
+        matrix = EmbeddingMatrix.load(conn, model, dimension)
+        index = IVFIndex.build(
+            model,
+            dimension,
+            matrix.vectors,
+            matrix.embedding_ids,
+            matrix.type_codes,
+            fingerprint=fingerprint,
+            n_lists=args.lists,
+        )
+        path = _get_ann_index_path(args, model)
+        index.save(path)
+
+        elapsed = time.perf_counter() - start
+        print(
+            f"\n✓ Indexed {len(index)} vectors in {index.n_lists} lists "
+            f"({elapsed:.2f}s)"
+        )
+        print(f"  Saved to: {path}")
+        return 0
+
+    except Exception as e:
+        logger.error(f"Failed to build ANN index: {e}")
+        if args.verbose:
+            raise
+        return 1
+    finally:
+        if db_service:
+            db_service.close()
+
+
+def ann_benchmark(args: argparse.Namespace) -> int:
+    """
+    Report ANN recall@k and latency versus brute-force search.
+
+    Args:
+        args: Command-line arguments.
+
+    Returns:
+        int: Exit code (0 for success, 1 for failure).
+    """
+    db_service = None
+    try:
+        db_service = DatabaseService(args.database)
+        db_service.connect()
+        assert db_service._connection is not None, "Database not connected"
+        conn = db_service._connection
+
+        resolved = _resolve_stored_model(conn, args.model)
+        if resolved is None:
+            print("✗ No embeddings found. Run 'rebuild' first.")
+            return 1
+        model = resolved[0]
+
+        path = _get_ann_index_path(args, model)
+        index = IVFIndex.load(path)
+        if index is None:
+            print(f"✗ No ANN index found at {path}. Run 'build-ann' first.")
+            return 1
+
+        fresh = index.is_fresh(embeddings_fingerprint(conn, model))
+        print(f"ANN index: {path}")
+        print(f"  Model: {model}")
+        print(f"  Vectors: {len(index)} in {index.n_lists} lists")
+        print(f"  Status: {'fresh' if fresh else 'stale (rebuild recommended)'}")
+        print()
+
+        if args.probes:
+            probes = [int(p) for p in args.probes.split(",") if p.strip()]
+        else:
+            probes = [index.n_probe]
+
+        results = []
+        print(
+            f"{'probes':>8} {'recall@' + str(args.top_k):>10} {'ann ms':>10} "
+            f"{'brute ms':>10} {'speedup':>8}"
+        )
+        for n_probe in probes:
+            stats = index.evaluate(
+                top_k=args.top_k, n_queries=args.queries, n_probe=n_probe
+            )
+            speedup = (
+                stats["brute_force_ms"] / stats["ann_ms"] if stats["ann_ms"] else 0.0
+            )
+            results.append({"probes": n_probe, **stats, "speedup": speedup})
+            print(
+                f"{n_probe:>8} {stats['recall']:>10.3f} {stats['ann_ms']:>10.3f} "
+                f"{stats['brute_force_ms']:>10.3f} {speedup:>7.1f}x"
+            )
+
+        if args.json:
+            print(json.dumps(results, indent=2))
+
+        return 0
+
+    except Exception as e:
+        logger.error(f"Failed to benchmark ANN index: {e}")
+        if args.verbose:
+            raise
+        return 1
+    finally:
+        if db_service:
+            db_service.close()
+
+
 def main() -> None:
     """Main entry point for the CLI."""
     parser = argparse.ArgumentParser(
@@ -286,10 +505,27 @@ def main() -> None:
     rebuild_parser.add_argument(
         "--model", help="Model name override (uses env var if not specified)"
     )
+    rebuild_parser.add_argument(
+        "--index-dir",
+        help="ANN index directory (default: indexes/ next to the database)",
+    )
     rebuild_parser.add_argument(
         "--excluded-attributes",
         help="Comma-separated list of attributes to exclude from indexing",
     )
+    rebuild_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_EMBED_BATCH_SIZE,
+        help=f"Texts per embedding request (default: {DEFAULT_EMBED_BATCH_SIZE})",
+    )
+    rebuild_parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_EMBED_WORKERS,
+        help="Embedding requests kept in flight concurrently "
+        f"(default: {DEFAULT_EMBED_WORKERS})",
+    )
 
     # Index-object command
     index_parser = subparsers.add_parser("index-object", help="Index a single object")
@@ -313,6 +549,10 @@ def main() -> None:
     index_parser.add_argument(
         "--model", help="Model name override (uses env var if not specified)"
     )
+    index_parser.add_argument(
+        "--index-dir",
+        help="ANN index directory (default: indexes/ next to the database)",
+    )
     index_parser.add_argument(
         "--excluded-attributes",
         help="Comma-separated list of attributes to exclude from indexing",
@@ -347,6 +587,10 @@ def main() -> None:
     query_parser.add_argument(
         "--model", help="Model name override (uses env var if not specified)"
     )
+    query_parser.add_argument(
+        "--index-dir",
+        help="ANN index directory (default: indexes/ next to the database)",
+    )
     query_parser.add_argument(
         "--json",
         action="store_true",
@@ -372,6 +616,58 @@ def main() -> None:
         "--model", help="Model name override (if expecting specific model deletion)"
     )
 
+    # Build-ann command
+    build_ann_parser = subparsers.add_parser(
+        "build-ann", help="Build the on-disk ANN index from stored embeddings"
+    )
+    build_ann_parser.add_argument(
+        "--model",
+        help="Stored model name (default: model with the most embeddings)",
+    )
+    build_ann_parser.add_argument(
+        "--lists",
+        type=int,
+        help="Number of IVF clusters (default: sqrt of vector count)",
+    )
+    build_ann_parser.add_argument(
+        "--index-dir",
+        help="Index directory (default: indexes/ next to the database)",
+    )
+
+    # Ann-benchmark command
+    ann_bench_parser = subparsers.add_parser(
+        "ann-benchmark", help="Report ANN recall@k and latency vs brute force"
+    )
+    ann_bench_parser.add_argument(
+        "--model",
+        help="Stored model name (default: model with the most embeddings)",
+    )
+    ann_bench_parser.add_argument(
+        "--top-k",
+        type=int,
+        default=10,
+        help="Number of neighbours compared per query (default: 10)",
+    )
+    ann_bench_parser.add_argument(
+        "--queries",
+        type=int,
+        default=100,
+        help="Number of sampled queries (default: 100)",
+    )
+    ann_bench_parser.add_argument(
+        "--probes",
+        help="Comma-separated cluster probe counts to compare (e.g. 1,4,8,16)",
+    )
+    ann_bench_parser.add_argument(
+        "--index-dir",
+        help="Index directory (default: indexes/ next to the database)",
+    )
+    ann_bench_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Also output results as JSON",
+    )
+
     # Parse arguments
     args = parser.parse_args()
 
@@ -393,6 +689,10 @@ def main() -> None:
         return query_index(args)
     elif args.command == "delete-object":
         return delete_object(args)
+    elif args.command == "build-ann":
+        return build_ann(args)
+    elif args.command == "ann-benchmark":
+        return ann_benchmark(args)
     else:
         parser.print_help()
         return 1
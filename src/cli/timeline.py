@@ -11,11 +11,17 @@ Usage:
     python -m src.cli.timeline clear --database world.kraken
     python -m src.cli.timeline tag-color --database world.kraken \
         --tag "Faction" --color "#FF0000"
+    python -m src.cli.timeline benchmark --database world.kraken \
+        --mode FIRST_MATCH --repeat 10
 """
 
 import argparse
+import json
 import logging
+import statistics
 import sys
+import time
+from typing import Any, Dict, List, Optional
 
 from src.cli.utils import validate_database_path
 from src.commands.timeline_grouping_commands import (
@@ -23,6 +29,7 @@ from src.commands.timeline_grouping_commands import (
     SetTimelineGroupingCommand,
     UpdateTagColorCommand,
 )
+from src.core.events import Event
 from src.services.db_service import DatabaseService
 
 # Setup logging
@@ -119,6 +126,150 @@ def update_tag_color(args: argparse.Namespace) -> int:
             db_service.close()
 
 
+def _per_tag_grouping(
+    db_service: DatabaseService,
+    tag_order: List[str],
+    mode: str,
+    date_range: Optional[tuple] = None,
+) -> Dict[str, Any]:
+    """
+    Reference grouping that issues one query per tag plus one for the rest.
+
+    This is the strategy get_events_grouped_by_tags used before it switched
+    to a single aggregated query; it is kept here as the benchmark baseline.
+    """
+    conn = db_service._connection
+    assert conn is not None
+
+    date_filter = ""
+    date_params: List[Any] = []
+    if date_range:
+        date_filter = "AND e.lore_date >= ? AND e.lore_date <= ?"
+        date_params = [date_range[0], date_range[1]]
+
+    def hydrate(rows: List[Any]) -> List[Event]:
+        events = []
+        for row in rows:
+            data = dict(row)
+            if data.get("attributes"):
+                data["attributes"] = json.loads(data["attributes"])
+            events.append(Event.from_dict(data))
+        return events
+
+    groups = []
+    assigned = set()
+    for tag_name in tag_order:
+        rows = conn.execute(
+            f"""
+            SELECT e.*
+            FROM events e
+            INNER JOIN event_tags et ON e.id = et.event_id
+            INNER JOIN tags t ON et.tag_id = t.id
+            WHERE t.name = ?
+            {date_filter}
+            ORDER BY e.lore_date
+            """,
+            [tag_name.strip()] + date_params,
+        ).fetchall()
+        events = [
+            e for e in hydrate(rows) if not (mode == "FIRST_MATCH" and e.id in assigned)
+        ]
+        assigned.update(e.id for e in events)
+        groups.append({"tag_name": tag_name, "events": events})
+
+    rows = conn.execute(
+        f"""
+        SELECT e.*
+        FROM events e
+        WHERE e.id NOT IN (
+            SELECT et.event_id
+            FROM event_tags et
+            INNER JOIN tags t ON et.tag_id = t.id
+            WHERE t.name IN ({",".join("?" * len(tag_order))})
+        )
+        {date_filter}
+        ORDER BY e.lore_date
+        """,
+        [t.strip() for t in tag_order] + date_params,
+    ).fetchall()
+
+    return {"groups": groups, "remaining": hydrate(rows)}
+
+
+def _grouping_ids(result: Dict[str, Any]) -> List[List[str]]:
+    """Returns sorted event IDs per group (remaining last) for comparison."""
+    lists = [g["events"] for g in result["groups"]] + [result["remaining"]]
+    return [sorted(e.id for e in events) for events in lists]
+
+
+def benchmark_grouping(args: argparse.Namespace) -> int:
+    """Compare single-query tag grouping against the per-tag query loop."""
+    db_service = None
+    try:
+        db_service = DatabaseService(args.database)
+        db_service.connect()
+
+        if args.tags:
+            tags = [t.strip() for t in args.tags.split(",") if t.strip()]
+        else:
+            tags = [t["name"] for t in db_service.get_tags_with_events()]
+        if not tags:
+            print("✗ No tags to group by.")
+            return 1
+
+        def measure(fn: Any) -> tuple:
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                result = fn()
+                timings.append((time.perf_counter() - start) * 1000)
+            return result, statistics.median(timings)
+
+        grouped, single_ms = measure(
+            lambda: db_service.get_events_grouped_by_tags(tags, mode=args.mode)
+        )
+        reference, loop_ms = measure(
+            lambda: _per_tag_grouping(db_service, tags, args.mode)
+        )
+        _, counts_ms = measure(lambda: db_service.get_group_metadata(tags))
+
+        matches = _grouping_ids(grouped) == _grouping_ids(reference)
+        speedup = loop_ms / single_ms if single_ms else 0.0
+
+        print(f"Tags: {len(tags)}  Mode: {args.mode}  Runs: {args.repeat}")
+        print(f"  Single query: {single_ms:>9.2f} ms")
+        print(f"  Per-tag loop: {loop_ms:>9.2f} ms ({speedup:.1f}x slower)")
+        print(f"  Metadata:     {counts_ms:>9.2f} ms")
+        print(f"  Results match: {'yes' if matches else 'NO'}")
+
+        if args.json:
+            print(
+                json.dumps(
+                    {
+                        "tags": len(tags),
+                        "mode": args.mode,
+                        "single_query_ms": single_ms,
+                        "per_tag_ms": loop_ms,
+                        "metadata_ms": counts_ms,
+                        "speedup": speedup,
+                        "matches": matches,
+                    },
+                    indent=2,
+                )
+            )
+
+        return 0 if matches else 1
+
+    except Exception as e:
+        logger.error(f"Failed to benchmark grouping: {e}")
+        if args.verbose:
+            raise
+        return 1
+    finally:
+        if db_service:
+            db_service.close()
+
+
 def main() -> None:
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -164,6 +315,28 @@ def main() -> None:
     color_parser.add_argument("--color", required=True, help="Hex color code")
     color_parser.set_defaults(func=update_tag_color)
 
+    # Benchmark command
+    bench_parser = subparsers.add_parser(
+        "benchmark", help="Compare grouping query strategies"
+    )
+    bench_parser.add_argument(
+        "--database", "-d", required=True, help="Path to .kraken database file"
+    )
+    bench_parser.add_argument(
+        "--tags", help="Comma-separated list of tags (default: all event tags)"
+    )
+    bench_parser.add_argument(
+        "--mode",
+        choices=["DUPLICATE", "FIRST_MATCH"],
+        default="DUPLICATE",
+        help="Grouping mode (default: DUPLICATE)",
+    )
+    bench_parser.add_argument(
+        "--repeat", type=int, default=5, help="Runs per strategy (default: 5)"
+    )
+    bench_parser.add_argument("--json", action="store_true", help="Output as JSON")
+    bench_parser.set_defaults(func=benchmark_grouping)
+
     args = parser.parse_args()
 
     if args.verbose:
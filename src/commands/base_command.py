@@ -4,17 +4,118 @@ Base Command Module.
 Defines the abstract base class and result type for all commands in the application.
 
 Classes:
+    ChangeSet: Created/updated/deleted object IDs produced by a command.
     CommandResult: Standardized result object for command execution.
     BaseCommand: Abstract base class implementing command pattern with undo/redo.
 """
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Dict, Union
+from typing import Dict, Optional, Set, Union
 
 from src.services.db_service import DatabaseService
 
 
+@dataclass
+class ChangeSet:
+    """
+    Describes which objects a command touched, grouped by kind.
+
+    Lets the UI fetch and patch only the affected rows instead of reloading
+    every event and entity after each command.
+
+    Attributes:
+        created (Dict[str, Set[str]]): Kind ("event", "entity") -> new IDs.
+        updated (Dict[str, Set[str]]): Kind -> IDs of modified objects.
+        deleted (Dict[str, Set[str]]): Kind -> IDs of removed objects.
+    """
+
+    created: Dict[str, Set[str]] = field(default_factory=dict)
+    updated: Dict[str, Set[str]] = field(default_factory=dict)
+    deleted: Dict[str, Set[str]] = field(default_factory=dict)
+
+    @classmethod
+    def single(cls, action: str, kind: str, object_id: str) -> "ChangeSet":
+        """
+        Builds a change set describing one object.
+
+        Args:
+            action (str): "created", "updated" or "deleted".
+            kind (str): The object kind, e.g. "event" or "entity".
+            object_id (str): The ID of the affected object.
+
+        Returns:
+            ChangeSet: A change set holding the single entry.
+        """
+        changes = cls()
+        changes.record(action, kind, object_id)
+        return changes
+
+    def record(self, action: str, kind: str, object_id: str) -> None:
+        """
+        Adds an object to the change set.
+
+        Args:
+            action (str): "created", "updated" or "deleted".
+            kind (str): The object kind, e.g. "event" or "entity".
+            object_id (str): The ID of the affected object.
+
+        Raises:
+            ValueError: If the action is unknown.
+        """
+        if action not in ("created", "updated", "deleted"):
+            raise ValueError(f"Unknown change action: {action}")
+        getattr(self, action).setdefault(kind, set()).add(object_id)
+
+    def upserted_ids(self, kind: str) -> Set[str]:
+        """
+        Returns the IDs that must be (re)fetched for a kind.
+
+        Args:
+            kind (str): The object kind.
+
+        Returns:
+            Set[str]: Created and updated IDs that were not later deleted.
+        """
+        ids = self.created.get(kind, set()) | self.updated.get(kind, set())
+        return ids - self.deleted.get(kind, set())
+
+    def deleted_ids(self, kind: str) -> Set[str]:
+        """
+        Returns the IDs removed for a kind.
+
+        Args:
+            kind (str): The object kind.
+
+        Returns:
+            Set[str]: Deleted IDs.
+        """
+        return set(self.deleted.get(kind, set()))
+
+    @property
+    def kinds(self) -> Set[str]:
+        """
+        Returns every object kind mentioned in the change set.
+
+        Returns:
+            Set[str]: The kinds with at least one change.
+        """
+        return set(self.created) | set(self.updated) | set(self.deleted)
+
+    def is_empty(self) -> bool:
+        """
+        Checks whether the change set describes no changes.
+
+        Returns:
+            bool: True if no IDs were recorded.
+        """
+        return (
+            not any(self.created.values())
+            and not any(self.updated.values())
+            and not any(self.deleted.values())
+        )
+
+
 @dataclass
 class CommandResult:
     """
@@ -28,6 +129,9 @@ class CommandResult:
                                  (field -> error content).
         command_name (str): The name of the command that generated
                             this result.
+        changes (Optional[ChangeSet]): Objects touched by the command, used
+                                       for incremental UI updates. None means
+                                       the UI must fall back to full reloads.
     """
 
     success: bool
@@ -35,6 +139,7 @@ class CommandResult:
     errors: Dict[str, str] = field(default_factory=dict)
     data: Dict = field(default_factory=dict)
     command_name: str = ""
+    changes: Optional[ChangeSet] = None
 
 
 class BaseCommand(ABC):
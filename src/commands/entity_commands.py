@@ -5,7 +5,7 @@ Commands for manipulating Entity objects.
 import logging
 from typing import Optional
 
-from src.commands.base_command import BaseCommand, CommandResult
+from src.commands.base_command import BaseCommand, ChangeSet, CommandResult
 from src.core.entities import Entity
 from src.services.db_service import DatabaseService
 
@@ -60,6 +60,7 @@ class CreateEntityCommand(BaseCommand):
                 message=f"Entity '{self._entity.name}' created.",
                 command_name="CreateEntityCommand",
                 data={"id": self._entity.id},
+                changes=ChangeSet.single("created", "entity", self._entity.id),
             )
         except Exception as e:
             logger.error(f"Failed to create entity: {e}")
@@ -165,6 +166,7 @@ class UpdateEntityCommand(BaseCommand):
                 success=True,
                 message="Entity updated.",
                 command_name="UpdateEntityCommand",
+                changes=ChangeSet.single("updated", "entity", self.entity_id),
             )
         except Exception as e:
             logger.error(f"Failed to update entity: {e}")
@@ -231,6 +233,7 @@ class DeleteEntityCommand(BaseCommand):
                 success=True,
                 message="Entity deleted.",
                 command_name="DeleteEntityCommand",
+                changes=ChangeSet.single("deleted", "entity", self._entity_id),
             )
         except Exception as e:
             logger.error(f"Failed to delete entity: {e}")
@@ -12,7 +12,7 @@ All commands support undo/redo operations and return CommandResult objects.
 import logging
 from typing import Optional
 
-from src.commands.base_command import BaseCommand, CommandResult
+from src.commands.base_command import BaseCommand, ChangeSet, CommandResult
 from src.core.events import Event
 from src.services.db_service import DatabaseService
 
@@ -73,6 +73,7 @@ class CreateEventCommand(BaseCommand):
                 message=f"Event '{self.event.name}' created.",
                 command_name="CreateEventCommand",
                 data={"id": self.event.id},
+                changes=ChangeSet.single("created", "event", self.event.id),
             )
         except Exception as e:
             logger.error(f"Failed to create event: {e}")
@@ -192,6 +193,7 @@ class UpdateEventCommand(BaseCommand):
                 success=True,
                 message="Event updated successfully.",
                 command_name="UpdateEventCommand",
+                changes=ChangeSet.single("updated", "event", self.event_id),
             )
         except Exception as e:
             logger.error(f"Failed to update event: {e}")
@@ -256,6 +258,7 @@ class DeleteEventCommand(BaseCommand):
                 success=True,
                 message="Event deleted.",
                 command_name="DeleteEventCommand",
+                changes=ChangeSet.single("deleted", "event", self.event_id),
             )
         except Exception as e:
             logger.error(f"Failed to delete event: {e}")
@@ -4,8 +4,7 @@ Commands for processing WikiLinks and updating relations.
 """
 
 import logging
-from collections import defaultdict
-from typing import Dict, List, Set
+from typing import List, Set
 
 from src.commands.base_command import BaseCommand, CommandResult
 from src.services.db_service import DatabaseService
@@ -69,31 +68,9 @@ class ProcessWikiLinksCommand(BaseCommand):
                     command_name="ProcessWikiLinksCommand",
                 )
 
-            # 2. Build name->Target map including aliases (Mixed Entities and Events)
-            # We map name -> list of objects (Entity or Event)
-
-            # 2a. Load Entities
-            all_entities = db_service.get_all_entities()
-            name_to_targets: Dict[str, List] = defaultdict(list)
-
-            for entity in all_entities:
-                # Add primary name
-                name_key = entity.name.casefold()
-                name_to_targets[name_key].append(entity)
-
-                # Add aliases if present
-                aliases = entity.attributes.get("aliases", [])
-                if isinstance(aliases, list):
-                    for alias in aliases:
-                        if isinstance(alias, str):
-                            alias_key = alias.casefold()
-                            name_to_targets[alias_key].append(entity)
-
-            # 2b. Load Events
-            all_events = db_service.get_all_events()
-            for event in all_events:
-                name_key = event.name.casefold()
-                name_to_targets[name_key].append(event)
+            # 2. Names and aliases resolve through db_service.name_index,
+            # which is loaded once and patched on writes, so nothing here
+            # scales with the size of the world.
 
             # 3. Get existing relations for deduplication
             existing_relations = db_service.get_relations(self.source_id)
@@ -113,24 +90,12 @@ class ProcessWikiLinksCommand(BaseCommand):
             valid_links = []
 
             for candidate in candidates:
-                target_obj = None
-                target_type_str = "Entity"  # Default or detected
-
                 # Handle ID-based links
                 if candidate.is_id_based:
-                    # Direct lookup by ID
-                    # Try Entity first
                     assert candidate.target_id is not None  # Guaranteed by parser
-                    target_obj = db_service.get_entity(candidate.target_id)
-                    if target_obj:
-                        target_type_str = "Entity"
-                    else:
-                        # Try Event
-                        target_obj = db_service.get_event(candidate.target_id)
-                        if target_obj:
-                            target_type_str = "Event"
-
-                    if not target_obj:
+                    resolved = db_service.resolve_object(candidate.target_id)
+
+                    if not resolved:
                         # Broken link - target doesn't exist
                         skipped_missing.append(
                             candidate.modifier or candidate.target_id
@@ -138,11 +103,13 @@ class ProcessWikiLinksCommand(BaseCommand):
                         logger.warning(f"Broken ID-based link: {candidate.target_id}")
                         continue
 
+                    target_id = candidate.target_id
+                    target_name, target_type = resolved
+
                 # Handle name-based links (legacy)
                 else:
                     assert candidate.name is not None  # Guaranteed by parser
-                    name_key = candidate.name.casefold()
-                    matching_targets = name_to_targets.get(name_key, [])
+                    matching_targets = db_service.find_objects_by_name(candidate.name)
 
                     if len(matching_targets) == 0:
                         # No match found
@@ -159,31 +126,20 @@ class ProcessWikiLinksCommand(BaseCommand):
                         )
                         continue
 
-                    else:
-                        # Exactly one match
-                        target_obj = matching_targets[0]
-                        # Determine type
-                        if hasattr(target_obj, "type") and hasattr(
-                            target_obj, "lore_date"
-                        ):
-                            target_type_str = "Event"
-                        else:
-                            target_type_str = "Entity"
-
-                # At this point we have a valid target_obj
-                if not target_obj:
-                    continue
+                    # Exactly one match
+                    target_id, target_name, target_type = matching_targets[0]
 
                 # Skip self-references
-                if target_obj.id == self.source_id:
+                if target_id == self.source_id:
                     continue
 
                 # It's a valid link
-                valid_links.append(f"{target_obj.name} ({target_type_str})")
+                target_type_str = target_type.capitalize()
+                valid_links.append(f"{target_name} ({target_type_str})")
                 created_count += 1
                 logger.info(
                     f"Found valid link: {self.source_id} -> "
-                    f"{target_obj.name} ({target_type_str}) "
+                    f"{target_name} ({target_type_str}) "
                     f"at offset {candidate.span[0]} "
                     f"({'ID-based' if candidate.is_id_based else 'name-based'})"
                 )
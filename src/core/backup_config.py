@@ -24,6 +24,8 @@ class BackupConfig:
         external_backup_path: Optional external location for additional copies.
         verify_after_backup: Whether to verify backup integrity after creation.
         vacuum_before_backup: Whether to run VACUUM before creating backup.
+        incremental_backup: Whether to store backups as deduplicated chunks,
+            keeping only the parts of the database that changed.
     """
 
     enabled: bool = True
@@ -36,6 +38,7 @@ class BackupConfig:
     external_backup_path: Optional[Path] = None  # Optional external location
     verify_after_backup: bool = True
     vacuum_before_backup: bool = False  # Can be slow for large DBs
+    incremental_backup: bool = False
 
     def to_dict(self) -> dict:
         """
@@ -57,6 +60,7 @@ class BackupConfig:
             ),
             "verify_after_backup": self.verify_after_backup,
             "vacuum_before_backup": self.vacuum_before_backup,
+            "incremental_backup": self.incremental_backup,
         }
 
     @classmethod
@@ -88,4 +92,5 @@ class BackupConfig:
             external_backup_path=external_backup_path,
             verify_after_backup=data.get("verify_after_backup", True),
             vacuum_before_backup=data.get("vacuum_before_backup", False),
+            incremental_backup=data.get("incremental_backup", False),
         )
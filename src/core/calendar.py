@@ -14,12 +14,16 @@ Classes:
     CalendarConverter: Bidirectional float/date converter.
 """
 
+import bisect
 import json
 import logging
+import math
 import time
 import uuid
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -409,6 +413,12 @@ class CalendarConverter:
     - Time fractions (sub-day precision)
 
     Internal indexing is 0-based: 0.0 = start of Year 1, Month 1, Day 1.
+
+    Year starts are computed in closed form for the standard year, with
+    year variants kept in a sorted index of cumulative length offsets, so
+    both directions cost O(log variants) regardless of how far a date is
+    from the Epoch. The tables are built once from the configuration; create
+    a new converter after changing it.
     """
 
     def __init__(self, config: CalendarConfig) -> None:
@@ -419,88 +429,155 @@ class CalendarConverter:
             config: The calendar configuration to use.
         """
         self._config = config
-        # Cache for year start positions (year -> absolute_day)
-        self._year_cache: Dict[int, float] = {}
+        self._build_year_tables()
+
+    def _build_year_tables(self) -> None:
+        """Precomputes year-length and month-offset tables from the config."""
+        self._base_months = self._config.months
+        self._base_month_starts = self._month_starts(self._base_months)
+        self._base_length = self._base_month_starts[-1]
+
+        # First variant wins, matching CalendarConfig.get_months_for_year
+        variant_months: Dict[int, List[MonthDefinition]] = {}
+        for variant in self._config.year_variants:
+            variant_months.setdefault(variant.year, variant.months)
+        self._variant_months = variant_months
+        self._variant_month_starts = {
+            year: self._month_starts(months) for year, months in variant_months.items()
+        }
+        self._variant_years = sorted(variant_months)
+
+        # _variant_offsets[i] = extra days contributed by the first i variants
+        self._variant_offsets = [0]
+        for year in self._variant_years:
+            delta = self._variant_month_starts[year][-1] - self._base_length
+            self._variant_offsets.append(self._variant_offsets[-1] + delta)
+        self._epoch_offset = self._variant_offsets[
+            bisect.bisect_left(self._variant_years, 1)
+        ]
 
-    def to_float(self, date: CalendarDate) -> float:
+        # Start day of each variant year, for float -> year lookups
+        self._variant_starts = [self._year_start(y) for y in self._variant_years]
+
+        self._base_month_starts_arr = np.asarray(self._base_month_starts)
+        self._variant_years_arr = np.asarray(self._variant_years, dtype=np.int64)
+        self._variant_offsets_arr = np.asarray(self._variant_offsets, dtype=np.int64)
+        self._variant_starts_arr = np.asarray(self._variant_starts, dtype=np.float64)
+        self._variant_lengths_arr = np.asarray(
+            [self._variant_month_starts[y][-1] for y in self._variant_years],
+            dtype=np.float64,
+        )
+
+    @staticmethod
+    def _month_starts(months: List[MonthDefinition]) -> List[int]:
         """
-        Converts a structured date to an absolute day float.
+        Returns the cumulative day offset of each month.
 
         Args:
-            date: The CalendarDate to convert.
+            months: Month structure of a year.
 
         Returns:
-            float: Absolute day value where 0.0 = start of Epoch.
-
-        Note:
-            Year 1, Month 1, Day 1 = 0.0
-            Negative years produce negative floats.
+            List[int]: Offsets of every month start, followed by the year length.
         """
-        if date.year >= 1:
-            return self._to_float_positive(date)
-        else:
-            return self._to_float_negative(date)
+        starts = [0]
+        for month in months:
+            starts.append(starts[-1] + month.days)
+        return starts
+
+    def _months_for(self, year: int) -> List[MonthDefinition]:
+        """Returns the month structure of a year via the variant index."""
+        return self._variant_months.get(year, self._base_months)
 
-    def _to_float_positive(self, date: CalendarDate) -> float:
+    def _month_starts_for(self, year: int) -> List[int]:
+        """Returns the cumulative month offsets of a year."""
+        return self._variant_month_starts.get(year, self._base_month_starts)
+
+    def _year_start(self, year: int) -> int:
         """
-        Converts a positive-year date to float.
+        Returns the absolute day on which a year begins.
 
         Args:
-            date: Date with year >= 1.
+            year: Any year, including pre-Epoch years <= 0.
 
         Returns:
-            float: Absolute day value.
+            int: Absolute day of Month 1, Day 1 of that year.
         """
-        total_days = 0.0
+        index = bisect.bisect_left(self._variant_years, year)
+        return (
+            (year - 1) * self._base_length
+            + self._variant_offsets[index]
+            - self._epoch_offset
+        )
 
-        # Sum all complete years before target year
-        for y in range(1, date.year):
-            total_days += self._config.get_year_length(y)
+    def _year_at(self, absolute_day: float) -> int:
+        """
+        Returns the year containing an absolute day.
 
-        # Sum all complete months before target month
-        months = self._config.get_months_for_year(date.year)
-        for m_idx in range(date.month - 1):  # month is 1-indexed
-            total_days += months[m_idx].days
+        Args:
+            absolute_day: The float value to locate.
 
-        # Add days within the month (day is 1-indexed, so subtract 1)
-        total_days += date.day - 1
+        Returns:
+            int: The year whose span contains absolute_day.
 
-        # Add time fraction
-        total_days += date.time_fraction
+        Raises:
+            ValueError: If the standard year has no days.
+        """
+        if self._base_length <= 0:
+            raise ValueError("Calendar has no days in a standard year.")
 
-        return total_days
+        if not self._variant_years:
+            year = math.floor(absolute_day / self._base_length) + 1
+        else:
+            # Find the last variant year starting at or before absolute_day;
+            # the years between consecutive variants are all standard years.
+            index = bisect.bisect_right(self._variant_starts, absolute_day) - 1
+            if index < 0:
+                anchor_year = self._variant_years[0]
+                anchor_start = self._variant_starts[0]
+            else:
+                variant_year = self._variant_years[index]
+                anchor_start = (
+                    self._variant_starts[index]
+                    + self._variant_month_starts[variant_year][-1]
+                )
+                if absolute_day < anchor_start:
+                    return variant_year
+                anchor_year = variant_year + 1
+            year = anchor_year + math.floor(
+                (absolute_day - anchor_start) / self._base_length
+            )
+
+        # Guard against float rounding at exact year boundaries
+        while absolute_day < self._year_start(year):
+            year -= 1
+        while absolute_day >= self._year_start(year + 1):
+            year += 1
+        return year
 
-    def _to_float_negative(self, date: CalendarDate) -> float:
+    def to_float(self, date: CalendarDate) -> float:
         """
-        Converts a negative/zero-year date to float.
-
-        Pre-Epoch dates (year <= 0) produce negative floats.
+        Converts a structured date to an absolute day float.
 
         Args:
-            date: Date with year <= 0.
+            date: The CalendarDate to convert.
 
         Returns:
-            float: Negative absolute day value.
-        """
-        # For year 0: we need to count backwards from 0.0
-        # Year 0, Month 12, Day 30 = -1.0 (day before Epoch)
-        # Year 0, Month 1, Day 1 = -360.0 (for 360-day calendar)
-
-        # Calculate days from start of year to the date
-        months = self._config.get_months_for_year(date.year)
-        days_in_year = 0
-        for m_idx in range(date.month - 1):
-            days_in_year += months[m_idx].days
-        days_in_year += date.day - 1
-        days_in_year += date.time_fraction
+            float: Absolute day value where 0.0 = start of Epoch.
 
-        # Calculate total days for all years from date.year to year 0
-        total_years_days = 0.0
-        for y in range(date.year, 1):  # from date.year up to but not including 1
-            total_years_days += self._config.get_year_length(y)
+        Note:
+            Year 1, Month 1, Day 1 = 0.0
+            Negative years produce negative floats.
+        """
+        month_starts = self._month_starts_for(date.year)
+        month_offset = month_starts[date.month - 1] if date.month > 1 else 0
 
-        # The float is negative: -(remaining days to reach year 1)
-        return -(total_years_days - days_in_year)
+        # Day is 1-indexed, so subtract 1
+        return (
+            self._year_start(date.year)
+            + month_offset
+            + (date.day - 1)
+            + date.time_fraction
+        )
 
     def from_float(self, absolute_day: float) -> CalendarDate:
         """
@@ -516,40 +593,28 @@ class CalendarConverter:
             0.0 = Year 1, Month 1, Day 1
             Negative values produce pre-Epoch dates.
         """
-        if absolute_day >= 0:
-            return self._from_float_positive(absolute_day)
-        else:
-            return self._from_float_negative(absolute_day)
+        year = self._year_at(absolute_day)
+        return self._date_in_year(year, absolute_day - self._year_start(year))
 
-    def _from_float_positive(self, absolute_day: float) -> CalendarDate:
+    def _date_in_year(self, year: int, remaining: float) -> CalendarDate:
         """
-        Converts a non-negative float to date.
+        Builds a CalendarDate from a day offset within a year.
 
         Args:
-            absolute_day: Float >= 0.
+            year: The year of the date.
+            remaining: Days since the start of that year.
 
         Returns:
             CalendarDate: Structured date.
         """
-        remaining = absolute_day
-        year = 1
-
-        # Find the year
-        while True:
-            year_length = self._config.get_year_length(year)
-            if remaining < year_length:
-                break
-            remaining -= year_length
-            year += 1
+        months = self._months_for(year)
+        month_starts = self._month_starts_for(year)
 
-        # Find the month
-        months = self._config.get_months_for_year(year)
-        month = 1
-        for m_idx, month_def in enumerate(months):
-            if remaining < month_def.days:
-                month = m_idx + 1  # 1-indexed
-                break
-            remaining -= month_def.days
+        # Find the month (skipping zero-length months)
+        m_idx = bisect.bisect_right(month_starts, remaining) - 1
+        if m_idx < len(months):
+            month = m_idx + 1  # 1-indexed
+            remaining -= month_starts[m_idx]
         else:
             # Edge case: exactly at year boundary
             month = len(months)
@@ -570,62 +635,94 @@ class CalendarConverter:
             month_name=month_name,
         )
 
-    def _from_float_negative(self, absolute_day: float) -> CalendarDate:
+    def _year_starts_many(self, years: np.ndarray) -> np.ndarray:
+        """Vectorized _year_start for an integer array of years."""
+        index = np.searchsorted(self._variant_years_arr, years, side="left")
+        return (
+            (years - 1) * self._base_length
+            + self._variant_offsets_arr[index]
+            - self._epoch_offset
+        )
+
+    def to_float_many(self, dates: Sequence[CalendarDate]) -> np.ndarray:
         """
-        Converts a negative float to pre-Epoch date.
+        Converts many structured dates to absolute day floats at once.
 
         Args:
-            absolute_day: Float < 0.
+            dates: The CalendarDates to convert.
 
         Returns:
-            CalendarDate: Structured date with year <= 0.
+            np.ndarray: Absolute day values, in the order of dates.
         """
-        # absolute_day is negative
-        # -1.0 = last day of Year 0
-        # -360.0 = first day of Year 0 (for 360-day calendar)
+        count = len(dates)
+        years = np.fromiter((d.year for d in dates), dtype=np.int64, count=count)
+        month_idx = np.fromiter(
+            (max(d.month - 1, 0) for d in dates), dtype=np.int64, count=count
+        )
+        days = np.fromiter(
+            (d.day - 1 + d.time_fraction for d in dates),
+            dtype=np.float64,
+            count=count,
+        )
 
-        remaining = -absolute_day  # Make it positive for calculation
-        year = 0
+        month_offsets = self._base_month_starts_arr[
+            np.minimum(month_idx, len(self._base_months))
+        ].astype(np.float64)
+        if self._variant_years:
+            # Variant years are rare, so patch their month offsets individually
+            for i in np.flatnonzero(np.isin(years, self._variant_years_arr)):
+                month_starts = self._variant_month_starts[int(years[i])]
+                month_offsets[i] = month_starts[month_idx[i]]
 
-        # Find the year (going backwards)
-        while True:
-            year_length = self._config.get_year_length(year)
-            if remaining <= year_length:
-                break
-            remaining -= year_length
-            year -= 1
+        return self._year_starts_many(years) + month_offsets + days
 
-        # Now remaining is the offset from the END of this year
-        # We need to convert to offset from START
-        year_length = self._config.get_year_length(year)
-        from_start = year_length - remaining
-
-        # Find the month
-        months = self._config.get_months_for_year(year)
-        month = 1
-        current = from_start
-        for m_idx, month_def in enumerate(months):
-            if current < month_def.days:
-                month = m_idx + 1
-                break
-            current -= month_def.days
-        else:
-            month = len(months)
-            current = months[-1].days - 1
+    def from_float_many(self, values: Sequence[float]) -> List[CalendarDate]:
+        """
+        Converts many absolute day floats to structured dates at once.
 
-        # Extract day and time fraction
-        day = int(current) + 1
-        time_fraction = current - int(current)
+        The year lookup is vectorized over the whole array; only building
+        the CalendarDate objects happens per value.
 
-        month_name = months[month - 1].name if month <= len(months) else None
+        Args:
+            values: The float values to convert.
 
-        return CalendarDate(
-            year=year,
-            month=month,
-            day=day,
-            time_fraction=time_fraction,
-            month_name=month_name,
-        )
+        Returns:
+            List[CalendarDate]: Structured dates, in the order of values.
+
+        Raises:
+            ValueError: If the standard year has no days.
+        """
+        if self._base_length <= 0:
+            raise ValueError("Calendar has no days in a standard year.")
+
+        days = np.asarray(values, dtype=np.float64).ravel()
+        if not self._variant_years:
+            years = np.floor(days / self._base_length).astype(np.int64) + 1
+        else:
+            index = np.searchsorted(self._variant_starts_arr, days, side="right") - 1
+            safe = np.maximum(index, 0)
+            variant_end = (
+                self._variant_starts_arr[safe] + self._variant_lengths_arr[safe]
+            )
+            anchor_year = np.where(
+                index < 0, self._variant_years_arr[0], self._variant_years_arr[safe] + 1
+            )
+            anchor_start = np.where(index < 0, self._variant_starts_arr[0], variant_end)
+            years = anchor_year + np.floor(
+                (days - anchor_start) / self._base_length
+            ).astype(np.int64)
+            in_variant = (index >= 0) & (days < variant_end)
+            years = np.where(in_variant, self._variant_years_arr[safe], years)
+
+        # Guard against float rounding at exact year boundaries
+        starts = self._year_starts_many(years)
+        years = years - (days < starts) + (days >= self._year_starts_many(years + 1))
+        remaining = days - self._year_starts_many(years)
+
+        return [
+            self._date_in_year(int(year), float(offset))
+            for year, offset in zip(years, remaining)
+        ]
 
     def format_date(self, absolute_day: float, format_str: Optional[str] = None) -> str:
         """
@@ -641,7 +738,7 @@ class CalendarConverter:
         date = self.from_float(absolute_day)
 
         # Get month name
-        months = self._config.get_months_for_year(date.year)
+        months = self._months_for(date.year)
         month_name = (
             months[date.month - 1].name if date.month <= len(months) else "Unknown"
         )
@@ -5,7 +5,11 @@ Provides shared search logic for filtering domain objects (Entities, Events)
 based on text matching against various properties.
 """
 
-from typing import Any
+from typing import Any, List
+
+# Joins the fields of a search key; user input never contains it, so a term
+# cannot match across two fields
+SEARCH_KEY_SEPARATOR = "\x1f"
 
 
 class SearchUtils:
@@ -69,3 +73,47 @@ class SearchUtils:
                         return True
 
         return False
+
+    @staticmethod
+    def normalize_term(search_term: str) -> str:
+        """
+        Normalizes a search term for matching against search keys.
+
+        Args:
+            search_term: The text to search for.
+
+        Returns:
+            str: The stripped, casefolded term.
+        """
+        return (search_term or "").strip().casefold()
+
+    @staticmethod
+    def search_key(obj: Any) -> str:
+        """
+        Builds the precomputed search key of an object or dictionary.
+
+        The key holds the casefolded name, type, description, tags and string
+        attribute values, i.e. the fields matches_search() looks at, so a
+        normalized term matches the object when it is a substring of the key.
+
+        Args:
+            obj: The object to index (Entity, Event, or dict).
+
+        Returns:
+            str: The search key.
+        """
+
+        def get_val(key: str) -> Any:
+            if isinstance(obj, dict):
+                return obj.get(key)
+            return getattr(obj, key, None)
+
+        fields: List[Any] = [get_val("name"), get_val("type"), get_val("description")]
+        fields.extend(get_val("tags") or [])
+        attributes = get_val("attributes")
+        if isinstance(attributes, dict):
+            fields.extend(attributes.values())
+
+        return SEARCH_KEY_SEPARATOR.join(
+            field.casefold() for field in fields if isinstance(field, str) and field
+        )
@@ -6,62 +6,118 @@ Manages caching of resolved states to ensure performance.
 """
 
 import logging
-from typing import Any, Dict, Tuple
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
 
 from PySide6.QtCore import QObject, Slot
 
-from src.core.temporal_resolver import TemporalResolver
+from src.core.temporal_resolver import EntityTimeline, TemporalResolver
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of entity timelines kept before the least recently used
+# one is evicted.
+DEFAULT_TIMELINE_CACHE_SIZE = 1024
+
 
 class TemporalManager(QObject):
     """
     Manages temporal state resolution, catching, and invalidation.
     """
 
-    def __init__(self, db_service: Any) -> None:
+    def __init__(
+        self, db_service: Any, max_entities: int = DEFAULT_TIMELINE_CACHE_SIZE
+    ) -> None:
         """
         Args:
             db_service: Reference to DatabaseService to fetch entities/relations.
+            max_entities: Number of entity timelines to keep cached (LRU).
         """
         super().__init__()
         self._db = db_service
         self._resolver = TemporalResolver()
+        self._max_entities = max(1, max_entities)
 
-        # Cache structure: { (entity_id, time): state_dict }
-        # This is a naive cache. In reality, state is valid for a RANGE.
-        # But for MVP playhead scrubbing, exact match or simple LRU is
-        # a starting point.
-        self._cache: Dict[Tuple[str, float], Dict[str, Any]] = {}
+        # Cache structure: { entity_id: EntityTimeline }, in LRU order.
+        # A state is valid for a whole range between two change points, so
+        # each entity is resolved once and every playhead time is a bisect.
+        self._timelines: "OrderedDict[str, EntityTimeline]" = OrderedDict()
 
     def get_entity_state_at(self, entity_id: str, time: float) -> Dict[str, Any]:
         """
         Returns the resolved state of an entity at a specific time.
         Uses cache if available.
         """
+        timeline = self.get_entity_timeline(entity_id)
+        if timeline is None:
+            return {}
+        return timeline.state_at(time)
+
+    def get_entity_timeline(self, entity_id: str) -> Optional[EntityTimeline]:
+        """
+        Returns the precomputed change-point timeline of an entity.
+
+        Builds and caches it on first use, evicting the least recently used
+        timeline when the cache is full.
+
+        Args:
+            entity_id: ID of the entity.
+
+        Returns:
+            EntityTimeline, or None if the entity does not exist.
+        """
         # 1. Check Cache
-        cache_key = (entity_id, time)
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        timeline = self._timelines.get(entity_id)
+        if timeline is not None:
+            self._timelines.move_to_end(entity_id)
+            return timeline
 
         # 2. Fetch Data
         entity = self._db.get_entity(entity_id)
         if not entity:
             logger.warning(f"TemporalManager: Entity {entity_id} not found.")
-            return {}
+            return None
 
-        # Fetch ALL incoming relations for this entity
-        # Optimization Todo: Fetch only relations relevant to time window?
-        # For now, fetching all is safer for correctness.
+        # Fetch ALL incoming relations for this entity; the timeline covers
+        # every time, so no later lookup needs the database again.
         relations = self._db.get_incoming_relations(entity_id)
 
-        # 3. Resolve
-        state = self._resolver.resolve_entity_state(entity, relations, time)
+        # 3. Resolve every interval between change points
+        timeline = self._resolver.build_timeline(entity, relations)
 
         # 4. Cache and Return
-        self._cache[cache_key] = state
-        return state
+        self._timelines[entity_id] = timeline
+        if len(self._timelines) > self._max_entities:
+            self._timelines.popitem(last=False)
+        return timeline
+
+    def get_world_state_at(
+        self, time: float, entity_ids: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the resolved state of every entity (or a subset) at a time.
+
+        Loads all temporal relations with one joined query and resolves them
+        in a single sweep, instead of one entity/relations round-trip each.
+
+        Args:
+            time: The timestamp (lore_date) to resolve at.
+            entity_ids: Optional subset of entity IDs. If None, all entities.
+
+        Returns:
+            Dict mapping entity ID to its resolved attributes.
+        """
+        if entity_ids is None:
+            entities = self._db.get_all_entities()
+        else:
+            _, entities = self._db.get_objects_by_ids(
+                [("entity", entity_id) for entity_id in entity_ids]
+            )
+
+        relations = self._db.get_temporal_relations(
+            None if entity_ids is None else [entity.id for entity in entities]
+        )
+        return self._resolver.resolve_world_state(entities, relations, time)
 
     @Slot(str, str, str)
     def on_relation_changed(self, rel_id: str, source_id: str, target_id: str) -> None:
@@ -109,14 +165,8 @@ class TemporalManager(QObject):
         Args:
             entity_id: ID of the entity to invalidate.
         """
-        # Remove all keys where entity_id matches
-        keys_to_remove = [k for k in self._cache.keys() if k[0] == entity_id]
-        for k in keys_to_remove:
-            del self._cache[k]
-
-        logger.debug(
-            f"Invalidated cache for entity {entity_id} ({len(keys_to_remove)} entries)"
-        )
+        if self._timelines.pop(entity_id, None) is not None:
+            logger.debug(f"Invalidated cached timeline for entity {entity_id}")
 
     def clear_all_cache(self) -> None:
         """
@@ -125,6 +175,6 @@ class TemporalManager(QObject):
         Useful for global changes that might affect many entities
         (e.g., changing calendar system, bulk date adjustments).
         """
-        cache_size = len(self._cache)
-        self._cache.clear()
+        cache_size = len(self._timelines)
+        self._timelines.clear()
         logger.info(f"Nuclear cache clear: removed {cache_size} entries")
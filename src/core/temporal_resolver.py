@@ -5,14 +5,64 @@ Responsible for computing the state of an entity at a given point in time
 by aggregating and merging relation-driven overrides.
 """
 
+import bisect
 import logging
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.core.entities import Entity
 
 logger = logging.getLogger(__name__)
 
 
+class EntityTimeline:
+    """
+    Precomputed states of one entity over the whole time axis.
+
+    Every valid_from/valid_to of its relations is a change point. Between two
+    consecutive change points the set of active relations is fixed, so the
+    state for each interval is resolved once and a lookup is a single bisect.
+    """
+
+    def __init__(self, boundaries: List[float], states: List[Dict[str, Any]]) -> None:
+        """
+        Args:
+            boundaries: Sorted, unique change points.
+            states: len(boundaries) + 1 snapshots. states[0] applies before
+                the first boundary, states[i] from boundaries[i - 1] up to
+                (but excluding) boundaries[i].
+        """
+        self.boundaries = boundaries
+        self.states = states
+
+    def state_at(self, time: float) -> Dict[str, Any]:
+        """
+        Returns the snapshot valid at the given time.
+
+        Args:
+            time: The timestamp (lore_date) to look up.
+
+        Returns:
+            Dict[str, Any]: The merged attributes at that time.
+        """
+        return self.states[bisect.bisect_right(self.boundaries, time)]
+
+    def interval_at(self, time: float) -> Tuple[float, float]:
+        """
+        Returns the half-open [start, end) range over which the state at
+        `time` stays unchanged.
+
+        Args:
+            time: The timestamp (lore_date) to look up.
+
+        Returns:
+            Tuple[float, float]: Interval bounds, using +/-inf at the ends.
+        """
+        idx = bisect.bisect_right(self.boundaries, time)
+        start = self.boundaries[idx - 1] if idx > 0 else float("-inf")
+        end = self.boundaries[idx] if idx < len(self.boundaries) else float("inf")
+        return start, end
+
+
 class TemporalResolver:
     """
     Computes entity state at time T based on a list of relations.
@@ -45,19 +95,7 @@ class TemporalResolver:
         # 2. Filter applicable relations
         applicable_relations = []
         for rel in relations:
-            attrs = rel.get("attributes", {})
-            source_event_date = rel.get("source_event_date")
-
-            # Dynamic Timing Logic
-            if attrs.get("valid_from_event") is True and source_event_date is not None:
-                valid_from = float(source_event_date)
-            else:
-                valid_from = attrs.get("valid_from")
-
-            if attrs.get("valid_to_event") is True and source_event_date is not None:
-                valid_to = float(source_event_date)
-            else:
-                valid_to = attrs.get("valid_to")
+            valid_from, valid_to = self._valid_range(rel)
 
             # Skip if no temporal data
             if valid_from is None:
@@ -91,6 +129,131 @@ class TemporalResolver:
 
         return current_state
 
+    def resolve_world_state(
+        self,
+        entities: List[Entity],
+        relations: List[Dict[str, Any]],
+        time: float,
+        include_base_state: bool = True,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Computes the merged state of many entities at one time in a single sweep.
+
+        Relations for all entities are sorted once by application order
+        (valid_from first) and walked until valid_from passes `time`, so each
+        entity gets the same result as resolve_entity_state.
+
+        Args:
+            entities: The base Entity objects to resolve.
+            relations: Relation dicts targeted at any of these entities
+                (must include 'target_id').
+            time: The timestamp (lore_date) to resolve at.
+            include_base_state: If True, starts with entity.attributes.
+
+        Returns:
+            Dict mapping entity ID to its merged attributes.
+        """
+        states = {
+            entity.id: entity.attributes.copy() if include_base_state else {}
+            for entity in entities
+        }
+
+        active = []
+        for rel in relations:
+            if rel.get("target_id") not in states:
+                continue
+            valid_from, valid_to = self._valid_range(rel)
+            if valid_from is None:
+                continue
+            active.append((self._sort_key(rel), rel, valid_to))
+
+        active.sort(key=lambda item: item[0])
+
+        for sort_key, rel, valid_to in active:
+            if sort_key[0] > time:
+                break  # Sorted by valid_from: nothing later applies
+            if valid_to is not None and valid_to <= time:
+                continue
+            payload = rel.get("attributes", {}).get("payload", {})
+            if payload:
+                self._merge_payload(states[rel["target_id"]], payload)
+
+        return states
+
+    def build_timeline(
+        self,
+        entity: Entity,
+        relations: List[Dict[str, Any]],
+        include_base_state: bool = True,
+    ) -> EntityTimeline:
+        """
+        Precomputes the entity's state for every interval between change points.
+
+        Produces the same snapshots as calling resolve_entity_state at any
+        time inside each interval.
+
+        Args:
+            entity: The base Entity object.
+            relations: List of relation dicts targeted at this entity.
+            include_base_state: If True, starts with entity.attributes.
+
+        Returns:
+            EntityTimeline: Sorted change points with one snapshot per interval.
+        """
+        ranges = []
+        for rel in relations:
+            valid_from, valid_to = self._valid_range(rel)
+            if valid_from is None:
+                continue
+            ranges.append((rel, float(valid_from), valid_to))
+
+        ranges.sort(key=lambda item: self._sort_key(item[0]))
+
+        change_points = set()
+        for _, valid_from, valid_to in ranges:
+            change_points.add(valid_from)
+            if valid_to is not None:
+                change_points.add(float(valid_to))
+        boundaries = sorted(change_points)
+
+        base_state = entity.attributes.copy() if include_base_state else {}
+        states = [base_state]
+        for start in boundaries:
+            state = base_state.copy()
+            for rel, valid_from, valid_to in ranges:
+                if valid_from <= start and (valid_to is None or valid_to > start):
+                    payload = rel.get("attributes", {}).get("payload", {})
+                    if payload:
+                        self._merge_payload(state, payload)
+            # Adjacent intervals with equal state share one snapshot
+            states.append(states[-1] if state == states[-1] else state)
+
+        return EntityTimeline(boundaries, states)
+
+    def _valid_range(
+        self, relation: Dict[str, Any]
+    ) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Returns the (valid_from, valid_to) bounds of a relation.
+
+        Event-anchored bounds use the source event's date.
+        """
+        attrs = relation.get("attributes", {})
+        source_event_date = relation.get("source_event_date")
+
+        # Dynamic Timing Logic
+        if attrs.get("valid_from_event") is True and source_event_date is not None:
+            valid_from = float(source_event_date)
+        else:
+            valid_from = attrs.get("valid_from")
+
+        if attrs.get("valid_to_event") is True and source_event_date is not None:
+            valid_to = float(source_event_date)
+        else:
+            valid_to = attrs.get("valid_to")
+
+        return valid_from, valid_to
+
     def _sort_key(self, relation: Dict[str, Any]) -> Tuple[float, int, float, str]:
         """
         Returns a sort key for deterministic application order.
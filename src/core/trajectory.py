@@ -2,11 +2,15 @@
 Trajectory Interpolation Module.
 
 Provides utilities for interpolating entity positions along temporal trajectories.
-Uses binary search (bisect) for O(log N) keyframe lookup.
+Uses binary search (bisect) for O(log N) keyframe lookup, and a packed
+TrajectoryStore to interpolate every marker of a map in one batched call.
 """
 
 import bisect
 from dataclasses import dataclass
+from typing import Mapping, Sequence
+
+import numpy as np
 
 
 @dataclass
@@ -95,6 +99,168 @@ def interpolate_position(
     return (x, y)
 
 
+def keyframes_in_window(
+    keyframes: list[Keyframe], t0: float, t1: float
+) -> list[Keyframe]:
+    """
+    Returns the keyframes needed to interpolate anywhere in [t0, t1].
+
+    These are the keyframes inside the window plus the nearest keyframe
+    before t0 and after t1, so interpolate_position() on the result agrees
+    with the full trajectory for every t in the window.
+
+    Args:
+        keyframes: List of Keyframe objects, must be sorted by time.
+        t0: Start of the time window.
+        t1: End of the time window.
+
+    Returns:
+        The sorted sub-list of keyframes.
+
+    Example:
+        >>> kfs = [Keyframe(0, 0.0, 0.0), Keyframe(10, 0.5, 0.5),
+        ...        Keyframe(20, 1.0, 1.0), Keyframe(30, 0.0, 1.0)]
+        >>> [kf.t for kf in keyframes_in_window(kfs, 12, 18)]
+        [10, 20]
+    """
+    times = [kf.t for kf in keyframes]
+    lo = bisect.bisect_left(times, t0)
+    if lo > 0:
+        # Include every keyframe sharing the bracketing timestamp
+        lo = bisect.bisect_left(times, times[lo - 1])
+    hi = bisect.bisect_right(times, t1)
+    if hi < len(times):
+        hi = bisect.bisect_right(times, times[hi])
+    return keyframes[lo:hi]
+
+
+class TrajectoryStore:
+    """
+    Packed keyframes of many trajectories for batched interpolation.
+
+    Keyframe times and coordinates of all trajectories are concatenated into
+    NumPy arrays, with offsets marking where each trajectory starts. Each
+    keyframe time is replaced by its rank among all distinct times, so a
+    trajectory's keyframes map to exact int64 keys (trajectory index,
+    rank) that are sorted across the whole store. One ``searchsorted`` over
+    those keys then finds the surrounding keyframes of every trajectory.
+
+    Results match interpolate_position() exactly. Trajectories with fewer
+    than two keyframes are not stored, as they never have a position.
+    """
+
+    def __init__(self, trajectories: Mapping[str, Sequence[Keyframe]]) -> None:
+        """
+        Packs the given trajectories.
+
+        Args:
+            trajectories: Sorted keyframes per marker ID.
+        """
+        self.marker_ids: list[str] = [
+            marker_id
+            for marker_id, keyframes in trajectories.items()
+            if len(keyframes) >= 2
+        ]
+        self._index = {marker_id: i for i, marker_id in enumerate(self.marker_ids)}
+
+        counts = np.array(
+            [len(trajectories[marker_id]) for marker_id in self.marker_ids],
+            dtype=np.int64,
+        )
+        self._starts = np.zeros(len(counts), dtype=np.int64)
+        if len(counts):
+            self._starts[1:] = np.cumsum(counts)[:-1]
+        self._counts = counts
+
+        keyframes = [
+            kf for marker_id in self.marker_ids for kf in trajectories[marker_id]
+        ]
+        self._times = np.array([kf.t for kf in keyframes], dtype=np.float64)
+        self._xs = np.array([kf.x for kf in keyframes], dtype=np.float64)
+        self._ys = np.array([kf.y for kf in keyframes], dtype=np.float64)
+
+        self._distinct_times, ranks = np.unique(self._times, return_inverse=True)
+        self._stride = len(self._distinct_times) + 1
+        owners = np.repeat(np.arange(len(counts), dtype=np.int64), counts)
+        self._keys = owners * self._stride + ranks.astype(np.int64)
+        self._owner_base = np.arange(len(counts), dtype=np.int64) * self._stride
+
+    def __len__(self) -> int:
+        """Returns the number of stored trajectories."""
+        return len(self.marker_ids)
+
+    def index_of(self, marker_id: str) -> int | None:
+        """
+        Returns the row of a marker in the arrays from positions_at().
+
+        Args:
+            marker_id: The marker ID.
+
+        Returns:
+            The row index, or None if the marker has no stored trajectory.
+        """
+        return self._index.get(marker_id)
+
+    def positions_at(self, t: float) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Interpolates every stored trajectory at time t.
+
+        Args:
+            t: The time at which to calculate the positions.
+
+        Returns:
+            Tuple of (xs, ys) arrays, one row per entry of marker_ids.
+        """
+        if not self.marker_ids:
+            empty = np.empty(0, dtype=np.float64)
+            return empty, empty.copy()
+
+        # Rank of t among the distinct keyframe times, from either side
+        rank_left = int(np.searchsorted(self._distinct_times, t, side="left"))
+        rank_right = int(np.searchsorted(self._distinct_times, t, side="right"))
+
+        # bisect_left / bisect_right of t inside each trajectory, in one call
+        bounds = np.searchsorted(
+            self._keys,
+            np.concatenate(
+                (self._owner_base + rank_left, self._owner_base + rank_right)
+            ),
+            side="left",
+        )
+        count = len(self.marker_ids)
+        idx_left = bounds[:count] - self._starts
+        idx = bounds[count:] - self._starts
+        last = self._counts - 1
+
+        # Surrounding keyframes; before the first or after the last keyframe
+        # both collapse onto that keyframe (dt == 0), which clamps
+        start = self._starts + np.clip(idx - 1, 0, last)
+        end = self._starts + np.clip(idx, 0, last)
+        t0 = self._times[start]
+        dt = self._times[end] - t0
+        interior = (idx > 0) & (idx <= last) & (dt != 0)
+
+        alpha = np.zeros(count, dtype=np.float64)
+        np.divide(t - t0, dt, out=alpha, where=interior)
+        x0 = self._xs[start]
+        y0 = self._ys[start]
+        xs = np.where(interior, x0 + (self._xs[end] - x0) * alpha, x0)
+        ys = np.where(interior, y0 + (self._ys[end] - y0) * alpha, y0)
+
+        # Exact match on a keyframe: that keyframe's position (the first of
+        # coincident keyframes, as bisect_left finds it)
+        if rank_left < rank_right:
+            first_at_t = self._starts + np.minimum(idx_left, last)
+            exact = (idx_left <= last) & (
+                self._keys[first_at_t] == self._owner_base + rank_left
+            )
+            matched = first_at_t[exact]
+            xs[exact] = self._xs[matched]
+            ys[exact] = self._ys[matched]
+
+        return xs, ys
+
+
 def keyframes_to_mfjson(keyframes: list[Keyframe]) -> dict:
     """
     Serialize a list of Keyframes to an OGC MF-JSON MovingPoint structure.
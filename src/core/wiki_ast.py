@@ -9,9 +9,10 @@ with source position tracking for cursor synchronization.
 from __future__ import annotations
 
 import re
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, List, Optional, Tuple
+from typing import Any, Iterable, List, Optional, Tuple
 
 
 class NodeType(Enum):
@@ -82,6 +83,18 @@ class WikiNode:
         return "".join(child.get_text_content() for child in self.children)
 
 
+def _shift_spans(nodes: Iterable[WikiNode], delta: int, span_attr: str) -> None:
+    """Shift one kind of span (md_span or html_span) of subtrees by delta."""
+    stack = list(nodes)
+    while stack:
+        node = stack.pop()
+        span = getattr(node, span_attr)
+        if span is not None:
+            span.start += delta
+            span.end += delta
+        stack.extend(node.children)
+
+
 class WikiASTParser:
     """
     Parses Markdown text into a Wiki AST with source position tracking.
@@ -110,34 +123,88 @@ class WikiASTParser:
         )
 
         # Split into lines/paragraphs
-        lines = markdown.split("\n")
         pos = 0
+        for line in markdown.split("\n"):
+            node = self._parse_line(line, pos)
+            if node:
+                root.add_child(node)
+            pos += len(line) + 1  # +1 for newline
 
-        for line in lines:
-            line_start = pos
-            line_end = pos + len(line)
-
-            if not line.strip():
-                # Empty line - just a linebreak
-                if line:
-                    node = WikiNode(
-                        node_type=NodeType.LINEBREAK,
-                        md_span=SourceSpan(line_start, line_end),
-                    )
-                    root.add_child(node)
-            elif line.strip().startswith("#"):
-                # Heading
-                heading_node = self._parse_heading(line, line_start)
-                if heading_node:
-                    root.add_child(heading_node)
-            else:
-                # Paragraph
-                para_node = self._parse_paragraph(line, line_start)
-                root.add_child(para_node)
+        return root
 
-            pos = line_end + 1  # +1 for newline
+    def reparse(
+        self, root: WikiNode, old_markdown: str, new_markdown: str
+    ) -> Tuple[WikiNode, range]:
+        """
+        Update an AST after an edit, re-parsing only the changed lines.
 
-        return root
+        Blocks before and after the edited lines are kept (their Markdown
+        spans shifted by the change in length), so editing one paragraph of
+        a long article costs one paragraph of parsing.
+
+        Args:
+            root: Root node returned by parse() or reparse() for old_markdown.
+                Its md_spans must still be source positions, i.e. the tree
+                must not have been passed through to_markdown().
+            old_markdown: The Markdown source root was parsed from.
+            new_markdown: The edited Markdown source.
+
+        Returns:
+            Tuple of (updated_root, range of root.children re-parsed).
+        """
+        old_lines = old_markdown.split("\n")
+        new_lines = new_markdown.split("\n")
+        common = min(len(old_lines), len(new_lines))
+
+        prefix = 0
+        while prefix < common and old_lines[prefix] == new_lines[prefix]:
+            prefix += 1
+        suffix = 0
+        while (
+            suffix < common - prefix
+            and old_lines[-1 - suffix] == new_lines[-1 - suffix]
+        ):
+            suffix += 1
+
+        # Character range of the changed lines in the old source
+        start = sum(len(line) + 1 for line in old_lines[:prefix])
+        old_stop = len(old_markdown) + 1
+        old_stop -= sum(len(line) + 1 for line in old_lines[len(old_lines) - suffix :])
+
+        # Root children are in source order
+        starts = [child.md_span.start for child in root.children]
+        first = bisect_left(starts, start)
+        stop = bisect_left(starts, old_stop)
+
+        new_children: List[WikiNode] = []
+        pos = start
+        for line in new_lines[prefix : len(new_lines) - suffix]:
+            node = self._parse_line(line, pos)
+            if node:
+                new_children.append(node)
+            pos += len(line) + 1
+
+        delta = len(new_markdown) - len(old_markdown)
+        if delta:
+            _shift_spans(root.children[stop:], delta, "md_span")
+        root.children[first:stop] = new_children
+        root.md_span = SourceSpan(0, len(new_markdown))
+
+        return root, range(first, first + len(new_children))
+
+    def _parse_line(self, line: str, offset: int) -> Optional[WikiNode]:
+        """Parse one source line into a block node, if it produces one."""
+        if not line.strip():
+            # Empty line - just a linebreak
+            if line:
+                return WikiNode(
+                    node_type=NodeType.LINEBREAK,
+                    md_span=SourceSpan(offset, offset + len(line)),
+                )
+            return None
+        if line.strip().startswith("#"):
+            return self._parse_heading(line, offset)
+        return self._parse_paragraph(line, offset)
 
     def _parse_heading(self, line: str, offset: int) -> Optional[WikiNode]:
         """Parse a heading line."""
@@ -500,6 +567,36 @@ class WikiASTSerializer:
 
         return "".join(result), root
 
+    def update_plaintext(self, root: WikiNode, changed: range) -> WikiNode:
+        """
+        Update Plain Text spans after WikiASTParser.reparse().
+
+        Only the re-parsed blocks are serialized; the blocks after them are
+        shifted. The other blocks must have spans from an earlier
+        to_plaintext() or update_plaintext().
+
+        Args:
+            root: The root node returned by reparse().
+            changed: The range of re-parsed children returned by reparse().
+
+        Returns:
+            The root with updated spans.
+        """
+        children = root.children
+        pos = children[changed.start - 1].html_span.end + 1 if changed.start else 0
+
+        for i in changed:
+            _, pos = self._node_to_plaintext(children[i], pos)
+            if i < len(children) - 1:
+                pos += 1
+
+        if changed.stop < len(children):
+            delta = pos - children[changed.stop].html_span.start
+            if delta:
+                _shift_spans(children[changed.stop :], delta, "html_span")
+
+        return root
+
     def _node_to_plaintext(self, node: WikiNode, pos: int) -> Tuple[str, int]:
         """Convert a single node to Plain Text."""
         start_pos = pos
@@ -550,6 +647,10 @@ class WikiASTSerializer:
 class CursorMapper:
     """
     Maps cursor positions between Markdown and HTML using the AST.
+
+    Leaf spans are indexed by start position at construction, so each lookup
+    is a binary search. Overlapping spans (not produced by the parser and
+    serializers) fall back to a scan in document order.
     """
 
     def __init__(self, ast: WikiNode) -> None:
@@ -562,13 +663,60 @@ class CursorMapper:
         self.ast = ast
         self._leaf_nodes: List[WikiNode] = []
         self._collect_leaves(ast)
+        self._md_index = self._build_index("md_span")
+        self._html_index = self._build_index("html_span")
 
     def _collect_leaves(self, node: WikiNode) -> None:
         """Collect all leaf nodes (TEXT, WIKILINK) for mapping."""
-        if node.node_type in (NodeType.TEXT, NodeType.WIKILINK):
-            self._leaf_nodes.append(node)
-        for child in node.children:
-            self._collect_leaves(child)
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current.node_type in (NodeType.TEXT, NodeType.WIKILINK):
+                self._leaf_nodes.append(current)
+            stack.extend(reversed(current.children))
+
+    def _build_index(
+        self, span_attr: str
+    ) -> Optional[Tuple[List[int], List[int], List[WikiNode]]]:
+        """
+        Index leaves with non-empty spans by start position.
+
+        Returns:
+            Tuple of (starts, ends, nodes) sorted by start, or None if the
+            spans overlap.
+        """
+        entries = []
+        for node in self._leaf_nodes:
+            span = getattr(node, span_attr)
+            if span is not None and span.end > span.start:
+                entries.append((span.start, span.end, node))
+        entries.sort(key=lambda entry: entry[0])
+
+        starts = [entry[0] for entry in entries]
+        ends = [entry[1] for entry in entries]
+        if any(ends[i] > starts[i + 1] for i in range(len(entries) - 1)):
+            return None
+        return starts, ends, [entry[2] for entry in entries]
+
+    def _find_leaf(
+        self,
+        index: Optional[Tuple[List[int], List[int], List[WikiNode]]],
+        span_attr: str,
+        pos: int,
+    ) -> Optional[WikiNode]:
+        """Find the leaf whose span (md_span or html_span) contains pos."""
+        if index is None:
+            for node in self._leaf_nodes:
+                span = getattr(node, span_attr)
+                if span and span.contains(pos):
+                    return node
+            return None
+
+        starts, ends, nodes = index
+        i = bisect_right(starts, pos) - 1
+        if i >= 0 and pos < ends[i]:
+            return nodes[i]
+        return None
 
     def md_to_html(self, md_pos: int) -> int:
         """
@@ -580,32 +728,33 @@ class CursorMapper:
         Returns:
             Corresponding position in HTML.
         """
-        for node in self._leaf_nodes:
-            if node.md_span and node.md_span.contains(md_pos):
-                # Found the node containing the cursor
-                offset = node.md_span.offset_within(md_pos)
-                if node.html_span:
-                    # For links, we need to account for the tag
-                    if node.node_type == NodeType.WIKILINK:
-                        target = node.attributes.get("target", "")
-                        label = node.attributes.get("label", target)
-
-                        # Check if html_span includes tags or just text
-                        span_len = node.html_span.end - node.html_span.start
-                        if span_len == len(label):
-                            # Plain text mapping (no tags)
-                            return node.html_span.start + offset
-
-                        # HTML mapping (with tags)
-                        # Cursor is in the label portion
-                        # HTML: <a href="target">label</a>
-                        # The label starts after <a href="target">
-                        tag_prefix = f'<a href="{target}">'
-                        return node.html_span.start + len(tag_prefix) + offset
-
-                    return node.html_span.start + offset
-        # Fallback: return position clamped to end
-        return md_pos
+        node = self._find_leaf(self._md_index, "md_span", md_pos)
+        if node is None or node.md_span is None or node.html_span is None:
+            # Fallback: return position clamped to end
+            return md_pos
+
+        # Found the node containing the cursor
+        offset = node.md_span.offset_within(md_pos)
+
+        # For links, we need to account for the tag
+        if node.node_type == NodeType.WIKILINK:
+            target = node.attributes.get("target", "")
+            label = node.attributes.get("label", target)
+
+            # Check if html_span includes tags or just text
+            span_len = node.html_span.end - node.html_span.start
+            if span_len == len(label):
+                # Plain text mapping (no tags)
+                return node.html_span.start + offset
+
+            # HTML mapping (with tags)
+            # Cursor is in the label portion
+            # HTML: <a href="target">label</a>
+            # The label starts after <a href="target">
+            tag_prefix = f'<a href="{target}">'
+            return node.html_span.start + len(tag_prefix) + offset
+
+        return node.html_span.start + offset
 
     def html_to_md(self, html_pos: int) -> int:
         """
@@ -617,34 +766,34 @@ class CursorMapper:
         Returns:
             Corresponding position in Markdown.
         """
-        for node in self._leaf_nodes:
-            if node.html_span and node.html_span.contains(html_pos):
-                offset = node.html_span.offset_within(html_pos)
-                if node.md_span:
-                    if node.node_type == NodeType.WIKILINK:
-                        target = node.attributes.get("target", "")
-                        label = node.attributes.get("label", target)
-
-                        # Check if html_span includes tags or just text
-                        span_len = node.html_span.end - node.html_span.start
-                        if span_len == len(label):
-                            # Plain text mapping (no tags)
-                            effective_offset = offset
-                        else:
-                            # In HTML, cursor might be in the label
-                            tag_prefix = f'<a href="{target}">'
-                            effective_offset = offset - len(tag_prefix)
-
-                        if effective_offset < 0:
-                            effective_offset = 0
-
-                        # In MD: [[target|label]] or [[target]]
-                        # Label starts at position 2 + len(target) + 1 if has separator
-                        if target != label:
-                            label_start = 2 + len(target) + 1
-                        else:
-                            label_start = 2
-                        return node.md_span.start + label_start + effective_offset
-
-                    return node.md_span.start + offset
-        return html_pos
+        node = self._find_leaf(self._html_index, "html_span", html_pos)
+        if node is None or node.md_span is None or node.html_span is None:
+            return html_pos
+
+        offset = node.html_span.offset_within(html_pos)
+        if node.node_type == NodeType.WIKILINK:
+            target = node.attributes.get("target", "")
+            label = node.attributes.get("label", target)
+
+            # Check if html_span includes tags or just text
+            span_len = node.html_span.end - node.html_span.start
+            if span_len == len(label):
+                # Plain text mapping (no tags)
+                effective_offset = offset
+            else:
+                # In HTML, cursor might be in the label
+                tag_prefix = f'<a href="{target}">'
+                effective_offset = offset - len(tag_prefix)
+
+            if effective_offset < 0:
+                effective_offset = 0
+
+            # In MD: [[target|label]] or [[target]]
+            # Label starts at position 2 + len(target) + 1 if has separator
+            if target != label:
+                label_start = 2 + len(target) + 1
+            else:
+                label_start = 2
+            return node.md_span.start + label_start + effective_offset
+
+        return node.md_span.start + offset
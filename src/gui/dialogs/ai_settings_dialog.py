@@ -39,6 +39,7 @@ class AISettingsDialog(QDialog):
     """
 
     rebuild_index_requested = Signal(str)  # object_type ('entity', 'event', 'all')
+    rebuild_cancel_requested = Signal()  # Cancel the running rebuild
     index_status_requested = Signal()  # Request to refresh index status
 
     def __init__(self, parent: Optional[QWidget] = None) -> None:
@@ -130,8 +131,16 @@ class AISettingsDialog(QDialog):
         self.btn_rebuild.clicked.connect(self._on_rebuild_clicked)
         rebuild_layout.addWidget(self.btn_rebuild, stretch=1)
 
+        self.btn_cancel_rebuild = QPushButton("Cancel Rebuild")
+        self.btn_cancel_rebuild.setEnabled(False)
+        self.btn_cancel_rebuild.clicked.connect(self.rebuild_cancel_requested.emit)
+        rebuild_layout.addWidget(self.btn_cancel_rebuild, stretch=1)
+
         index_layout.addLayout(rebuild_layout)
 
+        self.lbl_rebuild_progress = QLabel("")
+        index_layout.addWidget(self.lbl_rebuild_progress)
+
         # Refresh button
         self.btn_refresh_status = QPushButton("Refresh Status")
         self.btn_refresh_status.clicked.connect(self.index_status_requested.emit)
@@ -763,3 +772,24 @@ class AISettingsDialog(QDialog):
         self.lbl_model.setText(f"Model: {model}")
         self.lbl_indexed_count.setText(f"Indexed: {counts}")
         self.lbl_last_indexed.setText(f"Last Updated: {last_updated}")
+
+    def set_rebuild_running(self, running: bool) -> None:
+        """
+        Update the rebuild controls for a starting or finished rebuild.
+
+        Args:
+            running: True while a rebuild is in progress.
+        """
+        self.btn_rebuild.setEnabled(not running)
+        self.btn_cancel_rebuild.setEnabled(running)
+        if running:
+            self.lbl_rebuild_progress.setText("Starting rebuild...")
+
+    def update_rebuild_progress(self, message: str) -> None:
+        """
+        Show rebuild progress (or its final outcome).
+
+        Args:
+            message: Progress text to display.
+        """
+        self.lbl_rebuild_progress.setText(message)
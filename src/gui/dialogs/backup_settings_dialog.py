@@ -41,6 +41,7 @@ BACKUP_WEEKLY_RETENTION_KEY = "backup_weekly_retention"
 BACKUP_MANUAL_RETENTION_KEY = "backup_manual_retention"
 BACKUP_VERIFY_AFTER_KEY = "backup_verify_after"
 BACKUP_VACUUM_BEFORE_KEY = "backup_vacuum_before"
+BACKUP_INCREMENTAL_KEY = "backup_incremental"
 BACKUP_CUSTOM_DIR_KEY = "backup_custom_dir"
 BACKUP_EXTERNAL_PATH_KEY = "backup_external_path"
 
@@ -126,6 +127,14 @@ class BackupSettingsDialog(QDialog):
         )
         layout.addRow(self.chk_vacuum)
 
+        # Incremental backups
+        self.chk_incremental = QCheckBox("Store backups incrementally")
+        self.chk_incremental.setToolTip(
+            "Keeps only the parts of the database that changed since earlier "
+            "backups, saving disk space"
+        )
+        layout.addRow(self.chk_incremental)
+
         parent_layout.addWidget(group)
 
     def _create_retention_section(self, parent_layout: QVBoxLayout) -> None:
@@ -311,6 +320,7 @@ class BackupSettingsDialog(QDialog):
         )
         settings.setValue(BACKUP_VERIFY_AFTER_KEY, self.chk_verify.isChecked())
         settings.setValue(BACKUP_VACUUM_BEFORE_KEY, self.chk_vacuum.isChecked())
+        settings.setValue(BACKUP_INCREMENTAL_KEY, self.chk_incremental.isChecked())
         settings.setValue(BACKUP_CUSTOM_DIR_KEY, self.edit_custom_dir.text().strip())
         settings.setValue(
             BACKUP_EXTERNAL_PATH_KEY, self.edit_external_path.text().strip()
@@ -347,6 +357,9 @@ class BackupSettingsDialog(QDialog):
         self.chk_vacuum.setChecked(
             settings.value(BACKUP_VACUUM_BEFORE_KEY, False, type=bool)
         )
+        self.chk_incremental.setChecked(
+            settings.value(BACKUP_INCREMENTAL_KEY, False, type=bool)
+        )
         self.edit_custom_dir.setText(settings.value(BACKUP_CUSTOM_DIR_KEY, ""))
         self.edit_external_path.setText(settings.value(BACKUP_EXTERNAL_PATH_KEY, ""))
 
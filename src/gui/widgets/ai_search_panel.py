@@ -282,11 +282,12 @@ class AISearchPanelWidget(QWidget):
         """
         Update UI to show search in progress.
 
+        The input stays enabled: searches run in the background and a new
+        query supersedes the one in progress.
+
         Args:
             searching: True if search is in progress.
         """
-        self.btn_search.setEnabled(not searching)
-        self.search_input.setEnabled(not searching)
         if searching:
             self.set_status("Searching...")
 
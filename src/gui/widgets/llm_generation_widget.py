@@ -125,7 +125,8 @@ def perform_rag_search(prompt: str, db_path: Optional[str], top_k: int = 3) -> s
         # Extract main topic from prompt? Or just use full prompt
         # For now, use first 100 chars or full prompt
         query_text = prompt[:200]
-        results = search_service.query(query_text, top_k=top_k)
+        # Hybrid ranking so exact name mentions are retrieved as well
+        results = search_service.query(query_text, top_k=top_k, hybrid=True)
 
         conn.close()
 
@@ -345,6 +345,9 @@ class LongformContentWidget(WikiTextEdit):
         """Initialize the content widget."""
         super().__init__(parent)
         self.setReadOnly(True)
+        # Item to scroll to once a background render is shown
+        self._pending_scroll_item: Optional[int] = None
+        self.render_finished.connect(self._scroll_to_pending_item)
 
     def load_content(self, sequence: List[Dict[str, Any]]) -> None:
         """
@@ -385,8 +388,18 @@ class LongformContentWidget(WikiTextEdit):
         Args:
             item_index: Index of the item in the sequence.
         """
+        if self.is_render_pending():
+            self._pending_scroll_item = item_index
+            return
         self.scrollToAnchor(f"item-{item_index}")
 
+    @Slot()
+    def _scroll_to_pending_item(self) -> None:
+        """Scrolls to the item requested while the document was rendering."""
+        item_index, self._pending_scroll_item = self._pending_scroll_item, None
+        if item_index is not None:
+            self.scrollToAnchor(f"item-{item_index}")
+
 
 class LongformEditorWidget(QWidget):
     """
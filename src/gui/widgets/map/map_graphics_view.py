@@ -6,10 +6,13 @@ Provides the MapGraphicsView class for rendering and interacting with the map.
 
 import json
 import logging
-from typing import Any, Callable, Dict, Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
 
+import numpy as np
 from PySide6.QtCore import (
     Property,
+    QCoreApplication,
     QPoint,
     QPointF,
     QPropertyAnimation,
@@ -67,6 +70,12 @@ from src.gui.widgets.map.coordinate_system import MapCoordinateSystem
 from src.gui.widgets.map.icon_picker_dialog import IconPickerDialog
 from src.gui.widgets.map.marker_item import MarkerItem
 from src.gui.widgets.map.scale_bar_painter import ScaleBarPainter
+from src.gui.widgets.map.tile_pyramid import (
+    TilePyramidWorker,
+    load_pyramid,
+    needs_pyramid,
+)
+from src.gui.widgets.map.tiled_map_item import TiledMapItem
 
 logger = logging.getLogger(__name__)
 
@@ -455,9 +464,21 @@ class MapGraphicsView(QGraphicsView):
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
 
         # Map and markers
-        self.pixmap_item: Optional[QGraphicsPixmapItem] = None
+        self.pixmap_item: Optional[Union[QGraphicsPixmapItem, TiledMapItem]] = None
         self.markers: Dict[str, MarkerItem] = {}
 
+        # Marker lore dates packed for temporal state updates (None = stale)
+        self._temporal_markers: list[MarkerItem] = []
+        self._temporal_dates: Optional[np.ndarray] = None
+        self._temporal_future = np.empty(0, dtype=bool)
+        self._temporal_past = np.empty(0, dtype=bool)
+
+        # Background tile pyramid builds, keyed by image path
+        self._pyramid_workers: Dict[str, TilePyramidWorker] = {}
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.stop_tile_pyramid_builds)
+
         # Theme
         self.tm = ThemeManager()
         self.tm.theme_changed.connect(self._update_theme)
@@ -504,6 +525,10 @@ class MapGraphicsView(QGraphicsView):
         """
         Loads a map image into the view.
 
+        Large maps with a built tile pyramid are drawn tile by tile; a large
+        map without one is shown as a single pixmap while its pyramid is
+        built in the background for the next time it is opened.
+
         Args:
             image_path: Path to the image file.
 
@@ -511,18 +536,27 @@ class MapGraphicsView(QGraphicsView):
             bool: True if successful, False otherwise.
         """
         try:
-            pixmap = QPixmap(image_path)
-            if pixmap.isNull():
-                logger.error(f"Failed to load map image: {image_path}")
-                return False
+            info = load_pyramid(Path(image_path))
+            if info is not None:
+                map_item = TiledMapItem(info)
+                if map_item.pixmap().isNull():
+                    logger.warning(f"Unreadable tile pyramid for: {image_path}")
+                    info = None
+
+            if info is None:
+                pixmap = QPixmap(image_path)
+                if pixmap.isNull():
+                    logger.error(f"Failed to load map image: {image_path}")
+                    return False
+                map_item = QGraphicsPixmapItem(pixmap)
+                self.build_tile_pyramid(image_path)
 
             # Clear existing map
             if self.pixmap_item:
                 self.scene.removeItem(self.pixmap_item)
 
             # Add new map
-            # Add new map
-            self.pixmap_item = QGraphicsPixmapItem(pixmap)
+            self.pixmap_item = map_item
             self.pixmap_item.setZValue(LAYER_MAP_BG)
             self.scene.addItem(self.pixmap_item)
 
@@ -540,6 +574,42 @@ class MapGraphicsView(QGraphicsView):
             logger.error(f"Error loading map: {e}")
             return False
 
+    def build_tile_pyramid(self, image_path: str) -> None:
+        """
+        Starts building a map's tile pyramid in the background.
+
+        Does nothing for maps small enough to show as one pixmap, or if a
+        current pyramid exists or a build is running.
+
+        Args:
+            image_path: Path to the map image.
+        """
+        if image_path in self._pyramid_workers:
+            return
+        if not needs_pyramid(Path(image_path)):
+            return
+        if load_pyramid(Path(image_path)) is not None:
+            return
+
+        worker = TilePyramidWorker(image_path)
+        worker.finished.connect(lambda: self._on_pyramid_worker_finished(image_path))
+        self._pyramid_workers[image_path] = worker
+        worker.start(TilePyramidWorker.Priority.LowPriority)
+        logger.info(f"Building tile pyramid for: {image_path}")
+
+    def _on_pyramid_worker_finished(self, image_path: str) -> None:
+        """Releases a finished pyramid build."""
+        worker = self._pyramid_workers.pop(image_path, None)
+        if worker is not None:
+            worker.deleteLater()
+
+    def stop_tile_pyramid_builds(self) -> None:
+        """Cancels running pyramid builds and waits for their threads."""
+        for worker in list(self._pyramid_workers.values()):
+            worker.requestInterruption()
+            worker.wait()
+        self._pyramid_workers.clear()
+
     def resizeEvent(self, event: QResizeEvent) -> None:
         """
         Handle resize events.
@@ -645,6 +715,7 @@ class MapGraphicsView(QGraphicsView):
         # Add to scene and track
         self.scene.addItem(marker)
         self.markers[marker_id] = marker
+        self._temporal_dates = None
 
         # Connect click signal
         marker.clicked.connect(self.marker_clicked.emit)
@@ -664,6 +735,20 @@ class MapGraphicsView(QGraphicsView):
         # Remove spammy log
         # logger.debug(f"Updated marker {marker_id} to normalized ({x:.3f}, {y:.3f})")
 
+    def update_marker_label(
+        self,
+        marker_id: str,
+        label: str,
+        description: Optional[str] = None,
+        lore_date: Optional[float] = None,
+    ) -> None:
+        """
+        Updates a marker's label, tooltip and lore date in place.
+        """
+        if marker_id in self.markers:
+            self.markers[marker_id].set_label(label, description, lore_date)
+            self._temporal_dates = None
+
     def remove_marker(self, marker_id: str) -> None:
         """
         Removes a marker from the map.
@@ -671,6 +756,7 @@ class MapGraphicsView(QGraphicsView):
         if marker_id in self.markers:
             self.scene.removeItem(self.markers[marker_id])
             del self.markers[marker_id]
+            self._temporal_dates = None
             logger.debug(f"Removed marker {marker_id}")
 
     def clear_markers(self) -> None:
@@ -678,33 +764,54 @@ class MapGraphicsView(QGraphicsView):
         for marker in list(self.markers.values()):
             self.scene.removeItem(marker)
         self.markers.clear()
+        self._temporal_dates = None
 
     def update_markers_temporal_state(
         self, playhead_time: float, current_time: float
     ) -> None:
         """
         Updates the temporal visual state of all markers based on time.
+
+        States are computed for all markers at once; only markers whose
+        state changed since the last update are touched.
         """
-        for marker in self.markers.values():
-            if marker.lore_date is None:
-                # Timeless entities are always present/vivid
-                marker.set_temporal_state(is_future=False, is_past=False)
-                continue
-
-            # Determine State
-            # "Future": It hasn't happened yet in the playback.
-            # Usually, playhead is the view into history.
-            # If playhead < event_date, it's future relative to view.
-            is_future = marker.lore_date > playhead_time
-
-            # We use the Playhead as the primary visibility filter for
-            # "replaying history". Markers in the future of the playhead
-            # are considered "Not yet happened".
-
-            # Is Past: It has already happened.
-            is_past = marker.lore_date <= playhead_time
-
-            marker.set_temporal_state(is_future=is_future, is_past=is_past)
+        if self._temporal_dates is None:
+            # Timeless markers (no lore date) get NaN, which compares False
+            # both ways: always present/vivid
+            self._temporal_markers = list(self.markers.values())
+            self._temporal_dates = np.array(
+                [
+                    np.nan if marker.lore_date is None else marker.lore_date
+                    for marker in self._temporal_markers
+                ],
+                dtype=np.float64,
+            )
+            applied = None
+        else:
+            applied = (self._temporal_future, self._temporal_past)
+
+        # "Future": It hasn't happened yet in the playback.
+        # We use the Playhead as the primary visibility filter for
+        # "replaying history". Markers in the future of the playhead
+        # are considered "Not yet happened".
+        is_future = self._temporal_dates > playhead_time
+
+        # Is Past: It has already happened.
+        is_past = self._temporal_dates <= playhead_time
+
+        if applied is None:
+            changed = np.arange(len(self._temporal_markers))
+        else:
+            changed = np.flatnonzero(
+                (is_future != applied[0]) | (is_past != applied[1])
+            )
+        for i in changed:
+            self._temporal_markers[i].set_temporal_state(
+                is_future=bool(is_future[i]), is_past=bool(is_past[i])
+            )
+
+        self._temporal_future = is_future
+        self._temporal_past = is_past
 
     def _normalized_to_scene(self, x: float, y: float) -> QPointF:
         """
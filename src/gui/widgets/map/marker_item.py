@@ -157,6 +157,26 @@ class MarkerItem(QGraphicsObject):
         y = (self.MARKER_SIZE / 2) + 2  # 2px padding
         self._label_item.setPos(x, y)
 
+    def set_label(
+        self,
+        label: str,
+        description: Optional[str] = None,
+        lore_date: Optional[float] = None,
+    ) -> None:
+        """
+        Updates the label, tooltip and lore date of the marker.
+
+        Args:
+            label: New label text.
+            description: Optional description for tooltip.
+            lore_date: Optional lore timestamp for temporal filtering.
+        """
+        self.label = label
+        self.lore_date = lore_date
+        self.setToolTip(description or label)
+        self._label_item.setText(label)
+        self._update_label_position()
+
     def _load_icon(self, icon_name: Optional[str]) -> None:
         """
         Loads an SVG icon for the marker.
@@ -0,0 +1,353 @@
+"""
+Map Tile Pyramid Module.
+
+Builds and describes multi-resolution tile pyramids for large map images.
+
+A pyramid lives next to its source image in the world's assets folder, as
+``<image stem>.tiles/``. Level 0 holds the image at full resolution cut into
+TILE_SIZE x TILE_SIZE tiles; each further level halves the resolution until
+the whole map fits in a single tile. ``pyramid.json`` records the image size
+and the source file's size and mtime, so a pyramid is ignored once the
+source image changes.
+
+Building uses QImage only, so it is safe to run off the GUI thread.
+"""
+
+import json
+import logging
+import math
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+from PySide6.QtCore import QRect, QSize, Qt, QThread, Signal
+from PySide6.QtGui import QImageReader
+
+logger = logging.getLogger(__name__)
+
+TILE_SIZE = 256
+TILE_FORMAT = "png"
+PYRAMID_VERSION = 1
+PYRAMID_INFO_FILE = "pyramid.json"
+
+# Maps smaller than this on both sides are cheap enough to show as one pixmap
+TILED_MAP_MIN_SIDE = 4096
+
+
+def pyramid_dir(image_path: Path) -> Path:
+    """
+    Returns the directory holding an image's tile pyramid.
+
+    Args:
+        image_path: Path to the source map image.
+
+    Returns:
+        Path: ``<image dir>/<image stem>.tiles``.
+    """
+    image_path = Path(image_path)
+    return image_path.parent / f"{image_path.stem}.tiles"
+
+
+def level_count(width: int, height: int, tile_size: int = TILE_SIZE) -> int:
+    """
+    Returns the number of pyramid levels for an image size.
+
+    Args:
+        width: Image width in pixels.
+        height: Image height in pixels.
+        tile_size: Tile edge length in pixels.
+
+    Returns:
+        int: Levels needed until the image fits in one tile.
+    """
+    longest = max(width, height, 1)
+    if longest <= tile_size:
+        return 1
+    return 1 + math.ceil(math.log2(longest / tile_size))
+
+
+@dataclass
+class PyramidInfo:
+    """
+    Description of a built tile pyramid.
+
+    Attributes:
+        root: Directory holding the pyramid.
+        width: Full-resolution image width in pixels.
+        height: Full-resolution image height in pixels.
+        tile_size: Tile edge length in pixels.
+        levels: Number of levels; level 0 is full resolution.
+        source_size: Size of the source image file in bytes.
+        source_mtime_ns: Modification time of the source image file.
+    """
+
+    root: Path
+    width: int
+    height: int
+    tile_size: int
+    levels: int
+    source_size: int
+    source_mtime_ns: int
+
+    def level_size(self, level: int) -> QSize:
+        """
+        Returns the image size at a level.
+
+        Args:
+            level: Pyramid level.
+
+        Returns:
+            QSize: Width and height in that level's pixels.
+        """
+        scale = 1 << level
+        return QSize(
+            max(1, math.ceil(self.width / scale)),
+            max(1, math.ceil(self.height / scale)),
+        )
+
+    def tile_grid(self, level: int) -> tuple[int, int]:
+        """
+        Returns the number of tile columns and rows at a level.
+
+        Args:
+            level: Pyramid level.
+
+        Returns:
+            tuple[int, int]: (columns, rows).
+        """
+        size = self.level_size(level)
+        return (
+            math.ceil(size.width() / self.tile_size),
+            math.ceil(size.height() / self.tile_size),
+        )
+
+    def tile_path(self, level: int, col: int, row: int) -> Path:
+        """
+        Returns the file path of a tile.
+
+        Args:
+            level: Pyramid level.
+            col: Tile column.
+            row: Tile row.
+
+        Returns:
+            Path: Path to the tile image.
+        """
+        return self.root / str(level) / f"{col}_{row}.{TILE_FORMAT}"
+
+    def to_dict(self) -> dict:
+        """
+        Converts the info to a dictionary for JSON serialization.
+
+        Returns:
+            dict: Dictionary representation (without the root path).
+        """
+        return {
+            "version": PYRAMID_VERSION,
+            "width": self.width,
+            "height": self.height,
+            "tile_size": self.tile_size,
+            "levels": self.levels,
+            "source_size": self.source_size,
+            "source_mtime_ns": self.source_mtime_ns,
+        }
+
+    @classmethod
+    def from_dict(cls, root: Path, data: dict) -> "PyramidInfo":
+        """
+        Creates a PyramidInfo from a dictionary.
+
+        Args:
+            root: Directory holding the pyramid.
+            data: Dictionary from ``pyramid.json``.
+
+        Returns:
+            PyramidInfo: A new PyramidInfo instance.
+        """
+        return cls(
+            root=root,
+            width=data["width"],
+            height=data["height"],
+            tile_size=data["tile_size"],
+            levels=data["levels"],
+            source_size=data["source_size"],
+            source_mtime_ns=data["source_mtime_ns"],
+        )
+
+
+def load_pyramid(image_path: Path) -> Optional[PyramidInfo]:
+    """
+    Loads the pyramid of an image if one is built and current.
+
+    Args:
+        image_path: Path to the source map image.
+
+    Returns:
+        Optional[PyramidInfo]: The pyramid, or None if missing or stale.
+    """
+    image_path = Path(image_path)
+    info_path = pyramid_dir(image_path) / PYRAMID_INFO_FILE
+    try:
+        with open(info_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != PYRAMID_VERSION:
+            return None
+        info = PyramidInfo.from_dict(info_path.parent, data)
+        stat = image_path.stat()
+    except (OSError, ValueError, KeyError):
+        return None
+
+    if info.source_size != stat.st_size or info.source_mtime_ns != stat.st_mtime_ns:
+        logger.debug(f"Tile pyramid for {image_path.name} is stale")
+        return None
+    return info
+
+
+def needs_pyramid(image_path: Path) -> bool:
+    """
+    Checks whether an image is large enough to be shown through tiles.
+
+    Only the image header is read.
+
+    Args:
+        image_path: Path to the source map image.
+
+    Returns:
+        bool: True if either side is at least TILED_MAP_MIN_SIDE pixels.
+    """
+    size = QImageReader(str(image_path)).size()
+    return max(size.width(), size.height()) >= TILED_MAP_MIN_SIDE
+
+
+def build_pyramid(
+    image_path: Path,
+    tile_size: int = TILE_SIZE,
+    is_cancelled: Optional[Callable[[], bool]] = None,
+) -> Optional[PyramidInfo]:
+    """
+    Builds the tile pyramid of an image.
+
+    Tiles are written to a temporary directory that replaces the previous
+    pyramid only once every level is complete.
+
+    Args:
+        image_path: Path to the source map image.
+        tile_size: Tile edge length in pixels.
+        is_cancelled: Optional callable polled between tiles; returning True
+            aborts the build.
+
+    Returns:
+        Optional[PyramidInfo]: The built pyramid, or None if cancelled.
+
+    Raises:
+        ValueError: If the image cannot be read.
+    """
+    image_path = Path(image_path)
+    stat = image_path.stat()
+
+    reader = QImageReader(str(image_path))
+    size = reader.size()
+    # Qt refuses decodes above its allocation limit (256 MB by default). The
+    # limit is process-wide, so it is only raised for this one decode.
+    needed_mb = size.width() * size.height() * 4 // (1024 * 1024) + 1
+    limit_mb = QImageReader.allocationLimit()
+    raise_limit = bool(limit_mb) and limit_mb < needed_mb
+    if raise_limit:
+        QImageReader.setAllocationLimit(needed_mb)
+    try:
+        image = reader.read()
+    finally:
+        if raise_limit:
+            QImageReader.setAllocationLimit(limit_mb)
+    if image.isNull():
+        raise ValueError(f"Cannot read map image {image_path}: {reader.errorString()}")
+
+    final_dir = pyramid_dir(image_path)
+    temp_dir = final_dir.with_name(f".{final_dir.name}.tmp")
+    if temp_dir.exists():
+        shutil.rmtree(temp_dir)
+
+    info = PyramidInfo(
+        root=temp_dir,
+        width=image.width(),
+        height=image.height(),
+        tile_size=tile_size,
+        levels=level_count(image.width(), image.height(), tile_size),
+        source_size=stat.st_size,
+        source_mtime_ns=stat.st_mtime_ns,
+    )
+
+    try:
+        for level in range(info.levels):
+            if level > 0:
+                level_size = info.level_size(level)
+                image = image.scaled(
+                    level_size,
+                    Qt.AspectRatioMode.IgnoreAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation,
+                )
+            (temp_dir / str(level)).mkdir(parents=True)
+
+            cols, rows = info.tile_grid(level)
+            for row in range(rows):
+                for col in range(cols):
+                    if is_cancelled is not None and is_cancelled():
+                        shutil.rmtree(temp_dir)
+                        return None
+                    rect = QRect(col * tile_size, row * tile_size, tile_size, tile_size)
+                    tile = image.copy(rect.intersected(image.rect()))
+                    if not tile.save(str(info.tile_path(level, col, row))):
+                        raise OSError(f"Failed to write map tile {level}/{col}_{row}")
+
+        with open(temp_dir / PYRAMID_INFO_FILE, "w", encoding="utf-8") as f:
+            json.dump(info.to_dict(), f, indent=2)
+
+        if final_dir.exists():
+            shutil.rmtree(final_dir)
+        temp_dir.rename(final_dir)
+    except Exception:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        raise
+
+    info.root = final_dir
+    logger.info(
+        f"Built tile pyramid for {image_path.name}: "
+        f"{info.width}x{info.height}, {info.levels} levels"
+    )
+    return info
+
+
+class TilePyramidWorker(QThread):
+    """
+    Worker thread building a tile pyramid.
+
+    Building a pyramid for a 16k map takes seconds, so it runs in background
+    and the map is shown as a single pixmap until it is done.
+    """
+
+    pyramid_ready = Signal(str)  # image path
+    pyramid_failed = Signal(str, str)  # image path, error message
+
+    def __init__(self, image_path: str) -> None:
+        """
+        Initializes the worker.
+
+        Args:
+            image_path: Path to the source map image.
+        """
+        super().__init__()
+        self.image_path = image_path
+
+    def run(self) -> None:
+        """Builds the pyramid in the background thread."""
+        try:
+            info = build_pyramid(
+                Path(self.image_path), is_cancelled=self.isInterruptionRequested
+            )
+        except Exception as e:
+            logger.error(f"Failed to build tile pyramid: {e}", exc_info=True)
+            self.pyramid_failed.emit(self.image_path, str(e))
+            return
+        if info is not None:
+            self.pyramid_ready.emit(self.image_path)
@@ -0,0 +1,266 @@
+"""
+Tiled Map Item Module.
+
+Provides a graphics item drawing a map from its tile pyramid.
+
+Only the tiles intersecting the exposed area are drawn, taken from the
+pyramid level matching the current zoom. Decoded tiles are kept in an LRU
+cache. Each paint loads a bounded number of missing tiles and fills the
+rest from coarser cached levels, scheduling another paint until the view is
+complete, so panning never blocks on a full screen of tile decodes.
+"""
+
+import logging
+import math
+from collections import OrderedDict
+from typing import Optional, Set, Tuple
+
+from PySide6.QtCore import QRectF, QTimer
+from PySide6.QtGui import QPainter, QPixmap
+from PySide6.QtWidgets import (
+    QGraphicsItem,
+    QGraphicsObject,
+    QStyleOptionGraphicsItem,
+    QWidget,
+)
+
+from src.gui.widgets.map.tile_pyramid import PyramidInfo
+
+logger = logging.getLogger(__name__)
+
+TileKey = Tuple[int, int, int]  # level, column, row
+
+# 256 tiles of 256x256 ARGB are 64 MB
+DEFAULT_TILE_CACHE_SIZE = 256
+MAX_TILE_LOADS_PER_PAINT = 12
+
+
+class TileCache:
+    """
+    Least-recently-used cache of decoded tile pixmaps.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_TILE_CACHE_SIZE) -> None:
+        """
+        Initializes the cache.
+
+        Args:
+            capacity: Maximum number of tiles to keep.
+        """
+        self.capacity = capacity
+        self._tiles: "OrderedDict[TileKey, QPixmap]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """Returns the number of cached tiles."""
+        return len(self._tiles)
+
+    def __contains__(self, key: TileKey) -> bool:
+        """Returns whether a tile is cached, without touching its recency."""
+        return key in self._tiles
+
+    def get(self, key: TileKey) -> Optional[QPixmap]:
+        """
+        Returns a cached tile and marks it as recently used.
+
+        Args:
+            key: (level, column, row) of the tile.
+
+        Returns:
+            Optional[QPixmap]: The tile, or None if not cached.
+        """
+        pixmap = self._tiles.get(key)
+        if pixmap is not None:
+            self._tiles.move_to_end(key)
+        return pixmap
+
+    def put(self, key: TileKey, pixmap: QPixmap) -> None:
+        """
+        Caches a tile, evicting the least recently used ones over capacity.
+
+        Args:
+            key: (level, column, row) of the tile.
+            pixmap: The decoded tile.
+        """
+        self._tiles[key] = pixmap
+        self._tiles.move_to_end(key)
+        while len(self._tiles) > self.capacity:
+            self._tiles.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drops all cached tiles."""
+        self._tiles.clear()
+
+
+class TiledMapItem(QGraphicsObject):
+    """
+    Graphics item showing a map image through its tile pyramid.
+
+    The item's coordinates are full-resolution image pixels, exactly like a
+    QGraphicsPixmapItem of the source image, so markers and the coordinate
+    system work unchanged.
+    """
+
+    def __init__(
+        self,
+        info: PyramidInfo,
+        cache: Optional[TileCache] = None,
+        parent: Optional[QGraphicsItem] = None,
+    ) -> None:
+        """
+        Initializes the item and loads the single-tile overview level.
+
+        Args:
+            info: The pyramid to draw.
+            cache: Tile cache to use (a private one if not given).
+            parent: Optional parent item.
+        """
+        super().__init__(parent)
+        self.info = info
+        self.cache = cache if cache is not None else TileCache()
+        self._bounds = QRectF(0, 0, info.width, info.height)
+        self._top_level = info.levels - 1
+        self._overview = QPixmap(str(info.tile_path(self._top_level, 0, 0)))
+        self._update_pending = False
+        self._broken: Set[TileKey] = set()
+
+        # exposedRect is only filled in with the extended style option
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption)
+
+    def boundingRect(self) -> QRectF:
+        """Returns the full-resolution map rectangle."""
+        return self._bounds
+
+    def pixmap(self) -> QPixmap:
+        """
+        Returns the overview pixmap.
+
+        Mirrors QGraphicsPixmapItem.pixmap() for code that only checks that
+        a map is loaded.
+
+        Returns:
+            QPixmap: The whole map at the coarsest level.
+        """
+        return self._overview
+
+    def level_for_scale(self, scale: float) -> int:
+        """
+        Picks the coarsest level that still has a pixel per screen pixel.
+
+        Args:
+            scale: Screen pixels per full-resolution map pixel.
+
+        Returns:
+            int: Pyramid level to draw.
+        """
+        if scale <= 0:
+            return self._top_level
+        level = math.floor(math.log2(1.0 / scale)) if scale < 1.0 else 0
+        return max(0, min(self._top_level, level))
+
+    def _tile_rect(self, level: int, col: int, row: int) -> QRectF:
+        """Returns the item-space rectangle covered by a tile."""
+        span = self.info.tile_size * (1 << level)
+        return QRectF(col * span, row * span, span, span).intersected(self._bounds)
+
+    def _tile(self, level: int, col: int, row: int, load: bool) -> Optional[QPixmap]:
+        """Returns a tile from the cache, loading it from disk if allowed."""
+        if level == self._top_level:
+            return self._overview
+        key = (level, col, row)
+        pixmap = self.cache.get(key)
+        if pixmap is None and load:
+            pixmap = QPixmap(str(self.info.tile_path(level, col, row)))
+            if pixmap.isNull():
+                logger.warning(f"Missing map tile {level}/{col}_{row}")
+                self._broken.add(key)
+                return None
+            self.cache.put(key, pixmap)
+        return pixmap
+
+    def _draw_from_level(
+        self, painter: QPainter, target: QRectF, level: int, col: int, row: int
+    ) -> bool:
+        """Draws the part of a tile covering target; False if not cached."""
+        pixmap = self._tile(level, col, row, load=False)
+        if pixmap is None:
+            return False
+        scale = 1 << level
+        span = self.info.tile_size * scale
+        source = QRectF(
+            (target.left() - col * span) / scale,
+            (target.top() - row * span) / scale,
+            target.width() / scale,
+            target.height() / scale,
+        )
+        painter.drawPixmap(target, pixmap, source)
+        return True
+
+    def _draw_fallback(
+        self, painter: QPainter, target: QRectF, level: int, col: int, row: int
+    ) -> None:
+        """Draws a missing tile's area from the nearest coarser cached level."""
+        for coarser in range(level + 1, self._top_level + 1):
+            shift = coarser - level
+            if self._draw_from_level(
+                painter, target, coarser, col >> shift, row >> shift
+            ):
+                return
+
+    def _schedule_update(self) -> None:
+        """Requests another paint to load the tiles still missing."""
+        if not self._update_pending:
+            self._update_pending = True
+            QTimer.singleShot(0, self, self._continue_loading)
+
+    def _continue_loading(self) -> None:
+        """Repaints after a deferred tile load."""
+        self._update_pending = False
+        self.update()
+
+    def paint(
+        self,
+        painter: QPainter,
+        option: QStyleOptionGraphicsItem,
+        widget: Optional[QWidget] = None,
+    ) -> None:
+        """
+        Draws the visible tiles at the level matching the zoom.
+
+        Args:
+            painter: The painter.
+            option: Style options; exposedRect limits the tiles drawn.
+            widget: The widget being painted on.
+        """
+        exposed = option.exposedRect.intersected(self._bounds)
+        if exposed.isEmpty():
+            return
+
+        scale = option.levelOfDetailFromTransform(painter.worldTransform())
+        if widget is not None:
+            scale *= widget.devicePixelRatioF()
+        level = self.level_for_scale(scale)
+
+        span = self.info.tile_size * (1 << level)
+        cols, rows = self.info.tile_grid(level)
+        first_col = max(0, int(exposed.left() // span))
+        last_col = min(cols - 1, int(math.ceil(exposed.right() / span)) - 1)
+        first_row = max(0, int(exposed.top() // span))
+        last_row = min(rows - 1, int(math.ceil(exposed.bottom() / span)) - 1)
+
+        loads_left = MAX_TILE_LOADS_PER_PAINT
+        missing = False
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                target = self._tile_rect(level, col, row)
+                if self._tile(level, col, row, load=False) is None:
+                    key = (level, col, row)
+                    if loads_left > 0 and key not in self._broken:
+                        loads_left -= 1
+                        self._tile(level, col, row, load=True)
+                    if not self._draw_from_level(painter, target, level, col, row):
+                        missing = missing or key not in self._broken
+                        self._draw_fallback(painter, target, level, col, row)
+                    continue
+                self._draw_from_level(painter, target, level, col, row)
+        if missing:
+            self._schedule_update()
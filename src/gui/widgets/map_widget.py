@@ -13,8 +13,9 @@ maintainability:
 
 import logging
 import os
-from typing import Iterator, List, Optional, Tuple
+from typing import List, Optional
 
+import numpy as np
 from PySide6.QtCore import QSettings, Qt, Signal, Slot
 from PySide6.QtGui import QKeyEvent, QResizeEvent
 from PySide6.QtWidgets import (
@@ -31,7 +32,7 @@ from PySide6.QtWidgets import (
 )
 
 from src.core.paths import get_resource_path
-from src.core.trajectory import KEYFRAME_TIME_EPSILON, interpolate_position
+from src.core.trajectory import KEYFRAME_TIME_EPSILON, TrajectoryStore
 from src.gui.widgets.map.map_graphics_view import MapGraphicsView
 from src.gui.widgets.map.marker_item import MarkerItem
 
@@ -219,6 +220,10 @@ class MapWidget(QWidget):
         self._current_time: float = 0.0  # Story's "Now" time from Timeline
 
         self._active_trajectories: dict[str, list] = {}  # marker_id -> list[Keyframe]
+        self._trajectory_store = TrajectoryStore({})
+        # Positions last pushed to the view per store row (NaN = unknown)
+        self._shown_xs = np.empty(0)
+        self._shown_ys = np.empty(0)
         self._selected_marker_id: Optional[str] = None
         self._transient_marker_ids: set[str] = set()  # Markers currently being dragged
 
@@ -268,6 +273,8 @@ class MapWidget(QWidget):
         for marker_id, _, keyframes in trajectories:
             self._active_trajectories[marker_id] = keyframes
             count += 1
+        self._trajectory_store = TrajectoryStore(self._active_trajectories)
+        self._forget_shown_position()
 
         # Detect first trajectory use for animation
         settings = QSettings()
@@ -327,26 +334,48 @@ class MapWidget(QWidget):
         logger.info(f"Adding keyframe for {marker_id} at t={t}: ({x:.3f}, {y:.3f})")
         self._emit_keyframe_upsert(marker_id, t, x, y, is_add=True)
 
-    def _iter_trajectory_positions(self) -> Iterator[Tuple[str, float, float]]:
-        """Yield (marker_id, x, y) for markers with trajectories at current time."""
-        for marker_id, keyframes in self._active_trajectories.items():
-            position = interpolate_position(keyframes, self._playhead_time)
-            if position:
-                x, y = position
-                yield marker_id, x, y
+    def _forget_shown_position(self, marker_id: Optional[str] = None) -> None:
+        """
+        Marks trajectory positions as unknown so the next update pushes them.
+
+        Args:
+            marker_id: Marker whose position changed outside trajectory
+                updates, or None for all markers.
+        """
+        if marker_id is None:
+            self._shown_xs = np.full(len(self._trajectory_store), np.nan)
+            self._shown_ys = np.full(len(self._trajectory_store), np.nan)
+            return
+        row = self._trajectory_store.index_of(marker_id)
+        if row is not None:
+            self._shown_xs[row] = np.nan
+            self._shown_ys[row] = np.nan
 
     def _update_trajectory_positions(self, force_all: bool = False) -> None:
         """
         Updates all trajectory-based markers for the current playhead time.
 
+        All trajectories are interpolated in one batched call; only markers
+        whose position changed since the last update are moved in the scene.
+
         Args:
             force_all: If True, even markers in transient state are snapped back.
         """
-        for marker_id, x, y in self._iter_trajectory_positions():
+        store = self._trajectory_store
+        if not len(store):
+            return
+
+        xs, ys = store.positions_at(self._playhead_time)
+        changed = (xs != self._shown_xs) | (ys != self._shown_ys)
+        for row in np.flatnonzero(changed):
+            marker_id = store.marker_ids[row]
             if not force_all and marker_id in self._transient_marker_ids:
                 logger.debug(f"Skipping update for transient marker {marker_id}")
                 continue
+            x, y = float(xs[row]), float(ys[row])
             self.view.update_marker_position(marker_id, x, y)
+            self._shown_xs[row] = x
+            self._shown_ys[row] = y
 
     @Slot(float)
     def on_time_changed(self, time: float) -> None:
@@ -554,6 +583,15 @@ class MapWidget(QWidget):
         """
         return self.view.load_map(image_path)
 
+    def build_tile_pyramid(self, image_path: str) -> None:
+        """
+        Starts building the tile pyramid of a large map in the background.
+
+        Args:
+            image_path: Path to the image file.
+        """
+        self.view.build_tile_pyramid(image_path)
+
     def add_marker(
         self,
         marker_id: str,
@@ -582,6 +620,7 @@ class MapWidget(QWidget):
         self.view.add_marker(
             marker_id, object_type, label, x, y, icon, color, description, lore_date
         )
+        self._forget_shown_position(marker_id)
 
     def update_marker_position(self, marker_id: str, x: float, y: float) -> None:
         """
@@ -593,6 +632,25 @@ class MapWidget(QWidget):
             y: Normalized Y coordinate.
         """
         self.view.update_marker_position(marker_id, x, y)
+        self._forget_shown_position(marker_id)
+
+    def update_marker_label(
+        self,
+        marker_id: str,
+        label: str,
+        description: Optional[str] = None,
+        lore_date: Optional[float] = None,
+    ) -> None:
+        """
+        Updates a marker's label and tooltip without re-creating it.
+
+        Args:
+            marker_id: Unique identifier for the marker.
+            label: New label text.
+            description: Optional description for tooltip.
+            lore_date: Optional lore timestamp for temporal filtering.
+        """
+        self.view.update_marker_label(marker_id, label, description, lore_date)
 
     def remove_marker(self, marker_id: str) -> None:
         """
@@ -602,10 +660,12 @@ class MapWidget(QWidget):
             marker_id: ID of the marker to remove.
         """
         self.view.remove_marker(marker_id)
+        self._forget_shown_position(marker_id)
 
     def clear_markers(self) -> None:
         """Removes all markers from the map."""
         self.view.clear_markers()
+        self._forget_shown_position()
 
     def _configure_map_width(self) -> None:
         """Opens a dialog to configure the real-world width of the map."""
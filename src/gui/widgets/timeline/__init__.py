@@ -127,6 +127,10 @@ class TimelineWidget(QWidget):
         """Passes the event list to the view."""
         self.view.set_events(events)
 
+    def apply_event_changes(self, upserted: list, deleted_ids: list) -> None:
+        """Passes changed and deleted events to the view for patching."""
+        self.view.apply_event_changes(upserted, deleted_ids)
+
     def focus_event(self, event_id: str) -> None:
         """Centers the timeline on the given event."""
         self.view.focus_event(event_id)
@@ -0,0 +1,121 @@
+"""
+Density Histogram Item Module.
+
+Provides the DensityHistogramItem used as a level-of-detail stand-in for
+event items when the timeline is zoomed too far out to show them one by one.
+"""
+
+from bisect import bisect_left
+from typing import List, Optional
+
+from PySide6.QtCore import QRectF, Qt
+from PySide6.QtGui import QColor, QPainter
+from PySide6.QtWidgets import QGraphicsItem, QStyleOptionGraphicsItem, QWidget
+
+from src.core.theme_manager import ThemeManager
+
+
+def bin_counts(dates: List[float], start: float, end: float, bins: int) -> List[int]:
+    """
+    Counts how many dates fall into each of `bins` equal slices of a range.
+
+    Args:
+        dates: Sorted lore dates.
+        start: Start of the binned range (inclusive).
+        end: End of the binned range (exclusive).
+        bins: Number of bins.
+
+    Returns:
+        List[int]: Event count per bin, left to right.
+    """
+    if bins <= 0 or end <= start:
+        return []
+
+    width = (end - start) / bins
+    edges = [bisect_left(dates, start + i * width) for i in range(bins)]
+    edges.append(bisect_left(dates, end))
+    return [edges[i + 1] - edges[i] for i in range(bins)]
+
+
+class DensityHistogramItem(QGraphicsItem):
+    """
+    Bar chart of event counts over time, drawn in scene coordinates.
+
+    Bars are scaled relative to the fullest bin so the shape of the
+    distribution stays readable at any zoom level.
+    """
+
+    HEIGHT = 120
+
+    def __init__(self, parent: Optional[QGraphicsItem] = None) -> None:
+        """
+        Initializes the DensityHistogramItem.
+
+        Args:
+            parent: Parent graphics item.
+        """
+        super().__init__(parent)
+        self._start_x = 0.0
+        self._bin_width = 0.0
+        self._counts: List[int] = []
+        self._max_count = 0
+        self.setZValue(-2)
+
+    def set_bins(
+        self, start_x: float, bin_width: float, counts: List[int], top_y: float
+    ) -> None:
+        """
+        Replaces the histogram contents.
+
+        Args:
+            start_x: Scene X of the left edge of the first bin.
+            bin_width: Width of each bin in scene units.
+            counts: Event count per bin.
+            top_y: Scene Y of the top of the histogram area.
+        """
+        self.prepareGeometryChange()
+        self._start_x = start_x
+        self._bin_width = bin_width
+        self._counts = list(counts)
+        self._max_count = max(self._counts, default=0)
+        self.setY(top_y)
+        self.update()
+
+    @property
+    def counts(self) -> List[int]:
+        """Event count per bin."""
+        return list(self._counts)
+
+    def boundingRect(self) -> QRectF:
+        """Returns the area covered by all bins."""
+        return QRectF(
+            self._start_x, 0, self._bin_width * len(self._counts), self.HEIGHT
+        )
+
+    def paint(
+        self,
+        painter: QPainter,
+        option: QStyleOptionGraphicsItem,
+        widget: Optional[QWidget] = None,
+    ) -> None:
+        """Draws one bar per non-empty bin, anchored to the bottom edge."""
+        if not self._max_count:
+            return
+
+        color = QColor(ThemeManager().get_theme().get("primary", "#5A8DEE"))
+        color.setAlpha(170)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(color)
+
+        for i, count in enumerate(self._counts):
+            if not count:
+                continue
+            bar_height = self.HEIGHT * count / self._max_count
+            painter.drawRect(
+                QRectF(
+                    self._start_x + i * self._bin_width,
+                    self.HEIGHT - bar_height,
+                    self._bin_width,
+                    bar_height,
+                )
+            )
@@ -5,9 +5,19 @@ Provides the TimelineView class for rendering and interacting with the timeline.
 """
 
 import logging
+from bisect import bisect_left, bisect_right, insort
 from typing import Any
 
-from PySide6.QtCore import QPointF, QRectF, QSettings, QSize, Qt, QTimer, Signal
+from PySide6.QtCore import (
+    QEvent,
+    QPointF,
+    QRectF,
+    QSettings,
+    QSize,
+    Qt,
+    QTimer,
+    Signal,
+)
 from PySide6.QtGui import (
     QColor,
     QFont,
@@ -22,6 +32,10 @@ from PySide6.QtGui import (
 from PySide6.QtWidgets import QGraphicsView, QWidget
 
 from src.core.theme_manager import ThemeManager
+from src.gui.widgets.timeline.density_histogram_item import (
+    DensityHistogramItem,
+    bin_counts,
+)
 from src.gui.widgets.timeline.event_item import EventItem
 from src.gui.widgets.timeline.group_band_manager import GroupBandManager
 from src.gui.widgets.timeline.group_label_overlay import GroupLabelOverlay
@@ -72,6 +86,15 @@ class TimelineView(QGraphicsView):
     ALL_EVENTS_GROUP_NAME = "All events"
     ALL_EVENTS_COLOR = "#808080"  # Neutral gray
 
+    # Virtualization: above this many events only items near the viewport
+    # are materialized in the scene (standard layout only).
+    VIRTUALIZE_THRESHOLD = 2000
+    VIRTUAL_MARGIN = 0.5  # Extra materialized span, as a fraction of the view
+    # Above this many events in range, draw a density histogram instead
+    LOD_ITEM_BUDGET = 1500
+    DENSITY_BIN_PIXELS = 6  # On-screen width of one histogram bin
+    VIEWPORT_SYNC_DELAY_MS = 30
+
     def __init__(self, parent: QWidget = None) -> None:
         """
         Initializes the TimelineView.
@@ -163,6 +186,22 @@ class TimelineView(QGraphicsView):
         # Track duplicate event items created for "All events" group
         self._duplicate_event_items = []
 
+        # Materialized items by event ID, kept in sync instead of scanning
+        # the scene. In virtualized mode only a subset of events has items.
+        self._event_items: dict[str, EventItem] = {}
+        self._drop_lines: dict = {}
+        self._axis_line = None
+        self._event_dates: list[float] = []  # Parallel to self.events
+        self._max_event_duration = 0.0
+        self._event_y: dict[str, float] = {}  # Standard layout lane positions
+        self._max_event_y = 60.0
+        self._density_item = None
+
+        self._viewport_sync_timer = QTimer(self)
+        self._viewport_sync_timer.setSingleShot(True)
+        self._viewport_sync_timer.setInterval(self.VIEWPORT_SYNC_DELAY_MS)
+        self._viewport_sync_timer.timeout.connect(self._sync_visible_items)
+
         # Initialize grouping state (will be set by set_grouping_config)
         self._grouping_tag_order = []
         self._grouping_mode = "DUPLICATE"
@@ -222,6 +261,17 @@ class TimelineView(QGraphicsView):
         corner.setStyleSheet(f"background-color: {scrollbar_bg};")
         self.setCornerWidget(corner)
 
+    def changeEvent(self, event: QEvent) -> None:
+        """
+        Re-measures event labels and repacks lanes when the font changes.
+        """
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.FontChange and hasattr(self, "events"):
+            font = QFont(self.font())
+            font.setBold(True)
+            self._lane_packer.set_font(font)
+            self.repack_events()
+
     def resizeEvent(self, event: QResizeEvent) -> None:
         """
         Handles resize events to ensure initial fit works correctly.
@@ -249,6 +299,8 @@ class TimelineView(QGraphicsView):
             # Update label positions
             self._update_label_overlay()
 
+        self._schedule_viewport_sync()
+
     # Height allocated for sticky parent context tier
     CONTEXT_TIER_HEIGHT = 14
 
@@ -462,106 +514,37 @@ class TimelineView(QGraphicsView):
         - Greedy interval packing (First Fit)
         - Sort events by start time.
         - Packs into first available lane.
+
+        With VIRTUALIZE_THRESHOLD or more events, only events near the
+        viewport get items; see _sync_visible_items.
         """
-        # Cleanup duplicates first to avoid pollution when scanning scene
+        # Cleanup duplicates first so only original items are tracked
         self._clear_duplicates()
 
         # Sort by Date
         sorted_events = sorted(events, key=lambda e: e.lore_date)
         self.events = sorted_events
-
-        # Build a map of existing items by event ID
-        existing_items = {}
-        drop_lines = {}
-        for item in self.scene.items():
-            if isinstance(item, EventItem):
-                existing_items[item.event.id] = item
-            elif hasattr(item, "event_id"):  # Drop lines marked with event_id
-                drop_lines[item.event_id] = item
-
-        # Track which items we've reused
-        reused_ids = set()
+        self._index_events()
 
         # Draw Infinite Axis Line if not present
-        axis_exists = any(
-            not isinstance(item, EventItem) and not hasattr(item, "event_id")
-            for item in self.scene.items()
-        )
-        if not axis_exists:
+        if self._axis_line is None:
             axis_pen = QPen(QColor(100, 100, 100))
             axis_pen.setCosmetic(True)
-            self.scene.addLine(-1e12, 0, 1e12, 0, axis_pen)
+            self._axis_line = self.scene.addLine(-1e12, 0, 1e12, 0, axis_pen)
 
-        # NOTE: Don't call repack_events() here - items don't exist yet.
-        # Items are created below, then repack_events() is called at line 470.
-
-        # Now place items in scene
-        # REPACK will have set positions, but items new or old need to be managed
-        # Actually repack_events() only updates EXISTING items or lane assignments
-        # We need to create items first?
-        # NO. Logic inversion.
-        # set_events() must CREATE items first, then pack them.
-
-        # Correct logic:
-        # 1. Create/Update all EventItems at y=0 (temp)
-        # 2. Call repack_events() to position them vertically.
-
-        # Let's rewrite this block slightly.
+        # Drop items of removed events and refresh the ones we keep.
+        # Missing items are created by repack_events() once lanes are known.
+        current_ids = {e.id for e in sorted_events}
+        for event_id in [i for i in self._event_items if i not in current_ids]:
+            self._remove_event_item(event_id)
 
-        # Create/Update items first
         for event in sorted_events:
-            if event.id in existing_items:
-                item = existing_items[event.id]
+            item = self._event_items.get(event.id)
+            if item is not None:
                 item.update_event(event)
 
-                reused_ids.add(event.id)
-            else:
-                item = EventItem(event, self.scale_factor)
-                # item.setY(0) # Will be set by repack
-                item.on_drag_complete = self._on_event_drag_complete
-                self.scene.addItem(item)
-                existing_items[event.id] = item  # Add to map for repack
-
-            # Reuse or create drop line
-            drop_line_top = -self.RULER_HEIGHT
-            if event.id in drop_lines:
-                line = drop_lines[event.id]
-                line.setLine(item.x(), drop_line_top, item.x(), 60)  # Temp Y
-            else:
-                line = self.scene.addLine(
-                    item.x(),
-                    drop_line_top,
-                    item.x(),
-                    80,  # Temp Y
-                    QPen(QColor(80, 80, 80), 1, Qt.PenStyle.DashLine),
-                )
-                line.setZValue(-1)
-                line.event_id = event.id  # Mark for tracking
-
-        # Clean up removed items
-        current_ids = {e.id for e in sorted_events}
-        for event_id, item in list(existing_items.items()):
-            if event_id not in current_ids:
-                self.scene.removeItem(item)
-
-        # Clean up drop lines
-        for event_id, line in list(drop_lines.items()):
-            if event_id not in current_ids:
-                self.scene.removeItem(line)
-
-        # Now Repack
         self.repack_events()
 
-        # Update Drop Lines after repack
-        # We need to iterate drop lines again to match new item Y
-        # But we don't have a map from item -> drop line easily without query
-        # Actually drop_lines is map id -> line.
-        for event_id, line in drop_lines.items():
-            if event_id in existing_items:  # Still exists
-                item = existing_items[event_id]
-                # Drop line goes to item's Y
-                line.setLine(item.x(), -self.RULER_HEIGHT, item.x(), item.y())
-
         if sorted_events:
             self._update_scene_rect_from_events(sorted_events)
 
@@ -587,6 +570,8 @@ class TimelineView(QGraphicsView):
                 else:
                     self._initial_fit_pending = True
         else:
+            self._hide_density()
+
             # Handle empty state - still want infinite panning
             self._update_scene_rect_default()
 
@@ -595,6 +580,45 @@ class TimelineView(QGraphicsView):
             if not self._has_done_initial_fit:
                 self._has_done_initial_fit = True
 
+    def apply_event_changes(self, upserted: list, deleted_ids: list) -> None:
+        """
+        Patches the scene with changed events instead of rebuilding it.
+
+        Only items for the given events are created, updated or removed; the
+        rest of the scene is left untouched before lanes are repacked.
+
+        Args:
+            upserted: Created or modified Event objects.
+            deleted_ids: IDs of events that were removed.
+        """
+        if not upserted and not deleted_ids:
+            return
+
+        self._clear_duplicates()
+
+        changed_ids = set(deleted_ids) | {e.id for e in upserted}
+        self.events = [e for e in self.events if e.id not in changed_ids]
+        for event in upserted:
+            insort(self.events, event, key=lambda e: e.lore_date)
+        self._index_events()
+
+        for event_id in deleted_ids:
+            self._remove_event_item(event_id)
+
+        for event in upserted:
+            item = self._event_items.get(event.id)
+            if item is not None:
+                item.update_event(event)
+
+        # Items for new events are created by the repack if they are in range
+        self.repack_events()
+
+        if self.events:
+            self._update_scene_rect_from_events(self.events)
+        else:
+            self._hide_density()
+            self._update_scene_rect_default()
+
     def repack_events(self) -> None:
         """
         Repacks events into lanes based on the current effective zoom level.
@@ -605,7 +629,7 @@ class TimelineView(QGraphicsView):
         if not self.events:
             return
 
-        # Cleanup duplicates before scanning scene for layout
+        # Cleanup duplicates before laying out the original items
         self._clear_duplicates()
 
         # Calculate effective scale (Scene scale * View zoom)
@@ -647,42 +671,28 @@ class TimelineView(QGraphicsView):
             accumulate((h + 10 for h in lane_heights[:-1]), initial=80)
         )
 
-        # Update Y positions of existing items
-        existing_items = {}
-        drop_lines = {}
-        for item in self.scene.items():
-            if isinstance(item, EventItem):
-                existing_items[item.event.id] = item
-            elif hasattr(item, "event_id"):
-                drop_lines[item.event_id] = item
-
-        max_y = 80
-        for event in self.events:
-            if event.id in existing_items:
-                lane_index = event_lane_assignments[event.id]
-                y = (
-                    lane_y_offsets[lane_index]
-                    if lane_index < len(lane_y_offsets)
-                    else 80
-                )
-                item = existing_items[event.id]
+        # Lane positions are kept for every event so items materialized
+        # later (e.g. while panning) land in the right place.
+        self._event_y = {
+            event.id: (
+                lane_y_offsets[lane_index]
+                if (lane_index := event_lane_assignments[event.id])
+                < len(lane_y_offsets)
+                else 80
+            )
+            for event in self.events
+        }
+        self._max_event_y = lane_y_offsets[-1]
 
-                # Set Y position and ensure visible
-                item.setY(y)
-                item.setVisible(True)
-                item._initial_y = y  # Update constraint
+        # Track max Y for scene rect: lanes are as tall as their tallest event
+        max_y = max((y + h for y, h in zip(lane_y_offsets, lane_heights)), default=80)
 
-                # Track max Y for scene rect
-                event_height = EventItem.get_event_height(event)
-                max_y = max(max_y, y + event_height)
+        self._sync_visible_items()
 
-                # Update drop line
-                if event.id in drop_lines:
-                    line = drop_lines[event.id]
-                    line.setLine(item.x(), -self.RULER_HEIGHT, item.x(), y)
-                    line.setVisible(True)
+        # Update Y positions of materialized items
+        for event_id, item in self._event_items.items():
+            self._position_event_item(item, self._event_y[event_id], self._drop_lines)
 
-        # Recalculate Scene Rect Height
         # Recalculate Scene Rect Height
         current_rect = self.scene.sceneRect()
         max_y = max_y + 40  # Add margin
@@ -692,6 +702,147 @@ class TimelineView(QGraphicsView):
                 current_rect.x(), current_rect.y(), current_rect.width(), max_y
             )
 
+    def _index_events(self) -> None:
+        """Rebuilds the date index used to find events in a visible range."""
+        self._event_dates = [e.lore_date for e in self.events]
+        self._max_event_duration = max(
+            (e.lore_duration or 0.0 for e in self.events), default=0.0
+        )
+
+    def _is_virtualized(self) -> bool:
+        """Returns True if only events near the viewport get scene items."""
+        return len(self.events) >= self.VIRTUALIZE_THRESHOLD and not (
+            self._grouping_tag_order and self._band_manager
+        )
+
+    def _create_event_item(self, event: Any) -> EventItem:
+        """
+        Creates and registers the EventItem and drop line for an event.
+
+        Args:
+            event: The Event to materialize.
+
+        Returns:
+            EventItem: The new item, positioned if its lane is known.
+        """
+        item = EventItem(event, self.scale_factor)
+        item.on_drag_complete = self._on_event_drag_complete
+        self.scene.addItem(item)
+        self._event_items[event.id] = item
+
+        line = self.scene.addLine(
+            item.x(),
+            -self.RULER_HEIGHT,
+            item.x(),
+            80,  # Temp Y, fixed when the item is positioned
+            QPen(QColor(80, 80, 80), 1, Qt.PenStyle.DashLine),
+        )
+        line.setZValue(-1)
+        line.event_id = event.id  # Mark for tracking
+        self._drop_lines[event.id] = line
+
+        if event.id in self._event_y:
+            self._position_event_item(item, self._event_y[event.id], self._drop_lines)
+        return item
+
+    def _remove_event_item(self, event_id: str) -> None:
+        """Removes the EventItem and drop line of an event, if materialized."""
+        item = self._event_items.pop(event_id, None)
+        if item is not None:
+            self.scene.removeItem(item)
+        line = self._drop_lines.pop(event_id, None)
+        if line is not None:
+            self.scene.removeItem(line)
+
+    def _materialize_all(self) -> None:
+        """Ensures every event has an item (used by the grouped layout)."""
+        self._hide_density()
+        for event in self.events:
+            if event.id not in self._event_items:
+                self._create_event_item(event)
+
+    def _materialized_range(self) -> tuple[int, int]:
+        """
+        Returns the slice of self.events that should have scene items.
+
+        Covers the visible date range widened by VIRTUAL_MARGIN on each
+        side, plus the longest duration so bars reaching into view from
+        the left are kept.
+        """
+        date_range = self._get_visible_date_range()
+        if date_range is None:
+            return 0, len(self.events)
+
+        start, end = date_range
+        margin = (end - start) * self.VIRTUAL_MARGIN
+        lo = bisect_left(self._event_dates, start - margin - self._max_event_duration)
+        hi = bisect_right(self._event_dates, end + margin)
+        return lo, hi
+
+    def _sync_visible_items(self) -> None:
+        """
+        Materializes items for events near the viewport and drops the rest.
+
+        Below VIRTUALIZE_THRESHOLD every event keeps an item. Above it, the
+        events in _materialized_range get items, unless there are more than
+        LOD_ITEM_BUDGET of them, in which case a density histogram is drawn
+        instead. Selected or dragged items are never dropped.
+        """
+        if not self.events or (self._grouping_tag_order and self._band_manager):
+            return
+
+        if not self._is_virtualized():
+            self._hide_density()
+            wanted = self.events
+        else:
+            lo, hi = self._materialized_range()
+            if hi - lo > self.LOD_ITEM_BUDGET:
+                self._show_density()
+                wanted = []
+            else:
+                self._hide_density()
+                wanted = self.events[lo:hi]
+
+        wanted_ids = {e.id for e in wanted}
+        for event_id, item in list(self._event_items.items()):
+            if event_id in wanted_ids or item.isSelected() or item._is_dragging:
+                continue
+            self._remove_event_item(event_id)
+
+        for event in wanted:
+            if event.id not in self._event_items:
+                self._create_event_item(event)
+
+    def _schedule_viewport_sync(self) -> None:
+        """Debounces a re-sync of materialized items after panning/resizing."""
+        if self._is_virtualized():
+            self._viewport_sync_timer.start()
+
+    def _show_density(self) -> None:
+        """Shows the density histogram for the visible range and margin."""
+        if self._density_item is None:
+            self._density_item = DensityHistogramItem()
+            self.scene.addItem(self._density_item)
+
+        start, end = self._get_visible_date_range() or (
+            self._event_dates[0],
+            self._event_dates[-1] + 1,
+        )
+        margin = (end - start) * self.VIRTUAL_MARGIN
+        start, end = start - margin, end + margin
+        span_pixels = self.viewport().width() * (1 + 2 * self.VIRTUAL_MARGIN)
+        bins = max(1, int(span_pixels / self.DENSITY_BIN_PIXELS))
+
+        counts = bin_counts(self._event_dates, start, end, bins)
+        bin_width = (end - start) / bins * self.scale_factor
+        self._density_item.set_bins(start * self.scale_factor, bin_width, counts, 80)
+        self._density_item.setVisible(True)
+
+    def _hide_density(self) -> None:
+        """Hides the density histogram, if one was created."""
+        if self._density_item is not None:
+            self._density_item.setVisible(False)
+
     def _partition_events(self, events: list, tag_order: list, mode: str) -> dict:
         """Partition events into groups based on tags."""
         groups = {tag: [] for tag in tag_order}
@@ -739,14 +890,10 @@ class TimelineView(QGraphicsView):
         # Sort events by date first for proper packing
         self.events.sort(key=lambda e: e.lore_date)
 
-        # Build map of existing items (now clean of duplicates)
-        event_items = {}
-        drop_lines = {}
-        for item in self.scene.items():
-            if isinstance(item, EventItem):
-                event_items[item.event.id] = item
-            elif hasattr(item, "setLine") and hasattr(item, "event_id"):
-                drop_lines[item.event_id] = item
+        # Swimlanes are not virtualized: every event needs its item
+        self._materialize_all()
+        event_items = self._event_items
+        drop_lines = self._drop_lines
 
         # (Cleanup already done by caller: repack_events)
 
@@ -785,7 +932,7 @@ class TimelineView(QGraphicsView):
             if events_in_group:
                 # Pack events for this group
                 layout_map, lane_heights = self._lane_packer.pack_events(
-                    events_in_group
+                    events_in_group, layout_key=("group", tag)
                 )
 
                 # Position events
@@ -899,6 +1046,10 @@ class TimelineView(QGraphicsView):
                     len(lane_heights) * self._lane_packer.LANE_PADDING
                 )
 
+        self._max_event_y = max(
+            (item.y() for item in event_items.values()), default=60.0
+        )
+
         # Update scene rect
         current_rect = self.scene.sceneRect()
         # Ensure we cover everything
@@ -1008,16 +1159,8 @@ class TimelineView(QGraphicsView):
         if not event_id:
             return
 
-        # Find the item
-        # Find the item
-        found_item = next(
-            (
-                item
-                for item in self.scene.items()
-                if isinstance(item, EventItem) and item.event.id == event_id
-            ),
-            None,
-        )
+        # Only materialized events can be previewed
+        found_item = self._event_items.get(event_id)
 
         if not found_item:
             return
@@ -1038,6 +1181,11 @@ class TimelineView(QGraphicsView):
 
         found_item.setToolTip(f"{found_item.event.name} ({found_item.event.lore_date})")
 
+        if "lore_date" in event_data or "lore_duration" in event_data:
+            # Keep the date index used for viewport culling consistent
+            self.events.sort(key=lambda e: e.lore_date)
+            self._index_events()
+
         # Repack to handle position/size changes
         self.repack_events()
 
@@ -1084,13 +1232,27 @@ class TimelineView(QGraphicsView):
             settings.setValue("timeline/playhead_time", new_time)
 
     def focus_event(self, event_id: str) -> None:
-        """Centers the view on the specified event."""
-        for item in self.scene.items():
-            if isinstance(item, EventItem) and item.event.id == event_id:
-                self.centerOn(item)
-                item.setSelected(True)
+        """
+        Centers the view on the specified event.
+
+        Events outside the materialized range are scrolled into view first;
+        the selected item then stays materialized until deselected.
+        """
+        item = self._event_items.get(event_id)
+        if item is None:
+            event = next((e for e in self.events if e.id == event_id), None)
+            if event is None:
                 return
 
+            self.centerOn(
+                event.lore_date * self.scale_factor, self._event_y.get(event_id, 80)
+            )
+            self._sync_visible_items()
+            item = self._event_items.get(event_id) or self._create_event_item(event)
+
+        self.centerOn(item)
+        item.setSelected(True)
+
     def _apply_zoom(self, zoom_level: float) -> None:
         """
         Applies a zoom level and updates related state.
@@ -1402,6 +1564,10 @@ class TimelineView(QGraphicsView):
         if dy != 0:
             self._update_label_overlay()
 
+        # Materialize events panned into view
+        if dx != 0:
+            self._schedule_viewport_sync()
+
     def _on_tag_color_change_requested(self, tag_name: str) -> None:
         """
         Handle tag color change request.
@@ -1458,11 +1624,8 @@ class TimelineView(QGraphicsView):
         start_x = center_x - HUGE_BUFFER
         end_x = center_x + HUGE_BUFFER
 
-        # Y bounds - inspect items to find max Y
-        max_y_found = 60
-        for item in self.scene.items():
-            if isinstance(item, EventItem):
-                max_y_found = max(max_y_found, item.y())
+        # Y bounds - lowest event position from the last layout pass
+        max_y_found = max(60, self._max_event_y)
 
         max_y = max_y_found + self.LANE_HEIGHT + 40
         min_y = 0
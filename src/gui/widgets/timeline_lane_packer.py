@@ -3,10 +3,17 @@ Timeline Lane Packer Module.
 
 Provides the lane packing algorithm for organizing events on the timeline
 without overlaps using a greedy "First Fit" approach.
+
+The first free lane is found with a min segment tree over lane end times,
+text widths are cached per font and event name, and repeated packs of a
+mostly unchanged event list resume from the first changed event. Both the
+width cache and the packs kept per layout are bounded.
 """
 
 import logging
-from typing import Dict, List, Tuple
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Tuple
 
 from PySide6.QtGui import QFont, QFontMetrics
 
@@ -15,6 +22,126 @@ from src.gui.widgets.timeline.event_item import EventItem
 
 logger = logging.getLogger(__name__)
 
+# (id, lore_date, lore_duration, name) - everything that affects packing
+EventKey = Tuple[str, float, float, str]
+# (lane end times, lane heights) captured before an event is packed
+LaneState = Tuple[List[float], List[int]]
+
+
+class _LaneIndex:
+    """
+    Min segment tree over lane end times.
+
+    Answers "leftmost lane whose end time is <= t" in O(log lanes), which is
+    exactly the lane a linear First Fit scan would pick.
+    """
+
+    def __init__(self, end_times: Optional[List[float]] = None) -> None:
+        """
+        Builds the index.
+
+        Args:
+            end_times: Initial end time per lane.
+        """
+        self.end_times: List[float] = list(end_times or [])
+        self._capacity = 1
+        while self._capacity < len(self.end_times):
+            self._capacity *= 2
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        """Rebuilds the tree from end_times for the current capacity."""
+        tree = [float("inf")] * (2 * self._capacity)
+        tree[self._capacity : self._capacity + len(self.end_times)] = self.end_times
+        for node in range(self._capacity - 1, 0, -1):
+            tree[node] = min(tree[2 * node], tree[2 * node + 1])
+        self._tree = tree
+
+    def first_free(self, start_time: float) -> int:
+        """
+        Finds the leftmost lane that is free at start_time.
+
+        Args:
+            start_time: When the new event starts.
+
+        Returns:
+            int: The lane index, or -1 if every lane is still occupied.
+        """
+        tree = self._tree
+        if tree[1] > start_time:
+            return -1
+        node = 1
+        while node < self._capacity:
+            node *= 2
+            if tree[node] > start_time:
+                node += 1
+        return node - self._capacity
+
+    def set_end(self, lane: int, end_time: float) -> None:
+        """
+        Updates the end time of an existing lane.
+
+        Args:
+            lane: The lane index.
+            end_time: The new end time.
+        """
+        self.end_times[lane] = end_time
+        node = lane + self._capacity
+        tree = self._tree
+        tree[node] = end_time
+        node //= 2
+        while node:
+            tree[node] = min(tree[2 * node], tree[2 * node + 1])
+            node //= 2
+
+    def append(self, end_time: float) -> int:
+        """
+        Opens a new lane.
+
+        Args:
+            end_time: End time of the first event in the lane.
+
+        Returns:
+            int: The new lane index.
+        """
+        self.end_times.append(end_time)
+        lane = len(self.end_times) - 1
+        if lane >= self._capacity:
+            self._capacity *= 2
+            self._rebuild()
+        else:
+            self.set_end(lane, end_time)
+        return lane
+
+
+class _PackRun:
+    """Result and checkpoints of one pack, used to resume the next one."""
+
+    def __init__(
+        self,
+        keys: List[EventKey],
+        lanes: List[int],
+        heights: List[int],
+        checkpoints: Dict[int, LaneState],
+        scale_factor: float,
+    ) -> None:
+        """
+        Stores a finished pack.
+
+        Args:
+            keys: Packing key of each event, in packing order.
+            lanes: Assigned lane of each event, in packing order.
+            heights: Final lane heights.
+            checkpoints: Event index -> lane state before that event.
+            scale_factor: The scale the events were packed at.
+        """
+        self.keys = keys
+        self.lanes = lanes
+        self.heights = heights
+        self.checkpoints = checkpoints
+        self.checkpoint_indices = sorted(checkpoints)
+        self.scale_factor = scale_factor
+
 
 class TimelineLanePacker:
     """
@@ -30,6 +157,16 @@ class TimelineLanePacker:
     MIN_BAR_WIDTH = 10.0  # Minimum width for duration bars
     LANE_PADDING = 10  # Vertical padding between lanes
 
+    # Lane state is saved every N events so repacks can resume mid-list
+    CHECKPOINT_INTERVAL = 256
+    # Zooming in shrinks every event's time extent, so a layout packed at a
+    # smaller scale stays overlap-free. Reuse it up to this zoom factor.
+    RESCALE_TOLERANCE = 1.25
+    # Number of layouts (e.g. grouping bands) whose last pack is kept
+    MAX_CACHED_LAYOUTS = 32
+    # Measured label widths kept before the width cache starts over
+    MAX_CACHED_TEXT_WIDTHS = 16384
+
     def __init__(self, scale_factor: float = 20.0) -> None:
         """
         Initializes the TimelineLanePacker.
@@ -40,21 +177,45 @@ class TimelineLanePacker:
         self.scale_factor = scale_factor
         self.font = None
         self.fm = None
+        self._font_key = ""
+        self._text_widths: Dict[Tuple[str, str], int] = {}
+        self._runs: "OrderedDict[Hashable, _PackRun]" = OrderedDict()
 
     def _ensure_font_metrics(self) -> None:
         """Ensures font metrics are initialized (requires QApplication)."""
         if self.fm is None:
-            self.font = QFont()
-            self.font.setBold(True)
-            self.fm = QFontMetrics(self.font)
+            font = QFont()
+            font.setBold(True)
+            self.set_font(font)
 
-    def pack_events(self, events: List[Event]) -> Tuple[Dict[str, int], List[int]]:
+    def set_font(self, font: QFont) -> None:
+        """
+        Sets the label font used to measure event widths.
+
+        Previous packs are dropped, as they were measured with another font.
+
+        Args:
+            font: The font event labels are drawn with.
+        """
+        self.font = font
+        self.fm = QFontMetrics(font)
+        self._font_key = font.key()
+        self._runs.clear()
+
+    def pack_events(
+        self, events: List[Event], layout_key: Hashable = None
+    ) -> Tuple[Dict[str, int], List[int]]:
         """
         Packs events into lanes using the First Fit algorithm.
 
+        Packing the same events again only replays from the first event that
+        changed, and a small zoom-in reuses the previous layout.
+
         Args:
             events: List of Event objects to pack (should be sorted by
                 lore_date).
+            layout_key: Identifies the event list (e.g. a grouping band) so
+                several lists can be packed alternately and still be resumed.
 
         Returns:
             Tuple of:
@@ -63,30 +224,191 @@ class TimelineLanePacker:
         """
         self._ensure_font_metrics()
 
-        lanes_end_times = []  # Stores end time (in lore date units) per lane
-        lanes_heights = []  # Stores max height (in pixels) per lane
-        event_lane_assignments = {}
+        keys = [(e.id, e.lore_date, e.lore_duration, e.name) for e in events]
+        previous = self._runs.get(layout_key)
+        if previous is not None:
+            self._runs.move_to_end(layout_key)
+
+        if previous is not None and previous.keys == keys:
+            if (
+                previous.scale_factor
+                <= self.scale_factor
+                <= previous.scale_factor * self.RESCALE_TOLERANCE
+            ):
+                return self._result(previous)
 
         logger.debug(f"Packing {len(events)} events. Scale: {self.scale_factor}")
 
-        for event in events:
-            start_time = event.lore_date
-            event_height = EventItem.get_event_height(event)
+        if previous is not None and previous.scale_factor == self.scale_factor:
+            run = self._repack(events, keys, previous)
+        else:
+            run = self._pack_from(events, keys, 0, ([], []), [], {})
+
+        self._runs[layout_key] = run
+        while len(self._runs) > self.MAX_CACHED_LAYOUTS:
+            self._runs.popitem(last=False)
+        return self._result(run)
+
+    def invalidate(self, layout_key: Hashable = None) -> None:
+        """
+        Forgets the previous pack for a layout so the next one starts fresh.
+
+        Args:
+            layout_key: The layout to forget; None forgets all layouts.
+        """
+        if layout_key is None:
+            self._runs.clear()
+        else:
+            self._runs.pop(layout_key, None)
+
+    @staticmethod
+    def _result(run: _PackRun) -> Tuple[Dict[str, int], List[int]]:
+        """
+        Converts a pack run into the public return value.
+
+        Args:
+            run: The finished pack.
+
+        Returns:
+            Tuple of the event ID -> lane map and a copy of the lane heights.
+        """
+        assignments = {key[0]: lane for key, lane in zip(run.keys, run.lanes)}
+        return assignments, list(run.heights)
+
+    def _repack(
+        self, events: List[Event], keys: List[EventKey], previous: _PackRun
+    ) -> _PackRun:
+        """
+        Repacks from the last checkpoint before the first changed event.
+
+        Args:
+            events: The events to pack.
+            keys: Packing keys of events.
+            previous: The previous pack at the same scale.
+
+        Returns:
+            _PackRun: The new pack.
+        """
+        old_keys = previous.keys
+        prefix = 0
+        limit = min(len(keys), len(old_keys))
+        while prefix < limit and keys[prefix] == old_keys[prefix]:
+            prefix += 1
+
+        pos = bisect_right(previous.checkpoint_indices, prefix) - 1
+        resume = previous.checkpoint_indices[pos] if pos >= 0 else 0
+        state = previous.checkpoints[resume] if pos >= 0 else ([], [])
+        checkpoints = {
+            i: previous.checkpoints[i] for i in previous.checkpoint_indices[: pos + 1]
+        }
+
+        return self._pack_from(
+            events, keys, resume, state, previous.lanes[:resume], checkpoints, previous
+        )
+
+    def _pack_from(
+        self,
+        events: List[Event],
+        keys: List[EventKey],
+        start: int,
+        state: LaneState,
+        lanes: List[int],
+        checkpoints: Dict[int, LaneState],
+        previous: Optional[_PackRun] = None,
+    ) -> _PackRun:
+        """
+        Packs events[start:] on top of a saved lane state.
 
-            # Calculate visual duration (in time units)
-            visual_duration = self._calculate_visual_duration(event)
-            gap_duration = self.GAP_PIXELS / self.scale_factor
+        When a previous pack is given, packing stops as soon as the lane state
+        matches the previous pack at the same position of an unchanged tail;
+        the rest of the previous assignments are reused from there.
 
-            end_time = start_time + visual_duration + gap_duration
+        Args:
+            events: The events to pack.
+            keys: Packing keys of events.
+            start: Index of the first event to pack.
+            state: Lane end times and heights before events[start].
+            lanes: Lanes already assigned to events[:start].
+            checkpoints: Checkpoints already valid for events[:start].
+            previous: The previous pack at the same scale, if any.
 
-            # First Fit (Gravity) - find first available lane
-            assigned_lane = self._find_available_lane(
-                lanes_end_times, lanes_heights, start_time, end_time, event_height
+        Returns:
+            _PackRun: The new pack.
+        """
+        lane_index = _LaneIndex(state[0])
+        heights = list(state[1])
+        gap_duration = self.GAP_PIXELS / self.scale_factor
+        interval = self.CHECKPOINT_INTERVAL
+
+        # Unchanged tail of the previous pack, aligned by the length change
+        shift = 0
+        tail_start = len(keys)
+        if previous is not None:
+            old_keys = previous.keys
+            shift = len(keys) - len(old_keys)
+            tail = 0
+            while (
+                tail < min(len(keys), len(old_keys)) - start
+                and keys[-1 - tail] == old_keys[-1 - tail]
+            ):
+                tail += 1
+            tail_start = len(keys) - tail
+
+        for i in range(start, len(events)):
+            if i >= tail_start and i > start:
+                old = previous.checkpoints.get(i - shift)
+                if old is not None and old == (lane_index.end_times, heights):
+                    # Same state, same remaining events -> same result
+                    lanes.extend(previous.lanes[i - shift :])
+                    for index in previous.checkpoint_indices:
+                        if index >= i - shift:
+                            checkpoints[index + shift] = previous.checkpoints[index]
+                    return _PackRun(
+                        keys,
+                        lanes,
+                        list(previous.heights),
+                        checkpoints,
+                        self.scale_factor,
+                    )
+
+            if i % interval == 0:
+                checkpoints[i] = (list(lane_index.end_times), list(heights))
+
+            event = events[i]
+            start_time = event.lore_date
+            end_time = start_time + self._calculate_visual_duration(event)
+            end_time += gap_duration
+
+            lanes.append(
+                self._find_available_lane(
+                    lane_index,
+                    heights,
+                    start_time,
+                    end_time,
+                    EventItem.get_event_height(event),
+                )
             )
 
-            event_lane_assignments[event.id] = assigned_lane
+        return _PackRun(keys, lanes, heights, checkpoints, self.scale_factor)
+
+    def _text_width(self, text: str) -> int:
+        """
+        Returns the rendered width of a label, measured once per font and name.
+
+        Args:
+            text: The label text.
 
-        return event_lane_assignments, lanes_heights
+        Returns:
+            int: Width in pixels for the packer's font.
+        """
+        key = (self._font_key, text)
+        width = self._text_widths.get(key)
+        if width is None:
+            if len(self._text_widths) >= self.MAX_CACHED_TEXT_WIDTHS:
+                self._text_widths.clear()
+            width = self.fm.horizontalAdvance(text)
+            self._text_widths[key] = width
+        return width
 
     def _calculate_visual_duration(self, event: Event) -> float:
         """
@@ -108,7 +430,7 @@ class TimelineLanePacker:
             # Should practically never happen if QApplication exists
             return 0.0
 
-        text_width = self.fm.horizontalAdvance(event.name)
+        text_width = self._text_width(event.name)
 
         if event.lore_duration > 0:
             # Duration Event - bar with label BELOW
@@ -127,7 +449,7 @@ class TimelineLanePacker:
 
     def _find_available_lane(
         self,
-        lanes_end_times: List[float],
+        lane_index: _LaneIndex,
         lanes_heights: List[int],
         start_time: float,
         end_time: float,
@@ -137,7 +459,7 @@ class TimelineLanePacker:
         Finds the first available lane for an event.
 
         Args:
-            lanes_end_times: List of end times for each existing lane.
+            lane_index: Index over the end time of each existing lane.
             lanes_heights: List of max heights for each existing lane.
             start_time: When the event starts.
             end_time: When the event ends (including visual space).
@@ -146,18 +468,16 @@ class TimelineLanePacker:
         Returns:
             int: The lane index (0-based).
         """
-        # Try to find an existing lane that's available
-        for i, lane_end in enumerate(lanes_end_times):
-            if lane_end <= start_time:
-                # This lane is available - update its end time and max height
-                lanes_end_times[i] = end_time
-                lanes_heights[i] = max(lanes_heights[i], event_height)
-                return i
+        lane = lane_index.first_free(start_time)
+        if lane >= 0:
+            # This lane is available - update its end time and max height
+            lane_index.set_end(lane, end_time)
+            lanes_heights[lane] = max(lanes_heights[lane], event_height)
+            return lane
 
         # No available lane found, create a new one
-        lanes_end_times.append(end_time)
         lanes_heights.append(event_height)
-        return len(lanes_end_times) - 1
+        return lane_index.append(end_time)
 
     def update_scale_factor(self, scale_factor: float) -> None:
         """
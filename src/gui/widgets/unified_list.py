@@ -7,17 +7,29 @@ filtering and color-coded differentiation.
 
 import json
 import logging
-from typing import List, Union
-
-from PySide6.QtCore import QMimeData, QSize, Qt, Signal, Slot
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
+
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QMimeData,
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    QSize,
+    Qt,
+    QTimer,
+    Signal,
+    Slot,
+)
 from PySide6.QtGui import QBrush, QColor, QDrag
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QComboBox,
     QHBoxLayout,
     QLabel,
     QLineEdit,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QMenu,
     QPushButton,
     QVBoxLayout,
@@ -26,16 +38,31 @@ from PySide6.QtWidgets import (
 
 from src.core.entities import Entity
 from src.core.events import Event
+from src.core.search_utils import SearchUtils
 from src.gui.utils.style_helper import StyleHelper
 
 KRAKEN_ITEM_MIME_TYPE = "application/x-kraken-item"
 
+# Item data roles
+ID_ROLE = Qt.ItemDataRole.UserRole
+TYPE_ROLE = Qt.ItemDataRole.UserRole + 1
+NAME_ROLE = Qt.ItemDataRole.UserRole + 2
+
+# Delay after the last keystroke before the search filter runs
+SEARCH_DEBOUNCE_MS = 150
+
+# Rows the list view lays out per event loop pass
+LAYOUT_BATCH_SIZE = 200
+
+ItemKey = Tuple[str, str]  # item type, ID
+AnyIndex = Union[QModelIndex, QPersistentModelIndex]
+
 logger = logging.getLogger(__name__)
 
 
-class DraggableListWidget(QListWidget):
+class DraggableListView(QListView):
     """
-    A QListWidget that supports dragging items with custom MIME data.
+    A QListView that supports dragging items with custom MIME data.
 
     Drag data format (JSON):
         {"id": "uuid", "type": "event|entity", "name": "Display Name"}
@@ -45,7 +72,14 @@ class DraggableListWidget(QListWidget):
         """Initialize with drag enabled."""
         super().__init__(parent)
         self.setDragEnabled(True)
-        self.setDragDropMode(QListWidget.DragOnly)
+        self.setDragDropMode(QAbstractItemView.DragDropMode.DragOnly)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        # All rows are single lines, so the view can skip measuring them, and
+        # large lists are laid out in idle-time batches after a refilter
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.LayoutMode.Batched)
+        self.setBatchSize(LAYOUT_BATCH_SIZE)
 
     def startDrag(self, supportedActions: Qt.DropAction) -> None:
         """
@@ -54,20 +88,23 @@ class DraggableListWidget(QListWidget):
         Args:
             supportedActions: The drag actions supported.
         """
-        item = self.currentItem()
-        if not item:
+        index = self.currentIndex()
+        if not index.isValid():
             return
 
-        # Extract item data (stored via setData in _render_list)
-        item_id = item.data(Qt.ItemDataRole.UserRole)
-        item_type = item.data(Qt.ItemDataRole.UserRole + 1)
-        item_name = item.data(Qt.ItemDataRole.UserRole + 2)  # We'll add this
+        item_id = index.data(ID_ROLE)
+        item_type = index.data(TYPE_ROLE)
+        item_name = index.data(NAME_ROLE)
 
         if not item_id or not item_type:
             return
 
         # Build MIME data
-        data = {"id": item_id, "type": item_type, "name": item_name or item.text()}
+        data = {
+            "id": item_id,
+            "type": item_type,
+            "name": item_name or index.data(Qt.ItemDataRole.DisplayRole),
+        }
 
         mime_data = QMimeData()
         mime_data.setData(KRAKEN_ITEM_MIME_TYPE, json.dumps(data).encode("utf-8"))
@@ -81,6 +118,446 @@ class DraggableListWidget(QListWidget):
         drag.exec(Qt.CopyAction)
 
 
+class UnifiedListModel(QAbstractListModel):
+    """
+    Flat list model of all entities followed by all events.
+
+    Rows are kept as a column store: parallel lists indexed by row holding
+    each item's type, ID, name, label, tags and search key. The search key
+    is the casefolded text SearchUtils.matches_search() looks at, computed
+    once per object version, so filters scan plain strings instead of
+    re-reading every object. The columns are read-only outside the model.
+    """
+
+    def __init__(
+        self, entity_color: QColor, event_color: QColor, parent: QObject = None
+    ) -> None:
+        """
+        Initializes an empty model.
+
+        Args:
+            entity_color (QColor): Text color of entity rows.
+            event_color (QColor): Text color of event rows.
+            parent (QObject, optional): The parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        self._brushes = {
+            "entity": QBrush(entity_color),
+            "event": QBrush(event_color),
+        }
+        self.item_types: List[str] = []
+        self.item_ids: List[str] = []
+        self.names: List[str] = []
+        self.labels: List[str] = []
+        self.tags: List[FrozenSet[str]] = []
+        self.search_keys: List[str] = []
+        self.entity_count = 0
+        self._rows: Optional[Dict[ItemKey, int]] = None
+
+    def rowCount(self, parent: AnyIndex = QModelIndex()) -> int:
+        """
+        Returns the number of rows.
+
+        Args:
+            parent: Parent index; list models only have top-level rows.
+
+        Returns:
+            int: The row count.
+        """
+        return 0 if parent.isValid() else len(self.item_ids)
+
+    def data(self, index: AnyIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """
+        Returns the data of a row for a role.
+
+        Args:
+            index: The row index.
+            role: The item data role.
+
+        Returns:
+            The label, text brush, ID, type or name; None for other roles.
+        """
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.labels[row]
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self._brushes[self.item_types[row]]
+        if role == ID_ROLE:
+            return self.item_ids[row]
+        if role == TYPE_ROLE:
+            return self.item_types[row]
+        if role == NAME_ROLE:
+            return self.names[row]
+        return None
+
+    def set_objects(self, entities: List[Entity], events: List[Event]) -> None:
+        """
+        Replaces all rows.
+
+        Args:
+            entities (List[Entity]): Entities, in display order.
+            events (List[Event]): Events, in display order.
+        """
+        self.beginResetModel()
+        for column in self._columns():
+            column.clear()
+        for item_type, objects in (("entity", entities), ("event", events)):
+            for obj in objects:
+                for column, value in zip(
+                    self._columns(), self._row_values(item_type, obj)
+                ):
+                    column.append(value)
+        self.entity_count = len(entities)
+        self._rows = None
+        self.endResetModel()
+
+    def apply_changes(
+        self,
+        item_type: str,
+        objects: List[Union[Event, Entity]],
+        upserted: List[Union[Event, Entity]],
+        deleted_ids: List[str],
+    ) -> None:
+        """
+        Removes and inserts the changed rows of one item type.
+
+        Args:
+            item_type (str): "event" or "entity".
+            objects (List[Union[Event, Entity]]): The full, sorted list of
+                objects of this type after the change.
+            upserted (List[Union[Event, Entity]]): Created or modified objects.
+            deleted_ids (List[str]): IDs of removed objects.
+        """
+        changed_ids = set(deleted_ids) | {obj.id for obj in upserted}
+        start, end = self._segment(item_type)
+        for row in reversed(range(start, end)):
+            if self.item_ids[row] in changed_ids:
+                self._remove_rows(row, row)
+
+        positions = {obj.id: index for index, obj in enumerate(objects)}
+        inserts = sorted(
+            (positions[obj.id], obj) for obj in upserted if obj.id in positions
+        )
+        start, end = self._segment(item_type)
+        if end - start + len(inserts) != len(objects):
+            # The patch does not describe the new list; replace the segment
+            logger.debug(f"Re-rendering all {item_type} rows of the unified list")
+            if end > start:
+                self._remove_rows(start, end - 1)
+            inserts = list(enumerate(objects))
+
+        # Ascending positions: all earlier objects are in place at each insert
+        for position, obj in inserts:
+            self._insert_row(start + position, item_type, obj)
+
+    def row_of(self, item_type: str, item_id: str) -> Optional[int]:
+        """
+        Finds the row of an item.
+
+        Args:
+            item_type (str): "event" or "entity".
+            item_id (str): The item ID.
+
+        Returns:
+            Optional[int]: The row, or None if the item is not in the model.
+        """
+        if self._rows is None:
+            self._rows = {
+                key: row for row, key in enumerate(zip(self.item_types, self.item_ids))
+            }
+        return self._rows.get((item_type, item_id))
+
+    def _columns(self) -> Tuple[list, ...]:
+        """Returns the columns, in the order of _row_values()."""
+        return (
+            self.item_types,
+            self.item_ids,
+            self.names,
+            self.labels,
+            self.tags,
+            self.search_keys,
+        )
+
+    @staticmethod
+    def _row_values(item_type: str, obj: Union[Event, Entity]) -> tuple:
+        """
+        Computes the column values of an object's row.
+
+        Args:
+            item_type (str): "event" or "entity".
+            obj (Union[Event, Entity]): The object to display.
+
+        Returns:
+            tuple: Type, ID, name, label, tags and search key.
+        """
+        if item_type == "entity":
+            label = f"{obj.name} ({obj.type})"
+        else:
+            label = f"[{obj.lore_date}] {obj.name}"
+        return (
+            item_type,
+            obj.id,
+            obj.name,
+            label,
+            frozenset(getattr(obj, "tags", None) or ()),
+            SearchUtils.search_key(obj),
+        )
+
+    def _segment(self, item_type: str) -> Tuple[int, int]:
+        """
+        Returns the row range holding one item type.
+
+        Args:
+            item_type (str): "event" or "entity".
+
+        Returns:
+            Tuple[int, int]: First row and end row (exclusive).
+        """
+        if item_type == "entity":
+            return 0, self.entity_count
+        return self.entity_count, len(self.item_ids)
+
+    def _insert_row(self, row: int, item_type: str, obj: Union[Event, Entity]) -> None:
+        """Inserts the row of an object."""
+        self.beginInsertRows(QModelIndex(), row, row)
+        for column, value in zip(self._columns(), self._row_values(item_type, obj)):
+            column.insert(row, value)
+        if item_type == "entity":
+            self.entity_count += 1
+        self._rows = None
+        self.endInsertRows()
+
+    def _remove_rows(self, first: int, last: int) -> None:
+        """Removes the rows from first to last (inclusive)."""
+        self.beginRemoveRows(QModelIndex(), first, last)
+        self.entity_count -= sum(
+            1 for row in range(first, last + 1) if self.item_types[row] == "entity"
+        )
+        for column in self._columns():
+            del column[first : last + 1]
+        self._rows = None
+        self.endRemoveRows()
+
+
+class UnifiedFilterModel(QAbstractListModel):
+    """
+    Filtering proxy over a UnifiedListModel.
+
+    Works like a QSortFilterProxyModel, but keeps the accepted source rows
+    in a sorted list and filters with list comprehensions over the source
+    columns instead of a per-row filterAcceptsRow() call. When the search
+    term is extended, only the rows accepted by the previous term are
+    scanned again. Source row insertions and removals are mapped onto
+    the visible rows, so patches do not refilter the whole list.
+    """
+
+    def __init__(self, source: UnifiedListModel, parent: QObject = None) -> None:
+        """
+        Initializes the proxy, accepting every source row.
+
+        Args:
+            source (UnifiedListModel): The model to filter.
+            parent (QObject, optional): The parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        self._source = source
+        self._visible: List[int] = list(range(source.rowCount()))
+        self._search_term = ""
+        self._item_types: FrozenSet[str] = frozenset({"entity", "event"})
+        self._tag_filter: dict = {}
+
+        source.modelReset.connect(self._on_source_reset)
+        source.rowsAboutToBeRemoved.connect(self._on_source_rows_about_to_be_removed)
+        source.rowsRemoved.connect(self._on_source_rows_removed)
+        source.rowsInserted.connect(self._on_source_rows_inserted)
+
+    def rowCount(self, parent: AnyIndex = QModelIndex()) -> int:
+        """
+        Returns the number of visible rows.
+
+        Args:
+            parent: Parent index; list models only have top-level rows.
+
+        Returns:
+            int: The row count.
+        """
+        return 0 if parent.isValid() else len(self._visible)
+
+    def data(self, index: AnyIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """
+        Returns the source model's data for a visible row.
+
+        Args:
+            index: The visible row index.
+            role: The item data role.
+
+        Returns:
+            The source data for the role.
+        """
+        if not index.isValid():
+            return None
+        return self._source.data(self._source.index(self._visible[index.row()]), role)
+
+    def flags(self, index: AnyIndex) -> Qt.ItemFlag:
+        """
+        Returns the item flags: rows are selectable and draggable.
+
+        Args:
+            index: The visible row index.
+
+        Returns:
+            Qt.ItemFlag: The flags.
+        """
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return (
+            Qt.ItemFlag.ItemIsEnabled
+            | Qt.ItemFlag.ItemIsSelectable
+            | Qt.ItemFlag.ItemIsDragEnabled
+        )
+
+    def map_from_source(self, source_row: int) -> Optional[int]:
+        """
+        Maps a source row to its visible row.
+
+        Args:
+            source_row (int): Row in the source model.
+
+        Returns:
+            Optional[int]: The visible row, or None if filtered out.
+        """
+        row = bisect_left(self._visible, source_row)
+        if row < len(self._visible) and self._visible[row] == source_row:
+            return row
+        return None
+
+    def set_filters(
+        self, search_term: str, item_types: Set[str], tag_filter: dict
+    ) -> None:
+        """
+        Updates the filters and the visible rows.
+
+        Args:
+            search_term (str): Normalized search term (see
+                SearchUtils.normalize_term); empty to match everything.
+            item_types (Set[str]): Item types to show.
+            tag_filter (dict): Tag filter with 'include', 'exclude' and
+                'match_all' keys.
+        """
+        item_types = frozenset(item_types)
+        tag_filter = dict(tag_filter or {})
+        if (
+            search_term == self._search_term
+            and item_types == self._item_types
+            and tag_filter == self._tag_filter
+        ):
+            return
+
+        # Rows matching an extended term are a subset of the current rows
+        narrowing = (
+            item_types == self._item_types
+            and tag_filter == self._tag_filter
+            and self._search_term in search_term
+        )
+        candidates = self._visible if narrowing else range(self._source.rowCount())
+
+        self._search_term = search_term
+        self._item_types = item_types
+        self._tag_filter = tag_filter
+
+        self.beginResetModel()
+        self._visible = self._accepted_rows(candidates)
+        self.endResetModel()
+
+    def _accepted_rows(self, rows: Iterable[int]) -> List[int]:
+        """
+        Filters source rows.
+
+        Args:
+            rows (Iterable[int]): Ascending source rows to check.
+
+        Returns:
+            List[int]: The rows passing all filters, ascending.
+        """
+        source = self._source
+        accepted = list(rows)
+
+        if self._item_types != {"entity", "event"}:
+            item_types = source.item_types
+            shown = self._item_types
+            accepted = [row for row in accepted if item_types[row] in shown]
+
+        include = set(self._tag_filter.get("include") or ())
+        exclude = set(self._tag_filter.get("exclude") or ())
+        if include or exclude:
+            tags = source.tags
+            match_all = self._tag_filter.get("match_all", False)
+            accepted = [
+                row
+                for row in accepted
+                if not (exclude and tags[row] & exclude)
+                and (
+                    not include
+                    or (include <= tags[row] if match_all else tags[row] & include)
+                )
+            ]
+
+        if self._search_term:
+            term = self._search_term
+            search_keys = source.search_keys
+            accepted = [row for row in accepted if term in search_keys[row]]
+
+        return accepted
+
+    @Slot()
+    def _on_source_reset(self) -> None:
+        """Refilters all rows after the source model was reset."""
+        self.beginResetModel()
+        self._visible = self._accepted_rows(range(self._source.rowCount()))
+        self.endResetModel()
+
+    @Slot(QModelIndex, int, int)
+    def _on_source_rows_about_to_be_removed(
+        self, parent: QModelIndex, first: int, last: int
+    ) -> None:
+        """Removes the visible rows of source rows about to be removed."""
+        start = bisect_left(self._visible, first)
+        end = bisect_right(self._visible, last)
+        if start < end:
+            self.beginRemoveRows(QModelIndex(), start, end - 1)
+            del self._visible[start:end]
+            self.endRemoveRows()
+
+    @Slot(QModelIndex, int, int)
+    def _on_source_rows_removed(
+        self, parent: QModelIndex, first: int, last: int
+    ) -> None:
+        """Shifts the source rows following removed rows."""
+        count = last - first + 1
+        visible = self._visible
+        for row in range(bisect_left(visible, first), len(visible)):
+            visible[row] -= count
+
+    @Slot(QModelIndex, int, int)
+    def _on_source_rows_inserted(
+        self, parent: QModelIndex, first: int, last: int
+    ) -> None:
+        """Shifts the following source rows and shows accepted new rows."""
+        count = last - first + 1
+        visible = self._visible
+        start = bisect_left(visible, first)
+        for row in range(start, len(visible)):
+            visible[row] += count
+
+        accepted = self._accepted_rows(range(first, last + 1))
+        if accepted:
+            self.beginInsertRows(QModelIndex(), start, start + len(accepted) - 1)
+            visible[start:start] = accepted
+            self.endInsertRows()
+
+
 class UnifiedListWidget(QWidget):
     """
     A unified list widget determining displaying both Events and Entities.
@@ -140,13 +617,19 @@ class UnifiedListWidget(QWidget):
 
         main_layout.addLayout(top_bar)
 
-        # Search Bar (Live filtering)
+        # Search Bar (Live filtering, debounced while typing)
         self.search_bar = QLineEdit()
         self.search_bar.setPlaceholderText("Search names, descriptions, tags...")
         self.search_bar.setClearButtonEnabled(True)
         self.search_bar.textChanged.connect(self._on_search_text_changed)
+        self.search_bar.returnPressed.connect(self._apply_search)
         main_layout.addWidget(self.search_bar)
 
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._apply_search)
+
         # Filter Row (Dynamic Types and Tags)
         filter_row = QHBoxLayout()
 
@@ -171,9 +654,23 @@ class UnifiedListWidget(QWidget):
 
         main_layout.addLayout(filter_row)
 
-        # List (with drag support)
-        self.list_widget = DraggableListWidget()
-        self.list_widget.itemSelectionChanged.connect(self._on_selection_changed)
+        # Colors - use ThemeManager for theme-aware colors
+        # TODO: Migrate to fully dynamic theme updates with
+        # ThemeManager.theme_changed signal
+        from src.core.theme_manager import ThemeManager
+
+        theme = ThemeManager().get_theme()
+        self.color_event = QColor(theme["accent_secondary"])
+        self.color_entity = QColor(theme["primary"])
+
+        # List (model/view with drag support)
+        self.model = UnifiedListModel(self.color_entity, self.color_event, self)
+        self.proxy_model = UnifiedFilterModel(self.model, self)
+        self.list_widget = DraggableListView()
+        self.list_widget.setModel(self.proxy_model)
+        self.list_widget.selectionModel().selectionChanged.connect(
+            self._on_selection_changed
+        )
         main_layout.addWidget(self.list_widget)
 
         # Empty State
@@ -186,23 +683,12 @@ class UnifiedListWidget(QWidget):
         # Data Cache
         self._events: List[Event] = []
         self._entities: List[Entity] = []
-        self._search_term = ""  # Track current search term
+        self._search_term = ""  # Track current (normalized) search term
         self._advanced_filter_config: dict = {}  # Advanced filter settings (tags)
+        # Set while the list restores a selection it dropped itself
+        self._restoring_selection = False
 
-        # Filter State
-        # self._active_types: set = set()  # Removed: Backend handled
-        # self._active_tags: set = set()   # Removed: Backend handled
-
-        # Colors - use ThemeManager for theme-aware colors
-        # TODO: Migrate to fully dynamic theme updates with
-        # ThemeManager.theme_changed signal
-        from src.core.theme_manager import ThemeManager
-
-        theme = ThemeManager().get_theme()
-        self.color_event = QColor(theme["accent_secondary"])
-        self.color_entity = QColor(theme["primary"])
-
-        self._render_list()
+        self._refresh_view()
 
     def set_data(self, events: List[Event], entities: List[Entity]) -> None:
         """
@@ -215,7 +701,108 @@ class UnifiedListWidget(QWidget):
         self._events = events
         self._entities = entities
 
-        self._render_list()
+        selected_key = self._selected_key()
+        self._restoring_selection = True
+        self.model.set_objects(entities, events)
+        self._restoring_selection = False
+        self._restore_selection(selected_key)
+        self._update_empty_state()
+
+    def apply_changes(
+        self,
+        item_type: str,
+        objects: List[Union[Event, Entity]],
+        upserted: List[Union[Event, Entity]],
+        deleted_ids: List[str],
+    ) -> None:
+        """
+        Patches the list with changed items instead of re-rendering it.
+
+        Args:
+            item_type (str): "event" or "entity".
+            objects (List[Union[Event, Entity]]): The full, sorted list of
+                objects of this type after the change.
+            upserted (List[Union[Event, Entity]]): Created or modified objects.
+            deleted_ids (List[str]): IDs of removed objects.
+        """
+        if item_type == "event":
+            self._events = objects
+        else:
+            self._entities = objects
+
+        selected_key = self._selected_key()
+        # Removing the selected row must not look like a user deselection
+        self._restoring_selection = True
+        self.model.apply_changes(item_type, objects, upserted, deleted_ids)
+        self._restoring_selection = False
+
+        self._restore_selection(selected_key)
+        self._update_empty_state()
+
+    def _visible_row(self, item_type: str, item_id: str) -> Optional[int]:
+        """
+        Finds the list row showing an item.
+
+        Args:
+            item_type (str): "event" or "entity".
+            item_id (str): The item ID.
+
+        Returns:
+            Optional[int]: The row, or None if the item is not shown.
+        """
+        source_row = self.model.row_of(item_type, item_id)
+        if source_row is None:
+            return None
+        return self.proxy_model.map_from_source(source_row)
+
+    def _selected_key(self) -> Optional[ItemKey]:
+        """
+        Returns the (type, id) of the selected item, if any.
+
+        Returns:
+            Optional[ItemKey]: The selection key or None.
+        """
+        indexes = self.list_widget.selectionModel().selectedIndexes()
+        if not indexes:
+            return None
+        return (indexes[0].data(TYPE_ROLE), indexes[0].data(ID_ROLE))
+
+    def _restore_selection(self, key: Optional[ItemKey]) -> None:
+        """
+        Reselects an item after the rows changed, without emitting item_selected.
+
+        Args:
+            key (Optional[ItemKey]): The previously selected item, if any.
+        """
+        row = self._visible_row(*key) if key else None
+        if row is not None and self._selected_key() != key:
+            self._restoring_selection = True
+            self.list_widget.setCurrentIndex(self.proxy_model.index(row))
+            self._restoring_selection = False
+        self.btn_delete.setEnabled(self.list_widget.selectionModel().hasSelection())
+
+    def _shown_types(self) -> Set[str]:
+        """
+        Returns the item types the category filter shows.
+
+        Returns:
+            Set[str]: Subset of {"event", "entity"}.
+        """
+        filter_mode = self.filter_combo.currentText()
+        if filter_mode == "Events Only":
+            return {"event"}
+        if filter_mode == "Entities Only":
+            return {"entity"}
+        return {"event", "entity"}
+
+    def _update_empty_state(self) -> None:
+        """Toggles between the list and the empty state label."""
+        if self.proxy_model.rowCount():
+            self.list_widget.show()
+            self.empty_label.hide()
+        else:
+            self.list_widget.hide()
+            self.empty_label.show()
 
     @Slot()
     @Slot()
@@ -246,7 +833,7 @@ class UnifiedListWidget(QWidget):
 
     def set_advanced_filter(self, config: dict) -> None:
         """
-        Sets the advanced filter configuration (tags) and re-renders the list.
+        Sets the advanced filter configuration (tags) and refilters the list.
 
         Args:
             config: Filter configuration dict with 'include', 'exclude', 'match_all' keys.
@@ -254,7 +841,7 @@ class UnifiedListWidget(QWidget):
         self._advanced_filter_config = config or {}
         has_filter = bool(config.get("include") or config.get("exclude"))
         self.set_filter_active(has_filter)
-        self._render_list()
+        self._refresh_view()
 
     def get_advanced_filter_config(self) -> dict:
         """
@@ -265,108 +852,17 @@ class UnifiedListWidget(QWidget):
         """
         return self._advanced_filter_config
 
-    # _clear_filters removed as it's replaced by backend refresh
-
-    def _render_list(self) -> None:
+    def _refresh_view(self) -> None:
         """
-        Renders the list based on current filter and data.
+        Applies the current search, category and tag filters.
         Preserves selection during refresh.
         """
-        # Capture current selection
-        current_id = None
-        current_type = None
-        selected_items = self.list_widget.selectedItems()
-        if selected_items:
-            current_id = selected_items[0].data(Qt.ItemDataRole.UserRole)
-            current_type = selected_items[0].data(Qt.ItemDataRole.UserRole + 1)
-
-        self.list_widget.clear()
-
-        filter_mode = self.filter_combo.currentText()
-        show_events = filter_mode in ["All Items", "Events Only"]
-        show_entities = filter_mode in ["All Items", "Entities Only"]
-
-        items_to_show = []
-
-        if show_events:
-            for event in self._events:
-                items_to_show.append(
-                    {
-                        "type": "event",
-                        "obj": event,
-                        "sort_key": str(event.lore_date),  # Sort events by date?
-                    }
-                )
-
-        if show_entities:
-            for entity in self._entities:
-                items_to_show.append(
-                    {"type": "entity", "obj": entity, "sort_key": entity.name}
-                )
-
-        # Sort? For now, mixed sort might be weird.
-        # Let's just append blocks or simple sort.
-        # Simple approach: Entities first (alphabetical),
-        # then Events (chronological)?
-        # Or mixed list? "Unify" usually implies mixed.
-        # User request didn't specify sort. Let's stick to simple append
-        # for now to be safe, or separate blocks like the current UI
-        # but in one list.
-        # Actually, let's keep them somewhat grouped for clarity until
-        # a unified timeline sort is requested.
-
-        has_items = False
-
-        if show_entities and self._entities:
-            # Header item? No, user said differentiated by color.
-            for entity in self._entities:
-                # Apply all filters (search, type, tag)
-                if not self._passes_filters(entity):
-                    continue
-                label = f"{entity.name} ({entity.type})"
-                item = QListWidgetItem(label)
-                item.setData(Qt.ItemDataRole.UserRole, entity.id)
-                item.setData(Qt.ItemDataRole.UserRole + 1, "entity")
-                item.setData(Qt.ItemDataRole.UserRole + 2, entity.name)  # For drag
-                item.setForeground(QBrush(self.color_entity))
-                self.list_widget.addItem(item)
-                has_items = True
-
-        if show_events and self._events:
-            for event in self._events:
-                # Apply all filters (search, type, tag)
-                if not self._passes_filters(event):
-                    continue
-                label = f"[{event.lore_date}] {event.name}"
-                item = QListWidgetItem(label)
-                item.setData(Qt.ItemDataRole.UserRole, event.id)
-                item.setData(Qt.ItemDataRole.UserRole + 1, "event")
-                item.setData(Qt.ItemDataRole.UserRole + 2, event.name)  # For drag
-                item.setForeground(QBrush(self.color_event))
-                self.list_widget.addItem(item)
-                has_items = True
-
-        if has_items:
-            self.list_widget.show()
-            self.empty_label.hide()
-
-            # Restore selection if possible
-            if current_id and current_type:
-                for index in range(self.list_widget.count()):
-                    item = self.list_widget.item(index)
-                    if (
-                        item.data(Qt.ItemDataRole.UserRole) == current_id
-                        and item.data(Qt.ItemDataRole.UserRole + 1) == current_type
-                    ):
-                        # Block signals to prevent re-triggering selection logic
-                        self.list_widget.blockSignals(True)
-                        self.list_widget.setCurrentItem(item)
-                        self.list_widget.blockSignals(False)
-
-                        break
-        else:
-            self.list_widget.hide()
-            self.empty_label.show()
+        selected_key = self._selected_key()
+        self.proxy_model.set_filters(
+            self._search_term, self._shown_types(), self._advanced_filter_config
+        )
+        self._restore_selection(selected_key)
+        self._update_empty_state()
 
     @Slot(str)
     @Slot(str)
@@ -374,81 +870,23 @@ class UnifiedListWidget(QWidget):
         """
         Handles search bar text changes for live filtering.
 
-        Args:
-            text (str): The search text.
-        """
-        self._search_term = text.lower().strip()
-        self._render_list()
-
-    def _matches_search(self, obj: Union[Event, Entity]) -> bool:
-        """
-        Checks if an object matches the current search term.
-        Delegates to shared SearchUtils.
+        Filtering waits until typing pauses; clearing the search applies
+        at once.
 
         Args:
-            obj: Event or Entity object.
-
-        Returns:
-            bool: True if matches search (or no search active).
-        """
-        from src.core.search_utils import SearchUtils
-
-        return SearchUtils.matches_search(obj, self._search_term)
-
-    def _passes_advanced_filters(self, obj: Union[Event, Entity]) -> bool:
-        """
-        Checks if an object passes the advanced tag filters.
-
-        Args:
-            obj: Event or Entity object.
-
-        Returns:
-            bool: True if passes all advanced filters.
-        """
-        if not self._advanced_filter_config:
-            return True
-
-        include_tags = self._advanced_filter_config.get("include", [])
-        exclude_tags = self._advanced_filter_config.get("exclude", [])
-        match_all = self._advanced_filter_config.get("match_all", False)
-
-        if not include_tags and not exclude_tags:
-            return True
-
-        item_tags = set(getattr(obj, "tags", []))
-
-        # Exclude check first
-        if exclude_tags and any(tag in item_tags for tag in exclude_tags):
-            return False
-
-        # Include check
-        if include_tags:
-            if match_all and not all(tag in item_tags for tag in include_tags):
-                return False
-            if not match_all and not any(tag in item_tags for tag in include_tags):
-                return False
-
-        return True
-
-    def _passes_filters(self, obj: Union[Event, Entity]) -> bool:
-        """
-        Checks if an object passes all active filters (search + advanced tags).
-
-        Args:
-            obj: Event or Entity object.
-
-        Returns:
-            bool: True if passes all filters.
+            text (str): The search text.
         """
-        # Check advanced tag filters
-        if not self._passes_advanced_filters(obj):
-            return False
-
-        # Check search term
-        if not self._matches_search(obj):
-            return False
+        if text.strip():
+            self._search_timer.start()
+        else:
+            self._apply_search()
 
-        return True
+    @Slot()
+    def _apply_search(self) -> None:
+        """Filters the list by the search bar text."""
+        self._search_timer.stop()
+        self._search_term = SearchUtils.normalize_term(self.search_bar.text())
+        self._refresh_view()
 
     @Slot(str)
     @Slot(str)
@@ -459,7 +897,7 @@ class UnifiedListWidget(QWidget):
         Args:
             text (str): The selected filter text.
         """
-        self._render_list()
+        self._refresh_view()
 
     @Slot()
     @Slot()
@@ -467,11 +905,11 @@ class UnifiedListWidget(QWidget):
         """
         Handles item selection changes in the list.
         """
-        items = self.list_widget.selectedItems()
-        if items:
-            item = items[0]
-            item_id = item.data(Qt.ItemDataRole.UserRole)
-            item_type = item.data(Qt.ItemDataRole.UserRole + 1)
+        if self._restoring_selection:
+            return
+        key = self._selected_key()
+        if key:
+            item_type, item_id = key
             self.item_selected.emit(item_type, item_id)
             self.btn_delete.setEnabled(True)
         else:
@@ -483,11 +921,9 @@ class UnifiedListWidget(QWidget):
         """
         Handles delete button clicks.
         """
-        items = self.list_widget.selectedItems()
-        if items:
-            item = items[0]
-            item_id = item.data(Qt.ItemDataRole.UserRole)
-            item_type = item.data(Qt.ItemDataRole.UserRole + 1)
+        key = self._selected_key()
+        if key:
+            item_type, item_id = key
             self.delete_requested.emit(item_type, item_id)
 
     def select_item(self, item_type: str, item_id: str) -> None:
@@ -502,21 +938,18 @@ class UnifiedListWidget(QWidget):
 
         def find_and_select() -> bool:
             """
-            Inner function to search list and select matching item.
+            Inner function to find and select the matching row.
 
-            Searches all items in the list widget for one matching the given
-            type and ID, then selects and scrolls to it.
+            Looks up the row showing the item with the given type and ID,
+            then selects and scrolls to it.
             """
-            for index in range(self.list_widget.count()):
-                item = self.list_widget.item(index)
-                if (
-                    item.data(Qt.ItemDataRole.UserRole) == item_id
-                    and item.data(Qt.ItemDataRole.UserRole + 1) == item_type
-                ):
-                    self.list_widget.setCurrentItem(item)
-                    self.list_widget.scrollToItem(item)
-                    return True
-            return False
+            row = self._visible_row(item_type, item_id)
+            if row is None:
+                return False
+            index = self.proxy_model.index(row)
+            self.list_widget.setCurrentIndex(index)
+            self.list_widget.scrollTo(index)
+            return True
 
         if find_and_select():
             return
@@ -534,7 +967,7 @@ class UnifiedListWidget(QWidget):
         if should_switch:
             # Switch to All Items is safest
             self.filter_combo.setCurrentText("All Items")
-            # Signal should trigger _render_list synchronously
+            # Signal should trigger _refresh_view synchronously
             find_and_select()
         else:
             # If we didn't switch filters (or even if we did and it's still not there due to another reason),
@@ -4,7 +4,6 @@ A specialized QTextEdit that supports WikiLink navigation via Ctrl+Click.
 """
 
 import logging
-import re
 from typing import Any, List, Optional
 
 from PySide6.QtCore import QStringListModel, Qt, Signal, Slot
@@ -25,10 +24,19 @@ from PySide6.QtWidgets import (
 )
 
 from src.core.theme_manager import ThemeManager
-from src.core.wiki_ast import CursorMapper, WikiASTParser, WikiASTSerializer
+from src.core.wiki_ast import (
+    CursorMapper,
+    WikiASTParser,
+    WikiASTSerializer,
+    WikiNode,
+)
+from src.services.wiki_render_service import LinkTargets, get_wiki_render_service
 
 logger = logging.getLogger(__name__)
 
+# Texts at least this long (in characters) are rendered on a background thread
+ASYNC_RENDER_THRESHOLD = 8000
+
 
 class WikiTextEdit(QTextEdit):
     """
@@ -40,6 +48,7 @@ class WikiTextEdit(QTextEdit):
 
     link_clicked = Signal(str)  # Emits the target name (e.g. "Gandalf")
     link_added = Signal(str, str)  # Emits (target_id_or_name, display_name) on creation
+    render_finished = Signal()  # Emitted when a background render is shown
 
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         """
@@ -54,6 +63,18 @@ class WikiTextEdit(QTextEdit):
         self._completion_map = {}  # Maps display names to IDs
         self._link_resolver = None  # Will be set later
         self._current_wiki_text = ""  # Store for re-rendering on theme change
+        self._link_targets: Optional[LinkTargets] = None  # None: all links valid
+        # Cursor mapping AST of _cursor_ast_text, updated incrementally
+        self._ast_parser = WikiASTParser()
+        self._ast_serializer = WikiASTSerializer()
+        self._cursor_ast: Optional[WikiNode] = None
+        self._cursor_ast_text = ""
+
+        # Background rendering of long texts
+        self._render_service = get_wiki_render_service()
+        self._render_service.finished.connect(self._on_render_finished)
+        self._render_request_id: Optional[int] = None
+        self._read_only_before_render = False
 
         # Enable mouse tracking for hover effects if desired
         self.setMouseTracking(True)
@@ -122,6 +143,32 @@ class WikiTextEdit(QTextEdit):
         y = padding
         self.btn_toggle_view.move(x, y)
 
+    def _cursor_mapper(self, md_text: str) -> CursorMapper:
+        """
+        Builds a cursor mapper between Markdown source and rendered text.
+
+        The AST from the previous toggle is re-parsed only where the text
+        changed. Markdown spans stay source positions (no to_markdown()
+        pass), so blank lines between paragraphs are accounted for.
+
+        Args:
+            md_text: The Markdown source.
+
+        Returns:
+            CursorMapper: Mapper for md_text.
+        """
+        if self._cursor_ast is None:
+            ast = self._ast_parser.parse(md_text)
+            self._ast_serializer.to_plaintext(ast)
+        else:
+            ast, changed = self._ast_parser.reparse(
+                self._cursor_ast, self._cursor_ast_text, md_text
+            )
+            self._ast_serializer.update_plaintext(ast, changed)
+        self._cursor_ast = ast
+        self._cursor_ast_text = md_text
+        return CursorMapper(ast)
+
     @Slot()
     def toggle_view_mode(self) -> None:
         """
@@ -135,14 +182,9 @@ class WikiTextEdit(QTextEdit):
         if self._view_mode == "rich":
             # Rich -> Source: Map HTML cursor to MD cursor
             md_text = self.get_wiki_text()
+            self._cancel_pending_render()
 
-            # Build AST for cursor mapping
-            parser = WikiASTParser()
-            serializer = WikiASTSerializer()
-            ast = parser.parse(md_text)
-            _, ast = serializer.to_markdown(ast)
-            _, ast = serializer.to_plaintext(ast)
-            mapper = CursorMapper(ast)
+            mapper = self._cursor_mapper(md_text)
 
             # Map cursor position from HTML (PlainText) to MD
             new_cursor_pos = mapper.html_to_md(old_cursor_pos)
@@ -170,21 +212,15 @@ class WikiTextEdit(QTextEdit):
             # Source -> Rich: Map MD cursor to HTML cursor
             raw_text = self.toPlainText()
 
-            # Build AST for cursor mapping
-            parser = WikiASTParser()
-            serializer = WikiASTSerializer()
-            ast = parser.parse(raw_text)
-            _, ast = serializer.to_markdown(ast)
-            _, ast = serializer.to_plaintext(ast)
-            mapper = CursorMapper(ast)
+            mapper = self._cursor_mapper(raw_text)
 
             # Map cursor position from MD to HTML (PlainText)
             new_cursor_pos = mapper.md_to_html(old_cursor_pos)
 
-            # Switch mode
+            # Switch mode (rendering now, as the cursor is restored below)
             self._view_mode = "rich"
-            self._current_wiki_text = None  # Force re-render
-            self.set_wiki_text(raw_text)
+            self._current_wiki_text = raw_text
+            self._render_rich(raw_text, allow_async=False)
 
             # Restore cursor (clamped to valid range)
             doc_length = self.document().characterCount()
@@ -254,6 +290,9 @@ class WikiTextEdit(QTextEdit):
             # Create set of lower-case names and IDs for validation
             self._valid_targets_lower = {name.lower() for name in self._completion_map}
             self._valid_ids = {item_id for item_id, _, _ in items}
+            self._link_targets = LinkTargets(
+                frozenset(self._valid_targets_lower), frozenset(self._valid_ids)
+            )
 
         elif names is not None:
             # Legacy mode - no ID mapping
@@ -261,6 +300,7 @@ class WikiTextEdit(QTextEdit):
             display_names = names
             self._valid_targets_lower = {name.lower() for name in names}
             self._valid_ids = set()
+            self._link_targets = LinkTargets(frozenset(self._valid_targets_lower))
         else:
             return
 
@@ -395,9 +435,11 @@ class WikiTextEdit(QTextEdit):
         """
         Sets the content using WikiLink syntax, converting it to HTML anchors.
         Uses the 'markdown' library for rich text rendering.
-        """
-        import markdown
 
+        Renders are cached; long texts that miss the cache are rendered on a
+        background thread, leaving the editor empty and read-only until the
+        HTML arrives (see render_finished).
+        """
         if text is None:
             text = ""
 
@@ -411,6 +453,7 @@ class WikiTextEdit(QTextEdit):
 
         # If in Source mode, just set the raw text and ignore HTML rendering
         if hasattr(self, "_view_mode") and self._view_mode == "source":
+            self._cancel_pending_render()
             # Block signals to prevent textChanged during programmatic update
             was_blocked = self.blockSignals(True)
             try:
@@ -424,67 +467,41 @@ class WikiTextEdit(QTextEdit):
 
         # Store text for re-rendering on theme change
         self._current_wiki_text = text
+        self._render_rich(text, allow_async=True)
 
-        # 1. Pre-process WikiLinks [[Target|Label]] -> Markdown [Label](Target)
-        # Markdown library processes standard links [Label](URL) naturally.
-        pattern = re.compile(r"\[\[([^]|]+)(?:\|([^]]+))?\]\]")
-
-        def replace_link_md(match: re.Match) -> str:
-            """
-            Convert WikiLink syntax to Markdown link syntax.
-            Checks validity of target against known items.
-            """
-            target = match[1].strip()
-            label = match[2].strip() if match[2] else target
-
-            # Check existence
-            is_valid = False
-
-            # Handle id: prefix for ID-based links
-            # Links can be:
-            #   [[Name]] -> target = "Name"
-            #   [[id:UUID|Label]] -> target = "id:UUID"
-            check_target = target
-            if target.startswith("id:"):
-                # Strip "id:" prefix for ID lookup
-                check_target = target[3:]
-
-            # Check names (case insensitive)
-            if (
-                hasattr(self, "_valid_targets_lower")
-                and check_target.lower() in self._valid_targets_lower
-            ):
-                is_valid = True
-            # Check IDs (exact match with stripped prefix)
-            elif hasattr(self, "_valid_ids") and check_target in self._valid_ids:
-                is_valid = True
-
-            # Fallback for when completer hasn't been set yet (don't mark red)
-            elif not hasattr(self, "_valid_targets_lower"):
-                is_valid = True
+    def is_render_pending(self) -> bool:
+        """
+        Checks whether a background render has not been shown yet.
 
-            if not is_valid:
-                pass
+        Returns:
+            bool: True while the editor waits for rendered HTML.
+        """
+        return self._render_request_id is not None
 
-            if is_valid:
-                return f"[{label}]({target})"
-            else:
-                # Render as raw HTML anchor with style for red color
-                return f'<a href="{target}" style="color: red;">{label}</a>'
+    def _render_rich(self, text: str, allow_async: bool) -> None:
+        """
+        Shows the rendered HTML of wiki text.
 
-        md_text = pattern.sub(replace_link_md, text)
+        Args:
+            text: Wiki text to render.
+            allow_async: Whether long texts missing the cache may be rendered
+                in the background.
+        """
+        self._cancel_pending_render()
+        css = self._get_theme_css()
+        service = self._render_service
 
-        # 2. Convert Markdown to HTML
-        # extensions=['extra'] enables tables, attr_list, def_list, etc.
-        html_body = markdown.markdown(md_text, extensions=["extra", "nl2br"])
+        html_content = service.get(service.cache_key(text, css, self._link_targets))
+        if html_content is None:
+            if allow_async and len(text) >= ASYNC_RENDER_THRESHOLD:
+                self._begin_pending_render(text, css)
+                return
+            html_content = service.render(text, css, self._link_targets)
 
-        # 3. Get theme CSS and wrap content with embedded stylesheet
-        # Embedding CSS directly in HTML ensures Qt applies it correctly
-        css = self._get_theme_css()
-        html_content = (
-            f"<html><head><style>{css}</style></head><body>{html_body}</body></html>"
-        )
+        self._show_html(html_content)
 
+    def _show_html(self, html_content: str) -> None:
+        """Replaces the document with rendered HTML without signalling edits."""
         # Block signals to prevent textChanged during programmatic update
         was_blocked = self.blockSignals(True)
         try:
@@ -492,6 +509,48 @@ class WikiTextEdit(QTextEdit):
         finally:
             self.blockSignals(was_blocked)
 
+    def _begin_pending_render(self, text: str, css: str) -> None:
+        """
+        Clears the editor and queues a background render of the text.
+
+        The editor stays read-only until the render is shown, so no edits
+        are made to a document that is about to be replaced.
+        """
+        self._read_only_before_render = self.isReadOnly()
+        self.setReadOnly(True)
+        was_blocked = self.blockSignals(True)
+        try:
+            self.clear()
+        finally:
+            self.blockSignals(was_blocked)
+        self._render_request_id = self._render_service.submit(
+            id(self), text, css, self._link_targets
+        )
+
+    def _cancel_pending_render(self) -> None:
+        """Discards the pending background render, if any."""
+        if self._render_request_id is None:
+            return
+        self._render_service.cancel(id(self))
+        self._render_request_id = None
+        self.setReadOnly(self._read_only_before_render)
+
+    @Slot(int, str)
+    def _on_render_finished(self, request_id: int, html_content: str) -> None:
+        """
+        Shows a background render unless it was superseded.
+
+        Args:
+            request_id: ID of the finished request.
+            html_content: The rendered HTML.
+        """
+        if request_id != self._render_request_id:
+            return  # Another editor's request, or a stale one
+        self._render_request_id = None
+        self.setReadOnly(self._read_only_before_render)
+        self._show_html(html_content)
+        self.render_finished.emit()
+
     def get_wiki_text(self) -> str:
         """
         Converts the editor content back to WikiLink syntax.
@@ -500,6 +559,10 @@ class WikiTextEdit(QTextEdit):
         if hasattr(self, "_view_mode") and self._view_mode == "source":
             return self.toPlainText()
 
+        # The document is empty until the background render arrives
+        if self.is_render_pending():
+            return self._current_wiki_text
+
         result = []
         block = self.document().begin()
         while block.isValid():
@@ -1032,22 +1095,8 @@ class WikiTextEdit(QTextEdit):
         Returns:
             bool: True if valid, False if broken/non-existent.
         """
-        # Handle id: prefix
-        check_target = target[3:] if target.startswith("id:") else target
-
-        # Check names (case insensitive)
-        if (
-            hasattr(self, "_valid_targets_lower")
-            and check_target.lower() in self._valid_targets_lower
-        ):
-            return True
-
-        # Check IDs
-        if hasattr(self, "_valid_ids") and check_target in self._valid_ids:
-            return True
-
-        # Fallback if completer not set
-        return not hasattr(self, "_valid_targets_lower")
+        # Every target counts as valid until the completer is set
+        return self._link_targets is None or self._link_targets.is_valid(target)
 
     def _check_for_completion(self) -> None:
         """
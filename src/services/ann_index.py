@@ -0,0 +1,494 @@
+"""
+Approximate Nearest Neighbour Index Module.
+
+Provides a pure-NumPy IVF (inverted file) index over normalized embedding
+vectors. Vectors are clustered with spherical k-means and stored grouped by
+cluster, so a query only scores the few clusters closest to it.
+
+Indexes are persisted as a directory of .npy arrays plus JSON metadata and
+are memory-mapped on load instead of re-reading the embeddings table. Each
+save writes a new data folder and then switches meta.json over to it, so an
+index that is still memory-mapped (which Windows refuses to delete) is never
+replaced in place.
+"""
+
+import json
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.services.search_service import (
+    OBJECT_TYPE_CODES,
+    EmbeddingFingerprint,
+    dot_scores,
+    top_k_indices,
+)
+
+logger = logging.getLogger(__name__)
+
+INDEX_FORMAT = "ivf-flat"
+INDEX_VERSION = 3
+
+# Number of clusters probed per query unless overridden
+DEFAULT_N_PROBE = 8
+
+# Training sample size per cluster for k-means
+TRAIN_POINTS_PER_LIST = 64
+
+# Rows scored per chunk when assigning vectors to clusters
+ASSIGN_CHUNK_SIZE = 8192
+
+_META_FILE = "meta.json"
+_IDS_FILE = "ids.json"
+_DATA_PREFIX = "data-"
+_ARRAY_FILES = ("centroids", "offsets", "vectors", "type_codes")
+
+
+def index_path(index_dir: Path, model: str) -> Path:
+    """
+    Get the on-disk location of the index for a model.
+
+    This is the only place index locations are derived, so indexes written
+    by the CLI, EmbeddingService and SearchService are found by each other.
+    Index directories are per world (see default_index_dir), so the name
+    only depends on the model.
+
+    Args:
+        index_dir: Directory holding index files.
+        model: Embedding model name.
+
+    Returns:
+        Path: Index directory path for the model.
+    """
+    safe_model_name = model.replace(":", "_").replace("/", "_")
+    return Path(index_dir) / f"{safe_model_name}.index"
+
+
+def _remove_stale_data(path: Path, keep: str) -> None:
+    """
+    Delete index files other than meta.json and the current data folder.
+
+    Files still memory-mapped by this or another process cannot be removed
+    on Windows; they are left for a later save to clean up.
+
+    Args:
+        path: Index directory.
+        keep: Name of the data folder meta.json points to.
+    """
+    for entry in path.iterdir():
+        if entry.name in (keep, _META_FILE):
+            continue
+        try:
+            if entry.is_dir():
+                shutil.rmtree(entry)
+            else:
+                entry.unlink()
+        except OSError as e:
+            logger.debug(f"Keeping old index data {entry} for now: {e}")
+
+
+def _assign(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """
+    Assign each vector to its most similar centroid.
+
+    Args:
+        vectors: Matrix of normalized vectors.
+        centroids: Matrix of normalized centroids.
+
+    Returns:
+        np.ndarray: Cluster index per vector.
+    """
+    assignments = np.empty(vectors.shape[0], dtype=np.int64)
+    for start in range(0, vectors.shape[0], ASSIGN_CHUNK_SIZE):
+        chunk = vectors[start : start + ASSIGN_CHUNK_SIZE]
+        assignments[start : start + len(chunk)] = np.argmax(chunk @ centroids.T, axis=1)
+    return assignments
+
+
+def _train_centroids(
+    sample: np.ndarray, n_lists: int, iterations: int, rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Train cluster centroids with spherical k-means.
+
+    Args:
+        sample: Training vectors (normalized).
+        n_lists: Number of clusters.
+        iterations: Number of k-means iterations.
+        rng: Random generator used for seeding.
+
+    Returns:
+        np.ndarray: Normalized centroid matrix of shape (n_lists, dimension).
+    """
+    centroids = sample[rng.choice(len(sample), n_lists, replace=False)].copy()
+
+    for _ in range(iterations):
+        assignments = _assign(sample, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignments, sample)
+        counts = np.bincount(assignments, minlength=n_lists)
+
+        # Reseed empty clusters from random sample points
+        empty = np.flatnonzero(counts == 0)
+        if empty.size:
+            sums[empty] = sample[rng.choice(len(sample), empty.size)]
+
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        centroids = sums / np.maximum(norms, 1e-12)
+
+    return centroids.astype(np.float32)
+
+
+class IVFIndex:
+    """
+    Inverted-file index with exact scoring inside probed clusters.
+
+    Vectors are stored sorted by cluster; offsets[i]:offsets[i + 1] is the
+    row range of cluster i.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        dimension: int,
+        centroids: np.ndarray,
+        offsets: np.ndarray,
+        vectors: np.ndarray,
+        type_codes: np.ndarray,
+        embedding_ids: List[str],
+        fingerprint: Optional[EmbeddingFingerprint] = None,
+        n_probe: int = DEFAULT_N_PROBE,
+    ) -> None:
+        """
+        Initialize the index from prebuilt arrays.
+
+        Args:
+            model: Embedding model name.
+            dimension: Vector dimension.
+            centroids: Cluster centroid matrix.
+            offsets: Row offsets per cluster (length n_lists + 1).
+            vectors: Vectors sorted by cluster.
+            type_codes: Object type code per vector row.
+            embedding_ids: Embeddings table row ID per vector row.
+            fingerprint: Fingerprint of the model's embeddings at build time.
+            n_probe: Default number of clusters probed per query.
+        """
+        self.model = model
+        self.dimension = dimension
+        self.centroids = centroids
+        self.offsets = offsets
+        self.vectors = vectors
+        self.type_codes = type_codes
+        self.embedding_ids = embedding_ids
+        self.fingerprint = fingerprint
+        self.n_probe = n_probe
+
+    def __len__(self) -> int:
+        """Return the number of indexed vectors."""
+        return len(self.embedding_ids)
+
+    def is_fresh(
+        self, fingerprint: EmbeddingFingerprint, object_type: Optional[str] = None
+    ) -> bool:
+        """
+        Check whether the indexed embeddings are unchanged.
+
+        Args:
+            fingerprint: Current fingerprint of the model's embeddings.
+            object_type: Only check this object type (all types if None).
+
+        Returns:
+            bool: True if the index matches the embeddings table.
+        """
+        if self.fingerprint is None:
+            return False
+        if object_type is None:
+            return self.fingerprint == fingerprint
+        return self.fingerprint.get(object_type) == fingerprint.get(object_type)
+
+    @property
+    def n_lists(self) -> int:
+        """Number of clusters in the index."""
+        return int(self.centroids.shape[0])
+
+    @classmethod
+    def build(
+        cls,
+        model: str,
+        dimension: int,
+        vectors: np.ndarray,
+        embedding_ids: Sequence[str],
+        type_codes: np.ndarray,
+        fingerprint: Optional[EmbeddingFingerprint] = None,
+        n_lists: Optional[int] = None,
+        iterations: int = 10,
+        seed: int = 42,
+    ) -> "IVFIndex":
+        """
+        Cluster vectors and build an index.
+
+        Args:
+            model: Embedding model name.
+            dimension: Vector dimension.
+            vectors: Matrix of normalized vectors.
+            embedding_ids: Embeddings table row ID per vector.
+            type_codes: Object type code per vector.
+            fingerprint: Fingerprint of the model's embeddings at build time.
+            n_lists: Number of clusters (defaults to sqrt of vector count).
+            iterations: Number of k-means iterations.
+            seed: Random seed for reproducible builds.
+
+        Returns:
+            IVFIndex: The built index.
+
+        Raises:
+            ValueError: If no vectors are provided.
+        """
+        count = vectors.shape[0]
+        if count == 0:
+            raise ValueError("Cannot build an index without vectors")
+
+        n_lists = min(n_lists or max(1, int(np.sqrt(count))), count)
+        rng = np.random.default_rng(seed)
+
+        sample_size = min(count, n_lists * TRAIN_POINTS_PER_LIST)
+        sample = vectors[np.sort(rng.choice(count, sample_size, replace=False))]
+        centroids = _train_centroids(sample, n_lists, iterations, rng)
+
+        assignments = _assign(vectors, centroids)
+        order = np.argsort(assignments, kind="stable")
+        offsets = np.zeros(n_lists + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(np.bincount(assignments, minlength=n_lists))
+
+        logger.info(f"Built IVF index for {model}: {count} vectors in {n_lists} lists")
+        return cls(
+            model=model,
+            dimension=dimension,
+            centroids=centroids,
+            offsets=offsets,
+            vectors=np.ascontiguousarray(vectors[order], dtype=np.float32),
+            type_codes=np.ascontiguousarray(type_codes[order], dtype=np.int8),
+            embedding_ids=[embedding_ids[i] for i in order],
+            fingerprint=fingerprint,
+            n_probe=min(DEFAULT_N_PROBE, n_lists),
+        )
+
+    def search(
+        self,
+        query_vector: np.ndarray,
+        top_k: int,
+        object_type: Optional[str] = None,
+        n_probe: Optional[int] = None,
+    ) -> List[Tuple[float, str]]:
+        """
+        Find approximate nearest neighbours of a query.
+
+        Args:
+            query_vector: Normalized query vector.
+            top_k: Number of results to return.
+            object_type: Optional filter for 'entity' or 'event'.
+            n_probe: Clusters to probe (defaults to the index setting).
+
+        Returns:
+            List of (score, embedding_id) tuples sorted by descending score.
+        """
+        if top_k <= 0 or len(self) == 0:
+            return []
+
+        n_probe = min(n_probe or self.n_probe, self.n_lists)
+        probed = top_k_indices(dot_scores(query_vector, self.centroids), n_probe)
+
+        rows = np.concatenate(
+            [np.arange(self.offsets[i], self.offsets[i + 1]) for i in probed]
+        )
+        if object_type:
+            code = OBJECT_TYPE_CODES.get(object_type, -1)
+            rows = rows[self.type_codes[rows] == code]
+        if rows.size == 0:
+            return []
+
+        scores = dot_scores(query_vector, self.vectors[rows])
+        best = top_k_indices(scores, top_k)
+        return [(float(scores[i]), self.embedding_ids[rows[i]]) for i in best]
+
+    def evaluate(
+        self,
+        top_k: int = 10,
+        n_queries: int = 100,
+        n_probe: Optional[int] = None,
+        seed: int = 0,
+    ) -> Dict[str, float]:
+        """
+        Measure recall@k and latency against exact brute-force search.
+
+        Queries are sampled from the indexed vectors.
+
+        Args:
+            top_k: Number of neighbours compared per query.
+            n_queries: Number of sampled queries.
+            n_probe: Clusters to probe (defaults to the index setting).
+            seed: Random seed for query sampling.
+
+        Returns:
+            Dict with recall, ann_ms and brute_force_ms (mean per query).
+        """
+        count = len(self)
+        if count == 0:
+            return {"recall": 0.0, "ann_ms": 0.0, "brute_force_ms": 0.0}
+
+        rng = np.random.default_rng(seed)
+        queries = self.vectors[rng.choice(count, min(n_queries, count), replace=False)]
+        k = min(top_k, count)
+
+        ann_time = 0.0
+        brute_time = 0.0
+        hits = 0
+        for query in queries:
+            start = time.perf_counter()
+            approx = self.search(query, k, n_probe=n_probe)
+            ann_time += time.perf_counter() - start
+
+            start = time.perf_counter()
+            exact = top_k_indices(dot_scores(query, self.vectors), k)
+            brute_time += time.perf_counter() - start
+
+            exact_ids = {self.embedding_ids[i] for i in exact}
+            hits += sum(1 for _, eid in approx if eid in exact_ids)
+
+        n = len(queries)
+        return {
+            "recall": hits / (n * k),
+            "ann_ms": ann_time / n * 1000.0,
+            "brute_force_ms": brute_time / n * 1000.0,
+        }
+
+    def save(self, path: Path) -> None:
+        """
+        Persist the index to a directory, replacing any existing index.
+
+        The arrays go to a new data folder and meta.json is replaced last,
+        so readers see either the old or the new index. Folders of previous
+        saves are removed unless they are still mapped by a loaded index.
+
+        Args:
+            path: Target index directory.
+        """
+        path = Path(path)
+        if path.exists() and not path.is_dir():
+            path.unlink()
+        data_name = f"{_DATA_PREFIX}{time.time_ns()}"
+        data_path = path / data_name
+        data_path.mkdir(parents=True)
+
+        arrays = {
+            "centroids": self.centroids,
+            "offsets": self.offsets,
+            "vectors": self.vectors,
+            "type_codes": self.type_codes,
+        }
+        for name in _ARRAY_FILES:
+            np.save(data_path / f"{name}.npy", arrays[name])
+
+        with open(data_path / _IDS_FILE, "w") as f:
+            json.dump(self.embedding_ids, f)
+
+        meta: Dict[str, Any] = {
+            "format": INDEX_FORMAT,
+            "version": INDEX_VERSION,
+            "data": data_name,
+            "model": self.model,
+            "dimension": self.dimension,
+            "count": len(self),
+            "n_lists": self.n_lists,
+            "n_probe": self.n_probe,
+            "fingerprint": (
+                {key: list(value) for key, value in self.fingerprint.items()}
+                if self.fingerprint is not None
+                else None
+            ),
+            "created_at": time.time(),
+        }
+        tmp_meta = path / (_META_FILE + ".tmp")
+        with open(tmp_meta, "w") as f:
+            json.dump(meta, f, indent=2)
+        # Switch readers to the new data folder
+        os.replace(tmp_meta, path / _META_FILE)
+
+        _remove_stale_data(path, keep=data_name)
+        logger.info(f"Saved IVF index to {path}")
+
+    @staticmethod
+    def read_metadata(path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Read index metadata without loading the arrays.
+
+        Args:
+            path: Index directory.
+
+        Returns:
+            Dict of metadata, or None if no valid index exists at path.
+        """
+        meta_path = Path(path) / _META_FILE
+        if not meta_path.is_file():
+            return None
+        try:
+            with open(meta_path, "r") as f:
+                meta = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.error(f"Failed to read index metadata {meta_path}: {e}")
+            return None
+        if meta.get("format") != INDEX_FORMAT or meta.get("version") != INDEX_VERSION:
+            logger.warning(f"Unsupported index format at {path}")
+            return None
+        return meta
+
+    @classmethod
+    def load(cls, path: Path, mmap: bool = True) -> Optional["IVFIndex"]:
+        """
+        Load an index from disk.
+
+        Args:
+            path: Index directory.
+            mmap: If True, memory-map the vector arrays instead of reading them.
+
+        Returns:
+            IVFIndex, or None if no valid index exists at path.
+        """
+        meta = cls.read_metadata(path)
+        if meta is None:
+            return None
+
+        path = Path(path) / meta["data"]
+        mmap_mode = "r" if mmap else None
+        try:
+            arrays = {
+                name: np.load(path / f"{name}.npy", mmap_mode=mmap_mode)
+                for name in _ARRAY_FILES
+            }
+            with open(path / _IDS_FILE, "r") as f:
+                embedding_ids = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to load index from {path}: {e}")
+            return None
+
+        fingerprint = meta.get("fingerprint")
+        return cls(
+            model=meta["model"],
+            dimension=meta["dimension"],
+            centroids=np.asarray(arrays["centroids"]),
+            offsets=np.asarray(arrays["offsets"]),
+            vectors=arrays["vectors"],
+            type_codes=arrays["type_codes"],
+            embedding_ids=embedding_ids,
+            fingerprint=(
+                {key: tuple(value) for key, value in fingerprint.items()}
+                if isinstance(fingerprint, dict)
+                else None
+            ),
+            n_probe=meta.get("n_probe", DEFAULT_N_PROBE),
+        )
@@ -12,7 +12,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional
 
 try:
     from PySide6.QtCore import QThread, QTimer, Signal
@@ -25,9 +25,57 @@ except ImportError:
 
 from src.core.backup_config import BackupConfig
 from src.core.paths import get_backup_directory
+from src.services.backup_store import MANIFEST_SUFFIX, ChunkStore
 
 logger = logging.getLogger(__name__)
 
+# Pages copied per sqlite3 backup step; the source is only read-locked while
+# a step runs, so writers can commit between steps.
+BACKUP_PAGES_PER_STEP = 1024
+
+ProgressCallback = Callable[[int, int], None]
+
+
+def snapshot_database(
+    source_path: Path,
+    dest_path: Path,
+    progress: Optional[ProgressCallback] = None,
+    pages_per_step: int = BACKUP_PAGES_PER_STEP,
+) -> None:
+    """
+    Copies a database into a standalone file with SQLite's online backup API.
+
+    Unlike a file copy this includes committed WAL content and never captures
+    a half-written transaction. The copy is switched to rollback journal mode
+    so it is a single self-contained file.
+
+    Args:
+        source_path: Database to copy.
+        dest_path: File to write the snapshot to (replaced if it exists).
+        progress: Optional callback receiving (copied_pages, total_pages).
+        pages_per_step: Number of pages copied per backup step.
+    """
+    if dest_path.exists():
+        dest_path.unlink()
+
+    def on_progress(status: int, remaining: int, total: int) -> None:
+        progress(total - remaining, total)
+
+    source = sqlite3.connect(str(source_path))
+    try:
+        dest = sqlite3.connect(str(dest_path))
+        try:
+            source.backup(
+                dest,
+                pages=pages_per_step,
+                progress=on_progress if progress else None,
+            )
+            dest.execute("PRAGMA journal_mode=DELETE")
+        finally:
+            dest.close()
+    finally:
+        source.close()
+
 
 class BackupType(Enum):
     """Types of backups supported by the system."""
@@ -146,9 +194,13 @@ if HAS_QT:
             # Create temporary file
             temp_path = self.backup_path.parent / f".{self.backup_path.name}.tmp"
 
+            def on_progress(copied: int, total: int) -> None:
+                percent = copied * 100 // total if total else 100
+                self.backup_progress.emit(f"Creating backup... {percent}%")
+
             try:
-                # Copy database file
-                shutil.copy2(self.db_path, temp_path)
+                # Snapshot database file
+                snapshot_database(self.db_path, temp_path, on_progress)
 
                 # Verify the temp file is a valid SQLite database
                 conn = sqlite3.connect(str(temp_path))
@@ -293,14 +345,21 @@ class BackupService:
         db_path: Optional[Path] = None,
         backup_type: BackupType = BackupType.MANUAL,
         description: str = "",
+        progress_callback: Optional[ProgressCallback] = None,
     ) -> Optional[BackupMetadata]:
         """
         Creates a backup of the database.
 
+        The database is copied with SQLite's online backup API. With
+        incremental backups enabled the snapshot is then added to the chunk
+        store and only a manifest is kept in the backup directory.
+
         Args:
             db_path: Path to database file (uses current if not specified).
             backup_type: Type of backup to create.
             description: Optional description for manual backups.
+            progress_callback: Optional callback receiving
+                (copied_pages, total_pages) while the database is copied.
 
         Returns:
             BackupMetadata: Metadata for the created backup, or None on failure.
@@ -312,38 +371,59 @@ class BackupService:
             logger.error("Cannot create backup: database path not set or doesn't exist")
             return None
 
+        temp_path = None
+
         try:
             # Generate backup filename
             backup_path = self._generate_backup_path(db_path, backup_type, description)
+            if self.config.incremental_backup:
+                backup_path = backup_path.with_suffix(MANIFEST_SUFFIX)
 
             # Ensure backup directory exists
             backup_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Create temporary file
-            temp_path = backup_path.parent / f".{backup_path.name}.tmp"
-
-            # Copy database file
-            shutil.copy2(db_path, temp_path)
+            temp_path = backup_path.parent / f".{backup_path.stem}.kraken.tmp"
 
-            # Verify backup integrity
-            if self.config.verify_after_backup:
-                if not self._verify_backup_file(temp_path):
-                    temp_path.unlink()
-                    logger.error("Backup verification failed")
-                    return None
-
-            # Calculate checksum
-            checksum = self._calculate_checksum(temp_path)
+            # Snapshot database file
+            snapshot_database(db_path, temp_path, progress_callback)
 
-            # Atomically rename to final path
-            temp_path.replace(backup_path)
+            if self.config.incremental_backup:
+                # Store changed chunks; the manifest becomes the backup file
+                stored = self._get_chunk_store().add_snapshot(temp_path, backup_path)
+                temp_path.unlink()
+                checksum = stored.checksum
+
+                # Unchanged chunks were verified when first stored
+                if self.config.verify_after_backup:
+                    if not self._get_chunk_store().verify_chunks(stored.new_chunks):
+                        backup_path.unlink()
+                        logger.error("Backup verification failed")
+                        return None
+            else:
+                # Verify backup integrity
+                if self.config.verify_after_backup:
+                    if not self._verify_backup_file(temp_path):
+                        temp_path.unlink()
+                        logger.error("Backup verification failed")
+                        return None
+
+                # Calculate checksum
+                checksum = self._calculate_checksum(temp_path)
+
+                # Atomically rename to final path
+                temp_path.replace(backup_path)
 
             # Create metadata
             metadata = BackupMetadata(
                 backup_path=backup_path,
                 backup_type=backup_type,
                 timestamp=datetime.now(),
-                size=backup_path.stat().st_size,
+                size=(
+                    stored.size
+                    if self.config.incremental_backup
+                    else backup_path.stat().st_size
+                ),
                 checksum=checksum,
                 description=description,
             )
@@ -363,6 +443,8 @@ class BackupService:
 
         except Exception as e:
             logger.error(f"Failed to create backup: {e}", exc_info=True)
+            if temp_path and temp_path.exists():
+                temp_path.unlink()
             return None
 
     def restore_backup(
@@ -372,7 +454,7 @@ class BackupService:
         Restores a database from a backup.
 
         Args:
-            backup_path: Path to the backup file to restore.
+            backup_path: Path to the backup file or incremental manifest.
             target_path: Path to restore to (uses current DB if not specified).
 
         Returns:
@@ -389,28 +471,39 @@ class BackupService:
             logger.error(f"Backup file not found: {backup_path}")
             return False
 
-        temp_path = None  # Initialize to None for cleanup handling
+        # Create temporary file
+        temp_path = target_path.parent / f".{target_path.name}.tmp"
+        incremental = backup_path.suffix == MANIFEST_SUFFIX
 
         try:
+            if incremental:
+                # Reassemble the snapshot, then check it like a backup file
+                self._get_chunk_store().restore(backup_path, temp_path)
+                verified_path = temp_path
+            else:
+                verified_path = backup_path
+
             # Verify backup integrity
-            if not self._verify_backup_file(backup_path):
+            if not self._verify_backup_file(verified_path):
                 logger.error("Backup verification failed")
+                if temp_path.exists():
+                    temp_path.unlink()
                 return False
 
             # Create safety backup of current database
             if target_path.exists():
-                from datetime import datetime
-
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 safety_backup = target_path.parent / f"pre_restore_{timestamp}.kraken"
-                shutil.copy2(target_path, safety_backup)
+                try:
+                    snapshot_database(target_path, safety_backup)
+                except sqlite3.Error:
+                    # Unreadable as a database; keep the raw file instead
+                    shutil.copy2(target_path, safety_backup)
                 logger.info(f"Created safety backup: {safety_backup}")
 
-            # Create temporary file
-            temp_path = target_path.parent / f".{target_path.name}.tmp"
-
             # Copy backup to temp location
-            shutil.copy2(backup_path, temp_path)
+            if not incremental:
+                shutil.copy2(backup_path, temp_path)
 
             # Atomically replace current database
             temp_path.replace(target_path)
@@ -421,7 +514,7 @@ class BackupService:
         except Exception as e:
             logger.error(f"Failed to restore backup: {e}", exc_info=True)
             # Clean up temp file if exists
-            if temp_path and temp_path.exists():
+            if temp_path.exists():
                 temp_path.unlink()
             return False
 
@@ -452,11 +545,13 @@ class BackupService:
         Verifies the integrity of a backup file.
 
         Args:
-            backup_path: Path to the backup file to verify.
+            backup_path: Path to the backup file or incremental manifest.
 
         Returns:
             bool: True if backup is valid, False otherwise.
         """
+        if backup_path.suffix == MANIFEST_SUFFIX:
+            return self._get_chunk_store().verify(backup_path)
         return self._verify_backup_file(backup_path)
 
     def cleanup_old_backups(self) -> None:
@@ -467,6 +562,17 @@ class BackupService:
         for backup_type in BackupType:
             self._cleanup_by_type(backup_type)
 
+        # Drop chunks that no remaining incremental backup refers to
+        store = self._get_chunk_store()
+        if store.root.exists():
+            store.collect_garbage(
+                path
+                for backup_type in BackupType
+                for path in (store.root.parent / backup_type.value).glob(
+                    f"*{MANIFEST_SUFFIX}"
+                )
+            )
+
     def start_auto_backup(self, interval_minutes: Optional[int] = None) -> None:
         """
         Starts the automated backup timer.
@@ -508,6 +614,19 @@ class BackupService:
         if self._current_db_path:
             self.create_backup(backup_type=BackupType.AUTO_SAVE)
 
+    def _get_chunk_store(self) -> ChunkStore:
+        """
+        Returns the chunk store used for incremental backups.
+
+        Returns:
+            ChunkStore: Store rooted in the backup directory.
+        """
+        if self.config.backup_dir:
+            backup_dir = Path(self.config.backup_dir)
+        else:
+            backup_dir = get_backup_directory()
+        return ChunkStore(backup_dir / "store")
+
     def _generate_backup_path(
         self, db_path: Path, backup_type: BackupType, description: str = ""
     ) -> Path:
@@ -615,7 +734,7 @@ class BackupService:
         """
         sha256_hash = hashlib.sha256()
         with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
+            for byte_block in iter(lambda: f.read(1024 * 1024), b""):
                 sha256_hash.update(byte_block)
         return sha256_hash.hexdigest()
 
@@ -726,8 +845,13 @@ class BackupService:
             external_dir = self.config.external_backup_path / backup_type.value
             external_dir.mkdir(parents=True, exist_ok=True)
 
-            external_path = external_dir / backup_path.name
-            shutil.copy2(backup_path, external_path)
+            if backup_path.suffix == MANIFEST_SUFFIX:
+                # External copies are standalone database files
+                external_path = external_dir / f"{backup_path.stem}.kraken"
+                self._get_chunk_store().restore(backup_path, external_path)
+            else:
+                external_path = external_dir / backup_path.name
+                shutil.copy2(backup_path, external_path)
 
             logger.info(f"Copied backup to external location: {external_path}")
         except Exception as e:
@@ -0,0 +1,265 @@
+"""
+Backup Store Module.
+
+Content-addressed chunk store for incremental backups.
+
+A database snapshot is cut into fixed-size chunks, each stored once under its
+SHA-256 digest. A backup is a small JSON manifest listing the digests of its
+chunks, so consecutive snapshots share every chunk that did not change and
+only the changed chunks are written (and need verifying). Restoring
+reassembles the chunks in manifest order and checks the whole-file checksum.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, List, Set
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_SUFFIX = ".kmanifest"
+MANIFEST_VERSION = 1
+DEFAULT_CHUNK_SIZE = 256 * 1024  # 64 pages at SQLite's default page size
+
+
+@dataclass
+class StoredSnapshot:
+    """
+    Result of adding a snapshot to the store.
+
+    Attributes:
+        manifest_path: Path of the written manifest.
+        size: Size of the snapshot in bytes.
+        checksum: SHA256 checksum of the whole snapshot.
+        chunks: Digests of all chunks, in file order.
+        new_chunks: Digests of chunks that were not yet in the store.
+    """
+
+    manifest_path: Path
+    size: int
+    checksum: str
+    chunks: List[str] = field(default_factory=list)
+    new_chunks: List[str] = field(default_factory=list)
+
+
+class ChunkStore:
+    """
+    Deduplicating store of fixed-size snapshot chunks.
+
+    Chunks live in ``<root>/chunks/<digest[:2]>/<digest>``. Chunk and manifest
+    files are written to a temporary name and renamed into place, so an
+    interrupted backup never leaves a truncated chunk behind.
+    """
+
+    def __init__(self, root: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """
+        Initializes the store.
+
+        Args:
+            root: Directory holding the chunks.
+            chunk_size: Size in bytes of chunks cut from new snapshots.
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"Invalid chunk size: {chunk_size}")
+        self.root = Path(root)
+        self.chunk_size = chunk_size
+
+    def _chunk_path(self, digest: str) -> Path:
+        """Returns the file path of a chunk."""
+        return self.root / "chunks" / digest[:2] / digest
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        """Writes a file through a temporary name and renames it into place."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.parent / f".{path.name}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+    def add_snapshot(self, snapshot_path: Path, manifest_path: Path) -> StoredSnapshot:
+        """
+        Stores a snapshot file and writes its manifest.
+
+        The file is read once: chunk digests, the whole-file checksum and the
+        writes of new chunks all happen in the same pass.
+
+        Args:
+            snapshot_path: Database snapshot to store.
+            manifest_path: Where to write the manifest.
+
+        Returns:
+            StoredSnapshot: Summary of the stored snapshot.
+        """
+        file_hash = hashlib.sha256()
+        result = StoredSnapshot(manifest_path=manifest_path, size=0, checksum="")
+        written: Set[str] = set()
+
+        with open(snapshot_path, "rb") as f:
+            for chunk in iter(lambda: f.read(self.chunk_size), b""):
+                file_hash.update(chunk)
+                digest = hashlib.sha256(chunk).hexdigest()
+                result.chunks.append(digest)
+                result.size += len(chunk)
+
+                if digest in written or self._chunk_path(digest).exists():
+                    continue
+                self._write_atomic(self._chunk_path(digest), chunk)
+                written.add(digest)
+                result.new_chunks.append(digest)
+
+        result.checksum = file_hash.hexdigest()
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "chunk_size": self.chunk_size,
+            "size": result.size,
+            "checksum": result.checksum,
+            "chunks": result.chunks,
+        }
+        self._write_atomic(manifest_path, json.dumps(manifest).encode("utf-8"))
+
+        logger.debug(
+            f"Stored snapshot {manifest_path.name}: {len(result.chunks)} chunks, "
+            f"{len(result.new_chunks)} new"
+        )
+        return result
+
+    @staticmethod
+    def load_manifest(manifest_path: Path) -> dict:
+        """
+        Reads a manifest file.
+
+        Args:
+            manifest_path: Path to the manifest.
+
+        Returns:
+            dict: The manifest contents.
+
+        Raises:
+            ValueError: If the file is not a supported manifest.
+        """
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if (
+            not isinstance(manifest, dict)
+            or manifest.get("version") != MANIFEST_VERSION
+        ):
+            raise ValueError(f"Unsupported backup manifest: {manifest_path}")
+        return manifest
+
+    def verify_chunks(self, digests: Iterable[str]) -> bool:
+        """
+        Re-reads chunks and checks that each still matches its digest.
+
+        Args:
+            digests: Digests of the chunks to check.
+
+        Returns:
+            bool: True if every chunk exists and is intact.
+        """
+        for digest in dict.fromkeys(digests):
+            try:
+                data = self._chunk_path(digest).read_bytes()
+            except OSError as e:
+                logger.error(f"Backup chunk {digest} unreadable: {e}")
+                return False
+            if hashlib.sha256(data).hexdigest() != digest:
+                logger.error(f"Backup chunk {digest} is corrupted")
+                return False
+        return True
+
+    def verify(self, manifest_path: Path) -> bool:
+        """
+        Verifies every chunk of a manifest and the whole-file checksum.
+
+        Args:
+            manifest_path: Path to the manifest.
+
+        Returns:
+            bool: True if the snapshot can be restored intact.
+        """
+        try:
+            manifest = self.load_manifest(manifest_path)
+            file_hash = hashlib.sha256()
+            size = 0
+            for digest in manifest["chunks"]:
+                data = self._chunk_path(digest).read_bytes()
+                if hashlib.sha256(data).hexdigest() != digest:
+                    logger.error(f"Backup chunk {digest} is corrupted")
+                    return False
+                file_hash.update(data)
+                size += len(data)
+        except (OSError, ValueError, KeyError) as e:
+            logger.error(f"Backup manifest verification failed: {e}")
+            return False
+
+        if size != manifest["size"] or file_hash.hexdigest() != manifest["checksum"]:
+            logger.error(f"Backup manifest {manifest_path} does not match its chunks")
+            return False
+        return True
+
+    def restore(self, manifest_path: Path, target_path: Path) -> None:
+        """
+        Reassembles a snapshot from its chunks.
+
+        Args:
+            manifest_path: Path to the manifest.
+            target_path: File to write the reassembled snapshot to.
+
+        Raises:
+            ValueError: If the reassembled file does not match the manifest.
+            OSError: If a chunk cannot be read or the target written.
+        """
+        manifest = self.load_manifest(manifest_path)
+        file_hash = hashlib.sha256()
+        size = 0
+
+        with open(target_path, "wb") as out:
+            for digest in manifest["chunks"]:
+                data = self._chunk_path(digest).read_bytes()
+                file_hash.update(data)
+                size += len(data)
+                out.write(data)
+
+        if size != manifest["size"] or file_hash.hexdigest() != manifest["checksum"]:
+            target_path.unlink()
+            raise ValueError(f"Backup {manifest_path} failed checksum on restore")
+
+    def collect_garbage(self, manifest_paths: Iterable[Path]) -> int:
+        """
+        Deletes chunks no longer referenced by any manifest.
+
+        Args:
+            manifest_paths: All manifests whose chunks must be kept.
+
+        Returns:
+            int: Number of chunks deleted.
+        """
+        live: Set[str] = set()
+        for manifest_path in manifest_paths:
+            try:
+                live.update(self.load_manifest(manifest_path)["chunks"])
+            except (OSError, ValueError, KeyError) as e:
+                # Keep everything rather than risk deleting a live chunk
+                logger.error(f"Skipping chunk cleanup, unreadable manifest: {e}")
+                return 0
+
+        deleted = 0
+        chunks_dir = self.root / "chunks"
+        if not chunks_dir.exists():
+            return 0
+        for chunk_path in chunks_dir.glob("*/*"):
+            if chunk_path.name.startswith(".") or chunk_path.name in live:
+                continue
+            try:
+                chunk_path.unlink()
+                deleted += 1
+            except OSError as e:
+                logger.error(f"Failed to delete backup chunk {chunk_path}: {e}")
+
+        if deleted:
+            logger.debug(f"Deleted {deleted} unreferenced backup chunks")
+        return deleted
@@ -11,6 +11,7 @@ import json
 import logging
 import sqlite3
 from contextlib import contextmanager
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
 from src.core.calendar import CalendarConfig
@@ -18,6 +19,13 @@ from src.core.entities import Entity
 from src.core.events import Event
 from src.core.map import Map
 from src.core.marker import Marker
+from src.services.fulltext_index import (
+    FULLTEXT_SCHEMA_SQL,
+    fulltext_index_is_current,
+    rebuild_fulltext_index,
+    search_fulltext,
+)
+from src.services.name_index import NameIndex
 
 # Import repositories for modular CRUD operations
 from src.services.repositories import (
@@ -29,6 +37,7 @@ from src.services.repositories import (
     RelationRepository,
     TrajectoryRepository,
 )
+from src.services.tag_index import TagIndex
 
 if TYPE_CHECKING:
     from src.core.trajectory import Keyframe
@@ -46,14 +55,18 @@ class DatabaseService:
     classes while maintaining schema management and connection handling.
     """
 
-    def __init__(self, db_path: str = ":memory:") -> None:
+    def __init__(self, db_path: str = ":memory:", read_only: bool = False) -> None:
         """
         Args:
             db_path: Path to the .kraken database file.
                      Defaults to :memory: for testing.
+            read_only: Open the file read-only, skipping schema setup and
+                migrations. The connection may be closed from another thread.
         """
         self.db_path = db_path
+        self.read_only = read_only
         self._connection: Optional[sqlite3.Connection] = None
+        self._connection_serial = 0
         self._backup_service = None  # Optional backup service integration
 
         # Initialize repositories (will be connected after connection is established)
@@ -66,25 +79,43 @@ class DatabaseService:
         self._trajectory_repo = TrajectoryRepository()
         self.attachment_service: Optional["AttachmentService"] = None
 
+        # In-memory tag bitmaps for filter_ids_by_tags (built lazily)
+        self.tag_index = TagIndex()
+        # In-memory id/name/alias lookups for wiki links (loaded lazily)
+        self.name_index = NameIndex()
+
         logger.info(f"DatabaseService initialized with path: {self.db_path}")
 
     def connect(self) -> None:
         """Establishes connection to the database."""
         try:
-            self._connection = sqlite3.connect(self.db_path)
+            if self.read_only:
+                uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+                self._connection = sqlite3.connect(
+                    uri, uri=True, check_same_thread=False
+                )
+            else:
+                self._connection = sqlite3.connect(self.db_path)
+            self._connection_serial += 1
+            self.tag_index.invalidate()
+            self.name_index.invalidate()
             # Enable Foreign Keys
             self._connection.execute("PRAGMA foreign_keys = ON;")
             # Enable Write-Ahead Logging for better concurrency
             # WAL mode allows concurrent readers with a single writer
-            if self.db_path != ":memory:":
+            if self.read_only:
+                self._connection.execute("PRAGMA query_only = ON;")
+            elif self.db_path != ":memory:":
                 self._connection.execute("PRAGMA journal_mode=WAL;")
                 logger.debug("WAL mode enabled for database.")
             # Return rows as Row objects for name access
             self._connection.row_factory = sqlite3.Row
             logger.debug("Database connection established.")
 
-            self._init_schema()
-            self._run_migrations()
+            # The writer that opened the file owns the schema
+            if not self.read_only:
+                self._init_schema()
+                self._run_migrations()
 
             # Connect repositories to the database connection
             self._event_repo.set_connection(self._connection)
@@ -104,6 +135,8 @@ class DatabaseService:
         if self._connection:
             self._connection.close()
             self._connection = None
+            self.tag_index.invalidate()
+            self.name_index.invalidate()
             logger.debug("Database connection closed.")
 
     @contextmanager
@@ -120,6 +153,27 @@ class DatabaseService:
             logger.error(f"Transaction rolled back due to error: {e}")
             raise
 
+    def get_world_version(self) -> Tuple[int, int, int]:
+        """
+        Returns a token that changes whenever the world is written.
+
+        Combines a per-connect serial, this connection's total_changes and
+        PRAGMA data_version (which advances on commits from other
+        connections), so it can key caches of derived data.
+
+        Returns:
+            Tuple[int, int, int]: Opaque, comparable version token.
+        """
+        if not self._connection:
+            self.connect()
+        assert self._connection is not None
+        data_version = self._connection.execute("PRAGMA data_version").fetchone()[0]
+        return (
+            self._connection_serial,
+            self._connection.total_changes,
+            data_version,
+        )
+
     def _init_schema(self) -> None:
         """Creates the core tables if they don't exist."""
         schema_sql = """
@@ -212,7 +266,7 @@ class DatabaseService:
             marker_id TEXT NOT NULL,
             t_start REAL NOT NULL,
             t_end REAL NOT NULL,
-            trajectory JSON NOT NULL, -- List of [t, x, y]
+            trajectory JSON NOT NULL, -- MF-JSON, or a marker once in trajectory_keyframes
             properties JSON DEFAULT '{}', -- Changing properties over time
             created_at REAL,
             FOREIGN KEY(marker_id) REFERENCES markers(id) ON DELETE CASCADE
@@ -224,6 +278,34 @@ class DatabaseService:
         CREATE INDEX IF NOT EXISTS idx_moving_features_time
             ON moving_features(t_start, t_end);
 
+        -- Trajectory Keyframes Table (one row per keyframe)
+        CREATE TABLE IF NOT EXISTS trajectory_keyframes (
+            id INTEGER PRIMARY KEY,
+            trajectory_id TEXT NOT NULL,
+            marker_id TEXT NOT NULL,
+            t REAL NOT NULL,
+            x REAL NOT NULL,
+            y REAL NOT NULL,
+            FOREIGN KEY(trajectory_id) REFERENCES moving_features(id)
+                ON DELETE CASCADE
+        );
+
+        -- Indexes for keyframe edits and time-window queries
+        CREATE INDEX IF NOT EXISTS idx_trajectory_keyframes_trajectory_time
+            ON trajectory_keyframes(trajectory_id, t);
+        CREATE INDEX IF NOT EXISTS idx_trajectory_keyframes_marker_time
+            ON trajectory_keyframes(marker_id, t);
+
+        -- Rendered longform section HTML (web server render cache)
+        CREATE TABLE IF NOT EXISTS rendered_sections (
+            object_id TEXT NOT NULL,
+            content_hash TEXT NOT NULL,
+            renderer_version INTEGER NOT NULL,
+            html TEXT NOT NULL,
+            created_at REAL,
+            PRIMARY KEY (object_id, content_hash, renderer_version)
+        );
+
         -- Image Attachments Table
         CREATE TABLE IF NOT EXISTS image_attachments (
             id TEXT PRIMARY KEY,
@@ -310,11 +392,48 @@ class DatabaseService:
 
         CREATE INDEX IF NOT EXISTS idx_embeddings_created_at
             ON embeddings(created_at);
+
+        -- Embedding change counters per model and object type, read by the
+        -- search service to detect stale cached matrices and ANN indexes
+        -- (kept in sync by the triggers below)
+        CREATE TABLE IF NOT EXISTS embedding_stats (
+            model TEXT NOT NULL,
+            object_type TEXT NOT NULL,
+            row_count INTEGER NOT NULL DEFAULT 0,
+            version INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (model, object_type)
+        );
+
+        CREATE TRIGGER IF NOT EXISTS embedding_stats_ai
+        AFTER INSERT ON embeddings BEGIN
+            INSERT INTO embedding_stats (model, object_type, row_count, version)
+                VALUES (NEW.model, NEW.object_type, 1, 1)
+            ON CONFLICT (model, object_type) DO UPDATE SET
+                row_count = row_count + 1, version = version + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS embedding_stats_au
+        AFTER UPDATE ON embeddings BEGIN
+            UPDATE embedding_stats
+                SET row_count = row_count - 1, version = version + 1
+            WHERE model = OLD.model AND object_type = OLD.object_type;
+            INSERT INTO embedding_stats (model, object_type, row_count, version)
+                VALUES (NEW.model, NEW.object_type, 1, 1)
+            ON CONFLICT (model, object_type) DO UPDATE SET
+                row_count = row_count + 1, version = version + 1;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS embedding_stats_ad
+        AFTER DELETE ON embeddings BEGIN
+            UPDATE embedding_stats
+                SET row_count = row_count - 1, version = version + 1
+            WHERE model = OLD.model AND object_type = OLD.object_type;
+        END;
         """
 
         try:
             with self.transaction() as conn:
-                conn.executescript(schema_sql)
+                conn.executescript(schema_sql + FULLTEXT_SCHEMA_SQL)
             logger.debug("Database schema initialized.")
         except sqlite3.Error as e:
             logger.critical(f"Schema initialization failed: {e}")
@@ -346,6 +465,15 @@ class DatabaseService:
             # Migrate trajectory data from old format to MF-JSON
             self._migrate_trajectories_to_mfjson()
 
+            # Move trajectory JSON blobs into keyframe rows
+            self._migrate_trajectories_to_keyframe_rows()
+
+            # Index objects written before the full-text index existed
+            self._migrate_fulltext_index()
+
+            # Count embeddings written before the change counters existed
+            self._migrate_embedding_stats()
+
         except sqlite3.Error as e:
             logger.critical(f"Migration check failed: {e}")
             raise
@@ -395,6 +523,45 @@ class DatabaseService:
                 f"Migration: Converted {migrated_count} trajectories to MF-JSON format"
             )
 
+    def _migrate_trajectories_to_keyframe_rows(self) -> None:
+        """Migrates MF-JSON trajectory blobs to trajectory_keyframes rows."""
+        assert self._connection is not None
+
+        # Runs before connect() wires up the repositories
+        self._trajectory_repo.set_connection(self._connection)
+        converted = self._trajectory_repo.convert_json_trajectories()
+
+        if converted > 0:
+            logger.info(f"Migration: Moved {converted} trajectories to keyframe rows")
+
+    def _migrate_fulltext_index(self) -> None:
+        """Fills the full-text index if it is missing objects."""
+        assert self._connection is not None
+
+        if not fulltext_index_is_current(self._connection):
+            count = rebuild_fulltext_index(self._connection)
+            logger.info(f"Migration: Indexed {count} objects for full-text search")
+
+    def _migrate_embedding_stats(self) -> None:
+        """Fills the embedding change counters if they are missing."""
+        assert self._connection is not None
+
+        has_stats = self._connection.execute(
+            "SELECT EXISTS (SELECT 1 FROM embedding_stats)"
+        ).fetchone()[0]
+        if has_stats:
+            return
+        with self._connection:
+            cursor = self._connection.execute(
+                """
+                INSERT INTO embedding_stats (model, object_type, row_count, version)
+                SELECT model, object_type, COUNT(*), 1 FROM embeddings
+                GROUP BY model, object_type
+                """
+            )
+        if cursor.rowcount > 0:
+            logger.info("Migration: Counted existing embeddings")
+
     # --------------------------------------------------------------------------
     # Event CRUD - Delegates to EventRepository
     # --------------------------------------------------------------------------
@@ -412,6 +579,8 @@ class DatabaseService:
         if not self._connection:
             self.connect()
         self._event_repo.insert(event)
+        self.tag_index.add_object("event", event.id)
+        self.name_index.upsert("event", event.id, event.name)
 
     def get_event(self, event_id: str) -> Optional[Event]:
         """
@@ -465,6 +634,8 @@ class DatabaseService:
         if not self._connection:
             self.connect()
         self._event_repo.delete(event_id)
+        self.tag_index.remove_object("event", event_id)
+        self.name_index.remove(event_id)
 
     # --------------------------------------------------------------------------
     # Entity CRUD - Delegates to EntityRepository
@@ -483,6 +654,10 @@ class DatabaseService:
         if not self._connection:
             self.connect()
         self._entity_repo.insert(entity)
+        self.tag_index.add_object("entity", entity.id)
+        self.name_index.upsert(
+            "entity", entity.id, entity.name, entity.attributes.get("aliases")
+        )
 
     def get_entity(self, entity_id: str) -> Optional[Entity]:
         """
@@ -536,6 +711,8 @@ class DatabaseService:
         if not self._connection:
             self.connect()
         self._entity_repo.delete(entity_id)
+        self.tag_index.remove_object("entity", entity_id)
+        self.name_index.remove(entity_id)
 
     # --------------------------------------------------------------------------
     # Relation CRUD - Delegates to RelationRepository
@@ -611,6 +788,23 @@ class DatabaseService:
             self.connect()
         return self._relation_repo.get_by_target(target_id)
 
+    def get_temporal_relations(
+        self, target_ids: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieves all temporal relations targeting entities in one query.
+
+        Args:
+            target_ids: Optional entity IDs to restrict the targets to.
+
+        Returns:
+            List[Dict[str, Any]]: List of relation dictionaries, including
+            'source_event_date' for event-anchored bounds.
+        """
+        if not self._connection:
+            self.connect()
+        return self._relation_repo.get_temporal_by_targets(target_ids)
+
     def get_relation(self, rel_id: str) -> Optional[Dict[str, Any]]:
         """
         Retrieves a single relation by its ID.
@@ -688,27 +882,75 @@ class DatabaseService:
         Returns:
             Optional[str]: The name if found, else None.
         """
+        resolved = self.resolve_object(object_id)
+        return resolved[0] if resolved else None
+
+    def resolve_object(self, object_id: str) -> Optional[Tuple[str, str]]:
+        """
+        Resolves an entity or event ID to its name and type via name_index.
+
+        Args:
+            object_id (str): The ID to resolve.
+
+        Returns:
+            Optional[Tuple[str, str]]: (name, 'entity'|'event') if found,
+                else None.
+        """
         if not self._connection:
             self.connect()
         assert self._connection is not None
+        return self.name_index.resolve(self._connection, object_id)
 
-        # Try Entity
-        cursor = self._connection.execute(
-            "SELECT name FROM entities WHERE id = ?", (object_id,)
-        )
-        row = cursor.fetchone()
-        if row:
-            return row["name"]
+    def find_objects_by_name(self, name: str) -> List[Tuple[str, str, str]]:
+        """
+        Finds entities (by name or alias) and events (by name) via name_index.
 
-        # Try Event
-        cursor = self._connection.execute(
-            "SELECT name FROM events WHERE id = ?", (object_id,)
-        )
-        row = cursor.fetchone()
-        if row:
-            return row["name"]
+        Matching is case-insensitive (casefolded).
 
-        return None
+        Args:
+            name (str): The name or alias to look up.
+
+        Returns:
+            List[Tuple[str, str, str]]: (id, name, 'entity'|'event') per match.
+        """
+        if not self._connection:
+            self.connect()
+        assert self._connection is not None
+        return self.name_index.find(self._connection, name)
+
+    def search_text(
+        self,
+        text: str,
+        object_type: Optional[str] = None,
+        limit: int = 50,
+        prefix: bool = True,
+        match_all: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Searches entities and events via the full-text index (BM25 ranked).
+
+        Args:
+            text (str): Words and "quoted phrases" to search for.
+            object_type (Optional[str]): 'entity' or 'event' to filter by.
+            limit (int): Maximum number of results.
+            prefix (bool): Whether unquoted words match as prefixes.
+            match_all (bool): Require all terms rather than any term.
+
+        Returns:
+            List[Dict[str, Any]]: object_type, object_id, name and score per
+                match, best first.
+        """
+        if not self._connection:
+            self.connect()
+        assert self._connection is not None
+        return search_fulltext(
+            self._connection,
+            text,
+            object_type=object_type,
+            limit=limit,
+            prefix=prefix,
+            match_all=match_all,
+        )
 
     def insert_events_bulk(self, events: List[Event]) -> None:
         """
@@ -728,6 +970,9 @@ class DatabaseService:
         if not self._connection:
             self.connect()
         self._event_repo.insert_bulk(events)
+        for event in events:
+            self.tag_index.add_object("event", event.id)
+            self.name_index.upsert("event", event.id, event.name)
         logger.info(f"Bulk inserted {len(events)} events")
 
     def insert_entities_bulk(self, entities: List[Entity]) -> None:
@@ -748,6 +993,11 @@ class DatabaseService:
         if not self._connection:
             self.connect()
         self._entity_repo.insert_bulk(entities)
+        for entity in entities:
+            self.tag_index.add_object("entity", entity.id)
+            self.name_index.upsert(
+                "entity", entity.id, entity.name, entity.attributes.get("aliases")
+            )
         logger.info(f"Bulk inserted {len(entities)} entities")
 
     # --------------------------------------------------------------------------
@@ -1244,6 +1494,7 @@ class DatabaseService:
                     """,
                     (event_id, tag_id, created_at),
                 )
+            self.tag_index.add_tag("event", event_id, tag_name.strip())
         except sqlite3.Error as e:
             logger.error(f"Failed to assign tag '{tag_name}' to event {event_id}: {e}")
             raise
@@ -1276,6 +1527,7 @@ class DatabaseService:
                     """,
                     (entity_id, tag_id, created_at),
                 )
+            self.tag_index.add_tag("entity", entity_id, tag_name.strip())
         except sqlite3.Error as e:
             logger.error(
                 f"Failed to assign tag '{tag_name}' to entity {entity_id}: {e}"
@@ -1312,6 +1564,7 @@ class DatabaseService:
                 "DELETE FROM event_tags WHERE event_id = ? AND tag_id = ?",
                 (event_id, tag_id),
             )
+        self.tag_index.remove_tag("event", event_id, tag_name.strip())
 
     def remove_tag_from_entity(self, entity_id: str, tag_name: str) -> None:
         """
@@ -1343,6 +1596,7 @@ class DatabaseService:
                 "DELETE FROM entity_tags WHERE entity_id = ? AND tag_id = ?",
                 (entity_id, tag_id),
             )
+        self.tag_index.remove_tag("entity", entity_id, tag_name.strip())
 
     def get_tags_for_event(self, event_id: str) -> List[Dict[str, Any]]:
         """
@@ -1425,6 +1679,7 @@ class DatabaseService:
         # Delete tag (CASCADE will handle associations)
         with self.transaction() as conn:
             conn.execute("DELETE FROM tags WHERE id = ?", (tag_id,))
+        self.tag_index.drop_tag(tag_name.strip())
 
         logger.debug(f"Deleted tag: {tag_name}")
 
@@ -1498,6 +1753,72 @@ class DatabaseService:
             entities.append(Entity.from_dict(data))
         return entities
 
+    def _fetch_group_rows(
+        self,
+        tag_names: List[str],
+        date_range: Optional[tuple] = None,
+        include_untagged: bool = True,
+    ) -> List[Any]:
+        """
+        Fetches events joined with their grouping tags in a single query.
+
+        Tags are aggregated per event, so each event appears exactly once
+        with a ``group_tags`` column holding the names of its tags that are
+        in ``tag_names`` (separated by the 0x1F unit separator, NULL if none).
+
+        Args:
+            tag_names: Stripped tag names to match.
+            date_range: Optional tuple (start_date, end_date) to filter events.
+            include_untagged: Whether events matching none of the tags are
+                returned as well.
+
+        Returns:
+            List of sqlite3.Row objects sorted by lore_date.
+        """
+        if not self._connection:
+            self.connect()
+        assert self._connection is not None
+
+        date_filter = ""
+        date_params: List[Any] = []
+        if date_range:
+            date_filter = "AND e.lore_date >= ? AND e.lore_date <= ?"
+            date_params = [date_range[0], date_range[1]]
+
+        join = "LEFT JOIN" if include_untagged else "INNER JOIN"
+        placeholders = ",".join("?" * len(tag_names))
+        query = f"""
+            WITH gt AS (
+                SELECT et.event_id, group_concat(t.name, char(31)) AS group_tags
+                FROM tags t
+                INNER JOIN event_tags et ON et.tag_id = t.id
+                WHERE t.name IN ({placeholders})
+                GROUP BY et.event_id
+            )
+            SELECT e.*, gt.group_tags
+            FROM events e
+            {join} gt ON gt.event_id = e.id
+            WHERE 1=1
+            {date_filter}
+            ORDER BY e.lore_date
+        """
+        cursor = self._connection.execute(query, list(tag_names) + date_params)
+        return cursor.fetchall()
+
+    @staticmethod
+    def _event_from_group_row(row: Any) -> Tuple[Event, List[str]]:
+        """
+        Hydrates an Event from a _fetch_group_rows row.
+
+        Returns:
+            Tuple of the Event and the names of its matching grouping tags.
+        """
+        data = dict(row)
+        group_tags = data.pop("group_tags")
+        if data.get("attributes"):
+            data["attributes"] = json.loads(data["attributes"])
+        return Event.from_dict(data), group_tags.split("\x1f") if group_tags else []
+
     def get_events_grouped_by_tags(
         self,
         tag_order: List[str],
@@ -1511,6 +1832,10 @@ class DatabaseService:
         matching groups. In FIRST_MATCH mode, events appear only in their first
         matching group (by tag_order).
 
+        The event/tag join is fetched once and each event is hydrated once;
+        group membership is then assigned in a single pass, so an event in
+        several groups is the same Event object in each of them.
+
         Args:
             tag_order: List of tag names defining groups and their order.
             mode: Grouping mode - "DUPLICATE" (default) or "FIRST_MATCH".
@@ -1527,92 +1852,27 @@ class DatabaseService:
         if mode not in ("DUPLICATE", "FIRST_MATCH"):
             raise ValueError(f"Invalid mode: {mode}. Must be DUPLICATE or FIRST_MATCH")
 
-        if not self._connection:
-            self.connect()
-        assert self._connection is not None
-
-        # Build date filter clause
-        date_filter = ""
-        date_params = []
-        if date_range:
-            date_filter = "AND e.lore_date >= ? AND e.lore_date <= ?"
-            date_params = [date_range[0], date_range[1]]
-
-        # Initialize result structure
-        groups = []
-        assigned_event_ids = set()
-
-        # Process each tag in order
-        for tag_name in tag_order:
-            # Get events for this tag
-            query = f"""
-                SELECT e.*
-                FROM events e
-                INNER JOIN event_tags et ON e.id = et.event_id
-                INNER JOIN tags t ON et.tag_id = t.id
-                WHERE t.name = ?
-                {date_filter}
-                ORDER BY e.lore_date
-            """
-            params = [tag_name.strip()] + date_params
-
-            cursor = self._connection.execute(query, params)
-            rows = cursor.fetchall()
-
-            # Convert rows to Event objects
-            events = []
-            for row in rows:
-                data = dict(row)
-                if data.get("attributes"):
-                    data["attributes"] = json.loads(data["attributes"])
-                event = Event.from_dict(data)
-
-                # In FIRST_MATCH mode, skip if already assigned
-                if mode == "FIRST_MATCH" and event.id in assigned_event_ids:
-                    continue
+        # Map each tag name to its group positions (tag_order may repeat names)
+        slots: Dict[str, List[int]] = {}
+        for index, tag_name in enumerate(tag_order):
+            slots.setdefault(tag_name.strip(), []).append(index)
 
-                events.append(event)
-                assigned_event_ids.add(event.id)
-
-            # Add group even if empty (to maintain tag_order)
-            groups.append({"tag_name": tag_name, "events": events})
-
-        # Get remaining events (those not in any group)
-        remaining_query = f"""
-            SELECT e.*
-            FROM events e
-            WHERE e.id NOT IN (
-                SELECT DISTINCT et.event_id
-                FROM event_tags et
-                INNER JOIN tags t ON et.tag_id = t.id
-                WHERE t.name IN ({",".join("?" * len(tag_order))})
-            )
-            {date_filter}
-            ORDER BY e.lore_date
-        """
+        # Add groups even if empty (to maintain tag_order)
+        groups = [{"tag_name": tag_name, "events": []} for tag_name in tag_order]
+        remaining = []
 
-        # Handle case where tag_order is empty
-        if not tag_order:
-            remaining_query = f"""
-                SELECT e.*
-                FROM events e
-                WHERE 1=1
-                {date_filter}
-                ORDER BY e.lore_date
-            """
-            remaining_params = date_params
-        else:
-            remaining_params = [t.strip() for t in tag_order] + date_params
+        for row in self._fetch_group_rows(list(slots), date_range):
+            event, tag_names = self._event_from_group_row(row)
+            indices = sorted(i for name in tag_names for i in slots.get(name, ()))
 
-        cursor = self._connection.execute(remaining_query, remaining_params)
-        rows = cursor.fetchall()
+            if not indices:
+                remaining.append(event)
+                continue
 
-        remaining = []
-        for row in rows:
-            data = dict(row)
-            if data.get("attributes"):
-                data["attributes"] = json.loads(data["attributes"])
-            remaining.append(Event.from_dict(data))
+            if mode == "FIRST_MATCH":
+                indices = indices[:1]
+            for index in indices:
+                groups[index]["events"].append(event)
 
         return {"groups": groups, "remaining": remaining}
 
@@ -1624,6 +1884,8 @@ class DatabaseService:
         """
         Returns count and metadata for each tag group.
 
+        All tags are aggregated by a single GROUP BY query.
+
         Args:
             tag_order: List of tag names to get counts for.
             date_range: Optional tuple (start_date, end_date) to filter events.
@@ -1631,6 +1893,9 @@ class DatabaseService:
         Returns:
             List of dicts with tag_name, count, earliest_date, latest_date.
         """
+        if not tag_order:
+            return []
+
         if not self._connection:
             self.connect()
         assert self._connection is not None
@@ -1642,24 +1907,28 @@ class DatabaseService:
             date_filter = "AND e.lore_date >= ? AND e.lore_date <= ?"
             date_params = [date_range[0], date_range[1]]
 
+        tag_names = list(dict.fromkeys(t.strip() for t in tag_order))
+        cursor = self._connection.execute(
+            f"""
+            SELECT
+                t.name as tag_name,
+                COUNT(DISTINCT e.id) as count,
+                MIN(e.lore_date) as earliest_date,
+                MAX(e.lore_date) as latest_date
+            FROM events e
+            INNER JOIN event_tags et ON e.id = et.event_id
+            INNER JOIN tags t ON et.tag_id = t.id
+            WHERE t.name IN ({",".join("?" * len(tag_names))})
+            {date_filter}
+            GROUP BY t.name
+            """,
+            tag_names + date_params,
+        )
+        stats = {row["tag_name"]: row for row in cursor.fetchall()}
+
         counts = []
         for tag_name in tag_order:
-            query = f"""
-                SELECT
-                    COUNT(DISTINCT e.id) as count,
-                    MIN(e.lore_date) as earliest_date,
-                    MAX(e.lore_date) as latest_date
-                FROM events e
-                INNER JOIN event_tags et ON e.id = et.event_id
-                INNER JOIN tags t ON et.tag_id = t.id
-                WHERE t.name = ?
-                {date_filter}
-            """
-            params = [tag_name.strip()] + date_params
-
-            cursor = self._connection.execute(query, params)
-            row = cursor.fetchone()
-
+            row = stats.get(tag_name.strip())
             counts.append(
                 {
                     "tag_name": tag_name,
@@ -1720,21 +1989,28 @@ class DatabaseService:
 
         # Add "All events" metadata if requested
         if has_all_events:
-            # Count ALL events in database
-            all_events = self.get_all_events()
-            count = len(all_events)
+            if not self._connection:
+                self.connect()
+            assert self._connection is not None
 
-            # Get min/max dates
-            earliest = min((e.lore_date for e in all_events), default=0.0)
-            latest = max((e.lore_date for e in all_events), default=0.0)
+            # Count ALL events in database without loading them
+            row = self._connection.execute(
+                """
+                SELECT
+                    COUNT(*) as count,
+                    COALESCE(MIN(lore_date), 0.0) as earliest_date,
+                    COALESCE(MAX(lore_date), 0.0) as latest_date
+                FROM events
+                """
+            ).fetchone()
 
             metadata.append(
                 {
                     "tag_name": ALL_EVENTS_TAG,
                     "color": "#808080",  # Neutral gray
-                    "count": count,
-                    "earliest_date": earliest,
-                    "latest_date": latest,
+                    "count": row["count"],
+                    "earliest_date": row["earliest_date"],
+                    "latest_date": row["latest_date"],
                 }
             )
 
@@ -1757,39 +2033,10 @@ class DatabaseService:
         Returns:
             List[Event]: Events with the specified tag, sorted by lore_date.
         """
-        if not self._connection:
-            self.connect()
-        assert self._connection is not None
-
-        # Build date filter clause
-        date_filter = ""
-        params = [tag_name.strip()]
-
-        if date_range:
-            date_filter = "AND e.lore_date >= ? AND e.lore_date <= ?"
-            params.extend([date_range[0], date_range[1]])
-
-        cursor = self._connection.execute(
-            f"""
-            SELECT e.*
-            FROM events e
-            INNER JOIN event_tags et ON e.id = et.event_id
-            INNER JOIN tags t ON et.tag_id = t.id
-            WHERE t.name = ?
-            {date_filter}
-            ORDER BY e.lore_date
-            """,
-            tuple(params),
+        rows = self._fetch_group_rows(
+            [tag_name.strip()], date_range, include_untagged=False
         )
-        rows = cursor.fetchall()
-
-        events = []
-        for row in rows:
-            data = dict(row)
-            if data.get("attributes"):
-                data["attributes"] = json.loads(data["attributes"])
-            events.append(Event.from_dict(data))
-        return events
+        return [self._event_from_group_row(row)[0] for row in rows]
 
     def set_tag_color(self, tag_name: str, color: Optional[str]) -> None:
         """
@@ -1931,6 +2178,7 @@ class DatabaseService:
 
         Filters objects by tags using include/exclude lists with 'any' or 'all'
         semantics. Returns lightweight (object_type, object_id) tuples.
+        Evaluated against the in-memory tag_index rather than SQL.
 
         Args:
             object_type: Optional filter for 'entity' or 'event'. If None, both.
@@ -1978,7 +2226,7 @@ class DatabaseService:
         from src.services import tag_filter
 
         return tag_filter.filter_object_ids(
-            self._connection,
+            self,
             object_type=object_type,
             include=include,
             include_mode=include_mode,
@@ -2155,6 +2403,41 @@ class DatabaseService:
             self.connect()
         return self._trajectory_repo.get_by_map_id(map_id)
 
+    def get_trajectories_by_map_in_range(
+        self, map_id: str, t0: float, t1: float
+    ) -> List[Tuple[str, str, List["Keyframe"]]]:
+        """
+        Retrieves the keyframes of a map's trajectories for a time window.
+
+        Includes the nearest keyframe on either side of the window so that
+        interpolation inside it is exact.
+
+        Args:
+            map_id: UUID of the map.
+            t0: Start of the time window.
+            t1: End of the time window.
+
+        Returns:
+            List of (marker_id, trajectory_id, List[Keyframe]) tuples.
+        """
+        if not self._connection:
+            self.connect()
+        return self._trajectory_repo.get_by_map_id_in_range(map_id, t0, t1)
+
+    def export_trajectory_mfjson(self, trajectory_id: str) -> dict:
+        """
+        Exports a trajectory as an OGC MF-JSON MovingPoint.
+
+        Args:
+            trajectory_id: UUID of the trajectory record.
+
+        Returns:
+            The MF-JSON dict.
+        """
+        if not self._connection:
+            self.connect()
+        return self._trajectory_repo.export_mfjson(trajectory_id)
+
     def get_trajectories_by_marker(
         self, marker_id: str
     ) -> List[Tuple[str, List["Keyframe"]]]:
@@ -14,7 +14,14 @@ from typing import Any, Dict, List, Optional
 
 import numpy as np
 
+from src.services.ann_index import IVFIndex, index_path
 from src.services.llm_provider import Provider, create_provider
+from src.services.search_service import (
+    EmbeddingMatrix,
+    default_index_dir,
+    embeddings_fingerprint,
+    get_database_path,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -40,8 +47,11 @@ class EmbeddingService:
         Args:
             db_connection: SQLite database connection.
             provider: Embedding provider instance.
-            index_dir: Optional directory for index persistence (defaults to 'indexes/').
-            world_id: Optional world ID for per-world index management.
+            index_dir: Optional directory for index persistence (defaults to
+                'indexes/' in the world folder, or in the user data directory
+                for in-memory databases).
+            world_id: Optional world ID, used to keep the indexes of
+                in-memory databases apart.
 
         Raises:
             ValueError: If provider doesn't support embeddings.
@@ -61,13 +71,20 @@ class EmbeddingService:
         self.dimension = provider.get_dimension()
 
         # Setup index directory
+        db_path = get_database_path(db_connection)
         if index_dir:
             self.index_dir = Path(index_dir)
+        elif db_path:
+            # Default to indexes/ next to the world database
+            self.index_dir = default_index_dir(db_path)
         else:
-            # Default to indexes/ in user data directory
+            # In-memory databases fall back to the user data directory,
+            # with a folder per world
             from src.core.paths import get_user_data_path
 
             self.index_dir = Path(get_user_data_path()) / "indexes"
+            if world_id:
+                self.index_dir /= world_id
 
         self.index_dir.mkdir(parents=True, exist_ok=True)
 
@@ -83,18 +100,9 @@ class EmbeddingService:
             model: Optional model name (defaults to current provider model).
 
         Returns:
-            Path: Path to index file for the model.
+            Path: Path to index directory for the model.
         """
-        model_name = model or self.model
-        # Sanitize model name for filename
-        safe_model_name = model_name.replace(":", "_").replace("/", "_")
-
-        if self.world_id:
-            filename = f"{self.world_id}_{safe_model_name}.index"
-        else:
-            filename = f"{safe_model_name}.index"
-
-        return self.index_dir / filename
+        return index_path(self.index_dir, model or self.model)
 
     def validate_embedding(self, embedding: np.ndarray) -> bool:
         """
@@ -268,40 +276,44 @@ class EmbeddingService:
         logger.debug(f"Generated {len(embeddings)} embeddings via {self.model}")
         return embeddings
 
-    def rebuild_index(self) -> None:
+    def rebuild_index(self, n_lists: Optional[int] = None) -> Optional[IVFIndex]:
         """
         Rebuild the ANN index from database embeddings.
 
-        Loads all embeddings matching current model and dimension,
-        then persists index to disk.
+        Loads all embeddings matching current model and dimension, clusters
+        them into an IVF index and persists it to get_index_path().
+
+        Args:
+            n_lists: Optional number of clusters (defaults to sqrt of count).
 
-        Note: This is a placeholder for future ANN index integration.
-        Currently just validates embeddings exist and are accessible.
+        Returns:
+            IVFIndex: The built index, or None if no embeddings exist.
         """
         logger.info(f"Rebuilding index for model {self.model}...")
 
-        embeddings = self.get_embeddings_by_model()
+        fingerprint = embeddings_fingerprint(self.conn, self.model)
+        matrix = EmbeddingMatrix.load(self.conn, self.model, self.dimension)
 
-        if not embeddings:
+        if len(matrix) == 0:
             logger.warning("No embeddings found to index")
-            return
-
-        logger.info(f"Found {len(embeddings)} embeddings for indexing")
+            return None
 
-        # TODO: Implement actual ANN index building (e.g., FAISS, Annoy)
-        # For now, just save metadata about the index
-        index_path = self.get_index_path()
-        index_metadata = {
-            "model": self.model,
-            "dimension": self.dimension,
-            "count": len(embeddings),
-            "world_id": self.world_id,
-        }
+        logger.info(f"Found {len(matrix)} embeddings for indexing")
 
-        with open(index_path, "w") as f:
-            json.dump(index_metadata, f, indent=2)
+        index = IVFIndex.build(
+            self.model,
+            self.dimension,
+            matrix.vectors,
+            matrix.embedding_ids,
+            matrix.type_codes,
+            fingerprint=fingerprint,
+            n_lists=n_lists,
+        )
+        path = self.get_index_path()
+        index.save(path)
 
-        logger.info(f"Index metadata saved to {index_path}")
+        logger.info(f"Index saved to {path}")
+        return index
 
     def get_index_metadata(self, model: Optional[str] = None) -> Optional[Dict]:
         """
@@ -313,20 +325,15 @@ class EmbeddingService:
         Returns:
             Dict containing index metadata, or None if not found.
         """
-        index_path = self.get_index_path(model)
+        path = self.get_index_path(model)
 
-        if not index_path.exists():
-            logger.debug(f"Index file not found: {index_path}")
+        metadata = IVFIndex.read_metadata(path)
+        if metadata is None:
+            logger.debug(f"Index not found: {path}")
             return None
 
-        try:
-            with open(index_path, "r") as f:
-                metadata = json.load(f)
-            logger.debug(f"Loaded index metadata from {index_path}")
-            return metadata
-        except (json.JSONDecodeError, IOError) as e:
-            logger.error(f"Failed to load index metadata: {e}")
-            return None
+        logger.debug(f"Loaded index metadata from {path}")
+        return metadata
 
 
 def create_embedding_service(
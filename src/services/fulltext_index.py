@@ -0,0 +1,301 @@
+"""
+Full-Text Index Module.
+
+Maintains an FTS5 index over entity and event names, types, descriptions,
+tags and text attributes, and provides keyword queries ranked by BM25.
+
+The index is kept in sync by SQL triggers on entities, events, their tag
+links and tag renames, so every writer (including bulk imports and other
+processes) updates it in the same transaction. Attribute keys starting with
+an underscore hold internal metadata (e.g. longform placement) and are not
+indexed. FTS rows are keyed by the INTEGER PRIMARY KEY of search_documents,
+which stays stable across VACUUM, unlike the implicit rowids of the source
+tables.
+"""
+
+import logging
+import re
+import sqlite3
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# BM25 column weights: name, type, description, tags, attributes
+BM25_WEIGHTS = (10.0, 2.0, 1.0, 4.0, 2.0)
+
+DEFAULT_SEARCH_LIMIT = 50
+
+# (object type, table, tag link table, tag link id column)
+_SOURCES = (
+    ("entity", "entities", "entity_tags", "entity_id"),
+    ("event", "events", "event_tags", "event_id"),
+)
+
+_TOKEN_PATTERN = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def _doc_id_sql(object_type: str, id_expr: str) -> str:
+    """SQL expression for the search_documents ID of an object."""
+    return (
+        f"(SELECT id FROM search_documents "
+        f"WHERE object_type = '{object_type}' AND object_id = {id_expr})"
+    )
+
+
+def _tags_sql(link_table: str, link_column: str, id_expr: str) -> str:
+    """SQL expression concatenating an object's tag names."""
+    return (
+        f"(SELECT group_concat(t.name, ' ') FROM {link_table} lt "
+        f"JOIN tags t ON t.id = lt.tag_id WHERE lt.{link_column} = {id_expr})"
+    )
+
+
+def _attributes_sql(attributes_expr: str) -> str:
+    """SQL expression concatenating the public text values of attributes."""
+    return (
+        f"CASE WHEN json_valid({attributes_expr}) THEN "
+        f"(SELECT group_concat(value, ' ') FROM json_tree({attributes_expr}) "
+        f"WHERE type = 'text' AND fullkey NOT GLOB '$._*' "
+        f"AND fullkey NOT GLOB '$.\"_*') END"
+    )
+
+
+def _source_triggers(
+    object_type: str, table: str, link_table: str, link_column: str
+) -> str:
+    """Trigger DDL keeping the index in sync with one source table."""
+    new_doc = _doc_id_sql(object_type, "NEW.id")
+    old_doc = _doc_id_sql(object_type, "OLD.id")
+    return f"""
+        CREATE TRIGGER IF NOT EXISTS search_fts_{table}_ai
+        AFTER INSERT ON {table} BEGIN
+            INSERT OR IGNORE INTO search_documents (object_type, object_id)
+                VALUES ('{object_type}', NEW.id);
+            DELETE FROM search_fts WHERE rowid = {new_doc};
+            INSERT INTO search_fts
+                (rowid, name, type, description, tags, attributes)
+            VALUES (
+                {new_doc}, NEW.name, NEW.type, NEW.description,
+                {_tags_sql(link_table, link_column, "NEW.id")},
+                {_attributes_sql("NEW.attributes")}
+            );
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS search_fts_{table}_au
+        AFTER UPDATE OF name, type, description, attributes ON {table} BEGIN
+            UPDATE search_fts SET
+                name = NEW.name,
+                type = NEW.type,
+                description = NEW.description,
+                attributes = {_attributes_sql("NEW.attributes")}
+            WHERE rowid = {new_doc};
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS search_fts_{table}_ad
+        AFTER DELETE ON {table} BEGIN
+            DELETE FROM search_fts WHERE rowid = {old_doc};
+            DELETE FROM search_documents
+                WHERE object_type = '{object_type}' AND object_id = OLD.id;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS search_fts_{link_table}_ai
+        AFTER INSERT ON {link_table} BEGIN
+            UPDATE search_fts
+                SET tags = {_tags_sql(link_table, link_column, f"NEW.{link_column}")}
+            WHERE rowid = {_doc_id_sql(object_type, f"NEW.{link_column}")};
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS search_fts_{link_table}_ad
+        AFTER DELETE ON {link_table} BEGIN
+            UPDATE search_fts
+                SET tags = {_tags_sql(link_table, link_column, f"OLD.{link_column}")}
+            WHERE rowid = {_doc_id_sql(object_type, f"OLD.{link_column}")};
+        END;
+    """
+
+
+def _tag_rename_trigger() -> str:
+    """Trigger DDL refreshing the tags column of objects with a renamed tag."""
+    updates = "\n".join(
+        f"""
+            UPDATE search_fts
+                SET tags = (
+                    SELECT group_concat(t.name, ' ') FROM {link_table} lt
+                    JOIN tags t ON t.id = lt.tag_id
+                    WHERE lt.{link_column} = (
+                        SELECT object_id FROM search_documents
+                        WHERE id = search_fts.rowid
+                    )
+                )
+            WHERE rowid IN (
+                SELECT d.id FROM search_documents d
+                JOIN {link_table} lt ON lt.{link_column} = d.object_id
+                WHERE d.object_type = '{object_type}' AND lt.tag_id = NEW.id
+            );"""
+        for object_type, _, link_table, link_column in _SOURCES
+    )
+    return f"""
+        CREATE TRIGGER IF NOT EXISTS search_fts_tags_au
+        AFTER UPDATE OF name ON tags BEGIN
+            {updates}
+        END;
+    """
+
+
+FULLTEXT_SCHEMA_SQL = (
+    """
+        -- Full-text search (kept in sync by the triggers below)
+        CREATE TABLE IF NOT EXISTS search_documents (
+            id INTEGER PRIMARY KEY,
+            object_type TEXT NOT NULL,
+            object_id TEXT NOT NULL,
+            UNIQUE (object_type, object_id)
+        );
+
+        CREATE VIRTUAL TABLE IF NOT EXISTS search_fts USING fts5(
+            name, type, description, tags, attributes,
+            tokenize = 'unicode61 remove_diacritics 2',
+            prefix = '2 3'
+        );
+    """
+    + "".join(_source_triggers(*source) for source in _SOURCES)
+    + _tag_rename_trigger()
+)
+
+
+def rebuild_fulltext_index(conn: sqlite3.Connection) -> int:
+    """
+    Rebuilds the full-text index from the entities and events tables.
+
+    Args:
+        conn: Writable SQLite connection with the full-text schema.
+
+    Returns:
+        int: Number of indexed objects.
+    """
+    with conn:
+        conn.execute("DELETE FROM search_fts")
+        conn.execute("DELETE FROM search_documents")
+        for object_type, table, link_table, link_column in _SOURCES:
+            conn.execute(
+                f"""
+                INSERT INTO search_documents (object_type, object_id)
+                SELECT '{object_type}', id FROM {table}
+                """
+            )
+            conn.execute(
+                f"""
+                INSERT INTO search_fts
+                    (rowid, name, type, description, tags, attributes)
+                SELECT d.id, s.name, s.type, s.description,
+                       {_tags_sql(link_table, link_column, "s.id")},
+                       {_attributes_sql("s.attributes")}
+                FROM {table} s
+                JOIN search_documents d
+                  ON d.object_type = '{object_type}' AND d.object_id = s.id
+                """
+            )
+        count = conn.execute("SELECT COUNT(*) FROM search_documents").fetchone()[0]
+    logger.info(f"Full-text index rebuilt with {count} objects")
+    return count
+
+
+def fulltext_index_is_current(conn: sqlite3.Connection) -> bool:
+    """
+    Checks that every entity and event has a full-text document.
+
+    Args:
+        conn: SQLite connection with the full-text schema.
+
+    Returns:
+        bool: True if the document count matches the source tables.
+    """
+    indexed = conn.execute("SELECT COUNT(*) FROM search_documents").fetchone()[0]
+    expected = sum(
+        conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        for _, table, _, _ in _SOURCES
+    )
+    return indexed == expected
+
+
+def build_match_query(text: str, prefix: bool = True, match_all: bool = True) -> str:
+    """
+    Converts user search text to an FTS5 MATCH expression.
+
+    Double-quoted parts become phrases; other words become terms, matched
+    as prefixes when prefix is set. FTS5 operators in the input are treated
+    as plain words.
+
+    Args:
+        text: User search text.
+        prefix: Whether unquoted words match as prefixes.
+        match_all: Require every term (AND) rather than any term (OR).
+
+    Returns:
+        str: The MATCH expression, or an empty string if there are no terms.
+
+    Example:
+        >>> build_match_query('red "iron crown" dr')
+        '"red"* AND "iron crown" AND "dr"*'
+    """
+    terms = []
+    for phrase, word in _TOKEN_PATTERN.findall(text):
+        if phrase.strip():
+            terms.append('"' + phrase.strip().replace('"', '""') + '"')
+        elif word:
+            word = word.replace('"', '""')
+            terms.append(f'"{word}"*' if prefix else f'"{word}"')
+    return (" AND " if match_all else " OR ").join(terms)
+
+
+def search_fulltext(
+    conn: sqlite3.Connection,
+    text: str,
+    object_type: Optional[str] = None,
+    limit: int = DEFAULT_SEARCH_LIMIT,
+    prefix: bool = True,
+    match_all: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Searches entities and events by keywords, best BM25 matches first.
+
+    Args:
+        conn: SQLite connection (may be read-only).
+        text: Search text (words and "quoted phrases").
+        object_type: Optional filter for 'entity' or 'event'.
+        limit: Maximum number of results.
+        prefix: Whether unquoted words match as prefixes.
+        match_all: Require every term (AND) rather than any term (OR).
+
+    Returns:
+        List of dicts with keys object_type, object_id, name and score
+        (higher is better).
+    """
+    expression = build_match_query(text, prefix=prefix, match_all=match_all)
+    if not expression:
+        return []
+
+    weights = ", ".join(str(w) for w in BM25_WEIGHTS)
+    sql = f"""
+        SELECT d.object_type, d.object_id, search_fts.name,
+               bm25(search_fts, {weights}) AS rank
+        FROM search_fts
+        JOIN search_documents d ON d.id = search_fts.rowid
+        WHERE search_fts MATCH ?
+    """
+    params: List[Any] = [expression]
+    if object_type:
+        sql += " AND d.object_type = ?"
+        params.append(object_type)
+    sql += " ORDER BY rank LIMIT ?"
+    params.append(limit)
+
+    return [
+        {
+            "object_type": row[0],
+            "object_id": row[1],
+            "name": row[2],
+            "score": -row[3],
+        }
+        for row in conn.execute(sql, params)
+    ]
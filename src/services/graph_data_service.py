@@ -3,9 +3,16 @@ Graph Data Service Module.
 
 Provides data fetching and filtering for graph visualization.
 Separates data access concerns from the widget layer.
+
+All graph data comes from a GraphSnapshot loaded with a handful of narrow
+queries (one for relations, one per object table for nodes, one for
+attribute keys). Snapshots are cached per DatabaseService world version,
+so changing tag or relation-type filters is answered from memory.
 """
 
+import json
 import logging
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -14,6 +21,41 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _strip_id_prefix(id_str: str) -> str:
+    """Strips an 'id:' prefix from a relation endpoint if present."""
+    return id_str[3:] if id_str.startswith("id:") else id_str
+
+
+@dataclass
+class GraphSnapshot:
+    """
+    Everything the graph view and completers need from one world version.
+
+    Attributes:
+        nodes: Node dicts (id, name, type, object_type, tags), entities
+            first ordered by name, then events ordered by lore_date.
+        relations: Relation dicts (source_id, target_id, rel_type) whose
+            source is an existing entity or event, endpoints unstripped.
+        attribute_keys: Sorted public attribute keys across all objects.
+        entity_types: Sorted distinct entity types.
+    """
+
+    nodes: list[dict[str, Any]] = field(default_factory=list)
+    relations: list[dict[str, Any]] = field(default_factory=list)
+    attribute_keys: list[str] = field(default_factory=list)
+    entity_types: list[str] = field(default_factory=list)
+
+    @property
+    def tags(self) -> list[str]:
+        """Sorted unique tags across all nodes."""
+        return sorted({tag for node in self.nodes for tag in node["tags"]})
+
+    @property
+    def rel_types(self) -> list[str]:
+        """Sorted unique relation types."""
+        return sorted({r["rel_type"] for r in self.relations})
+
+
 class GraphDataService:
     """
     Service for fetching graph visualization data.
@@ -23,6 +65,117 @@ class GraphDataService:
     filtering by tags and relation types.
     """
 
+    def __init__(self) -> None:
+        """Initializes the service with an empty snapshot cache."""
+        self._snapshot: GraphSnapshot | None = None
+        self._snapshot_db: "DatabaseService | None" = None
+        self._snapshot_version: Any = None
+
+    def load_snapshot(self, db_service: "DatabaseService") -> GraphSnapshot:
+        """
+        Returns the graph snapshot for the current world version.
+
+        The snapshot is reloaded only when db_service reports a new world
+        version (or a different db_service is passed).
+
+        Args:
+            db_service: Database service instance.
+
+        Returns:
+            GraphSnapshot: Cached or freshly loaded snapshot.
+        """
+        version = db_service.get_world_version()
+        if (
+            self._snapshot is not None
+            and self._snapshot_db is db_service
+            and self._snapshot_version == version
+        ):
+            return self._snapshot
+
+        self._snapshot = self._read_snapshot(db_service)
+        self._snapshot_db = db_service
+        self._snapshot_version = version
+        return self._snapshot
+
+    def _read_snapshot(self, db_service: "DatabaseService") -> GraphSnapshot:
+        """
+        Reads nodes, relations and completer metadata from the database.
+
+        Args:
+            db_service: Database service instance.
+
+        Returns:
+            GraphSnapshot: Freshly loaded snapshot.
+        """
+        if not db_service._connection:
+            db_service.connect()
+        conn = db_service._connection
+        assert conn is not None
+
+        snapshot = GraphSnapshot()
+        tags_sql = (
+            "CASE WHEN json_valid(attributes) "
+            "THEN json_extract(attributes, '$._tags') END"
+        )
+        for object_type, query in (
+            (
+                "entity",
+                f"SELECT id, name, type, {tags_sql} FROM entities ORDER BY name ASC",
+            ),
+            (
+                "event",
+                f"SELECT id, name, type, {tags_sql} FROM events ORDER BY lore_date ASC",
+            ),
+        ):
+            for object_id, name, type_, tags_json in conn.execute(query):
+                tags = json.loads(tags_json) if tags_json else []
+                snapshot.nodes.append(
+                    {
+                        "id": object_id,
+                        "name": name,
+                        "type": type_,
+                        "object_type": object_type,
+                        "tags": tags if isinstance(tags, list) else [],
+                    }
+                )
+
+        cursor = conn.execute(
+            """
+            SELECT source_id, target_id, rel_type
+            FROM relations
+            WHERE source_id IN (SELECT id FROM entities UNION SELECT id FROM events)
+            """
+        )
+        snapshot.relations = [
+            {"source_id": source_id, "target_id": target_id, "rel_type": rel_type}
+            for source_id, target_id, rel_type in cursor
+        ]
+
+        cursor = conn.execute(
+            """
+            SELECT DISTINCT j.key
+            FROM (
+                SELECT attributes FROM entities
+                UNION ALL
+                SELECT attributes FROM events
+            ) AS o, json_each(o.attributes) AS j
+            WHERE json_valid(o.attributes) AND json_type(o.attributes) = 'object'
+            """
+        )
+        snapshot.attribute_keys = sorted(
+            key for (key,) in cursor if not key.startswith("_")
+        )
+
+        snapshot.entity_types = sorted(
+            row[0] for row in conn.execute("SELECT DISTINCT type FROM entities")
+        )
+
+        logger.debug(
+            f"Loaded graph snapshot: {len(snapshot.nodes)} nodes, "
+            f"{len(snapshot.relations)} relations"
+        )
+        return snapshot
+
     def get_graph_data(
         self,
         db_service: "DatabaseService",
@@ -42,45 +195,38 @@ class GraphDataService:
             - nodes: List of dicts with id, name, type, object_type keys
             - edges: List of dicts with source_id, target_id, rel_type keys
         """
-        # Collect all relations by iterating over all entities and events
-        all_relations = self._collect_all_relations(db_service)
+        snapshot = self.load_snapshot(db_service)
 
         # Filter relations by type if specified
         if include_rel_types:
             relations = [
-                r for r in all_relations if r.get("rel_type") in include_rel_types
+                r for r in snapshot.relations if r["rel_type"] in include_rel_types
             ]
         else:
-            relations = all_relations
-
-        # Helper to strip 'id:' prefix if present
-        def strip_id_prefix(id_str: str) -> str:
-            return id_str[3:] if id_str.startswith("id:") else id_str
-
-        # If filtering by rel_type, only include connected nodes
-        if include_rel_types:
-            connected_ids = set()
-            for rel in relations:
-                connected_ids.add(strip_id_prefix(rel["source_id"]))
-                connected_ids.add(strip_id_prefix(rel["target_id"]))
+            relations = snapshot.relations
 
-            nodes = self._get_nodes_by_ids(db_service, connected_ids, include_tags)
-        else:
-            nodes = self._get_all_nodes(db_service, include_tags)
-
-        # Build edges list using strip_id_prefix to match node ID format
+        # Build edges list using _strip_id_prefix to match node ID format
         edges = [
             {
-                "source_id": strip_id_prefix(r["source_id"]),
-                "target_id": strip_id_prefix(r["target_id"]),
+                "source_id": _strip_id_prefix(r["source_id"]),
+                "target_id": _strip_id_prefix(r["target_id"]),
                 "rel_type": r["rel_type"],
             }
             for r in relations
         ]
 
-        # If filtering by tags, also filter edges to only include those
-        # where both source and target are in the filtered nodes
+        # If filtering by rel_type, only include connected nodes
+        nodes = snapshot.nodes
+        if include_rel_types:
+            connected_ids = {e["source_id"] for e in edges}
+            connected_ids.update(e["target_id"] for e in edges)
+            nodes = [n for n in nodes if n["id"] in connected_ids]
+
         if include_tags:
+            nodes = [n for n in nodes if self._node_matches_tags(n, include_tags)]
+
+            # Also filter edges to only include those where both source and
+            # target are in the filtered nodes
             node_ids = {n["id"] for n in nodes}
             edges = [
                 e
@@ -88,7 +234,8 @@ class GraphDataService:
                 if e["source_id"] in node_ids and e["target_id"] in node_ids
             ]
 
-        return nodes, edges
+        # Copy so callers cannot mutate the cached snapshot
+        return [dict(n, tags=list(n["tags"])) for n in nodes], edges
 
     def get_all_tags(self, db_service: "DatabaseService") -> list[str]:
         """
@@ -100,19 +247,7 @@ class GraphDataService:
         Returns:
             List of unique tag strings, sorted alphabetically.
         """
-        tags: set[str] = set()
-
-        # Get tags from entities (returns Entity objects)
-        for entity in db_service.get_all_entities():
-            entity_tags = getattr(entity, "tags", [])
-            tags.update(entity_tags)
-
-        # Get tags from events (returns Event objects)
-        for event in db_service.get_all_events():
-            event_tags = getattr(event, "tags", [])
-            tags.update(event_tags)
-
-        return sorted(tags)
+        return self.load_snapshot(db_service).tags
 
     def get_all_relation_types(self, db_service: "DatabaseService") -> list[str]:
         """
@@ -124,8 +259,7 @@ class GraphDataService:
         Returns:
             List of unique rel_type strings, sorted alphabetically.
         """
-        all_relations = self._collect_all_relations(db_service)
-        return sorted({r.get("rel_type", "") for r in all_relations})
+        return self.load_snapshot(db_service).rel_types
 
     def get_all_entity_types(self, db_service: "DatabaseService") -> list[str]:
         """
@@ -137,8 +271,7 @@ class GraphDataService:
         Returns:
             List of unique entity type strings, sorted alphabetically.
         """
-        types = {getattr(e, "type", "entity") for e in db_service.get_all_entities()}
-        return sorted(types)
+        return list(self.load_snapshot(db_service).entity_types)
 
     def get_all_attribute_keys(self, db_service: "DatabaseService") -> list[str]:
         """
@@ -150,177 +283,23 @@ class GraphDataService:
         Returns:
             List of unique attribute key strings, sorted alphabetically.
         """
-        keys: set[str] = set()
-
-        # Get attributes from entities
-        for entity in db_service.get_all_entities():
-            keys.update(entity.attributes.keys())
-
-        # Get attributes from events
-        for event in db_service.get_all_events():
-            keys.update(event.attributes.keys())
-
-        # Filter out internal keys (starting with _)
-        return sorted([k for k in keys if not k.startswith("_")])
-
-    def _collect_all_relations(
-        self, db_service: "DatabaseService"
-    ) -> list[dict[str, Any]]:
-        """
-        Collects all relations by iterating over all entities and events.
-
-        Since DatabaseService doesn't expose a get_all_relations() method,
-        we collect relations by querying outgoing relations for each source.
-
-        Args:
-            db_service: Database service instance.
-
-        Returns:
-            List of relation dictionaries.
-        """
-        seen_ids: set[str] = set()
-        relations: list[dict[str, Any]] = []
-
-        # Get relations from all entities
-        for entity in db_service.get_all_entities():
-            for rel in db_service.get_relations(entity.id):
-                if rel["id"] not in seen_ids:
-                    seen_ids.add(rel["id"])
-                    relations.append(rel)
-
-        # Get relations from all events
-        for event in db_service.get_all_events():
-            for rel in db_service.get_relations(event.id):
-                if rel["id"] not in seen_ids:
-                    seen_ids.add(rel["id"])
-                    relations.append(rel)
-
-        return relations
-
-    def _get_all_nodes(
-        self,
-        db_service: "DatabaseService",
-        include_tags: list[str] | None = None,
-    ) -> list[dict[str, Any]]:
-        """
-        Gets all entities and events as nodes.
-
-        Args:
-            db_service: Database service instance.
-            include_tags: If provided, filter to items with any of these tags.
-
-        Returns:
-            List of node dicts.
-        """
-        nodes = []
-
-        # Add entities (returns Entity objects)
-        for entity in db_service.get_all_entities():
-            if self._entity_matches_tags(entity, include_tags):
-                nodes.append(self._entity_to_node(entity))
-
-        # Add events (returns Event objects)
-        for event in db_service.get_all_events():
-            if self._event_matches_tags(event, include_tags):
-                nodes.append(self._event_to_node(event))
-
-        return nodes
-
-    def _get_nodes_by_ids(
-        self,
-        db_service: "DatabaseService",
-        ids: set[str],
-        include_tags: list[str] | None = None,
-    ) -> list[dict[str, Any]]:
-        """
-        Gets nodes for specific IDs only.
-
-        Args:
-            db_service: Database service instance.
-            ids: Set of entity/event IDs to include.
-            include_tags: If provided, additionally filter by tags.
-
-        Returns:
-            List of node dicts.
-        """
-        nodes = []
-
-        # Check entities
-        for entity in db_service.get_all_entities():
-            if entity.id in ids and self._entity_matches_tags(entity, include_tags):
-                nodes.append(self._entity_to_node(entity))
-
-        # Check events
-        for event in db_service.get_all_events():
-            if event.id in ids and self._event_matches_tags(event, include_tags):
-                nodes.append(self._event_to_node(event))
-
-        return nodes
-
-    def _entity_to_node(self, entity: Any) -> dict[str, Any]:
-        """
-        Converts an Entity object to a node dictionary.
-
-        Args:
-            entity: The Entity object to convert.
-
-        Returns:
-            A dictionary with id, name, type, object_type, and tags keys.
-        """
-        return {
-            "id": entity.id,
-            "name": getattr(entity, "name", "Unnamed"),
-            "type": getattr(entity, "type", "entity"),
-            "object_type": "entity",
-            "tags": getattr(entity, "tags", []),
-        }
-
-    def _event_to_node(self, event: Any) -> dict[str, Any]:
-        """
-        Converts an Event object to a node dictionary.
-
-        Args:
-            event: The Event object to convert.
-
-        Returns:
-            A dictionary with id, name, type, object_type, and tags keys.
-        """
-        return {
-            "id": event.id,
-            "name": getattr(event, "name", "Unnamed"),
-            "type": getattr(event, "type", "event"),
-            "object_type": "event",
-            "tags": getattr(event, "tags", []),
-        }
-
-    def _entity_matches_tags(self, entity: Any, include_tags: list[str] | None) -> bool:
-        """
-        Checks if an entity matches the tag filter (OR semantics).
-
-        Args:
-            entity: The Entity object to check.
-            include_tags: List of tags to match (any). None or empty means no filter.
-
-        Returns:
-            True if the entity has at least one of the specified tags, or if no filter.
-        """
-        if not include_tags:  # None or empty list = no filter
-            return True
-        entity_tags = getattr(entity, "tags", [])
-        return any(tag in entity_tags for tag in include_tags)
+        # Internal keys (starting with _) are filtered out by the snapshot
+        return list(self.load_snapshot(db_service).attribute_keys)
 
-    def _event_matches_tags(self, event: Any, include_tags: list[str] | None) -> bool:
+    def _node_matches_tags(
+        self, node: dict[str, Any], include_tags: list[str] | None
+    ) -> bool:
         """
-        Checks if an event matches the tag filter (OR semantics).
+        Checks if a node matches the tag filter (OR semantics).
 
         Args:
-            event: The Event object to check.
+            node: The node dict to check.
             include_tags: List of tags to match (any). None or empty means no filter.
 
         Returns:
-            True if the event has at least one of the specified tags, or if no filter.
+            True if the node has at least one of the specified tags, or if no filter.
         """
         if not include_tags:  # None or empty list = no filter
             return True
-        event_tags = getattr(event, "tags", [])
-        return any(tag in event_tags for tag in include_tags)
+        node_tags = node["tags"]
+        return any(tag in node_tags for tag in include_tags)
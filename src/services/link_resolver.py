@@ -44,17 +44,9 @@ class LinkResolver:
         if target_id in self._cache:
             return self._cache[target_id]
 
-        # Try to find as entity
-        entity = self.db_service.get_entity(target_id)
-        if entity:
-            result = (entity.name, "entity")
-            self._cache[target_id] = result
-            return result
-
-        # Try to find as event
-        event = self.db_service.get_event(target_id)
-        if event:
-            result = (event.name, "event")
+        # Look up in the service's shared name index
+        result = self.db_service.resolve_object(target_id)
+        if result:
             self._cache[target_id] = result
             return result
 
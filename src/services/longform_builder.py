@@ -247,10 +247,45 @@ def ensure_all_items_indexed(conn: Connection, doc_id: str = DOC_ID_DEFAULT) ->
         )
 
 
+def has_unindexed_items(conn: Connection, doc_id: str = DOC_ID_DEFAULT) -> bool:
+    """
+    Check whether any event or entity is missing from the longform document.
+
+    Evaluated with SQLite's JSON functions, so no attributes are parsed in
+    Python and the connection may be read-only.
+
+    Args:
+        conn: SQLite connection.
+        doc_id: Document ID.
+
+    Returns:
+        bool: True if ensure_all_items_indexed() would add items.
+    """
+    path = f"$._longform.{json.dumps(doc_id)}"
+    # CASE guards the JSON functions, which raise on malformed attributes
+    missing = """
+        NOT CASE WHEN json_valid(attributes)
+            THEN COALESCE(
+                json_type(attributes, :path) = 'object'
+                AND json_extract(attributes, :path) != '{}',
+                0
+            )
+            ELSE 0
+        END
+    """
+    # Security: only the fixed table names of VALID_TABLES are interpolated
+    query = " UNION ALL ".join(
+        f"SELECT 1 FROM {table} WHERE {missing}" for table in VALID_TABLES
+    )
+    row = conn.execute(f"SELECT EXISTS ({query})", {"path": path}).fetchone()
+    return bool(row[0])
+
+
 def build_longform_sequence(
     conn: Connection,
     doc_id: str = DOC_ID_DEFAULT,
     allowed_ids: Optional[Set[str]] = None,
+    index_missing: bool = True,
 ) -> List[Dict[str, Any]]:
     """
     Build an ordered sequence of longform items for rendering.
@@ -263,6 +298,9 @@ def build_longform_sequence(
     Args:
         conn: SQLite connection.
         doc_id: Document ID to build sequence for.
+        allowed_ids: Optional set of IDs to restrict the sequence to.
+        index_missing: Whether to add missing items first (writes to the
+            database). Pass False on read-only connections.
 
     Returns:
         List[Dict]: Ordered list of items with heading_level computed.
@@ -270,7 +308,7 @@ def build_longform_sequence(
     """
     # 0. Sync check: ensure everything is in the doc
     # Skip this if we are filtering, as we don't want to auto-add items
-    if allowed_ids is None:
+    if allowed_ids is None and index_missing:
         ensure_all_items_indexed(conn, doc_id)
 
     items = read_all_longform_items(conn, doc_id, allowed_ids=allowed_ids)
@@ -0,0 +1,199 @@
+"""
+Name Index Module.
+
+Provides an in-memory index of entity and event names for wiki link
+resolution: id -> (name, type) and casefolded name/alias -> ids.
+
+The index is loaded with a single lightweight query over ids, names and
+entity aliases, so resolving links never hydrates full Entity or Event
+objects. It belongs to one DatabaseService connection, is patched by the
+service's insert/delete paths, and is reloaded when PRAGMA data_version
+shows a commit from another connection.
+"""
+
+import json
+import logging
+import sqlite3
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def clean_aliases(aliases: Any) -> Tuple[str, ...]:
+    """
+    Normalizes an 'aliases' attribute value to a tuple of strings.
+
+    Args:
+        aliases: Raw attribute value; anything but a list yields no aliases.
+
+    Returns:
+        Tuple[str, ...]: The string aliases.
+    """
+    if not isinstance(aliases, list):
+        return ()
+    return tuple(alias for alias in aliases if isinstance(alias, str))
+
+
+class NameIndex:
+    """
+    In-memory id/name/alias index for a single connection.
+
+    Only entity aliases are indexed, matching how wiki links resolve.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty, unloaded index."""
+        self._records: Dict[str, Tuple[str, str, Tuple[str, ...]]] = {}
+        self._by_key: Dict[str, Dict[str, None]] = {}
+        self._data_version: Optional[int] = None
+        self._loaded = False
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the index currently mirrors the database."""
+        return self._loaded
+
+    def invalidate(self) -> None:
+        """Discards the index so the next lookup reloads it."""
+        self._records = {}
+        self._by_key = {}
+        self._data_version = None
+        self._loaded = False
+
+    def load(self, conn: sqlite3.Connection) -> None:
+        """
+        Loads all entity and event names in one query.
+
+        Args:
+            conn: SQLite database connection.
+        """
+        self.invalidate()
+        cursor = conn.execute(
+            """
+            SELECT id, name, 'entity',
+                   CASE WHEN json_valid(attributes)
+                        THEN json_extract(attributes, '$.aliases') END
+            FROM entities
+            UNION ALL
+            SELECT id, name, 'event', NULL
+            FROM events
+            """
+        )
+        for object_id, name, object_type, aliases_json in cursor:
+            aliases: Any = None
+            if aliases_json:
+                try:
+                    aliases = json.loads(aliases_json)
+                except (TypeError, ValueError):
+                    aliases = None
+            self._add(object_id, name, object_type, clean_aliases(aliases))
+
+        self._data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        self._loaded = True
+        logger.debug(f"Loaded name index with {len(self._records)} objects")
+
+    def ensure_current(self, conn: sqlite3.Connection) -> None:
+        """
+        Reloads the index if it is unloaded or another connection wrote.
+
+        Args:
+            conn: SQLite database connection.
+        """
+        if (
+            not self._loaded
+            or conn.execute("PRAGMA data_version").fetchone()[0] != self._data_version
+        ):
+            self.load(conn)
+
+    def _add(
+        self, object_id: str, name: str, object_type: str, aliases: Tuple[str, ...]
+    ) -> None:
+        """Inserts a record and its name keys."""
+        self._records[object_id] = (name, object_type, aliases)
+        for key in (name, *aliases):
+            self._by_key.setdefault(key.casefold(), {})[object_id] = None
+
+    def _discard(self, object_id: str) -> None:
+        """Removes a record and its name keys."""
+        record = self._records.pop(object_id, None)
+        if record is None:
+            return
+        name, _, aliases = record
+        for key in (name, *aliases):
+            folded = key.casefold()
+            ids = self._by_key.get(folded)
+            if ids is not None:
+                ids.pop(object_id, None)
+                if not ids:
+                    del self._by_key[folded]
+
+    # --------------------------------------------------------------------------
+    # Incremental maintenance (no-ops until the index is loaded)
+    # --------------------------------------------------------------------------
+
+    def upsert(
+        self,
+        object_type: str,
+        object_id: str,
+        name: str,
+        aliases: Any = None,
+    ) -> None:
+        """
+        Records an inserted or updated entity or event.
+
+        Args:
+            object_type: 'entity' or 'event'.
+            object_id: The object's ID.
+            name: The object's current name.
+            aliases: Raw 'aliases' attribute (entities only).
+        """
+        if not self._loaded:
+            return
+        self._discard(object_id)
+        self._add(object_id, name, object_type, clean_aliases(aliases))
+
+    def remove(self, object_id: str) -> None:
+        """Records a deleted entity or event."""
+        if self._loaded:
+            self._discard(object_id)
+
+    # --------------------------------------------------------------------------
+    # Queries
+    # --------------------------------------------------------------------------
+
+    def resolve(
+        self, conn: sqlite3.Connection, object_id: str
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Resolves an ID to its current name and type.
+
+        Args:
+            conn: SQLite connection the index belongs to.
+            object_id: The entity or event ID.
+
+        Returns:
+            Optional[Tuple[str, str]]: (name, 'entity'|'event'), or None.
+        """
+        self.ensure_current(conn)
+        record = self._records.get(object_id)
+        if record is None:
+            return None
+        return record[0], record[1]
+
+    def find(self, conn: sqlite3.Connection, name: str) -> List[Tuple[str, str, str]]:
+        """
+        Finds objects whose name or alias matches, ignoring case.
+
+        Args:
+            conn: SQLite connection the index belongs to.
+            name: Name or alias to look up.
+
+        Returns:
+            List[Tuple[str, str, str]]: (id, name, type) for every match.
+        """
+        self.ensure_current(conn)
+        records = self._records
+        return [
+            (object_id, records[object_id][0], records[object_id][1])
+            for object_id in self._by_key.get(name.casefold(), ())
+        ]
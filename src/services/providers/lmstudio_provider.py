@@ -3,6 +3,8 @@ LM Studio Provider Implementation.
 
 Provides embeddings and text generation via LM Studio's OpenAI-compatible API.
 Supports streaming, health checks, timeouts, retries, and circuit breaker pattern.
+Requests share a persistent keep-alive session, so the provider can be called
+from several worker threads at once.
 """
 
 import asyncio
@@ -20,6 +22,26 @@ from src.services.resilience import CircuitBreaker
 logger = logging.getLogger(__name__)
 
 
+def create_session(pool_size: int) -> requests.Session:
+    """
+    Create a keep-alive HTTP session with a bounded connection pool.
+
+    Used by every client of the LM Studio API, so concurrent requests reuse
+    connections instead of opening one per call.
+
+    Args:
+        pool_size: Maximum number of pooled connections per host.
+
+    Returns:
+        requests.Session: Session to share between threads of one client.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 class LMStudioProvider(Provider):
     """
     LM Studio provider supporting embeddings and text generation.
@@ -38,6 +60,7 @@ class LMStudioProvider(Provider):
         timeout: int = 30,
         max_retries: int = 3,
         use_chat_api: bool = True,
+        pool_size: int = 10,
     ) -> None:
         """
         Initialize LM Studio provider.
@@ -53,6 +76,8 @@ class LMStudioProvider(Provider):
             use_chat_api: If True (default), use /v1/chat/completions with
                 messages format. If False, use legacy /v1/completions with
                 raw prompt format.
+            pool_size: Maximum number of keep-alive connections kept open
+                to the LM Studio host (bounds concurrent requests).
 
         Raises:
             ValueError: If model is not specified.
@@ -84,6 +109,7 @@ class LMStudioProvider(Provider):
         self.max_retries = max_retries
         self._dimension = None
         self.circuit_breaker = CircuitBreaker(failure_threshold=5, timeout=60.0)
+        self.session = create_session(pool_size)
 
         logger.info(f"LMStudioProvider initialized with model: {self.model}")
         logger.info(f"Embed URL: {self.embed_url}")
@@ -153,7 +179,7 @@ class LMStudioProvider(Provider):
         def _embed_impl() -> np.ndarray:
             """Inner implementation for retry wrapper."""
             payload = {"input": texts, "model": self.model}
-            response = requests.post(
+            response = self.session.post(
                 self.embed_url,
                 json=payload,
                 headers=self._make_headers(),
@@ -277,7 +303,7 @@ class LMStudioProvider(Provider):
 
             logger.debug(f"LM Studio generate payload: {json.dumps(payload, indent=2)}")
 
-            response = requests.post(
+            response = self.session.post(
                 self.generate_url,
                 json=payload,
                 headers=self._make_headers(),
@@ -395,7 +421,7 @@ class LMStudioProvider(Provider):
 
             def _make_request() -> requests.Response:
                 """Make HTTP request to streaming endpoint."""
-                return requests.post(
+                return self.session.post(
                     self.generate_url,
                     json=payload,
                     headers=self._make_headers(),
@@ -468,7 +494,7 @@ class LMStudioProvider(Provider):
             start_time = time.time()
 
             # Test embeddings endpoint with minimal request
-            response = requests.post(
+            response = self.session.post(
                 self.embed_url,
                 json={"input": ["test"], "model": self.model},
                 headers=self._make_headers(),
@@ -524,7 +550,7 @@ class LMStudioProvider(Provider):
                     }
 
                 # Try a minimal generation request
-                response = requests.post(
+                response = self.session.post(
                     self.generate_url,
                     json=payload,
                     headers=self._make_headers(),
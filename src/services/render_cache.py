@@ -0,0 +1,221 @@
+"""
+Render Cache Module.
+
+Provides a process-wide LRU cache of rendered longform section HTML and the
+helpers persisting renders in the `rendered_sections` table.
+
+Entries are keyed by (object id, content hash, renderer version). The content
+hash covers everything a section renders from, so an edited section simply
+misses; invalidating by object id on edits only frees the stale entries
+early. DatabaseWorker drops the entries of every object in a command's
+change set, which is how update commands reach the cache. Bumping
+RENDERER_VERSION retires every earlier render.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.services.repositories.base_repository import param_batches
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the rendered HTML of unchanged content would differ
+RENDERER_VERSION = 1
+
+DEFAULT_RENDER_CACHE_SIZE = 4096
+
+RenderKey = Tuple[str, str]  # object id, content hash
+
+
+class RenderCache:
+    """
+    Thread-safe least-recently-used cache of rendered HTML.
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_RENDER_CACHE_SIZE,
+        renderer_version: int = RENDERER_VERSION,
+    ) -> None:
+        """
+        Initializes the cache.
+
+        Args:
+            capacity: Maximum number of renders to keep.
+            renderer_version: Version of the renderer producing the HTML.
+        """
+        self.capacity = capacity
+        self.renderer_version = renderer_version
+        self._entries: "OrderedDict[Tuple[str, str, int], str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Returns the number of cached renders."""
+        return len(self._entries)
+
+    def get(self, object_id: str, content_hash: str) -> Optional[str]:
+        """
+        Returns a cached render and marks it as recently used.
+
+        Args:
+            object_id: ID of the rendered event or entity.
+            content_hash: Hash of the rendered content.
+
+        Returns:
+            Optional[str]: The HTML, or None if not cached.
+        """
+        key = (object_id, content_hash, self.renderer_version)
+        with self._lock:
+            html = self._entries.get(key)
+            if html is not None:
+                self._entries.move_to_end(key)
+            return html
+
+    def put(self, object_id: str, content_hash: str, html: str) -> None:
+        """
+        Caches a render, evicting the least recently used ones over capacity.
+
+        Args:
+            object_id: ID of the rendered event or entity.
+            content_hash: Hash of the rendered content.
+            html: The rendered HTML.
+        """
+        key = (object_id, content_hash, self.renderer_version)
+        with self._lock:
+            self._entries[key] = html
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, object_id: str) -> None:
+        """
+        Drops every render of an object.
+
+        Args:
+            object_id: ID of the edited or deleted event or entity.
+        """
+        self.invalidate_many([object_id])
+
+    def invalidate_many(self, object_ids: Iterable[str]) -> None:
+        """
+        Drops every render of several objects.
+
+        Args:
+            object_ids: IDs of edited or deleted events or entities.
+        """
+        stale_ids = set(object_ids)
+        if not stale_ids:
+            return
+        with self._lock:
+            for key in [key for key in self._entries if key[0] in stale_ids]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drops all cached renders."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by the web server and the command worker
+render_cache = RenderCache()
+
+
+def load_renders(
+    conn: sqlite3.Connection,
+    keys: Iterable[RenderKey],
+    renderer_version: int = RENDERER_VERSION,
+) -> Dict[RenderKey, str]:
+    """
+    Reads persisted renders.
+
+    Args:
+        conn: SQLite connection (may be read-only).
+        keys: (object id, content hash) pairs to look up.
+        renderer_version: Renderer version the renders must match.
+
+    Returns:
+        Dict[RenderKey, str]: HTML of the keys found.
+    """
+    wanted = set(keys)
+    ids = sorted({object_id for object_id, _ in wanted})
+    found: Dict[RenderKey, str] = {}
+    for batch in param_batches(ids):
+        placeholders = ",".join("?" * len(batch))
+        cursor = conn.execute(
+            f"""
+            SELECT object_id, content_hash, html FROM rendered_sections
+            WHERE renderer_version = ? AND object_id IN ({placeholders})
+            """,
+            (renderer_version, *batch),
+        )
+        for object_id, content_hash, html in cursor:
+            if (object_id, content_hash) in wanted:
+                found[(object_id, content_hash)] = html
+    return found
+
+
+def store_renders(
+    conn: sqlite3.Connection,
+    renders: Dict[RenderKey, str],
+    renderer_version: int = RENDERER_VERSION,
+) -> None:
+    """
+    Persists renders, replacing any older render of the same objects.
+
+    Args:
+        conn: Writable SQLite connection.
+        renders: HTML by (object id, content hash).
+        renderer_version: Renderer version that produced the HTML.
+    """
+    if not renders:
+        return
+    now = time.time()
+    rows: List[Tuple[str, str, int, str, float]] = [
+        (object_id, content_hash, renderer_version, html, now)
+        for (object_id, content_hash), html in renders.items()
+    ]
+    with conn:
+        conn.executemany(
+            "DELETE FROM rendered_sections WHERE object_id = ?",
+            [(object_id,) for object_id, _ in renders],
+        )
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO rendered_sections
+                (object_id, content_hash, renderer_version, html, created_at)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+
+
+def prune_renders(
+    conn: sqlite3.Connection, renderer_version: int = RENDERER_VERSION
+) -> int:
+    """
+    Deletes persisted renders of other renderer versions or deleted objects.
+
+    Args:
+        conn: Writable SQLite connection.
+        renderer_version: Current renderer version.
+
+    Returns:
+        int: Number of rows deleted.
+    """
+    with conn:
+        cursor = conn.execute(
+            """
+            DELETE FROM rendered_sections
+            WHERE renderer_version != ?
+               OR (object_id NOT IN (SELECT id FROM events)
+                   AND object_id NOT IN (SELECT id FROM entities))
+            """,
+            (renderer_version,),
+        )
+    if cursor.rowcount:
+        logger.debug(f"Pruned {cursor.rowcount} persisted section renders")
+    return cursor.rowcount
@@ -9,10 +9,30 @@ import json
 import logging
 import sqlite3
 from contextlib import contextmanager
-from typing import Iterator, Optional
+from typing import Iterator, List, Optional, Sequence, TypeVar
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Values bound per "IN (...)" query; SQLite builds before 3.32 allow at most
+# 999 host parameters per statement
+SQL_PARAM_BATCH = 400
+
+
+def param_batches(values: Sequence[T]) -> Iterator[List[T]]:
+    """
+    Split values into batches small enough to bind in one statement.
+
+    Args:
+        values: Values to bind, e.g. the IDs of an IN list.
+
+    Yields:
+        List[T]: Consecutive batches of at most SQL_PARAM_BATCH values.
+    """
+    for start in range(0, len(values), SQL_PARAM_BATCH):
+        yield list(values[start : start + SQL_PARAM_BATCH])
+
 
 class BaseRepository:
     """
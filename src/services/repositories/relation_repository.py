@@ -5,7 +5,7 @@ Handles CRUD operations for Relation entities in the database.
 """
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from src.services.repositories.base_repository import BaseRepository
 
@@ -139,6 +139,53 @@ class RelationRepository(BaseRepository):
             relations.append(data)
         return relations
 
+    def get_temporal_by_targets(
+        self, target_ids: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve every temporal relation that targets an entity, in one query.
+
+        A relation is temporal when its attributes carry a valid_from or are
+        anchored to the source event (valid_from_event). Includes
+        'source_event_date' like get_by_target.
+
+        Args:
+            target_ids: Optional entity IDs to restrict the targets to.
+                If None, relations for all entities are returned.
+
+        Returns:
+            List of relation dictionaries.
+        """
+        sql = """
+            SELECT r.*, e.lore_date as source_event_date, e.name as source_event_name
+            FROM relations r
+            JOIN entities t ON r.target_id = t.id
+            LEFT JOIN events e ON r.source_id = e.id
+            WHERE CASE WHEN json_valid(r.attributes) THEN
+                json_extract(r.attributes, '$.valid_from') IS NOT NULL
+                OR json_extract(r.attributes, '$.valid_from_event') = 1
+            ELSE 0 END
+        """
+        params: List[Any] = []
+        if target_ids is not None:
+            if not target_ids:
+                return []
+            placeholders = ",".join("?" for _ in target_ids)
+            sql += f" AND r.target_id IN ({placeholders})"
+            params.extend(target_ids)
+
+        if not self._connection:
+            raise RuntimeError("Database connection not initialized")
+
+        cursor = self._connection.execute(sql, params)
+        relations = []
+        for row in cursor.fetchall():
+            data = dict(row)
+            if data.get("attributes"):
+                data["attributes"] = self._deserialize_json(data["attributes"])
+            relations.append(data)
+        return relations
+
     def delete(self, relation_id: str) -> None:
         """
         Delete a relation permanently.
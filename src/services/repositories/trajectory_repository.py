@@ -3,23 +3,38 @@ Trajectory Repository Module.
 
 Handles database operations for the `moving_features` table,
 managing temporal trajectories for map markers.
+
+Keyframes are stored one row each in `trajectory_keyframes`, indexed on
+(trajectory, t) and (marker, t), so editing a keyframe touches a single row
+and time-window queries read only the keyframes they need. Trajectories
+written by older versions keep their keyframes as an MF-JSON blob in
+`moving_features.trajectory`; they are still readable and are moved into
+rows by the startup migration or on their first edit.
 """
 
 import json
 import logging
+import sqlite3
 import uuid
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from src.core.trajectory import (
     KEYFRAME_TIME_EPSILON,
     Keyframe,
+    keyframes_in_window,
     keyframes_to_mfjson,
     mfjson_to_keyframes,
 )
-from src.services.repositories.base_repository import BaseRepository
+from src.services.repositories.base_repository import BaseRepository, param_batches
 
 logger = logging.getLogger(__name__)
 
+# Value of moving_features.trajectory once keyframes live in their own table
+KEYFRAME_ROWS_STORAGE = '{"storage": "trajectory_keyframes"}'
+
+# Index-friendly pre-filter around epsilon comparisons on t
+_T_RANGE_MARGIN = 2 * KEYFRAME_TIME_EPSILON
+
 
 class TrajectoryRepository(BaseRepository):
     """
@@ -55,8 +70,6 @@ class TrajectoryRepository(BaseRepository):
         t_start = trajectory[0].t
         t_end = trajectory[-1].t
 
-        # Serialize trajectory to MF-JSON format
-        traj_json = json.dumps(keyframes_to_mfjson(trajectory))
         props_json = self._serialize_json(properties or {})
 
         feature_id = str(uuid.uuid4())
@@ -68,8 +81,17 @@ class TrajectoryRepository(BaseRepository):
 
         with self.transaction() as conn:
             conn.execute(
-                sql, (feature_id, marker_id, t_start, t_end, traj_json, props_json)
+                sql,
+                (
+                    feature_id,
+                    marker_id,
+                    t_start,
+                    t_end,
+                    KEYFRAME_ROWS_STORAGE,
+                    props_json,
+                ),
             )
+            self._insert_keyframe_rows(conn, feature_id, marker_id, trajectory)
 
         logger.info(f"Inserted trajectory {feature_id} for marker {marker_id}")
         return feature_id
@@ -90,26 +112,15 @@ class TrajectoryRepository(BaseRepository):
             raise RuntimeError("Database connection not initialized")
 
         sql = """
-            SELECT id, trajectory FROM moving_features
+            SELECT id, marker_id, trajectory FROM moving_features
             WHERE marker_id = ?
             ORDER BY t_start
         """
         cursor = self._connection.execute(sql, (marker_db_id,))
-        rows = cursor.fetchall()
-
-        results = []
-        for row in rows:
-            traj_id = row["id"]
-            traj_json = row["trajectory"]
-            try:
-                traj_data = json.loads(traj_json)
-                # Backward compatibility: detect old [[t,x,y],...] format
-                keyframes = self._parse_trajectory_json(traj_data)
-                results.append((traj_id, keyframes))
-            except (json.JSONDecodeError, IndexError, TypeError, ValueError) as e:
-                logger.error(f"Failed to parse trajectory {traj_id}: {e}")
-
-        return results
+        return [
+            (traj_id, keyframes)
+            for _, traj_id, keyframes in self._read_trajectories(cursor)
+        ]
 
     def get_by_map_id(self, map_id: str) -> List[Tuple[str, str, List[Keyframe]]]:
         """
@@ -133,78 +144,111 @@ class TrajectoryRepository(BaseRepository):
             ORDER BY mf.t_start
         """
         cursor = self._connection.execute(sql, (map_id,))
-        rows = cursor.fetchall()
-
-        results = []
-        for row in rows:
-            marker_id = row["marker_id"]
-            traj_id = row["traj_id"]
-            traj_json = row["trajectory"]
-            try:
-                traj_data = json.loads(traj_json)
-                # Backward compatibility: detect old [[t,x,y],...] format
-                keyframes = self._parse_trajectory_json(traj_data)
-                results.append((marker_id, traj_id, keyframes))
-            except (json.JSONDecodeError, IndexError, TypeError, ValueError) as e:
-                logger.error(f"Failed to parse trajectory {traj_id}: {e}")
+        return self._read_trajectories(cursor)
 
-        return results
-
-    def add_keyframe(self, map_id: str, object_id: str, keyframe: Keyframe) -> str:
+    def get_by_map_id_in_range(
+        self, map_id: str, t0: float, t1: float
+    ) -> List[Tuple[str, str, List[Keyframe]]]:
         """
-        Adds or updates a keyframe for the given marker (identified by map+object).
-        Resolves the internal markers.id first.
+        Retrieves the keyframes of a map's trajectories for a time window.
+
+        Each trajectory contributes its keyframes between t0 and t1 plus the
+        nearest keyframe on either side (see keyframes_in_window), so
+        positions interpolated inside the window match the full trajectory.
+        Keyframe rows are found through the (trajectory, t) index.
 
         Args:
-            map_id: ID of the map.
-            object_id: The object ID (Entity/Event ID).
-            keyframe: The Keyframe to add.
+            map_id: The UUID of the map.
+            t0: Start of the time window.
+            t1: End of the time window.
 
         Returns:
-            The ID of the trajectory updated or created.
+            List of tuples (object_id, trajectory_id, List[Keyframe]).
         """
         if not self._connection:
             raise RuntimeError("Database connection not initialized")
 
-        # 1. Resolve markers.id
-        row = self._connection.execute(
-            "SELECT id FROM markers WHERE map_id = ? AND object_id = ?",
-            (map_id, object_id),
-        ).fetchone()
+        sql = """
+            SELECT mf.id as traj_id, m.object_id as marker_id, mf.trajectory
+            FROM moving_features mf
+            JOIN markers m ON mf.marker_id = m.id
+            WHERE m.map_id = ?
+            ORDER BY mf.t_start
+        """
+        cursor = self._connection.execute(sql, (map_id,))
+        return self._read_trajectories(cursor, window=(t0, t1))
 
-        if not row:
-            logger.error(f"No marker found for map_id={map_id}, object_id={object_id}")
-            raise ValueError(f"Marker not found: map={map_id}, obj={object_id}")
+    def export_mfjson(self, trajectory_id: str) -> dict:
+        """
+        Exports a trajectory as an OGC MF-JSON MovingPoint.
 
-        marker_db_id = row["id"]
+        Args:
+            trajectory_id: The ID of the trajectory record.
+
+        Returns:
+            The MF-JSON dict produced by keyframes_to_mfjson.
+
+        Raises:
+            ValueError: If the trajectory does not exist or has no keyframes.
+        """
+        if not self._connection:
+            raise RuntimeError("Database connection not initialized")
 
-        # 2. Get existing trajectories
-        trajectories = self.get_by_marker_db_id(marker_db_id)
+        cursor = self._connection.execute(
+            "SELECT id, marker_id, trajectory FROM moving_features WHERE id = ?",
+            (trajectory_id,),
+        )
+        trajectories = self._read_trajectories(cursor)
+        if not trajectories:
+            raise ValueError(f"Trajectory not found: {trajectory_id}")
+        return keyframes_to_mfjson(trajectories[0][2])
 
-        if trajectories:
-            # Update existing (pick the last one based on t_start if multiple, or just first)
-            traj_id, keyframes = trajectories[0]
+    def add_keyframe(self, map_id: str, object_id: str, keyframe: Keyframe) -> str:
+        """
+        Adds or updates a keyframe for the given marker (identified by map+object).
+        Resolves the internal markers.id first.
 
-            # Remove any existing keyframe at exactly this time (or within small epsilon)
-            keyframes = [
-                k for k in keyframes if abs(k.t - keyframe.t) > KEYFRAME_TIME_EPSILON
-            ]
+        Args:
+            map_id: ID of the map.
+            object_id: The object ID (Entity/Event ID).
+            keyframe: The Keyframe to add.
 
-            keyframes.append(keyframe)
-            keyframes.sort(key=lambda k: k.t)
+        Returns:
+            The ID of the trajectory updated or created.
+        """
+        marker_db_id, traj_id = self._resolve_trajectory(map_id, object_id)
 
-            # Persist update
-            self._update_trajectory_record(traj_id, keyframes)
-            return traj_id
-        else:
+        if traj_id is None:
             return self.insert(marker_db_id, [keyframe])
 
+        self._ensure_keyframe_rows(traj_id)
+        with self.transaction() as conn:
+            # Replace any existing keyframe at this time (within epsilon)
+            conn.execute(
+                """
+                DELETE FROM trajectory_keyframes
+                WHERE trajectory_id = ? AND t BETWEEN ? AND ?
+                  AND ABS(t - ?) <= ?
+                """,
+                (
+                    traj_id,
+                    keyframe.t - _T_RANGE_MARGIN,
+                    keyframe.t + _T_RANGE_MARGIN,
+                    keyframe.t,
+                    KEYFRAME_TIME_EPSILON,
+                ),
+            )
+            self._insert_keyframe_rows(conn, traj_id, marker_db_id, [keyframe])
+            self._refresh_time_bounds(conn, traj_id)
+        return traj_id
+
     def update_keyframe_time(
         self, map_id: str, object_id: str, old_t: float, new_t: float
     ) -> str:
         """
         Updates the timestamp of a specific keyframe (Clock Mode editing).
-        Finds keyframe at old_t, changes its t to new_t, re-sorts trajectory.
+        Finds keyframe at old_t and changes its t to new_t; reads return
+        keyframes ordered by time, so the trajectory re-sorts naturally.
 
         Args:
             map_id: ID of the map.
@@ -218,47 +262,42 @@ class TrajectoryRepository(BaseRepository):
         Raises:
             ValueError: If marker or keyframe not found.
         """
-        if not self._connection:
-            raise RuntimeError("Database connection not initialized")
+        _, traj_id = self._resolve_trajectory(map_id, object_id)
 
-        # 1. Resolve markers.id
-        row = self._connection.execute(
-            "SELECT id FROM markers WHERE map_id = ? AND object_id = ?",
-            (map_id, object_id),
-        ).fetchone()
-
-        if not row:
-            logger.error(f"No marker found for map_id={map_id}, object_id={object_id}")
-            raise ValueError(f"Marker not found: map={map_id}, obj={object_id}")
-
-        marker_db_id = row["id"]
-
-        # 2. Get existing trajectories
-        trajectories = self.get_by_marker_db_id(marker_db_id)
-
-        if not trajectories:
+        if traj_id is None:
             raise ValueError(f"No trajectory found for marker {object_id}")
 
-        traj_id, keyframes = trajectories[0]
+        self._ensure_keyframe_rows(traj_id)
+        assert self._connection is not None
 
-        # 3. Find keyframe at old_t (within epsilon)
-        target_kf = None
-        for kf in keyframes:
-            if abs(kf.t - old_t) < KEYFRAME_TIME_EPSILON:
-                target_kf = kf
-                break
+        # Find keyframe at old_t (within epsilon)
+        row = self._connection.execute(
+            """
+            SELECT id FROM trajectory_keyframes
+            WHERE trajectory_id = ? AND t BETWEEN ? AND ?
+              AND ABS(t - ?) < ?
+            ORDER BY t, id
+            LIMIT 1
+            """,
+            (
+                traj_id,
+                old_t - _T_RANGE_MARGIN,
+                old_t + _T_RANGE_MARGIN,
+                old_t,
+                KEYFRAME_TIME_EPSILON,
+            ),
+        ).fetchone()
 
-        if not target_kf:
+        if not row:
             raise ValueError(f"Keyframe at t={old_t} not found")
 
-        # 4. Update timestamp
-        target_kf.t = new_t
-
-        # 5. Re-sort keyframes (natural reordering)
-        keyframes.sort(key=lambda k: k.t)
+        with self.transaction() as conn:
+            conn.execute(
+                "UPDATE trajectory_keyframes SET t = ? WHERE id = ?",
+                (new_t, row["id"]),
+            )
+            self._refresh_time_bounds(conn, traj_id)
 
-        # 6. Persist update
-        self._update_trajectory_record(traj_id, keyframes)
         logger.info(f"Updated keyframe time: {old_t:.2f} → {new_t:.2f} for {object_id}")
         return traj_id
 
@@ -277,12 +316,118 @@ class TrajectoryRepository(BaseRepository):
         Raises:
             ValueError: If marker or keyframe not found.
         """
+        _, traj_id = self._resolve_trajectory(map_id, object_id)
+
+        if traj_id is None:
+            raise ValueError(f"No trajectory found for marker {object_id}")
+
+        self._ensure_keyframe_rows(traj_id)
+        trajectory_deleted = False
+        with self.transaction() as conn:
+            deleted = conn.execute(
+                """
+                DELETE FROM trajectory_keyframes
+                WHERE trajectory_id = ? AND t BETWEEN ? AND ?
+                  AND ABS(t - ?) <= ?
+                """,
+                (
+                    traj_id,
+                    t - _T_RANGE_MARGIN,
+                    t + _T_RANGE_MARGIN,
+                    t,
+                    KEYFRAME_TIME_EPSILON,
+                ),
+            ).rowcount
+
+            if deleted:
+                remaining = conn.execute(
+                    """
+                    SELECT COUNT(*) FROM (
+                        SELECT 1 FROM trajectory_keyframes
+                        WHERE trajectory_id = ? LIMIT 2
+                    )
+                    """,
+                    (traj_id,),
+                ).fetchone()[0]
+
+                # A trajectory needs at least 2 keyframes to interpolate
+                if remaining < 2:
+                    conn.execute(
+                        "DELETE FROM trajectory_keyframes WHERE trajectory_id = ?",
+                        (traj_id,),
+                    )
+                    conn.execute("DELETE FROM moving_features WHERE id = ?", (traj_id,))
+                    trajectory_deleted = True
+                else:
+                    self._refresh_time_bounds(conn, traj_id)
+
+        if not deleted:
+            raise ValueError(f"Keyframe at t={t} not found")
+
+        logger.info(f"Deleted keyframe at t={t:.2f} for {object_id}")
+        if trajectory_deleted:
+            logger.info(
+                f"Trajectory {traj_id} has <2 keyframes, deleting entire trajectory"
+            )
+            return None
+        return traj_id
+
+    def convert_json_trajectories(self) -> int:
+        """
+        Moves every JSON-blob trajectory into keyframe rows.
+
+        Trajectories whose JSON cannot be parsed are logged and left as they
+        are.
+
+        Returns:
+            Number of trajectories converted.
+        """
+        if not self._connection:
+            raise RuntimeError("Database connection not initialized")
+
+        rows = self._connection.execute(
+            "SELECT id FROM moving_features WHERE trajectory != ?",
+            (KEYFRAME_ROWS_STORAGE,),
+        ).fetchall()
+
+        converted = 0
+        with self.transaction() as conn:
+            for row in rows:
+                try:
+                    self._convert_trajectory(conn, row["id"])
+                    converted += 1
+                except (json.JSONDecodeError, IndexError, TypeError, ValueError) as e:
+                    logger.warning(f"Skipping corrupt trajectory {row['id']}: {e}")
+        return converted
+
+    def _resolve_trajectory(
+        self, map_id: str, object_id: str
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Resolves markers.id and the marker's first trajectory.
+
+        Args:
+            map_id: ID of the map.
+            object_id: The object ID (Entity/Event ID).
+
+        Returns:
+            Tuple of (marker DB ID, trajectory ID or None).
+
+        Raises:
+            ValueError: If the marker does not exist.
+        """
         if not self._connection:
             raise RuntimeError("Database connection not initialized")
 
-        # 1. Resolve markers.id
         row = self._connection.execute(
-            "SELECT id FROM markers WHERE map_id = ? AND object_id = ?",
+            """
+            SELECT m.id AS marker_id,
+                   (SELECT mf.id FROM moving_features mf
+                    WHERE mf.marker_id = m.id
+                    ORDER BY mf.t_start LIMIT 1) AS traj_id
+            FROM markers m
+            WHERE m.map_id = ? AND m.object_id = ?
+            """,
             (map_id, object_id),
         ).fetchone()
 
@@ -290,56 +435,159 @@ class TrajectoryRepository(BaseRepository):
             logger.error(f"No marker found for map_id={map_id}, object_id={object_id}")
             raise ValueError(f"Marker not found: map={map_id}, obj={object_id}")
 
-        marker_db_id = row["id"]
-
-        # 2. Get existing trajectories
-        trajectories = self.get_by_marker_db_id(marker_db_id)
-
-        if not trajectories:
-            raise ValueError(f"No trajectory found for marker {object_id}")
-
-        traj_id, keyframes = trajectories[0]
+        return row["marker_id"], row["traj_id"]
 
-        # 3. Find and remove keyframe at t (within epsilon)
-        original_count = len(keyframes)
-        keyframes = [kf for kf in keyframes if abs(kf.t - t) > KEYFRAME_TIME_EPSILON]
+    def _ensure_keyframe_rows(self, traj_id: str) -> None:
+        """Moves a JSON-blob trajectory into keyframe rows before editing it."""
+        assert self._connection is not None
+        row = self._connection.execute(
+            "SELECT trajectory FROM moving_features WHERE id = ?", (traj_id,)
+        ).fetchone()
+        if row is None or row["trajectory"] == KEYFRAME_ROWS_STORAGE:
+            return
+        with self.transaction() as conn:
+            self._convert_trajectory(conn, traj_id)
 
-        if len(keyframes) == original_count:
-            raise ValueError(f"Keyframe at t={t} not found")
+    def _convert_trajectory(self, conn: sqlite3.Connection, traj_id: str) -> None:
+        """Writes a trajectory's JSON keyframes as rows and marks it converted."""
+        row = conn.execute(
+            "SELECT marker_id, trajectory FROM moving_features WHERE id = ?",
+            (traj_id,),
+        ).fetchone()
+        keyframes = self._parse_trajectory_json(json.loads(row["trajectory"]))
+        keyframes.sort(key=lambda k: k.t)
 
-        logger.info(f"Deleted keyframe at t={t:.2f} for {object_id}")
+        self._insert_keyframe_rows(conn, traj_id, row["marker_id"], keyframes)
+        conn.execute(
+            "UPDATE moving_features SET trajectory = ? WHERE id = ?",
+            (KEYFRAME_ROWS_STORAGE, traj_id),
+        )
+        if keyframes:
+            self._refresh_time_bounds(conn, traj_id)
+
+    @staticmethod
+    def _insert_keyframe_rows(
+        conn: sqlite3.Connection,
+        traj_id: str,
+        marker_id: str,
+        keyframes: Sequence[Keyframe],
+    ) -> None:
+        """Inserts keyframes as rows of a trajectory."""
+        conn.executemany(
+            """
+            INSERT INTO trajectory_keyframes (trajectory_id, marker_id, t, x, y)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            [(traj_id, marker_id, kf.t, kf.x, kf.y) for kf in keyframes],
+        )
+
+    @staticmethod
+    def _refresh_time_bounds(conn: sqlite3.Connection, traj_id: str) -> None:
+        """Recomputes t_start/t_end from the (trajectory, t) index."""
+        conn.execute(
+            """
+            UPDATE moving_features
+            SET t_start = (SELECT MIN(t) FROM trajectory_keyframes
+                           WHERE trajectory_id = :id),
+                t_end = (SELECT MAX(t) FROM trajectory_keyframes
+                         WHERE trajectory_id = :id)
+            WHERE id = :id
+            """,
+            {"id": traj_id},
+        )
+
+    def _read_trajectories(
+        self,
+        cursor: sqlite3.Cursor,
+        window: Optional[Tuple[float, float]] = None,
+    ) -> List[Tuple[str, str, List[Keyframe]]]:
+        """
+        Loads the keyframes of the moving_features rows of a cursor.
 
-        # 4. If trajectory now has less than 2 keyframes, delete the entire trajectory
-        if len(keyframes) < 2:
-            logger.info(
-                f"Trajectory {traj_id} has <2 keyframes, deleting entire trajectory"
-            )
-            with self.transaction() as conn:
-                conn.execute("DELETE FROM moving_features WHERE id = ?", (traj_id,))
-            return None
+        Trajectories without keyframes, or whose JSON blob cannot be parsed,
+        are left out.
 
-        # 5. Persist update
-        self._update_trajectory_record(traj_id, keyframes)
-        return traj_id
+        Args:
+            cursor: Cursor over (traj_id, marker_id, trajectory) rows.
+            window: Optional (t0, t1) restricting keyframes as in
+                keyframes_in_window.
 
-    def _update_trajectory_record(
-        self, traj_id: str, keyframes: List[Keyframe]
-    ) -> None:
-        """Updates the trajectory JSON in the database."""
-        if not keyframes:
-            return
+        Returns:
+            List of tuples (marker_id, trajectory_id, List[Keyframe]).
+        """
+        rows = cursor.fetchall()
+        row_keyframes = self._load_keyframe_rows(
+            [row[0] for row in rows if row[2] == KEYFRAME_ROWS_STORAGE], window
+        )
 
-        t_start = keyframes[0].t
-        t_end = keyframes[-1].t
-        traj_json = json.dumps(keyframes_to_mfjson(keyframes))
+        results = []
+        for traj_id, marker_id, traj_json in rows:
+            if traj_json == KEYFRAME_ROWS_STORAGE:
+                keyframes = row_keyframes[traj_id]
+            else:
+                try:
+                    traj_data = json.loads(traj_json)
+                    # Backward compatibility: detect old [[t,x,y],...] format
+                    keyframes = self._parse_trajectory_json(traj_data)
+                except (json.JSONDecodeError, IndexError, TypeError, ValueError) as e:
+                    logger.error(f"Failed to parse trajectory {traj_id}: {e}")
+                    continue
+                keyframes.sort(key=lambda k: k.t)
+                if window is not None:
+                    keyframes = keyframes_in_window(keyframes, *window)
+            if keyframes:
+                results.append((marker_id, traj_id, keyframes))
+        return results
 
-        sql = """
-            UPDATE moving_features
-            SET t_start = ?, t_end = ?, trajectory = ?
-            WHERE id = ?
-        """
-        with self.transaction() as conn:
-            conn.execute(sql, (t_start, t_end, traj_json, traj_id))
+    def _load_keyframe_rows(
+        self,
+        traj_ids: Sequence[str],
+        window: Optional[Tuple[float, float]] = None,
+    ) -> Dict[str, List[Keyframe]]:
+        """Reads the keyframe rows of several trajectories in time order."""
+        assert self._connection is not None
+        keyframes: Dict[str, List[Keyframe]] = {traj_id: [] for traj_id in traj_ids}
+        for batch in param_batches(traj_ids):
+            placeholders = ",".join("?" * len(batch))
+            if window is None:
+                cursor = self._connection.execute(
+                    f"""
+                    SELECT trajectory_id, t, x, y FROM trajectory_keyframes
+                    WHERE trajectory_id IN ({placeholders})
+                    ORDER BY trajectory_id, t, id
+                    """,
+                    batch,
+                )
+            else:
+                # Per trajectory: the window plus the nearest keyframe on
+                # either side, each bound found through the (trajectory, t)
+                # index
+                t0, t1 = window
+                cursor = self._connection.execute(
+                    f"""
+                    WITH bounds AS (
+                        SELECT mf.id AS trajectory_id,
+                            COALESCE((SELECT MAX(t) FROM trajectory_keyframes
+                                      WHERE trajectory_id = mf.id AND t < ?), ?)
+                                AS t_low,
+                            COALESCE((SELECT MIN(t) FROM trajectory_keyframes
+                                      WHERE trajectory_id = mf.id AND t > ?), ?)
+                                AS t_high
+                        FROM moving_features mf
+                        WHERE mf.id IN ({placeholders})
+                    )
+                    SELECT k.trajectory_id, k.t, k.x, k.y
+                    FROM bounds b
+                    JOIN trajectory_keyframes k
+                      ON k.trajectory_id = b.trajectory_id
+                     AND k.t BETWEEN b.t_low AND b.t_high
+                    ORDER BY k.trajectory_id, k.t, k.id
+                    """,
+                    (t0, t0, t1, t1, *batch),
+                )
+            for traj_id, t, x, y in cursor:
+                keyframes[traj_id].append(Keyframe(t=t, x=x, y=y))
+        return keyframes
 
     def _parse_trajectory_json(self, data: dict | list) -> List[Keyframe]:
         """
@@ -5,6 +5,7 @@ Provides fault tolerance patterns like circuit breakers for robust API interacti
 """
 
 import logging
+import threading
 import time
 from typing import Any, Callable
 
@@ -18,6 +19,10 @@ class CircuitBreaker:
     Tracks failures and opens circuit after threshold is reached,
     preventing further requests until a timeout period passes.
     Implements the three-state pattern: closed, open, half-open.
+
+    Safe to share between threads: state transitions are guarded by a lock,
+    and while half-open only a single trial call is let through; concurrent
+    callers are rejected until that call settles the state.
     """
 
     def __init__(self, failure_threshold: int = 5, timeout: float = 60.0) -> None:
@@ -33,6 +38,8 @@ class CircuitBreaker:
         self.failures = 0
         self.last_failure_time = 0.0
         self.state = "closed"  # closed, open, half-open
+        self._lock = threading.Lock()
+        self._trial_in_flight = False
 
     def call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
         """
@@ -49,35 +56,58 @@ class CircuitBreaker:
         Raises:
             Exception: If circuit is open or function fails.
         """
-        if self.state == "open":
-            if time.time() - self.last_failure_time >= self.timeout:
-                logger.info("Circuit breaker entering half-open state")
-                self.state = "half-open"
-            else:
-                raise Exception("Circuit breaker is OPEN - too many recent failures")
+        with self._lock:
+            if self.state == "open":
+                if time.time() - self.last_failure_time >= self.timeout:
+                    logger.info("Circuit breaker entering half-open state")
+                    self.state = "half-open"
+                else:
+                    raise Exception(
+                        "Circuit breaker is OPEN - too many recent failures"
+                    )
+
+            is_trial = self.state == "half-open"
+            if is_trial:
+                if self._trial_in_flight:
+                    raise Exception(
+                        "Circuit breaker is OPEN - half-open trial call in progress"
+                    )
+                self._trial_in_flight = True
 
         try:
             result = func(*args, **kwargs)
-            if self.state == "half-open":
-                logger.info("Circuit breaker closing after successful call")
-                self.state = "closed"
-                self.failures = 0
-            return result
         except Exception as e:
-            self.failures += 1
-            self.last_failure_time = time.time()
-
-            if self.failures >= self.failure_threshold:
-                logger.error(f"Circuit breaker OPENING after {self.failures} failures")
-                self.state = "open"
+            with self._lock:
+                if is_trial:
+                    self._trial_in_flight = False
+                self.failures += 1
+                self.last_failure_time = time.time()
+
+                if self.state == "half-open" or self.failures >= self.failure_threshold:
+                    if self.state != "open":
+                        logger.error(
+                            f"Circuit breaker OPENING after {self.failures} failures"
+                        )
+                    self.state = "open"
 
             raise e
 
+        with self._lock:
+            if is_trial:
+                self._trial_in_flight = False
+                if self.state == "half-open":
+                    logger.info("Circuit breaker closing after successful call")
+                    self.state = "closed"
+                    self.failures = 0
+        return result
+
     def reset(self) -> None:
         """Manually reset the circuit breaker to closed state."""
-        self.failures = 0
-        self.last_failure_time = 0.0
-        self.state = "closed"
+        with self._lock:
+            self.failures = 0
+            self.last_failure_time = 0.0
+            self.state = "closed"
+            self._trial_in_flight = False
         logger.info("Circuit breaker manually reset")
 
     def get_state(self) -> dict:
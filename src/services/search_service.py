@@ -11,15 +11,23 @@ import json
 import logging
 import os
 import sqlite3
+import threading
 import time
 import uuid
 from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
+    Deque,
     Dict,
     Iterator,
     List,
+    NamedTuple,
     Optional,
     Sequence,
     Tuple,
@@ -32,6 +40,7 @@ import numpy as np
 if TYPE_CHECKING:
     from src.core.entities import Entity
     from src.core.events import Event
+    from src.services.ann_index import IVFIndex
 
 logger = logging.getLogger(__name__)
 
@@ -187,6 +196,23 @@ def normalize_vector(v: np.ndarray) -> np.ndarray:
     return v / norm
 
 
+def normalize_vectors(M: np.ndarray) -> np.ndarray:
+    """
+    Normalize each row of a matrix to unit length.
+
+    Near-zero rows are returned unchanged, matching normalize_vector.
+
+    Args:
+        M: 2D array with one vector per row.
+
+    Returns:
+        np.ndarray: Row-normalized matrix as float32.
+    """
+    M = M.astype(np.float32)
+    norms = np.linalg.norm(M, axis=1, keepdims=True)
+    return M / np.where(norms < 1e-12, 1.0, norms)
+
+
 def serialize_vector(v: np.ndarray) -> bytes:
     """
     Serialize a vector to bytes for storage in SQLite BLOB.
@@ -259,6 +285,406 @@ def top_k_streaming(
     return [(score, item) for score, _, item in sorted_heap]
 
 
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Select indices of the top-k scores using a partial sort.
+
+    Uses np.argpartition so only the k best entries are fully sorted.
+
+    Args:
+        scores: 1D array of similarity scores.
+        k: Number of top items to return.
+
+    Returns:
+        np.ndarray: Indices into scores, sorted by descending score.
+    """
+    k = min(k, scores.shape[0])
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k < scores.shape[0]:
+        candidates = np.argpartition(-scores, k - 1)[:k]
+    else:
+        candidates = np.arange(scores.shape[0])
+    order = np.argsort(-scores[candidates], kind="stable")
+    return candidates[order]
+
+
+# Constant k of reciprocal rank fusion; dampens the weight of the top ranks
+RRF_K = 60
+
+# Hybrid queries fuse this many candidates per ranking (per requested result)
+HYBRID_CANDIDATE_FACTOR = 4
+HYBRID_MIN_CANDIDATES = 20
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[Tuple[str, str]]], k: int = RRF_K
+) -> List[Tuple[Tuple[str, str], float]]:
+    """
+    Merge rankings with reciprocal rank fusion.
+
+    Each item scores the sum of 1 / (k + rank) over the rankings it appears
+    in (ranks start at 1), so items ranked well by several rankings rise to
+    the top without having to calibrate their raw scores against each other.
+
+    Args:
+        rankings: Lists of (object type, object ID), best first.
+        k: Fusion constant.
+
+    Returns:
+        List of ((object type, object ID), fused score), best first; ties
+        keep first-seen order.
+
+    Example:
+        >>> fused = reciprocal_rank_fusion([[("entity", "a"), ("entity", "b")],
+        ...                                 [("entity", "b")]])
+        >>> [key[1] for key, _ in fused]
+        ['b', 'a']
+    """
+    scores: Dict[Tuple[str, str], float] = {}
+    for ranking in rankings:
+        for rank, key in enumerate(ranking, start=1):
+            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+def _format_result(row: Tuple[Any, ...], score: float) -> Dict[str, Any]:
+    """Format an embeddings row (id, type, object ID, metadata, snippet)."""
+    metadata = json.loads(row[3] or "{}")
+    return {
+        "id": row[0],
+        "object_type": row[1],
+        "object_id": row[2],
+        "score": score,
+        "name": metadata.get("name", ""),
+        "type": metadata.get("type", ""),
+        "metadata": metadata,
+        "text_content": row[4] or "",
+    }
+
+
+# =============================================================================
+# Vector Cache
+# =============================================================================
+
+# Maximum number of (database, model, dimension) matrices kept in memory
+MAX_CACHED_MATRICES = 4
+
+# Maximum number of memory-mapped ANN indexes kept open
+MAX_CACHED_ANN_INDEXES = 4
+
+# Minimum number of embeddings before rebuild_index also builds an ANN index
+ANN_MIN_VECTORS = 4096
+
+OBJECT_TYPE_CODES = {"entity": 0, "event": 1}
+
+
+# Change marker of one model's embeddings per object type
+EmbeddingFingerprint = Dict[str, Tuple[int, Optional[float]]]
+
+
+def embeddings_fingerprint(
+    conn: sqlite3.Connection, model: str
+) -> EmbeddingFingerprint:
+    """
+    Compute change markers for one model's embeddings, per object type.
+
+    Reads the embedding_stats counters, which triggers on the embeddings
+    table keep up to date (one small row per model and object type), so
+    this is safe to call before every search. Databases without the
+    counters (not created by DatabaseService) fall back to COUNT(*) and
+    MAX(created_at) over the model's rows. Any insert, upsert or delete
+    changes the marker of the written model and type only.
+
+    Args:
+        conn: SQLite database connection.
+        model: Embedding model name.
+
+    Returns:
+        Dict of object type -> (row count, change counter or latest
+        created_at timestamp).
+    """
+    try:
+        rows = conn.execute(
+            """
+            SELECT object_type, row_count, version FROM embedding_stats
+            WHERE model = ?
+            """,
+            (model,),
+        ).fetchall()
+    except sqlite3.OperationalError:
+        rows = conn.execute(
+            """
+            SELECT object_type, COUNT(*), MAX(created_at) FROM embeddings
+            WHERE model = ? GROUP BY object_type
+            """,
+            (model,),
+        ).fetchall()
+    return {row[0]: (row[1], row[2]) for row in rows}
+
+
+class EmbeddingMatrix:
+    """
+    Contiguous float32 matrix of all embeddings for one model and dimension.
+
+    Built once from the embeddings table and patched in place as objects
+    are indexed or deleted, so a query is a single matrix-vector product
+    instead of a scan over every BLOB.
+    """
+
+    def __init__(self, model: str, dimension: int) -> None:
+        """
+        Initialize an empty matrix.
+
+        Args:
+            model: Embedding model name.
+            dimension: Vector dimension.
+        """
+        self.model = model
+        self.dimension = dimension
+        self.fingerprint: Optional[EmbeddingFingerprint] = None
+        self._size = 0
+        self._vectors = np.empty((0, dimension), dtype=np.float32)
+        self._type_codes = np.empty(0, dtype=np.int8)
+        self._embedding_ids: List[str] = []
+        self._keys: List[Tuple[str, str]] = []
+        self._rows: Dict[Tuple[str, str], int] = {}
+        self._type_rows: Dict[str, np.ndarray] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        """Return the number of stored vectors."""
+        return self._size
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """Stored vectors, one row per object."""
+        return self._vectors[: self._size]
+
+    @property
+    def type_codes(self) -> np.ndarray:
+        """Object type code per row."""
+        return self._type_codes[: self._size]
+
+    @property
+    def embedding_ids(self) -> List[str]:
+        """Embeddings table row ID per row."""
+        return self._embedding_ids
+
+    @classmethod
+    def load(
+        cls, conn: sqlite3.Connection, model: str, dimension: int
+    ) -> "EmbeddingMatrix":
+        """
+        Build a matrix from the embeddings table.
+
+        Args:
+            conn: SQLite database connection.
+            model: Embedding model name.
+            dimension: Vector dimension.
+
+        Returns:
+            EmbeddingMatrix: Matrix holding every matching embedding.
+        """
+        matrix = cls(model, dimension)
+        matrix.fingerprint = embeddings_fingerprint(conn, model)
+
+        cursor = conn.execute(
+            """
+            SELECT id, object_type, object_id, vector FROM embeddings
+            WHERE model = ? AND vector_dim = ?
+            """,
+            (model, dimension),
+        )
+        expected_bytes = dimension * 4
+        rows = [row for row in cursor.fetchall() if len(row[3]) == expected_bytes]
+        if not rows:
+            return matrix
+
+        buffer = bytearray(b"".join(row[3] for row in rows))
+        matrix._vectors = np.frombuffer(buffer, dtype=np.float32).reshape(
+            len(rows), dimension
+        )
+        matrix._type_codes = np.array(
+            [OBJECT_TYPE_CODES.get(row[1], -1) for row in rows], dtype=np.int8
+        )
+        matrix._embedding_ids = [row[0] for row in rows]
+        matrix._keys = [(row[1], row[2]) for row in rows]
+        matrix._rows = {key: i for i, key in enumerate(matrix._keys)}
+        matrix._size = len(rows)
+
+        logger.debug(f"Loaded embedding matrix for {model} ({len(rows)} x {dimension})")
+        return matrix
+
+    def _grow(self) -> None:
+        """Double the row capacity of the backing arrays."""
+        capacity = max(16, self._vectors.shape[0] * 2)
+        vectors = np.empty((capacity, self.dimension), dtype=np.float32)
+        vectors[: self._size] = self._vectors[: self._size]
+        type_codes = np.empty(capacity, dtype=np.int8)
+        type_codes[: self._size] = self._type_codes[: self._size]
+        self._vectors = vectors
+        self._type_codes = type_codes
+
+    def upsert(
+        self,
+        embedding_id: str,
+        object_type: str,
+        object_id: str,
+        vector: np.ndarray,
+    ) -> None:
+        """
+        Insert or replace the vector for an object.
+
+        Existing rows keep their embedding ID, mirroring the ON CONFLICT
+        update in the embeddings table.
+
+        Args:
+            embedding_id: Embeddings table row ID (used for new rows).
+            object_type: 'entity' or 'event'.
+            object_id: Object UUID.
+            vector: Normalized embedding vector.
+        """
+        key = (object_type, object_id)
+        with self._lock:
+            row = self._rows.get(key)
+            if row is None:
+                row = self._size
+                if row == self._vectors.shape[0]:
+                    self._grow()
+                self._rows[key] = row
+                self._keys.append(key)
+                self._embedding_ids.append(embedding_id)
+                self._size += 1
+            self._vectors[row] = vector
+            self._type_codes[row] = OBJECT_TYPE_CODES.get(object_type, -1)
+            self._type_rows.clear()
+
+    def remove(self, object_type: str, object_id: str) -> None:
+        """
+        Remove the vector for an object, if present.
+
+        The last row is moved into the freed slot so storage stays dense.
+
+        Args:
+            object_type: 'entity' or 'event'.
+            object_id: Object UUID.
+        """
+        with self._lock:
+            row = self._rows.pop((object_type, object_id), None)
+            if row is None:
+                return
+            last = self._size - 1
+            if row != last:
+                self._vectors[row] = self._vectors[last]
+                self._type_codes[row] = self._type_codes[last]
+                self._keys[row] = self._keys[last]
+                self._embedding_ids[row] = self._embedding_ids[last]
+                self._rows[self._keys[row]] = row
+            self._keys.pop()
+            self._embedding_ids.pop()
+            self._size = last
+            self._type_rows.clear()
+
+    def _rows_for_type(self, object_type: str) -> np.ndarray:
+        """
+        Get the row indices for an object type, computing them once.
+
+        Args:
+            object_type: 'entity' or 'event'.
+
+        Returns:
+            np.ndarray: Row indices of matching vectors.
+        """
+        rows = self._type_rows.get(object_type)
+        if rows is None:
+            code = OBJECT_TYPE_CODES.get(object_type, -1)
+            rows = np.flatnonzero(self._type_codes[: self._size] == code)
+            self._type_rows[object_type] = rows
+        return rows
+
+    def search(
+        self,
+        query_vector: np.ndarray,
+        top_k: int,
+        object_type: Optional[str] = None,
+    ) -> List[Tuple[float, str]]:
+        """
+        Score all vectors against a query and return the best matches.
+
+        Args:
+            query_vector: Normalized query vector.
+            top_k: Number of results to return.
+            object_type: Optional filter for 'entity' or 'event'.
+
+        Returns:
+            List of (score, embedding_id) tuples sorted by descending score.
+        """
+        with self._lock:
+            if self._size == 0 or top_k <= 0:
+                return []
+
+            scores = dot_scores(query_vector, self._vectors[: self._size])
+            if object_type:
+                rows = self._rows_for_type(object_type)
+                scores = scores[rows]
+            else:
+                rows = None
+
+            best = top_k_indices(scores, top_k)
+            matrix_rows = rows[best] if rows is not None else best
+            return [
+                (float(scores[i]), self._embedding_ids[row])
+                for i, row in zip(best, matrix_rows)
+            ]
+
+
+_matrix_registry: "OrderedDict[Tuple[str, str, int], EmbeddingMatrix]" = OrderedDict()
+_matrix_registry_lock = threading.Lock()
+
+# Memory-mapped ANN indexes keyed by path, with the metadata mtime at load
+_ann_registry: "OrderedDict[str, Tuple[int, IVFIndex]]" = OrderedDict()
+
+
+def get_database_path(conn: sqlite3.Connection) -> str:
+    """
+    Get the file path of the main database for a connection.
+
+    Args:
+        conn: SQLite database connection.
+
+    Returns:
+        str: Database file path, or an empty string for in-memory databases.
+    """
+    for row in conn.execute("PRAGMA database_list").fetchall():
+        if row[1] == "main":
+            return row[2] or ""
+    return ""
+
+
+def default_index_dir(db_path: str) -> Path:
+    """
+    Get the default ANN index directory for a database.
+
+    Indexes live in the world folder next to the .kraken file so they are
+    naturally scoped per world.
+
+    Args:
+        db_path: Path to the database file.
+
+    Returns:
+        Path: The 'indexes' directory beside the database.
+    """
+    return Path(db_path).parent / "indexes"
+
+
+def clear_embedding_cache() -> None:
+    """Drop all shared in-memory embedding matrices."""
+    with _matrix_registry_lock:
+        _matrix_registry.clear()
+        _ann_registry.clear()
+
+
 # =============================================================================
 # Embedding Provider Interface
 # =============================================================================
@@ -309,7 +735,9 @@ class LMStudioEmbeddingProvider(EmbeddingProvider):
     """
     Embedding provider for LM Studio local embedding API.
 
-    Supports OpenAI-compatible embedding endpoints.
+    Supports OpenAI-compatible embedding endpoints. Requests go through a
+    persistent keep-alive session and a circuit breaker, both safe to share
+    between the worker threads of a concurrent rebuild.
     """
 
     def __init__(
@@ -318,6 +746,7 @@ class LMStudioEmbeddingProvider(EmbeddingProvider):
         model: Optional[str] = None,
         api_key: Optional[str] = None,
         timeout: int = 30,
+        pool_size: int = 10,
     ) -> None:
         """
         Initialize LM Studio embedding provider.
@@ -328,10 +757,16 @@ class LMStudioEmbeddingProvider(EmbeddingProvider):
             model: Model name (default from env or required).
             api_key: Optional API key.
             timeout: Request timeout in seconds.
+            pool_size: Maximum number of keep-alive connections to the host.
         """
         import requests
 
+        from src.services.providers.lmstudio_provider import create_session
+        from src.services.resilience import CircuitBreaker
+
         self.requests = requests
+        self.session = create_session(pool_size)
+        self.circuit_breaker = CircuitBreaker(failure_threshold=5, timeout=60.0)
         self.url = url or os.getenv(
             "LMSTUDIO_EMBED_URL", "http://localhost:8080/v1/embeddings"
         )
@@ -376,12 +811,16 @@ class LMStudioEmbeddingProvider(EmbeddingProvider):
 
         payload = {self.input_key: texts, self.model_key: self.model}
 
-        try:
-            response = self.requests.post(
+        def _post() -> Any:
+            """Send the request; HTTP error statuses count as breaker failures."""
+            response = self.session.post(
                 self.url, json=payload, headers=headers, timeout=self.timeout
             )
             response.raise_for_status()
+            return response
 
+        try:
+            response = self.circuit_breaker.call(_post)
             data = response.json()
 
             # Parse embeddings from response using configured path
@@ -512,6 +951,42 @@ class SentenceTransformersProvider(EmbeddingProvider):
 # Search Service
 # =============================================================================
 
+# Number of texts sent to the provider per embed call during rebuilds
+DEFAULT_EMBED_BATCH_SIZE = 32
+
+# Number of embed batches kept in flight concurrently during rebuilds
+DEFAULT_EMBED_WORKERS = 1
+
+# Number of rows fetched per query while streaming objects during rebuilds
+REBUILD_CHUNK_SIZE = 500
+
+
+class EmbeddingJob(NamedTuple):
+    """An object whose text is waiting to be embedded."""
+
+    object_type: str
+    object_id: str
+    text: str
+    text_hash: str
+    metadata: Dict[str, Any]
+
+
+@dataclass
+class RebuildStats:
+    """Counters and timing for a rebuild_index run."""
+
+    processed: int = 0
+    embedded: int = 0
+    skipped: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+    cancelled: bool = False
+
+    @property
+    def objects_per_second(self) -> float:
+        """Processed objects per second of wall time."""
+        return self.processed / self.elapsed if self.elapsed > 0 else 0.0
+
 
 class SearchService:
     """
@@ -522,7 +997,10 @@ class SearchService:
     """
 
     def __init__(
-        self, db_connection: sqlite3.Connection, provider: EmbeddingProvider
+        self,
+        db_connection: sqlite3.Connection,
+        provider: EmbeddingProvider,
+        index_dir: Optional[str] = None,
     ) -> None:
         """
         Initialize search service.
@@ -530,15 +1008,308 @@ class SearchService:
         Args:
             db_connection: SQLite database connection.
             provider: Embedding provider instance.
+            index_dir: Optional directory for ANN indexes (defaults to
+                'indexes/' next to the database file; disabled for
+                in-memory databases).
         """
         self.conn = db_connection
         self.provider = provider
         self.model = provider.get_model_name()
         self.dimension = provider.get_dimension()
 
+        # In-memory vector matrices keyed by (model, dimension). File-backed
+        # databases share them across service instances via the registry.
+        self._db_path = get_database_path(db_connection)
+        self._matrices: Dict[Tuple[str, int], EmbeddingMatrix] = {}
+
+        self.last_rebuild_stats: Optional[RebuildStats] = None
+
+        self.index_dir: Optional[Path] = None
+        if index_dir:
+            self.index_dir = Path(index_dir)
+        elif self._db_path:
+            self.index_dir = default_index_dir(self._db_path)
+
         logger.info(f"SearchService initialized with model: {self.model}")
         logger.info(f"Embedding dimension: {self.dimension}")
 
+    def _get_matrix(
+        self,
+        model: str,
+        fingerprint: Optional[EmbeddingFingerprint] = None,
+    ) -> EmbeddingMatrix:
+        """
+        Get an up-to-date embedding matrix for a model.
+
+        Reuses the cached matrix while the embeddings table is unchanged and
+        reloads it otherwise (e.g. after writes from another connection).
+
+        Args:
+            model: Embedding model name.
+            fingerprint: Current fingerprint of the model, if already known.
+
+        Returns:
+            EmbeddingMatrix: Matrix for the model at the current dimension.
+        """
+        key = (model, self.dimension)
+        if fingerprint is None:
+            fingerprint = embeddings_fingerprint(self.conn, model)
+
+        matrix = self._matrices.get(key)
+        if matrix is None and self._db_path:
+            with _matrix_registry_lock:
+                matrix = _matrix_registry.get((self._db_path, *key))
+
+        if matrix is None or matrix.fingerprint != fingerprint:
+            matrix = EmbeddingMatrix.load(self.conn, model, self.dimension)
+
+        self._matrices[key] = matrix
+        if self._db_path:
+            with _matrix_registry_lock:
+                registry_key = (self._db_path, *key)
+                _matrix_registry[registry_key] = matrix
+                _matrix_registry.move_to_end(registry_key)
+                while len(_matrix_registry) > MAX_CACHED_MATRICES:
+                    _matrix_registry.popitem(last=False)
+        return matrix
+
+    def get_ann_index_path(self, model: Optional[str] = None) -> Optional[Path]:
+        """
+        Get the ANN index location for a model.
+
+        Args:
+            model: Optional model name (defaults to current provider model).
+
+        Returns:
+            Path to the index, or None if ANN indexes are disabled.
+        """
+        if self.index_dir is None:
+            return None
+        from src.services.ann_index import index_path
+
+        return index_path(self.index_dir, model or self.model)
+
+    def _get_ann_index(
+        self,
+        model: str,
+        fingerprint: EmbeddingFingerprint,
+        object_type: Optional[str] = None,
+    ) -> Optional["IVFIndex"]:
+        """
+        Get the on-disk ANN index for a model if it matches the table.
+
+        Indexes are memory-mapped once and shared across service instances.
+        A query filtered by object type only needs that type to be unchanged.
+
+        Args:
+            model: Embedding model name.
+            fingerprint: Current fingerprint of the model.
+            object_type: Object type the query is limited to, if any.
+
+        Returns:
+            IVFIndex if a fresh index exists, otherwise None.
+        """
+        path = self.get_ann_index_path(model)
+        if path is None:
+            return None
+
+        from src.services.ann_index import IVFIndex
+
+        key = str(path)
+        meta_path = path / "meta.json"
+        try:
+            mtime = meta_path.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+
+        with _matrix_registry_lock:
+            cached = _ann_registry.get(key)
+            if cached is not None and cached[0] != mtime:
+                # Release the memory maps of a replaced or deleted index
+                del _ann_registry[key]
+                cached = None
+            elif cached is not None:
+                _ann_registry.move_to_end(key)
+        if mtime is None:
+            return None
+
+        if cached is not None:
+            index = cached[1]
+        else:
+            index = IVFIndex.load(path)
+            if index is None:
+                return None
+            with _matrix_registry_lock:
+                _ann_registry[key] = (mtime, index)
+                while len(_ann_registry) > MAX_CACHED_ANN_INDEXES:
+                    _ann_registry.popitem(last=False)
+
+        if (
+            not index.is_fresh(fingerprint, object_type)
+            or index.dimension != self.dimension
+        ):
+            logger.debug(f"ANN index at {path} is stale, using exact search")
+            return None
+        return index
+
+    def build_ann_index(
+        self, model: Optional[str] = None, n_lists: Optional[int] = None
+    ) -> Optional["IVFIndex"]:
+        """
+        Build and persist an ANN index from the embeddings table.
+
+        Args:
+            model: Optional model name (defaults to current provider model).
+            n_lists: Optional number of clusters (defaults to sqrt of count).
+
+        Returns:
+            The built IVFIndex, or None if disabled or nothing is indexed.
+        """
+        path = self.get_ann_index_path(model)
+        if path is None:
+            logger.warning("ANN index directory not configured, skipping build")
+            return None
+
+        from src.services.ann_index import IVFIndex
+
+        model = model or self.model
+        fingerprint = embeddings_fingerprint(self.conn, model)
+        matrix = self._get_matrix(model, fingerprint)
+        if len(matrix) == 0:
+            logger.warning("No embeddings found to build ANN index")
+            return None
+
+        index = IVFIndex.build(
+            matrix.model,
+            self.dimension,
+            matrix.vectors,
+            matrix.embedding_ids,
+            matrix.type_codes,
+            fingerprint=fingerprint,
+            n_lists=n_lists,
+        )
+        index.save(path)
+        return index
+
+    def _fingerprints_before_write(
+        self, model: Optional[str]
+    ) -> Dict[str, EmbeddingFingerprint]:
+        """
+        Take the fingerprints of cached matrices a write may affect.
+
+        Args:
+            model: Model the write applies to (all models if None).
+
+        Returns:
+            Dict of model -> fingerprint, empty if no matrix is cached.
+        """
+        models = {key[0] for key in self._matrices if model in (None, key[0])}
+        return {name: embeddings_fingerprint(self.conn, name) for name in models}
+
+    def _patch_matrices(
+        self,
+        fingerprints: Dict[str, EmbeddingFingerprint],
+        patch: Callable[[EmbeddingMatrix], None],
+    ) -> None:
+        """
+        Apply a write to cached matrices so they stay in sync with the table.
+
+        Matrices that were already stale before the write are dropped and
+        will be reloaded on the next query. Matrices for other models are
+        unaffected, as fingerprints are kept per model.
+
+        Args:
+            fingerprints: Result of _fingerprints_before_write().
+            patch: Callable applying the change to a matrix.
+        """
+        new_fingerprints: Dict[str, EmbeddingFingerprint] = {}
+        for key, matrix in list(self._matrices.items()):
+            model = key[0]
+            if model not in fingerprints:
+                continue
+            if matrix.fingerprint != fingerprints[model]:
+                del self._matrices[key]
+                continue
+            patch(matrix)
+            if model not in new_fingerprints:
+                new_fingerprints[model] = embeddings_fingerprint(self.conn, model)
+            matrix.fingerprint = new_fingerprints[model]
+
+    def _store_embeddings(
+        self, jobs: Sequence["EmbeddingJob"], vectors: np.ndarray
+    ) -> None:
+        """
+        Store normalized embeddings in one transaction and update matrices.
+
+        Args:
+            jobs: Objects that were embedded.
+            vectors: Normalized vectors, one row per job.
+        """
+        if not jobs:
+            return
+
+        fingerprints = self._fingerprints_before_write(self.model)
+        embedding_ids = [str(uuid.uuid4()) for _ in jobs]
+        now = time.time()
+
+        with self.conn:
+            self.conn.executemany(
+                """
+                INSERT INTO embeddings (
+                    id, object_type, object_id, model, vector, vector_dim,
+                    text_snippet, text_hash, metadata, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(object_type, object_id, model) DO UPDATE SET
+                    vector = excluded.vector,
+                    vector_dim = excluded.vector_dim,
+                    text_snippet = excluded.text_snippet,
+                    text_hash = excluded.text_hash,
+                    metadata = excluded.metadata,
+                    created_at = excluded.created_at
+                """,
+                [
+                    (
+                        embedding_id,
+                        job.object_type,
+                        job.object_id,
+                        self.model,
+                        serialize_vector(vector),
+                        self.dimension,
+                        job.text,
+                        job.text_hash,
+                        json.dumps(job.metadata),
+                        now,
+                    )
+                    for embedding_id, job, vector in zip(embedding_ids, jobs, vectors)
+                ],
+            )
+
+        if fingerprints:
+
+            def patch(matrix: EmbeddingMatrix) -> None:
+                for embedding_id, job, vector in zip(embedding_ids, jobs, vectors):
+                    matrix.upsert(embedding_id, job.object_type, job.object_id, vector)
+
+            self._patch_matrices(fingerprints, patch)
+
+    def _embed_jobs(self, jobs: Sequence["EmbeddingJob"]) -> np.ndarray:
+        """
+        Embed the texts of several objects with a single provider call.
+
+        Args:
+            jobs: Objects to embed.
+
+        Returns:
+            np.ndarray: Normalized vectors, one row per job.
+        """
+        embeddings = np.asarray(self.provider.embed([job.text for job in jobs]))
+        if embeddings.ndim != 2 or embeddings.shape[0] != len(jobs):
+            raise ValueError(
+                f"Provider returned {embeddings.shape[0] if embeddings.ndim else 0} "
+                f"embeddings for {len(jobs)} texts"
+            )
+        return normalize_vectors(embeddings)
+
     def _get_tags_for_object(
         self, object_type: str, object_id: str
     ) -> List[Dict[str, str]]:
@@ -552,6 +1323,21 @@ class SearchService:
         Returns:
             List of tag dicts with 'name' key.
         """
+        return self._get_tags_for_objects(object_type, [object_id]).get(object_id, [])
+
+    def _get_tags_for_objects(
+        self, object_type: str, object_ids: Sequence[str]
+    ) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Get tags for many entities or events with a single query.
+
+        Args:
+            object_type: 'entity' or 'event'.
+            object_ids: Object UUIDs (at most REBUILD_CHUNK_SIZE).
+
+        Returns:
+            Dict mapping object ID to a list of tag dicts with 'name' key.
+        """
         if object_type == "entity":
             table = "entity_tags"
             id_col = "entity_id"
@@ -559,50 +1345,89 @@ class SearchService:
             table = "event_tags"
             id_col = "event_id"
         else:
-            return []
+            return {}
+
+        if not object_ids:
+            return {}
 
+        placeholders = ",".join("?" for _ in object_ids)
         sql = f"""
-            SELECT t.name FROM tags t
+            SELECT tt.{id_col}, t.name FROM tags t
             JOIN {table} tt ON t.id = tt.tag_id
-            WHERE tt.{id_col} = ?
+            WHERE tt.{id_col} IN ({placeholders})
         """
-        cursor = self.conn.execute(sql, (object_id,))
-        return [{"name": row[0]} for row in cursor.fetchall()]
+        tags: Dict[str, List[Dict[str, str]]] = {}
+        for object_id, name in self.conn.execute(sql, list(object_ids)):
+            tags.setdefault(object_id, []).append({"name": name})
+        return tags
 
-    def index_entity(
-        self, entity_id: str, excluded_attributes: Optional[List[str]] = None
-    ) -> None:
+    def _build_object_text(
+        self,
+        object_type: str,
+        row: sqlite3.Row,
+        tags: List[Dict[str, str]],
+        excluded_attributes: Optional[List[str]],
+    ) -> Tuple[str, Dict[str, Any]]:
         """
-        Index a single entity.
+        Build the embedding text and display metadata for a table row.
 
         Args:
-            entity_id: Entity UUID.
+            object_type: 'entity' or 'event'.
+            row: Row from the entities or events table.
+            tags: Tag dicts for the object.
             excluded_attributes: Optional list of attribute keys to exclude.
 
-        Raises:
-            ValueError: If entity not found.
+        Returns:
+            Tuple of (text, metadata).
         """
-        # Fetch entity
-        cursor = self.conn.execute("SELECT * FROM entities WHERE id = ?", (entity_id,))
-        row = cursor.fetchone()
-        if not row:
-            raise ValueError(f"Entity {entity_id} not found")
+        data = dict(row)
+        if data.get("attributes"):
+            data["attributes"] = json.loads(data["attributes"])
+
+        if object_type == "entity":
+            from src.core.entities import Entity
+
+            entity = Entity.from_dict(data)
+            text = build_text_for_entity(entity, tags, excluded_attributes)
+            return text, {"name": entity.name, "type": entity.type}
+
+        from src.core.events import Event
 
-        # Convert row to dict
-        entity_data = dict(row)
-        if entity_data.get("attributes"):
-            entity_data["attributes"] = json.loads(entity_data["attributes"])
+        event = Event.from_dict(data)
+        text = build_text_for_event(event, tags, excluded_attributes)
+        return text, {"name": event.name, "type": event.type}
+
+    def _index_object(
+        self,
+        object_type: str,
+        object_id: str,
+        excluded_attributes: Optional[List[str]] = None,
+    ) -> Optional[str]:
+        """
+        Index a single entity or event unless its text is unchanged.
 
-        # Create minimal entity object
-        from src.core.entities import Entity
+        Args:
+            object_type: 'entity' or 'event'.
+            object_id: Object UUID.
+            excluded_attributes: Optional list of attribute keys to exclude.
 
-        entity = Entity.from_dict(entity_data)
+        Returns:
+            The object name if it was embedded, None if skipped.
 
-        # Get tags
-        tags = self._get_tags_for_object("entity", entity_id)
+        Raises:
+            ValueError: If the object is not found.
+        """
+        table = "entities" if object_type == "entity" else "events"
+        row = self.conn.execute(
+            f"SELECT * FROM {table} WHERE id = ?", (object_id,)
+        ).fetchone()
+        if not row:
+            raise ValueError(f"{object_type.capitalize()} {object_id} not found")
 
-        # Build text
-        text = build_text_for_entity(entity, tags, excluded_attributes)
+        tags = self._get_tags_for_object(object_type, object_id)
+        text, metadata = self._build_object_text(
+            object_type, row, tags, excluded_attributes
+        )
         text_hash_val = text_sha256(text)
 
         # Check if already indexed with same text
@@ -611,52 +1436,36 @@ class SearchService:
             SELECT text_hash FROM embeddings
             WHERE object_type = ? AND object_id = ? AND model = ?
             """,
-            ("entity", entity_id, self.model),
+            (object_type, object_id, self.model),
         ).fetchone()
 
         if existing and existing[0] == text_hash_val:
-            logger.debug(f"Entity {entity_id} already indexed with same text, skipping")
-            return
+            logger.debug(
+                f"{object_type.capitalize()} {object_id} already indexed "
+                "with same text, skipping"
+            )
+            return None
 
-        # Generate embedding
-        embedding = self.provider.embed([text])[0]
-        normalized = normalize_vector(embedding)
-        serialized = serialize_vector(normalized)
+        job = EmbeddingJob(object_type, object_id, text, text_hash_val, metadata)
+        self._store_embeddings([job], self._embed_jobs([job]))
+        return metadata["name"]
 
-        # Upsert into database
-        embedding_id = str(uuid.uuid4())
-        metadata = {"name": entity.name, "type": entity.type}
+    def index_entity(
+        self, entity_id: str, excluded_attributes: Optional[List[str]] = None
+    ) -> None:
+        """
+        Index a single entity.
 
-        self.conn.execute(
-            """
-            INSERT INTO embeddings (
-                id, object_type, object_id, model, vector, vector_dim,
-                text_snippet, text_hash, metadata, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(object_type, object_id, model) DO UPDATE SET
-                vector = excluded.vector,
-                vector_dim = excluded.vector_dim,
-                text_snippet = excluded.text_snippet,
-                text_hash = excluded.text_hash,
-                metadata = excluded.metadata,
-                created_at = excluded.created_at
-            """,
-            (
-                embedding_id,
-                "entity",
-                entity_id,
-                self.model,
-                serialized,
-                self.dimension,
-                text,
-                text_hash_val,
-                json.dumps(metadata),
-                time.time(),
-            ),
-        )
-        self.conn.commit()
+        Args:
+            entity_id: Entity UUID.
+            excluded_attributes: Optional list of attribute keys to exclude.
 
-        logger.info(f"Indexed entity {entity_id} ({entity.name})")
+        Raises:
+            ValueError: If entity not found.
+        """
+        name = self._index_object("entity", entity_id, excluded_attributes)
+        if name is not None:
+            logger.info(f"Indexed entity {entity_id} ({name})")
 
     def index_event(
         self, event_id: str, excluded_attributes: Optional[List[str]] = None
@@ -671,127 +1480,225 @@ class SearchService:
         Raises:
             ValueError: If event not found.
         """
-        # Fetch event
-        cursor = self.conn.execute("SELECT * FROM events WHERE id = ?", (event_id,))
-        row = cursor.fetchone()
-        if not row:
-            raise ValueError(f"Event {event_id} not found")
+        name = self._index_object("event", event_id, excluded_attributes)
+        if name is not None:
+            logger.info(f"Indexed event {event_id} ({name})")
 
-        # Convert row to dict
-        event_data = dict(row)
-        if event_data.get("attributes"):
-            event_data["attributes"] = json.loads(event_data["attributes"])
+    def _iter_object_rows(self, object_type: str) -> Iterator[List[sqlite3.Row]]:
+        """
+        Stream entity or event rows in chunks ordered by ID.
 
-        # Create minimal event object
-        from src.core.events import Event
+        Uses keyset pagination so no cursor stays open while batches are
+        written back to the embeddings table.
 
-        event = Event.from_dict(event_data)
+        Args:
+            object_type: 'entity' or 'event'.
 
-        # Get tags
-        tags = self._get_tags_for_object("event", event_id)
+        Yields:
+            Lists of at most REBUILD_CHUNK_SIZE rows.
+        """
+        table = "entities" if object_type == "entity" else "events"
+        last_id = ""
+        while True:
+            rows = self.conn.execute(
+                f"SELECT * FROM {table} WHERE id > ? ORDER BY id LIMIT ?",
+                (last_id, REBUILD_CHUNK_SIZE),
+            ).fetchall()
+            if not rows:
+                return
+            yield rows
+            last_id = rows[-1]["id"]
+
+    def _write_batch(
+        self,
+        jobs: List["EmbeddingJob"],
+        future: "Future[np.ndarray]",
+        stats: "RebuildStats",
+    ) -> None:
+        """
+        Wait for a batch's embeddings and store them.
 
-        # Build text
-        text = build_text_for_event(event, tags, excluded_attributes)
-        text_hash_val = text_sha256(text)
+        Always runs on the thread that owns the connection, so all writes
+        go through a single writer regardless of how many embed calls are
+        in flight.
 
-        # Check if already indexed with same text
-        existing = self.conn.execute(
-            """
-            SELECT text_hash FROM embeddings
-            WHERE object_type = ? AND object_id = ? AND model = ?
-            """,
-            ("event", event_id, self.model),
-        ).fetchone()
-
-        if existing and existing[0] == text_hash_val:
-            logger.debug(f"Event {event_id} already indexed with same text, skipping")
+        Args:
+            jobs: Objects that were submitted for embedding.
+            future: Future resolving to the normalized vectors.
+            stats: Rebuild statistics to update.
+        """
+        try:
+            self._store_embeddings(jobs, future.result())
+        except Exception as e:
+            logger.error(f"Failed to index batch of {len(jobs)} objects: {e}")
+            stats.failed += len(jobs)
             return
-
-        # Generate embedding
-        embedding = self.provider.embed([text])[0]
-        normalized = normalize_vector(embedding)
-        serialized = serialize_vector(normalized)
-
-        # Upsert into database
-        embedding_id = str(uuid.uuid4())
-        metadata = {"name": event.name, "type": event.type}
-
-        self.conn.execute(
-            """
-            INSERT INTO embeddings (
-                id, object_type, object_id, model, vector, vector_dim,
-                text_snippet, text_hash, metadata, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(object_type, object_id, model) DO UPDATE SET
-                vector = excluded.vector,
-                vector_dim = excluded.vector_dim,
-                text_snippet = excluded.text_snippet,
-                text_hash = excluded.text_hash,
-                metadata = excluded.metadata,
-                created_at = excluded.created_at
-            """,
-            (
-                embedding_id,
-                "event",
-                event_id,
-                self.model,
-                serialized,
-                self.dimension,
-                text,
-                text_hash_val,
-                json.dumps(metadata),
-                time.time(),
-            ),
-        )
-        self.conn.commit()
-
-        logger.info(f"Indexed event {event_id} ({event.name})")
+        stats.embedded += len(jobs)
 
     def rebuild_index(
         self,
         object_types: Optional[List[str]] = None,
         model: Optional[str] = None,
         excluded_attributes: Optional[List[str]] = None,
+        batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        max_workers: int = DEFAULT_EMBED_WORKERS,
+        cancel_event: Optional[threading.Event] = None,
     ) -> Dict[str, int]:
         """
         Rebuild embeddings index for specified object types.
 
+        Rows are streamed in chunks with their tags joined in bulk. Objects
+        whose text hash is unchanged are skipped; the rest are embedded
+        batch_size texts per provider call and written one transaction per
+        batch. Up to max_workers embed calls run concurrently on a thread
+        pool while this thread keeps reading rows and writing finished
+        batches in submission order. Statistics are kept in
+        last_rebuild_stats.
+
+        Setting cancel_event stops the rebuild at the next object. Batches
+        whose embed call already started are still written (each batch is
+        its own transaction), queued ones are dropped, and the ANN index is
+        not rebuilt; a later rebuild skips the objects that were stored.
+
         Args:
             object_types: List of object types to index ('entity', 'event').
                          If None, indexes all types.
             model: Optional model filter (not currently used, for future compatibility).
             excluded_attributes: Optional list of attribute keys to exclude.
+            batch_size: Number of texts sent per embed call.
+            progress_callback: Optional callable receiving (done, total).
+            max_workers: Maximum number of embed batches in flight.
+            cancel_event: Optional event that cancels the rebuild when set.
 
         Returns:
-            Dict with counts of indexed objects per type.
+            Dict with counts of indexed objects per type (objects visited
+            before a cancellation).
         """
         if object_types is None:
             object_types = ["entity", "event"]
+        object_types = [t for t in object_types if t in ("entity", "event")]
+        batch_size = max(1, batch_size)
+        max_workers = max(1, max_workers)
+
+        stats = RebuildStats()
+        start = time.perf_counter()
+
+        # Existing hashes for this model, for set-based skip-on-unchanged
+        existing = {
+            (row[0], row[1], row[2])
+            for row in self.conn.execute(
+                "SELECT object_type, object_id, text_hash FROM embeddings "
+                "WHERE model = ?",
+                (self.model,),
+            )
+        }
+
+        total = 0
+        for obj_type in object_types:
+            table = "entities" if obj_type == "entity" else "events"
+            total += self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
 
         counts = {}
+        pending: List[EmbeddingJob] = []
+        in_flight: Deque[Tuple[List[EmbeddingJob], "Future[np.ndarray]"]] = deque()
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="embed"
+        )
+
+        def cancelled() -> bool:
+            return cancel_event is not None and cancel_event.is_set()
+
+        def submit(jobs: List[EmbeddingJob]) -> None:
+            if not jobs:
+                return
+            # Bound the number of batches in flight; the oldest one is
+            # written before another embed call is queued.
+            while len(in_flight) >= max_workers and not cancelled():
+                self._write_batch(*in_flight.popleft(), stats)
+            if cancelled():
+                return
+            in_flight.append((jobs, executor.submit(self._embed_jobs, jobs)))
+
+        try:
+            for obj_type in object_types:
+                if cancelled():
+                    break
+                counts[obj_type] = 0
+                for rows in self._iter_object_rows(obj_type):
+                    if cancelled():
+                        break
+                    tags = self._get_tags_for_objects(
+                        obj_type, [row["id"] for row in rows]
+                    )
+
+                    for row in rows:
+                        if cancelled():
+                            break
+                        object_id = row["id"]
+                        counts[obj_type] += 1
+                        stats.processed += 1
+                        try:
+                            text, metadata = self._build_object_text(
+                                obj_type,
+                                row,
+                                tags.get(object_id, []),
+                                excluded_attributes,
+                            )
+                        except Exception as e:
+                            logger.error(f"Failed to index {obj_type} {object_id}: {e}")
+                            stats.failed += 1
+                            continue
+
+                        text_hash_val = text_sha256(text)
+                        if (obj_type, object_id, text_hash_val) in existing:
+                            stats.skipped += 1
+                            continue
+
+                        pending.append(
+                            EmbeddingJob(
+                                obj_type, object_id, text, text_hash_val, metadata
+                            )
+                        )
+                        if len(pending) >= batch_size:
+                            submit(pending)
+                            pending = []
+
+                    if progress_callback is not None:
+                        progress_callback(stats.processed, total)
+
+            if cancelled():
+                # Embed calls already running finish anyway; keep their vectors
+                stats.cancelled = True
+                for jobs, future in in_flight:
+                    if not future.cancel():
+                        self._write_batch(jobs, future, stats)
+                in_flight.clear()
+            else:
+                submit(pending)
+                while in_flight:
+                    self._write_batch(*in_flight.popleft(), stats)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        stats.elapsed = time.perf_counter() - start
+        self.last_rebuild_stats = stats
+        logger.info(
+            f"Rebuild {'cancelled' if stats.cancelled else 'complete'}. "
+            f"Indexed: {counts} "
+            f"(embedded {stats.embedded}, skipped {stats.skipped}, "
+            f"failed {stats.failed}, {stats.objects_per_second:.1f} objects/sec)"
+        )
+
+        if self.index_dir is not None and not stats.cancelled:
+            fingerprint = embeddings_fingerprint(self.conn, self.model)
+            if len(self._get_matrix(self.model, fingerprint)) >= ANN_MIN_VECTORS:
+                try:
+                    self.build_ann_index()
+                except Exception as e:
+                    # Queries fall back to exact search without an index
+                    logger.error(f"Failed to rebuild ANN index: {e}")
 
-        for obj_type in object_types:
-            if obj_type == "entity":
-                cursor = self.conn.execute("SELECT id FROM entities")
-                ids = [row[0] for row in cursor.fetchall()]
-                for entity_id in ids:
-                    try:
-                        self.index_entity(entity_id, excluded_attributes)
-                    except Exception as e:
-                        logger.error(f"Failed to index entity {entity_id}: {e}")
-                counts["entity"] = len(ids)
-
-            elif obj_type == "event":
-                cursor = self.conn.execute("SELECT id FROM events")
-                ids = [row[0] for row in cursor.fetchall()]
-                for event_id in ids:
-                    try:
-                        self.index_event(event_id, excluded_attributes)
-                    except Exception as e:
-                        logger.error(f"Failed to index event {event_id}: {e}")
-                counts["event"] = len(ids)
-
-        logger.info(f"Rebuild complete. Indexed: {counts}")
         return counts
 
     def query(
@@ -800,91 +1707,205 @@ class SearchService:
         object_type: Optional[str] = None,
         top_k: int = 10,
         model: Optional[str] = None,
+        hybrid: bool = False,
     ) -> List[Dict[str, Any]]:
         """
         Query the index using semantic search.
 
+        With hybrid=True, BM25 keyword matches from the full-text index and
+        embedding matches are merged with reciprocal rank fusion, so objects
+        whose name or text literally contains the query terms are found even
+        when their embeddings rank low. If embedding the query fails, the
+        keyword ranking is used alone.
+
         Args:
             text: Query text.
             object_type: Optional filter for 'entity' or 'event'.
             top_k: Number of results to return.
             model: Optional model filter (defaults to current provider's model).
+            hybrid: Fuse keyword (BM25) and embedding rankings.
 
         Returns:
             List of result dicts with keys: id, object_type, object_id, score,
-            name, type, metadata.
+            name, type, metadata, text_content. In hybrid mode the score is
+            the fused RRF score, and id is None for keyword matches that
+            have no embedding.
         """
         # Use current model if not specified
         query_model = model or self.model
 
+        if not hybrid:
+            hits = self._semantic_hits(text, query_model, top_k, object_type)
+            if not hits:
+                logger.info("No embeddings found matching query criteria")
+                return []
+            rows_by_id = self._fetch_embedding_rows(
+                [embedding_id for _, embedding_id in hits]
+            )
+            results = [
+                _format_result(rows_by_id[embedding_id], score)
+                for score, embedding_id in hits
+                if embedding_id in rows_by_id
+            ]
+            logger.info(
+                f"Query returned {len(results)} results (requested top {top_k})"
+            )
+            return results
+
+        return self._hybrid_query(text, query_model, top_k, object_type)
+
+    def _semantic_hits(
+        self, text: str, model: str, top_k: int, object_type: Optional[str]
+    ) -> List[Tuple[float, str]]:
+        """
+        Embed the query and find the closest embeddings.
+
+        Args:
+            text: Query text.
+            model: Embedding model to search.
+            top_k: Number of hits.
+            object_type: Optional filter for 'entity' or 'event'.
+
+        Returns:
+            List of (score, embedding ID), best first.
+        """
         # Generate query embedding
         query_embedding = self.provider.embed([text])[0]
         query_normalized = normalize_vector(query_embedding)
 
-        # Build SQL filter
-        sql = """
-            SELECT id, object_type, object_id, vector, vector_dim, metadata,
-                   text_snippet
+        # Prefer a fresh on-disk ANN index, otherwise score the cached matrix
+        # exactly (object type filter uses row masks in both cases)
+        fingerprint = embeddings_fingerprint(self.conn, model)
+        ann_index = self._get_ann_index(model, fingerprint, object_type)
+        if ann_index is not None:
+            return ann_index.search(query_normalized, top_k, object_type)
+        matrix = self._get_matrix(model, fingerprint)
+        return matrix.search(query_normalized, top_k, object_type)
+
+    def _fetch_embedding_rows(
+        self, embedding_ids: Sequence[str]
+    ) -> Dict[str, Tuple[Any, ...]]:
+        """Fetch display data of embeddings (top-k rows only) by ID."""
+        if not embedding_ids:
+            return {}
+        placeholders = ",".join("?" for _ in embedding_ids)
+        cursor = self.conn.execute(
+            f"""
+            SELECT id, object_type, object_id, metadata, text_snippet
             FROM embeddings
-            WHERE model = ? AND vector_dim = ?
-        """
-        params = [query_model, self.dimension]
+            WHERE id IN ({placeholders})
+            """,
+            list(embedding_ids),
+        )
+        return {row[0]: tuple(row) for row in cursor.fetchall()}
 
-        if object_type:
-            sql += " AND object_type = ?"
-            params.append(object_type)
+    def _hybrid_query(
+        self, text: str, model: str, top_k: int, object_type: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """Fuse full-text and embedding rankings (see query())."""
+        from src.services.fulltext_index import search_fulltext
 
-        # Fetch all matching embeddings
-        cursor = self.conn.execute(sql, params)
-        rows = cursor.fetchall()
+        candidates = max(top_k * HYBRID_CANDIDATE_FACTOR, HYBRID_MIN_CANDIDATES)
 
-        if not rows:
-            logger.info("No embeddings found matching query criteria")
+        try:
+            semantic_hits = self._semantic_hits(text, model, candidates, object_type)
+        except Exception as e:
+            logger.warning(f"Semantic ranking failed, using keywords only: {e}")
+            semantic_hits = []
+        rows_by_id = self._fetch_embedding_rows(
+            [embedding_id for _, embedding_id in semantic_hits]
+        )
+        semantic_keys = [
+            (rows_by_id[embedding_id][1], rows_by_id[embedding_id][2])
+            for _, embedding_id in semantic_hits
+            if embedding_id in rows_by_id
+        ]
+
+        # Exact terms, any of them: prompts are long and word prefixes of
+        # common words would match nearly everything
+        try:
+            lexical_hits = search_fulltext(
+                self.conn,
+                text,
+                object_type=object_type,
+                limit=candidates,
+                prefix=False,
+                match_all=False,
+            )
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Keyword ranking failed, using embeddings only: {e}")
+            lexical_hits = []
+        lexical_keys = [(hit["object_type"], hit["object_id"]) for hit in lexical_hits]
+
+        fused = reciprocal_rank_fusion([semantic_keys, lexical_keys])[:top_k]
+        if not fused:
+            logger.info("Hybrid query found no matches")
             return []
 
-        # Compute similarities and collect results
-        def score_generator() -> Iterator[Tuple[float, Dict[str, Any]]]:
-            """
-            Generator function to compute similarity scores for query results.
-
-            Yields similarity scores for each embedding vector in the result set.
-            """
-            for row in rows:
-                row_dict = dict(row)
-                vector_blob = row_dict["vector"]
-                vector_dim = row_dict["vector_dim"]
-
-                # Deserialize vector
-                vec = deserialize_vector(vector_blob, vector_dim)
-
-                # Compute dot product (vectors are normalized)
-                score = float(np.dot(query_normalized, vec))
-
-                yield score, row_dict
-
-        # Get top-k using streaming heap
-        top_results = top_k_streaming(score_generator(), top_k)
+        rows_by_key = {(row[1], row[2]): row for row in rows_by_id.values()}
+        missing = [key for key, _ in fused if key not in rows_by_key]
+        rows_by_key.update(self._fetch_embedding_rows_by_object(missing, model))
 
-        # Format results
         results = []
-        for score, row_dict in top_results:
-            metadata = json.loads(row_dict.get("metadata", "{}"))
-            results.append(
-                {
-                    "id": row_dict["id"],
-                    "object_type": row_dict["object_type"],
-                    "object_id": row_dict["object_id"],
-                    "score": score,
-                    "name": metadata.get("name", ""),
-                    "type": metadata.get("type", ""),
-                    "metadata": metadata,
-                    "text_content": row_dict.get("text_snippet", ""),
-                }
-            )
+        for key, score in fused:
+            row = rows_by_key.get(key)
+            if row is None:
+                result = self._build_unindexed_result(*key)
+                if result is None:
+                    continue
+                result["score"] = score
+            else:
+                result = _format_result(row, score)
+            results.append(result)
 
-        logger.info(f"Query returned {len(results)} results (requested top {top_k})")
+        logger.info(
+            f"Hybrid query returned {len(results)} results (requested top {top_k})"
+        )
         return results
 
+    def _fetch_embedding_rows_by_object(
+        self, keys: Sequence[Tuple[str, str]], model: str
+    ) -> Dict[Tuple[str, str], Tuple[Any, ...]]:
+        """Fetch display data of the embeddings of (object type, ID) pairs."""
+        rows: Dict[Tuple[str, str], Tuple[Any, ...]] = {}
+        for object_type, object_id in keys:
+            row = self.conn.execute(
+                """
+                SELECT id, object_type, object_id, metadata, text_snippet
+                FROM embeddings
+                WHERE object_type = ? AND object_id = ? AND model = ?
+                """,
+                (object_type, object_id, model),
+            ).fetchone()
+            if row is not None:
+                rows[(object_type, object_id)] = tuple(row)
+        return rows
+
+    def _build_unindexed_result(
+        self, object_type: str, object_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """Build a result for a keyword match that has no embedding yet."""
+        table = "entities" if object_type == "entity" else "events"
+        cursor = self.conn.cursor()
+        cursor.row_factory = sqlite3.Row
+        row = cursor.execute(
+            f"SELECT * FROM {table} WHERE id = ?", (object_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        tags = self._get_tags_for_object(object_type, object_id)
+        text, metadata = self._build_object_text(object_type, row, tags, None)
+        return {
+            "id": None,
+            "object_type": object_type,
+            "object_id": object_id,
+            "score": 0.0,
+            "name": metadata.get("name", ""),
+            "type": metadata.get("type", ""),
+            "metadata": metadata,
+            "text_content": text,
+        }
+
     def delete_index_for_object(
         self, object_type: str, object_id: str, model: Optional[str] = None
     ) -> None:
@@ -896,6 +1917,8 @@ class SearchService:
             object_id: Object UUID.
             model: Optional model filter (deletes for all models if None).
         """
+        fingerprints = self._fingerprints_before_write(model)
+
         if model:
             self.conn.execute(
                 """
@@ -913,6 +1936,11 @@ class SearchService:
                 (object_type, object_id),
             )
         self.conn.commit()
+
+        if fingerprints:
+            self._patch_matrices(
+                fingerprints, lambda m: m.remove(object_type, object_id)
+            )
         logger.info(f"Deleted embeddings for {object_type} {object_id}")
 
 
@@ -1020,17 +2048,27 @@ def create_search_service(
     db_connection: sqlite3.Connection,
     provider_name: Optional[str] = None,
     model: Optional[str] = None,
+    index_dir: Optional[str] = None,
 ) -> SearchService:
     """
     Create a SearchService with the specified provider.
 
+    Queries use the world's ANN index when it is fresh, and full rebuilds
+    refresh it.
+
     Args:
         db_connection: SQLite database connection.
         provider_name: 'lmstudio' or 'sentence-transformers'.
         model: Model name override.
+        index_dir: ANN index directory (defaults to the world's 'indexes/'
+            directory; none for in-memory databases).
 
     Returns:
         SearchService: Configured service instance.
     """
     provider = create_provider(provider_name, model)
-    return SearchService(db_connection, provider)
+    if index_dir is None:
+        db_path = get_database_path(db_connection)
+        if db_path:
+            index_dir = str(default_index_dir(db_path))
+    return SearchService(db_connection, provider, index_dir=index_dir)
@@ -0,0 +1,212 @@
+"""
+Search Worker Module.
+
+Runs semantic search queries and index rebuilds off the UI thread. The
+worker owns its own database connection and SearchService, so the embedding
+provider and the in-memory vector matrices stay warm between queries.
+"""
+
+import logging
+import threading
+import time
+import traceback
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+from src.services.db_service import DatabaseService
+
+if TYPE_CHECKING:
+    from src.services.search_service import SearchService
+
+logger = logging.getLogger(__name__)
+
+# Pending query: request ID, text, object type filter, top_k
+SearchRequest = Tuple[int, str, Optional[str], int]
+
+
+class SearchWorker(QObject):
+    """
+    Worker object that executes semantic search operations in a separate thread.
+
+    Queries are coalesced: submit_search() only keeps the latest request, so
+    a burst of queries typed while one is running results in a single
+    further query. Results carry the ID returned by submit_search() so
+    callers can ignore results of superseded requests.
+    """
+
+    # Signals
+    initialized = Signal(bool)  # Success/Fail
+    results_ready = Signal(int, list)  # request ID, List[dict]
+    search_failed = Signal(int, str)  # request ID, error message
+    rebuild_progress = Signal(int, int, float, float)  # done, total, objects/sec, ETA
+    rebuild_finished = Signal(dict, bool)  # counts per type, cancelled
+    rebuild_failed = Signal(str)
+
+    # Internal: hands queued work to the worker thread
+    _search_queued = Signal()
+    _rebuild_queued = Signal(list, list)  # object types, excluded attributes
+
+    def __init__(self, db_path: str) -> None:
+        """
+        Initializes the worker.
+
+        Args:
+            db_path: Path to the database file.
+        """
+        super().__init__()
+        self.db_path = db_path
+        self.db_service: Optional[DatabaseService] = None
+        self.search_service: Optional["SearchService"] = None
+
+        self._lock = threading.Lock()
+        self._pending: Optional[SearchRequest] = None
+        self._last_request_id = 0
+        self._cancel_event = threading.Event()
+
+        self._search_queued.connect(self._run_pending_search)
+        self._rebuild_queued.connect(self._run_rebuild)
+
+    # ------------------------------------------------------------------
+    # Called from the UI thread
+    # ------------------------------------------------------------------
+
+    def submit_search(self, query: str, object_type: Optional[str], top_k: int) -> int:
+        """
+        Queues a query, replacing any query that has not started yet.
+
+        Args:
+            query: Search query text.
+            object_type: 'entity' or 'event', or None for all.
+            top_k: Number of results to return.
+
+        Returns:
+            int: ID of the request, echoed by results_ready/search_failed.
+        """
+        with self._lock:
+            self._last_request_id += 1
+            already_queued = self._pending is not None
+            self._pending = (self._last_request_id, query, object_type, top_k)
+            request_id = self._last_request_id
+        if not already_queued:
+            self._search_queued.emit()
+        return request_id
+
+    def start_rebuild(
+        self, object_types: List[str], excluded_attributes: List[str]
+    ) -> None:
+        """
+        Queues an index rebuild.
+
+        Args:
+            object_types: Types to rebuild ('entity', 'event').
+            excluded_attributes: Attribute keys left out of indexed text.
+        """
+        self._cancel_event.clear()
+        self._rebuild_queued.emit(list(object_types), list(excluded_attributes))
+
+    def cancel_rebuild(self) -> None:
+        """Cancels the running or queued rebuild at the next object."""
+        self._cancel_event.set()
+
+    # ------------------------------------------------------------------
+    # Worker thread slots
+    # ------------------------------------------------------------------
+
+    @Slot()
+    def initialize_db(self) -> None:
+        """Opens the worker's own database connection."""
+        try:
+            self.db_service = DatabaseService(self.db_path)
+            self.db_service.connect()
+            self.initialized.emit(True)
+        except Exception:
+            logger.critical(f"SearchWorker init failed: {traceback.format_exc()}")
+            self.initialized.emit(False)
+
+    @Slot()
+    def reset_service(self) -> None:
+        """Drops the SearchService so the next use picks up new AI settings."""
+        self.search_service = None
+
+    @Slot()
+    def cleanup(self) -> None:
+        """
+        Closes the database connection.
+        Should be called before the thread is terminated.
+        """
+        self.search_service = None
+        try:
+            if self.db_service:
+                self.db_service.close()
+                self.db_service = None
+        except Exception:
+            logger.error(
+                f"Error during search worker cleanup: {traceback.format_exc()}"
+            )
+
+    def _get_search_service(self) -> "SearchService":
+        """Returns the worker's SearchService, creating it on first use."""
+        if self.search_service is None:
+            from src.services.search_service import create_search_service
+
+            if self.db_service is None:
+                self.initialize_db()
+            assert self.db_service is not None
+            assert self.db_service._connection is not None
+            self.search_service = create_search_service(self.db_service._connection)
+        return self.search_service
+
+    @Slot()
+    def _run_pending_search(self) -> None:
+        """Runs the latest queued query."""
+        with self._lock:
+            request, self._pending = self._pending, None
+        if request is None:
+            return
+
+        request_id, query, object_type, top_k = request
+        try:
+            results = self._get_search_service().query(
+                text=query, object_type=object_type, top_k=top_k
+            )
+        except Exception as e:
+            logger.error(f"Semantic search failed: {e}")
+            self.search_failed.emit(request_id, str(e))
+            return
+        self.results_ready.emit(request_id, results)
+
+    @Slot(list, list)
+    def _run_rebuild(
+        self, object_types: List[str], excluded_attributes: List[str]
+    ) -> None:
+        """Rebuilds the index, streaming progress."""
+        if self._cancel_event.is_set():
+            self.rebuild_finished.emit({}, True)
+            return
+
+        # Rebuilds pick up changed AI settings
+        self.search_service = None
+        start = time.perf_counter()
+
+        def on_progress(done: int, total: int) -> None:
+            elapsed = time.perf_counter() - start
+            rate = done / elapsed if elapsed > 0 else 0.0
+            eta = (total - done) / rate if rate > 0 else 0.0
+            self.rebuild_progress.emit(done, total, rate, eta)
+
+        try:
+            service = self._get_search_service()
+            counts = service.rebuild_index(
+                object_types=object_types,
+                excluded_attributes=excluded_attributes,
+                progress_callback=on_progress,
+                cancel_event=self._cancel_event,
+            )
+        except Exception as e:
+            logger.error(f"Index rebuild failed: {e}")
+            self.rebuild_failed.emit(str(e))
+            return
+
+        stats = service.last_rebuild_stats
+        self.rebuild_finished.emit(counts, bool(stats and stats.cancelled))
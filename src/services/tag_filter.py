@@ -7,6 +7,10 @@ supporting case-sensitive and case-insensitive matching.
 
 This module works with the normalized tag tables (tags, event_tags, entity_tags)
 and returns lightweight (object_type, object_id) tuples for efficiency.
+
+When given a DatabaseService, filter_object_ids evaluates the filter against
+the service's in-memory TagIndex instead of querying SQL; TagClause remains
+the SQL implementation used for bare connections.
 """
 
 import logging
@@ -15,6 +19,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, List, Optional, Set, Tuple, Union
 
+from src.services.tag_index import TagIndex
+
 if TYPE_CHECKING:
     from src.services.db_service import DatabaseService
 
@@ -465,6 +471,19 @@ def filter_object_ids(
     # Get connection
     conn = _get_connection(conn_or_db_service)
 
+    # Prefer the service's in-memory tag index when available
+    tag_index = getattr(conn_or_db_service, "tag_index", None)
+    if isinstance(tag_index, TagIndex):
+        return tag_index.filter_ids(
+            conn,
+            object_type=object_type,
+            include=include,
+            include_mode=include_mode,
+            exclude=exclude,
+            exclude_mode=exclude_mode,
+            case_sensitive=case_sensitive,
+        )
+
     # Create TagClause and execute
     clause = TagClause(
         include=include,
@@ -0,0 +1,306 @@
+"""
+Tag Index Module.
+
+Provides an in-memory index from tag names to bitmaps of the entities and
+events carrying them, so tag filters are evaluated as set algebra instead of
+one SQL query per include/exclude list and object type.
+
+Each object is given a compact integer slot per object type; a tag's members
+are stored as a Python int used as a bitmap over those slots. 'any' and 'all'
+become OR and AND over the bitmaps and exclusion becomes AND NOT, all of
+which run in C over machine words.
+
+The index belongs to one DatabaseService connection. It is built lazily on
+first use, updated incrementally by the DatabaseService tag and CRUD paths,
+and rebuilt when PRAGMA data_version shows another connection committed.
+"""
+
+import logging
+import sqlite3
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+OBJECT_TYPES = ("entity", "event")
+
+# (object table, join table, join column) per object type
+_TABLES = {
+    "entity": ("entities", "entity_tags", "entity_id"),
+    "event": ("events", "event_tags", "event_id"),
+}
+
+
+def bit_positions(bits: int) -> np.ndarray:
+    """
+    Get the positions of the set bits of a bitmap.
+
+    Args:
+        bits: Non-negative int used as a bitmap.
+
+    Returns:
+        np.ndarray: Ascending positions of the set bits.
+    """
+    if bits <= 0:
+        return np.empty(0, dtype=np.int64)
+    raw = np.frombuffer(bits.to_bytes((bits.bit_length() + 7) // 8, "little"), np.uint8)
+    return np.flatnonzero(np.unpackbits(raw, bitorder="little"))
+
+
+class _ObjectBitmaps:
+    """Slot assignment and per-tag bitmaps for one object type."""
+
+    def __init__(self) -> None:
+        self.ids: List[Optional[str]] = []
+        self.slots: Dict[str, int] = {}
+        self.universe = 0
+        self.tags: Dict[str, int] = {}
+
+    def add_object(self, object_id: str) -> int:
+        """Returns the slot of an object, assigning a new one if needed."""
+        slot = self.slots.get(object_id)
+        if slot is None:
+            slot = len(self.ids)
+            self.ids.append(object_id)
+            self.slots[object_id] = slot
+            self.universe |= 1 << slot
+        return slot
+
+    def remove_object(self, object_id: str) -> None:
+        """Retires an object's slot; stale tag bits are masked by universe."""
+        slot = self.slots.pop(object_id, None)
+        if slot is not None:
+            self.ids[slot] = None
+            self.universe &= ~(1 << slot)
+
+    def decode(self, bits: int) -> List[str]:
+        """Returns the sorted object IDs of a bitmap."""
+        ids = self.ids
+        return sorted(ids[slot] for slot in bit_positions(bits & self.universe))
+
+
+class TagIndex:
+    """
+    In-memory tag -> object bitmap index for a single connection.
+
+    Tag names are stored exactly as in the tags table; case-insensitive
+    lookups go through a map from lower-cased name to its stored variants.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty, unbuilt index."""
+        self._objects: Dict[str, _ObjectBitmaps] = {}
+        self._folded: Dict[str, Set[str]] = {}
+        self._data_version: Optional[int] = None
+        self._built = False
+
+    @property
+    def is_built(self) -> bool:
+        """Whether the index currently mirrors the database."""
+        return self._built
+
+    def invalidate(self) -> None:
+        """Discards the index so the next query rebuilds it."""
+        self._objects = {}
+        self._folded = {}
+        self._data_version = None
+        self._built = False
+
+    def rebuild(self, conn: sqlite3.Connection) -> None:
+        """
+        Loads all objects and tag assignments from the database.
+
+        Args:
+            conn: SQLite database connection.
+        """
+        self.invalidate()
+        for object_type, (table, join_table, join_column) in _TABLES.items():
+            bitmaps = _ObjectBitmaps()
+            for row in conn.execute(f"SELECT id FROM {table}"):
+                bitmaps.add_object(row[0])
+
+            slots = bitmaps.slots
+            members: Dict[str, List[int]] = {}
+            cursor = conn.execute(
+                f"""
+                SELECT t.name, j.{join_column}
+                FROM {join_table} j
+                INNER JOIN tags t ON j.tag_id = t.id
+                """
+            )
+            for name, object_id in cursor:
+                slot = slots.get(object_id)
+                if slot is not None:
+                    members.setdefault(name, []).append(slot)
+
+            for name, tag_slots in members.items():
+                bitmaps.tags[name] = self._pack(tag_slots)
+                self._folded.setdefault(name.lower(), set()).add(name)
+            self._objects[object_type] = bitmaps
+
+        self._data_version = self._read_data_version(conn)
+        self._built = True
+        logger.debug(
+            "Built tag index: %d entities, %d events, %d tag names",
+            len(self._objects["entity"].slots),
+            len(self._objects["event"].slots),
+            len(self._folded),
+        )
+
+    def ensure_current(self, conn: sqlite3.Connection) -> None:
+        """
+        Rebuilds the index if it is unbuilt or another connection wrote.
+
+        Args:
+            conn: SQLite database connection.
+        """
+        if not self._built or self._read_data_version(conn) != self._data_version:
+            self.rebuild(conn)
+
+    @staticmethod
+    def _read_data_version(conn: sqlite3.Connection) -> int:
+        """Returns PRAGMA data_version, which changes on foreign commits."""
+        return conn.execute("PRAGMA data_version").fetchone()[0]
+
+    @staticmethod
+    def _pack(slots: List[int]) -> int:
+        """Packs slot numbers into an int bitmap."""
+        flags = np.zeros(max(slots) + 1, dtype=np.uint8)
+        flags[slots] = 1
+        packed = np.packbits(flags, bitorder="little")
+        return int.from_bytes(packed.tobytes(), "little")
+
+    # --------------------------------------------------------------------------
+    # Incremental maintenance (no-ops until the index is built)
+    # --------------------------------------------------------------------------
+
+    def add_object(self, object_type: str, object_id: str) -> None:
+        """Records a newly inserted entity or event."""
+        if self._built:
+            self._objects[object_type].add_object(object_id)
+
+    def remove_object(self, object_type: str, object_id: str) -> None:
+        """Records a deleted entity or event."""
+        if self._built:
+            self._objects[object_type].remove_object(object_id)
+
+    def add_tag(self, object_type: str, object_id: str, tag_name: str) -> None:
+        """Records a tag assignment."""
+        if not self._built:
+            return
+        bitmaps = self._objects[object_type]
+        slot = bitmaps.add_object(object_id)
+        bitmaps.tags[tag_name] = bitmaps.tags.get(tag_name, 0) | (1 << slot)
+        self._folded.setdefault(tag_name.lower(), set()).add(tag_name)
+
+    def remove_tag(self, object_type: str, object_id: str, tag_name: str) -> None:
+        """Records a tag removal."""
+        if not self._built:
+            return
+        bitmaps = self._objects[object_type]
+        slot = bitmaps.slots.get(object_id)
+        if slot is not None and tag_name in bitmaps.tags:
+            bitmaps.tags[tag_name] &= ~(1 << slot)
+
+    def drop_tag(self, tag_name: str) -> None:
+        """Records deletion of a tag and all its assignments."""
+        if not self._built:
+            return
+        for bitmaps in self._objects.values():
+            bitmaps.tags.pop(tag_name, None)
+        variants = self._folded.get(tag_name.lower())
+        if variants is not None:
+            variants.discard(tag_name)
+            if not variants:
+                del self._folded[tag_name.lower()]
+
+    # --------------------------------------------------------------------------
+    # Queries
+    # --------------------------------------------------------------------------
+
+    def _tag_bits(
+        self, bitmaps: _ObjectBitmaps, tag_name: str, case_sensitive: bool
+    ) -> int:
+        """Returns the bitmap of one requested tag name."""
+        if case_sensitive:
+            return bitmaps.tags.get(tag_name, 0)
+        bits = 0
+        for name in self._folded.get(tag_name.lower(), ()):
+            bits |= bitmaps.tags.get(name, 0)
+        return bits
+
+    def _combine(
+        self,
+        bitmaps: _ObjectBitmaps,
+        tag_names: List[str],
+        mode: str,
+        case_sensitive: bool,
+    ) -> int:
+        """Combines tag bitmaps with 'any' (OR) or 'all' (AND) semantics."""
+        if not case_sensitive:
+            tag_names = [name.lower() for name in tag_names]
+        tag_bits = [
+            self._tag_bits(bitmaps, name, case_sensitive)
+            for name in dict.fromkeys(tag_names)
+        ]
+
+        if mode == "any":
+            result = 0
+            for bits in tag_bits:
+                result |= bits
+            return result
+        elif mode == "all":
+            result = bitmaps.universe
+            for bits in tag_bits:
+                result &= bits
+            return result
+        else:
+            raise ValueError(f"Invalid mode: {mode}. Must be 'any' or 'all'.")
+
+    def filter_ids(
+        self,
+        conn: sqlite3.Connection,
+        object_type: Optional[str] = None,
+        include: Optional[List[str]] = None,
+        include_mode: str = "any",
+        exclude: Optional[List[str]] = None,
+        exclude_mode: str = "any",
+        case_sensitive: bool = False,
+    ) -> List[Tuple[str, str]]:
+        """
+        Filter objects by tags using the index.
+
+        Same semantics as tag_filter.TagClause: an empty include means all
+        objects, and exclusion is applied after inclusion.
+
+        Args:
+            conn: SQLite connection the index belongs to.
+            object_type: Optional filter for 'entity' or 'event'. If None, both.
+            include: List of tag names to include.
+            include_mode: 'any' or 'all'.
+            exclude: List of tag names to exclude.
+            exclude_mode: 'any' or 'all'.
+            case_sensitive: If True, exact case matching.
+
+        Returns:
+            List[Tuple[str, str]]: Sorted (object_type, object_id) tuples.
+        """
+        self.ensure_current(conn)
+
+        results: List[Tuple[str, str]] = []
+        for current_type in OBJECT_TYPES:
+            if object_type is not None and object_type != current_type:
+                continue
+            bitmaps = self._objects[current_type]
+
+            if include:
+                bits = self._combine(bitmaps, include, include_mode, case_sensitive)
+            else:
+                bits = bitmaps.universe
+            if exclude:
+                bits &= ~self._combine(bitmaps, exclude, exclude_mode, case_sensitive)
+
+            results.extend((current_type, oid) for oid in bitmaps.decode(bits))
+
+        return results
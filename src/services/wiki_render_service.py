@@ -0,0 +1,323 @@
+"""
+Wiki Render Service Module.
+
+Converts wiki text (Markdown with [[WikiLinks]]) to the themed HTML shown by
+WikiTextEdit, caches the results and renders long texts on a background
+thread.
+
+Renders are cached by (text hash, link target fingerprint, theme CSS hash)
+with least-recently-used eviction, so switching back to an article, or to an
+unchanged article after a theme toggle, does not run Markdown again.
+Background requests are tracked per owner (one editor widget): a newer
+request or cancel() supersedes the previous one, which is then skipped or
+not reported.
+"""
+
+import hashlib
+import logging
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from html import escape
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+
+import markdown
+from PySide6.QtCore import QObject, Signal
+
+logger = logging.getLogger(__name__)
+
+WIKILINK_PATTERN = re.compile(r"\[\[([^]|]+)(?:\|([^]]+))?\]\]")
+
+WIKI_MARKDOWN_EXTENSIONS = ["extra", "nl2br"]
+
+DEFAULT_WIKI_RENDER_CACHE_SIZE = 64
+
+# Text hash, link target fingerprint, CSS hash
+WikiRenderKey = Tuple[str, Optional[int], int]
+
+
+@dataclass(frozen=True)
+class LinkTargets:
+    """
+    Known link targets used to mark broken WikiLinks.
+
+    Attributes:
+        names_lower: Lower-case names of linkable items.
+        ids: IDs of linkable items.
+        fingerprint: Hash of both sets, used in cache keys.
+    """
+
+    names_lower: FrozenSet[str]
+    ids: FrozenSet[str] = frozenset()
+    fingerprint: int = field(init=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Computes the fingerprint once, as the sets can be large."""
+        object.__setattr__(self, "fingerprint", hash((self.names_lower, self.ids)))
+
+    @classmethod
+    def from_names(cls, names: Iterable[str], ids: Iterable[str] = ()) -> "LinkTargets":
+        """
+        Creates link targets from item names and IDs.
+
+        Args:
+            names: Item names (any case).
+            ids: Item IDs.
+
+        Returns:
+            LinkTargets: The targets.
+        """
+        return cls(frozenset(name.lower() for name in names), frozenset(ids))
+
+    def is_valid(self, target: str) -> bool:
+        """
+        Checks whether a link target exists.
+
+        Args:
+            target: Link target, a name or "id:<UUID>".
+
+        Returns:
+            bool: True if the target names or identifies a known item.
+        """
+        check_target = target[3:] if target.startswith("id:") else target
+        return check_target.lower() in self.names_lower or check_target in self.ids
+
+
+def render_wiki_html(text: str, css: str, targets: Optional[LinkTargets]) -> str:
+    """
+    Renders wiki text to a themed HTML document.
+
+    WikiLinks become Markdown links; links to unknown targets become red
+    anchors. Without targets (no completer set yet) every link is valid.
+
+    Args:
+        text: Wiki text (Markdown with [[Target|Label]] links).
+        css: Stylesheet embedded in the document head.
+        targets: Known link targets, or None.
+
+    Returns:
+        str: The HTML document.
+    """
+
+    def replace_link_md(match: re.Match) -> str:
+        """Convert WikiLink syntax to Markdown link syntax."""
+        target = match[1].strip()
+        label = match[2].strip() if match[2] else target
+
+        if targets is None or targets.is_valid(target):
+            return f"[{label}]({target})"
+        # Render as raw HTML anchor with style for red color
+        return f'<a href="{target}" style="color: red;">{label}</a>'
+
+    md_text = WIKILINK_PATTERN.sub(replace_link_md, text)
+    html_body = markdown.markdown(md_text, extensions=WIKI_MARKDOWN_EXTENSIONS)
+
+    # Embedding CSS directly in HTML ensures Qt applies it correctly
+    return f"<html><head><style>{css}</style></head><body>{html_body}</body></html>"
+
+
+def render_plain_html(text: str, css: str) -> str:
+    """
+    Renders wiki text as escaped plain text, used when Markdown fails.
+
+    Args:
+        text: Wiki text.
+        css: Theme stylesheet.
+
+    Returns:
+        str: The HTML document.
+    """
+    body = escape(text).replace("\n", "<br>")
+    return f"<html><head><style>{css}</style></head><body>{body}</body></html>"
+
+
+class WikiRenderService(QObject):
+    """
+    Cached wiki text renderer with a background rendering thread.
+
+    Results of submit() are delivered through the finished signal, which
+    is queued to the thread of connected receivers.
+    """
+
+    finished = Signal(int, str)  # request ID, HTML
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_WIKI_RENDER_CACHE_SIZE,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        """
+        Initializes the service.
+
+        Args:
+            capacity: Maximum number of cached renders.
+            parent: Optional parent object.
+        """
+        super().__init__(parent)
+        self.capacity = capacity
+        self._cache: "OrderedDict[WikiRenderKey, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._latest: Dict[int, int] = {}  # owner -> latest request ID
+        self._last_request_id = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @staticmethod
+    def cache_key(text: str, css: str, targets: Optional[LinkTargets]) -> WikiRenderKey:
+        """
+        Builds the cache key of a render.
+
+        Args:
+            text: Wiki text.
+            css: Theme stylesheet.
+            targets: Known link targets, or None.
+
+        Returns:
+            WikiRenderKey: The key.
+        """
+        text_hash = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+        return (text_hash, targets.fingerprint if targets else None, hash(css))
+
+    def get(self, key: WikiRenderKey) -> Optional[str]:
+        """
+        Returns a cached render and marks it as recently used.
+
+        Args:
+            key: Key from cache_key().
+
+        Returns:
+            Optional[str]: The HTML, or None if not cached.
+        """
+        with self._lock:
+            html = self._cache.get(key)
+            if html is not None:
+                self._cache.move_to_end(key)
+            return html
+
+    def _put(self, key: WikiRenderKey, html: str) -> None:
+        """Caches a render, evicting the least recently used ones."""
+        with self._lock:
+            self._cache[key] = html
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.capacity:
+                self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drops all cached renders."""
+        with self._lock:
+            self._cache.clear()
+
+    def render(self, text: str, css: str, targets: Optional[LinkTargets]) -> str:
+        """
+        Renders on the calling thread, using and filling the cache.
+
+        Args:
+            text: Wiki text.
+            css: Theme stylesheet.
+            targets: Known link targets, or None.
+
+        Returns:
+            str: The HTML document.
+        """
+        key = self.cache_key(text, css, targets)
+        html = self.get(key)
+        if html is None:
+            html = render_wiki_html(text, css, targets)
+            self._put(key, html)
+        return html
+
+    def submit(
+        self, owner: int, text: str, css: str, targets: Optional[LinkTargets]
+    ) -> int:
+        """
+        Queues a background render, superseding the owner's previous request.
+
+        Args:
+            owner: Identifies the requester, e.g. id() of the editor.
+            text: Wiki text.
+            css: Theme stylesheet.
+            targets: Known link targets, or None.
+
+        Returns:
+            int: ID of the request, echoed by the finished signal.
+        """
+        with self._lock:
+            self._last_request_id += 1
+            request_id = self._last_request_id
+            self._latest[owner] = request_id
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="wiki-render"
+                )
+            executor = self._executor
+        executor.submit(self._run, owner, request_id, text, css, targets)
+        return request_id
+
+    def cancel(self, owner: int) -> None:
+        """
+        Supersedes the owner's pending request, if any.
+
+        Args:
+            owner: The requester passed to submit().
+        """
+        with self._lock:
+            self._latest.pop(owner, None)
+
+    def shutdown(self) -> None:
+        """Stops the background thread, dropping queued requests."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._latest.clear()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _is_current(self, owner: int, request_id: int) -> bool:
+        """Checks that a request has not been superseded."""
+        with self._lock:
+            return self._latest.get(owner) == request_id
+
+    def _run(
+        self,
+        owner: int,
+        request_id: int,
+        text: str,
+        css: str,
+        targets: Optional[LinkTargets],
+    ) -> None:
+        """Renders a queued request on the background thread."""
+        if not self._is_current(owner, request_id):
+            return
+        try:
+            html = self.render(text, css, targets)
+        except Exception:
+            logger.exception("Wiki text rendering failed")
+            html = render_plain_html(text, css)
+
+        with self._lock:
+            if self._latest.get(owner) != request_id:
+                return
+            del self._latest[owner]
+        self.finished.emit(request_id, html)
+
+
+_service: Optional[WikiRenderService] = None
+
+
+def get_wiki_render_service() -> WikiRenderService:
+    """
+    Returns the shared render service, creating it on first use.
+
+    Returns:
+        WikiRenderService: The service.
+    """
+    global _service
+    if _service is None:
+        _service = WikiRenderService()
+    return _service
+
+
+def shutdown_wiki_render_service() -> None:
+    """Stops the shared service's background thread, if it was started."""
+    if _service is not None:
+        _service.shutdown()
@@ -11,11 +11,12 @@ from typing import List, Optional, Set
 
 from PySide6.QtCore import QObject, Signal, Slot
 
-from src.commands.base_command import BaseCommand, CommandResult
+from src.commands.base_command import BaseCommand, ChangeSet, CommandResult
 from src.services import longform_builder
 from src.services.asset_store import AssetStore
 from src.services.attachment_service import AttachmentService
 from src.services.db_service import DatabaseService
+from src.services.render_cache import render_cache
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +31,7 @@ class DatabaseWorker(QObject):
     initialized = Signal(bool)  # Success/Fail
     events_loaded = Signal(list)  # List[Event]
     entities_loaded = Signal(list)  # List[Entity]
+    changes_loaded = Signal(object)  # dict of changed rows and deleted IDs
     maps_loaded = Signal(list)  # List[Map]
     markers_loaded = Signal(str, list)  # map_id, List[Marker]
     trajectories_loaded = Signal(list)  # List[Tuple[str, str, List[Keyframe]]]
@@ -72,6 +74,7 @@ class DatabaseWorker(QObject):
         self.asset_store = None
         self.attachment_service = None
         self.temporal_manager = None
+        self.graph_service = None
 
     @Slot()
     def initialize_db(self) -> None:
@@ -157,6 +160,52 @@ class DatabaseWorker(QObject):
             logger.error(f"Failed to load entities: {traceback.format_exc()}")
             self.error_occurred.emit("Failed to load entities.")
 
+    @Slot(object)
+    def load_changes(self, changes: ChangeSet) -> None:
+        """
+        Loads only the events and entities touched by a command.
+
+        Args:
+            changes: The ChangeSet reported by the command.
+
+        Emits:
+            changes_loaded (dict): Keys "events" and "entities" hold the
+                re-fetched objects; "deleted_events" and "deleted_entities"
+                hold the IDs that no longer exist.
+        """
+        if not self.db_service:
+            return
+
+        try:
+            requested = [
+                (kind, object_id)
+                for kind in ("event", "entity")
+                for object_id in changes.upserted_ids(kind)
+            ]
+            events, entities = (
+                self.db_service.get_objects_by_ids(requested) if requested else ([], [])
+            )
+
+            # An upserted ID that is gone by now was deleted by a later command
+            found = {e.id for e in events} | {e.id for e in entities}
+            deleted = {
+                kind: changes.deleted_ids(kind)
+                | {oid for k, oid in requested if k == kind and oid not in found}
+                for kind in ("event", "entity")
+            }
+
+            self.changes_loaded.emit(
+                {
+                    "events": events,
+                    "entities": entities,
+                    "deleted_events": sorted(deleted["event"]),
+                    "deleted_entities": sorted(deleted["entity"]),
+                }
+            )
+        except Exception:
+            logger.error(f"Failed to load changes: {traceback.format_exc()}")
+            self.error_occurred.emit("Failed to load changes.")
+
     @Slot()
     def load_maps(self) -> None:
         """Loads all maps."""
@@ -418,6 +467,15 @@ class DatabaseWorker(QObject):
             logger.error(f"Failed to load calendar config: {e}")
             self.calendar_config_loaded.emit(None)
 
+    def _invalidate_renders(self, changes: ChangeSet) -> None:
+        """Drops cached section renders of the objects a command touched."""
+        render_cache.invalidate_many(
+            object_id
+            for action in (changes.created, changes.updated, changes.deleted)
+            for ids in action.values()
+            for object_id in ids
+        )
+
     @Slot(
         object, object
     )  # Command, Optional[args] - simplified mainly for command objects
@@ -474,6 +532,9 @@ class DatabaseWorker(QObject):
                     command_name=command_name,
                 )
 
+            if result_obj.success and result_obj.changes:
+                self._invalidate_renders(result_obj.changes)
+
             self.command_finished.emit(result_obj)
             self.operation_finished.emit(f"Finished {command_name}.")
 
@@ -703,7 +764,10 @@ class DatabaseWorker(QObject):
             from src.services.graph_data_service import GraphDataService
 
             self.operation_started.emit("Loading Graph Data...")
-            graph_service = GraphDataService()
+            # Reused so its snapshot cache answers filter-only changes
+            if self.graph_service is None:
+                self.graph_service = GraphDataService()
+            graph_service = self.graph_service
             nodes, edges = graph_service.get_graph_data(
                 self.db_service, tags, rel_types
             )
@@ -734,7 +798,9 @@ class DatabaseWorker(QObject):
             from src.services.graph_data_service import GraphDataService
 
             # self.operation_started.emit("Loading Completer Data...") # Quiet
-            graph_service = GraphDataService()
+            if self.graph_service is None:
+                self.graph_service = GraphDataService()
+            graph_service = self.graph_service
 
             tags = graph_service.get_all_tags(self.db_service)
             rel_types = graph_service.get_all_relation_types(self.db_service)
@@ -13,9 +13,17 @@ class ServerConfig:
         host: Host address to bind to (default: 0.0.0.0 for all interfaces).
         port: Port number to listen on (default: 8000).
         db_path: Path to the database file to serve data from.
+        persist_renders: Whether rendered section HTML is stored in the
+            database's rendered_sections table across restarts. Off by
+            default: each store is a write to the world database, which
+            invalidates the data_version-keyed caches of every reader.
+        render_workers: Size of the process pool rendering many sections at
+            once (0 uses the CPU count).
     """
 
     host: str = "0.0.0.0"
     port: int = 8000
     db_path: str = "world.kraken"
     poll_interval_ms: int = 5000
+    persist_renders: bool = False
+    render_workers: int = 0
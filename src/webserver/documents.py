@@ -0,0 +1,434 @@
+"""
+Longform Document Snapshots for the Web Server.
+
+A LongformDocument is the ordered list of a document's sections (title,
+heading level, raw markdown content) together with content revisions: each
+section's revision hashes what it renders from, and the document revision
+hashes the section order and section revisions. Revisions are computed from
+content only, so every worker thread arrives at the same value and clients
+can use them as ETags and to skip sections they already hold.
+
+Markdown is rendered per section on demand, so a page of a paginated or
+streamed response only renders the sections it returns. SectionRenderer
+looks renders up in the shared render cache (and optionally the
+rendered_sections table) by section ID and revision, and renders large
+batches of misses, such as a cold start, over a process pool.
+
+DocumentCache keeps the documents built on one connection until
+PRAGMA data_version shows that another connection committed.
+"""
+
+import hashlib
+import logging
+import math
+import multiprocessing
+import os
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import markdown
+
+from src.services.render_cache import (
+    RenderCache,
+    RenderKey,
+    load_renders,
+    prune_renders,
+    render_cache,
+    store_renders,
+)
+
+logger = logging.getLogger(__name__)
+
+MARKDOWN_EXTENSIONS = ["extra", "nl2br"]
+
+# Documents kept per connection (one per doc_id/filter combination)
+DEFAULT_CACHED_DOCUMENTS = 8
+
+# Below this many misses, rendering in-process beats the pool's IPC overhead
+PARALLEL_RENDER_THRESHOLD = 64
+
+
+def resolve_links(text: str) -> str:
+    """
+    Convert wiki-style links to plain text for the read-only web view.
+
+    Args:
+        text: Text containing wiki-style [[links]].
+
+    Returns:
+        Text with links replaced by their labels.
+    """
+    # Replace [[Target|Label]] -> Label
+    text = re.sub(r"\[\[[^]|]+\|([^]]+)\]\]", r"\1", text)
+    # Replace [[Target]] -> Target
+    text = re.sub(r"\[\[([^]]+)\]\]", r"\1", text)
+    return text
+
+
+def render_section_html(title: str, heading_level: int, content: str) -> str:
+    """
+    Render a longform section to HTML.
+
+    Args:
+        title: Section title, rendered as a markdown heading.
+        heading_level: Heading level (1-6).
+        content: Raw markdown content of the section.
+
+    Returns:
+        str: The rendered HTML.
+    """
+    full_markdown = f"{'#' * heading_level} {title}\n\n" + resolve_links(content)
+    return markdown.markdown(full_markdown, extensions=MARKDOWN_EXTENSIONS)
+
+
+def _render_batch(items: List[Tuple[str, int, str]]) -> List[str]:
+    """Renders (title, heading level, content) items; runs in pool workers."""
+    return [render_section_html(*item) for item in items]
+
+
+@dataclass(frozen=True)
+class LongformSection:
+    """
+    One section of a longform document.
+
+    Attributes:
+        id: ID of the underlying event or entity.
+        table: "events" or "entities".
+        title: Displayed title (title override or name).
+        heading_level: Heading level (1-6).
+        content: Raw markdown content.
+        revision: Hash of title, heading level and content.
+    """
+
+    id: str
+    table: str
+    title: str
+    heading_level: int
+    content: str
+    revision: str
+
+    def render_html(self) -> str:
+        """Renders the section's markdown to HTML."""
+        return render_section_html(self.title, self.heading_level, self.content)
+
+    def to_dict(self, html: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Converts the section to its API representation.
+
+        Args:
+            html: The section's rendered HTML, rendered here if not given.
+
+        Returns:
+            Dict[str, Any]: JSON-serializable section.
+        """
+        return {
+            "id": self.id,
+            "table": self.table,
+            "title": self.title,
+            "heading_level": self.heading_level,
+            "revision": self.revision,
+            "html": self.render_html() if html is None else html,
+            "updated_at": None,
+        }
+
+
+def _hash(*parts: str) -> str:
+    """Returns a short hex digest of NUL-separated parts."""
+    digest = hashlib.sha256("\0".join(parts).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+@dataclass
+class LongformDocument:
+    """
+    Snapshot of a longform document with content revisions.
+
+    Attributes:
+        doc_id: Document ID.
+        revision: Hash over the ordered section revisions.
+        sections: Sections in reading order.
+    """
+
+    doc_id: str
+    revision: str
+    sections: List[LongformSection]
+    _positions: Dict[str, int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        """Indexes section positions for cursor lookups."""
+        self._positions = {
+            section.id: index for index, section in enumerate(self.sections)
+        }
+
+    @classmethod
+    def from_sequence(
+        cls, doc_id: str, sequence: List[Dict[str, Any]]
+    ) -> "LongformDocument":
+        """
+        Creates a document from build_longform_sequence() output.
+
+        Args:
+            doc_id: Document ID.
+            sequence: Ordered items with table, id, name, content, meta and
+                heading_level.
+
+        Returns:
+            LongformDocument: The document snapshot.
+        """
+        sections = []
+        for item in sequence:
+            title = item["meta"].get("title_override") or item["name"]
+            heading_level = item["heading_level"]
+            content = item.get("content") or ""
+            sections.append(
+                LongformSection(
+                    id=item["id"],
+                    table=item["table"],
+                    title=title,
+                    heading_level=heading_level,
+                    content=content,
+                    revision=_hash(title, str(heading_level), content),
+                )
+            )
+        revision = _hash(doc_id, *(f"{s.table}:{s.id}:{s.revision}" for s in sections))
+        return cls(doc_id=doc_id, revision=revision, sections=sections)
+
+    def page(
+        self, cursor: Optional[str] = None, limit: Optional[int] = None
+    ) -> Tuple[List[LongformSection], Optional[str]]:
+        """
+        Returns a page of sections.
+
+        Args:
+            cursor: ID of the last section of the previous page, or None to
+                start at the beginning.
+            limit: Maximum number of sections, or None for all remaining.
+
+        Returns:
+            Tuple of (sections, next cursor or None on the last page).
+
+        Raises:
+            ValueError: If the cursor section is no longer in the document.
+        """
+        start = 0
+        if cursor:
+            position = self._positions.get(cursor)
+            if position is None:
+                raise ValueError(f"Unknown cursor: {cursor}")
+            start = position + 1
+
+        end = len(self.sections) if limit is None else start + limit
+        sections = self.sections[start:end]
+        next_cursor = sections[-1].id if sections and end < len(self.sections) else None
+        return sections, next_cursor
+
+
+class DocumentCache:
+    """
+    Documents built on one connection, valid until another connection writes.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CACHED_DOCUMENTS) -> None:
+        """
+        Initializes the cache.
+
+        Args:
+            capacity: Maximum number of documents to keep.
+        """
+        self.capacity = capacity
+        self._documents: "OrderedDict[Tuple[str, str], LongformDocument]" = (
+            OrderedDict()
+        )
+        self._data_version: Optional[int] = None
+
+    def get(
+        self,
+        conn: sqlite3.Connection,
+        key: Tuple[str, str],
+        build: Callable[[], LongformDocument],
+    ) -> LongformDocument:
+        """
+        Returns a cached document, building it if missing or outdated.
+
+        Args:
+            conn: Connection the documents are read from.
+            key: (doc_id, filter key) identifying the document.
+            build: Builds the document on a cache miss.
+
+        Returns:
+            LongformDocument: The current document.
+        """
+        # Read before building, so commits made during the build are noticed
+        data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        if data_version != self._data_version:
+            self._documents.clear()
+            self._data_version = data_version
+
+        document = self._documents.get(key)
+        if document is not None:
+            self._documents.move_to_end(key)
+            return document
+
+        document = build()
+        self._documents[key] = document
+        while len(self._documents) > self.capacity:
+            self._documents.popitem(last=False)
+        return document
+
+    def clear(self) -> None:
+        """Drops all cached documents."""
+        self._documents.clear()
+        self._data_version = None
+
+
+class SectionRenderer:
+    """
+    Renders sections through the render cache.
+
+    Lookups go to the in-memory cache, then (when persisting) to the
+    rendered_sections table; the remaining sections are rendered serially,
+    or over a spawned process pool when there are many of them. New renders
+    are written back to both stores.
+    """
+
+    def __init__(
+        self,
+        cache: RenderCache = render_cache,
+        db_path: Optional[str] = None,
+        parallel_threshold: int = PARALLEL_RENDER_THRESHOLD,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """
+        Initializes the renderer.
+
+        Args:
+            cache: In-memory render cache.
+            db_path: Database to persist renders in, or None to keep them in
+                memory only.
+            parallel_threshold: Minimum number of misses rendered over the
+                process pool; 0 disables the pool.
+            max_workers: Pool size (defaults to the CPU count).
+        """
+        self.cache = cache
+        self.db_path = db_path
+        self.parallel_threshold = parallel_threshold
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pruned = False
+
+    def render(
+        self,
+        sections: Sequence[LongformSection],
+        conn: Optional[sqlite3.Connection] = None,
+    ) -> List[str]:
+        """
+        Returns the HTML of each section.
+
+        Args:
+            sections: Sections to render.
+            conn: Connection to read persisted renders from (may be
+                read-only); ignored when not persisting.
+
+        Returns:
+            List[str]: HTML per section, in order.
+        """
+        html: List[Optional[str]] = [
+            self.cache.get(section.id, section.revision) for section in sections
+        ]
+        missing = [i for i, value in enumerate(html) if value is None]
+
+        if missing and self.db_path and conn is not None:
+            stored = self._load(conn, [_key(sections[i]) for i in missing])
+            for i in missing:
+                value = stored.get(_key(sections[i]))
+                if value is not None:
+                    html[i] = value
+                    self.cache.put(sections[i].id, sections[i].revision, value)
+            missing = [i for i in missing if html[i] is None]
+
+        if missing:
+            rendered = self._render_missing([sections[i] for i in missing])
+            renders: Dict[RenderKey, str] = {}
+            for i, value in zip(missing, rendered):
+                html[i] = value
+                self.cache.put(sections[i].id, sections[i].revision, value)
+                renders[_key(sections[i])] = value
+            if self.db_path:
+                self._store(renders)
+
+        return [value or "" for value in html]
+
+    def shutdown(self) -> None:
+        """Stops the process pool (it is recreated on demand)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _render_missing(self, sections: List[LongformSection]) -> List[str]:
+        """Renders sections serially, or over the pool when there are many."""
+        items = [(s.title, s.heading_level, s.content) for s in sections]
+        if self.parallel_threshold <= 0 or len(items) < self.parallel_threshold:
+            return _render_batch(items)
+
+        # A few chunks per worker keeps the pool busy without per-item IPC
+        chunk_size = math.ceil(len(items) / (self.max_workers * 4))
+        chunks = [
+            items[start : start + chunk_size]
+            for start in range(0, len(items), chunk_size)
+        ]
+        try:
+            results = self._get_executor().map(_render_batch, chunks)
+            return [html for chunk in results for html in chunk]
+        except Exception as e:
+            logger.warning(f"Parallel rendering failed, rendering serially: {e}")
+            self.shutdown()
+            return _render_batch(items)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Returns the process pool, starting it on first use."""
+        with self._lock:
+            if self._executor is None:
+                # Spawn rather than fork: the server shares its process with
+                # Qt and uvicorn threads
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _load(
+        self, conn: sqlite3.Connection, keys: List[RenderKey]
+    ) -> Dict[RenderKey, str]:
+        """Reads persisted renders, treating database errors as misses."""
+        try:
+            return load_renders(conn, keys, self.cache.renderer_version)
+        except sqlite3.Error as e:
+            logger.warning(f"Could not read persisted renders: {e}")
+            return {}
+
+    def _store(self, renders: Dict[RenderKey, str]) -> None:
+        """Persists renders through a short-lived writable connection."""
+        assert self.db_path is not None
+        try:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                if not self._pruned:
+                    prune_renders(conn, self.cache.renderer_version)
+                    self._pruned = True
+                store_renders(conn, renders, self.cache.renderer_version)
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not persist renders: {e}")
+
+
+def _key(section: LongformSection) -> RenderKey:
+    """Returns the render cache key of a section."""
+    return (section.id, section.revision)
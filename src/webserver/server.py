@@ -3,20 +3,39 @@ Web Server Module for ProjektKraken.
 
 Provides FastAPI-based REST API for serving longform documents and health checks.
 This server is designed to run embedded within the main application via QThread.
+
+Requests are served from a pool of read-only database connections, one per
+worker thread. Each thread caches the longform documents it built until the
+application commits a change, and responses carry the document revision as
+an ETag so unchanged documents are answered with 304 Not Modified.
+Section HTML comes from a SectionRenderer shared by all threads.
 """
 
+import json
 import logging
 import os
-from typing import Any
+import sqlite3
+import threading
+from typing import Any, Iterator, List, Optional, Set, Tuple
 
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
 from src.services.db_service import DatabaseService
-from src.services.longform_builder import build_longform_sequence
+from src.services.longform_builder import (
+    build_longform_sequence,
+    ensure_all_items_indexed,
+    has_unindexed_items,
+)
 from src.webserver.config import ServerConfig
+from src.webserver.documents import (
+    DocumentCache,
+    LongformDocument,
+    LongformSection,
+    SectionRenderer,
+)
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -27,26 +46,219 @@ logging.getLogger("MARKDOWN").setLevel(logging.WARNING)
 # Global config (set on startup)
 _config: ServerConfig = ServerConfig()
 
+MAX_PAGE_SIZE = 500
+
+# Sections rendered per streamed batch (large enough to use the render pool)
+STREAM_RENDER_BATCH = 128
+
+# Per-thread pooled read-only service and document cache
+_local = threading.local()
+_pool_lock = threading.Lock()
+_pooled_services: List[DatabaseService] = []
+
+# Renders section HTML through the shared render cache (set on startup)
+_renderer: SectionRenderer = SectionRenderer()
+
 
 def get_db_service() -> DatabaseService:
     """
-    Create a new DatabaseService instance for the current request.
-    This ensures thread safety by creating a fresh connection per request/thread.
+    Return the read-only DatabaseService of the current worker thread.
+
+    Each thread keeps one connection for its lifetime (no schema setup or
+    migrations per request); a new one is opened if the configured database
+    changed.
     """
-    service = DatabaseService(db_path=_config.db_path)
-    service.connect()
-    # Ensure WAL mode (should be set by service.connect, but no harm checking)
+    service = getattr(_local, "service", None)
+    if service is not None and service.db_path != _config.db_path:
+        _release_service(service)
+        service = None
+    if service is None:
+        service = DatabaseService(db_path=_config.db_path, read_only=True)
+        _local.service = service
+        _local.documents = DocumentCache()
+    if service._connection is None:
+        # First use, or the pool was closed under this thread
+        service.connect()
+        _local.documents.clear()
+        with _pool_lock:
+            _pooled_services.append(service)
     return service
 
 
+def _release_service(service: DatabaseService) -> None:
+    """Closes a pooled service and removes it from the pool."""
+    with _pool_lock:
+        if service in _pooled_services:
+            _pooled_services.remove(service)
+    service.close()
+
+
+def close_db_pool() -> None:
+    """Close all pooled read-only connections (threads reconnect on demand)."""
+    with _pool_lock:
+        services = list(_pooled_services)
+        _pooled_services.clear()
+    for service in services:
+        service.close()
+
+
+def _index_missing_items(doc_id: str) -> None:
+    """
+    Add unindexed events/entities to the document through a short-lived
+    writable connection, as the desktop editor would on its next load.
+    """
+    conn = sqlite3.connect(_config.db_path)
+    conn.row_factory = sqlite3.Row
+    try:
+        ensure_all_items_indexed(conn, doc_id)
+    finally:
+        conn.close()
+
+
+def _parse_filter(filter_json: Optional[str]) -> Tuple[Optional[dict], str]:
+    """
+    Parse a filter_json parameter without touching the database.
+
+    Args:
+        filter_json: Optional JSON string configuring filters.
+
+    Returns:
+        Tuple of (filter config or None for all, normalized filter key).
+    """
+    if not filter_json:
+        return None, ""
+    try:
+        filter_config = json.loads(filter_json)
+    except json.JSONDecodeError:
+        logger.warning("Invalid JSON filter string provided to API")
+        return None, ""
+    if not filter_config:
+        return None, ""
+    return filter_config, json.dumps(filter_config, sort_keys=True)
+
+
+def _resolve_filter(
+    db: DatabaseService, filter_config: Optional[dict]
+) -> Optional[Set[str]]:
+    """
+    Resolve a parsed filter to the IDs it allows.
+
+    Args:
+        db: Database service to evaluate tag filters on.
+        filter_config: Filter config from _parse_filter, or None.
+
+    Returns:
+        Optional[Set[str]]: Allowed IDs, or None for all.
+    """
+    if filter_config is None:
+        return None
+    try:
+        # Use DRY compliance: Reuse existing filter logic
+        # filter_ids_by_tags returns List[tuple[str, str]] of (type, id)
+        result_tuples = db.filter_ids_by_tags(
+            object_type=filter_config.get("object_type"),
+            include=filter_config.get("include"),
+            include_mode=filter_config.get("include_mode", "any"),
+            exclude=filter_config.get("exclude"),
+            exclude_mode=filter_config.get("exclude_mode", "any"),
+            case_sensitive=filter_config.get("case_sensitive", False),
+        )
+    except Exception as e:
+        logger.error(f"Error applying filter in API: {e}")
+        return None
+    # Extract just the IDs (second element of each tuple)
+    return {item_id for _, item_id in result_tuples}
+
+
+def load_document(doc_id: str, filter_json: Optional[str] = None) -> LongformDocument:
+    """
+    Return the current longform document from the thread's cache.
+
+    Documents are cached per normalized filter, and tag filters are only
+    evaluated when the document has to be built.
+
+    Args:
+        doc_id: Document ID.
+        filter_json: Optional JSON string configuring tag filters.
+
+    Returns:
+        LongformDocument: The document snapshot.
+    """
+    db = get_db_service()
+    assert db._connection is not None, "Database not connected"
+    conn = db._connection
+    filter_config, filter_key = _parse_filter(filter_json)
+
+    def build() -> LongformDocument:
+        """Builds the document, indexing missing items when unfiltered."""
+        allowed_ids = _resolve_filter(db, filter_config)
+        if allowed_ids is None and has_unindexed_items(conn, doc_id):
+            _index_missing_items(doc_id)
+        sequence = build_longform_sequence(
+            conn, doc_id=doc_id, allowed_ids=allowed_ids, index_missing=False
+        )
+        return LongformDocument.from_sequence(doc_id, sequence)
+
+    return _local.documents.get(conn, (doc_id, filter_key), build)
+
+
+def _shutdown() -> None:
+    """Releases the connection pool and the render process pool."""
+    close_db_pool()
+    _renderer.shutdown()
+
+
+def _section_dicts(sections: List[LongformSection]) -> List[dict[str, Any]]:
+    """Renders sections and converts them to their API representation."""
+    conn = get_db_service()._connection
+    html = _renderer.render(sections, conn)
+    return [section.to_dict(value) for section, value in zip(sections, html)]
+
+
+def _etag(document: LongformDocument) -> str:
+    """Returns the strong ETag of a document revision."""
+    return f'"{document.revision}"'
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    """Checks If-None-Match against an ETag (weak comparison)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [tag.strip() for tag in header.split(",")]
+    return "*" in candidates or any(
+        tag.removeprefix("W/") == etag for tag in candidates
+    )
+
+
+def _page(
+    document: LongformDocument, cursor: Optional[str], limit: Optional[int]
+) -> Tuple[List[LongformSection], Optional[str]]:
+    """Pages a document, answering stale cursors with 400."""
+    try:
+        return document.page(cursor, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+def _cache_headers(etag: str) -> dict[str, str]:
+    """Headers making clients revalidate with If-None-Match."""
+    return {"ETag": etag, "Cache-Control": "no-cache"}
+
+
 def create_app(config: ServerConfig) -> FastAPI:
     """
     Factory function to create the FastAPI app with the given configuration.
     """
-    global _config
+    global _config, _renderer
     _config = config
+    _renderer.shutdown()
+    _renderer = SectionRenderer(
+        db_path=config.db_path if config.persist_renders else None,
+        max_workers=config.render_workers or None,
+    )
 
-    app = FastAPI(title="ProjektKraken Longform Server")
+    app = FastAPI(title="ProjektKraken Longform Server", on_shutdown=[_shutdown])
 
     # Mount static files
     static_dir = os.path.join(os.path.dirname(__file__), "static")
@@ -68,8 +280,8 @@ def create_app(config: ServerConfig) -> FastAPI:
         Returns:
             JSON object with "tags": list[str].
         """
-        db = get_db_service()
         try:
+            db = get_db_service()
             # db.get_active_tags() returns List[Dict] with 'id', 'name', etc.
             # We want the human-readable names of tags that actually have content.
             tags_data = db.get_active_tags()
@@ -82,135 +294,119 @@ def create_app(config: ServerConfig) -> FastAPI:
 
     @app.get("/api/longform")
     def get_longform(
-        doc_id: str = "default", filter_json: str | None = None
-    ) -> dict[str, Any]:
+        request: Request,
+        doc_id: str = "default",
+        filter_json: str | None = None,
+        cursor: str | None = None,
+        limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    ) -> Response:
         """
         Get the structured longform sequence as JSON.
         Includes rendered HTML content for each section.
 
+        Without a limit all sections are returned. With one, the response
+        holds at most `limit` sections and `next_cursor` is passed as
+        `cursor` to fetch the following page.
+
         Args:
+            request: The FastAPI request object (for If-None-Match).
             doc_id: Document ID.
             filter_json: Optional JSON string configuring filters.
+            cursor: ID of the last section of the previous page.
+            limit: Optional maximum number of sections.
         """
-        db = get_db_service()
         try:
-            allowed_ids = None
-            if filter_json:
-                try:
-                    import json
-
-                    filter_config = json.loads(filter_json)
-                    if filter_config:
-                        # Use DRY compliance: Reuse existing filter logic
-                        # filter_ids_by_tags returns List[tuple[str, str]] of (type, id)
-                        result_tuples = db.filter_ids_by_tags(
-                            object_type=filter_config.get("object_type"),
-                            include=filter_config.get("include"),
-                            include_mode=filter_config.get("include_mode", "any"),
-                            exclude=filter_config.get("exclude"),
-                            exclude_mode=filter_config.get("exclude_mode", "any"),
-                            case_sensitive=filter_config.get("case_sensitive", False),
-                        )
-                        # Extract just the IDs (second element of each tuple)
-                        allowed_ids = {item_id for _, item_id in result_tuples}
-                except json.JSONDecodeError:
-                    logger.warning("Invalid JSON filter string provided to API")
-                except Exception as e:
-                    logger.error(f"Error applying filter in API: {e}")
-                    print(f"DEBUG EXCEPTION: {e}")
-
-            assert db._connection is not None, "Database not connected"
-            sequence = build_longform_sequence(
-                db._connection, doc_id=doc_id, allowed_ids=allowed_ids
-            )
-
-            # Since WikiTextEdit is a QWidget, we can't easily run it in a
-            # headless thread safely without QApplication.
-            # However, looking at WikiTextEdit code, the rendering logic is
-            # mostly string manipulation using the `markdown` library.
-            import markdown
-
-            def resolve_links(text: str) -> str:
-                """Convert wiki-style links to plain text or HTML anchors.
-
-                Args:
-                    text: Text containing wiki-style [[links]].
-
-                Returns:
-                    Text with links resolved/stripped for display.
-                """
-                # Basic [[Link]] -> [Link](Link) or similar logic
-                # For the web view, we might want [[Link]] to jump to anchors or
-                # just be plain text.
-                # Logic: [[id:123|Label]] -> <a href="#item-index">Label</a>?
-                # For V1 read-only, we might just strip wiki links or make them bold.
-                import re
-
-                # Replace [[Target|Label]] -> Label
-                text = re.sub(r"\[\[[^]|]+\|([^]]+)\]\]", r"\1", text)
-                # Replace [[Target]] -> Target
-                text = re.sub(r"\[\[([^]]+)\]\]", r"\1", text)
-                return text
-
-            data = []
-            for item in sequence:
-                # Construct Markdown with Header
-                title = item["meta"].get("title_override") or item["name"]
-                heading_level = item["heading_level"]
-                header_md = f"{'#' * heading_level} {title}\n\n"
-
-                # Pre-process links in content
-                raw_content = item.get("content", "")
-                processed_body = resolve_links(raw_content)
-
-                # Combine
-                full_markdown = header_md + processed_body
-
-                # Convert to HTML
-                html_content = markdown.markdown(
-                    full_markdown, extensions=["extra", "nl2br"]
-                )
-
-                data.append(
-                    {
-                        "id": item["id"],
-                        "table": item["table"],
-                        "title": item["meta"].get("title_override") or item["name"],
-                        "heading_level": item["heading_level"],
-                        "html": html_content,
-                        "updated_at": item.get("updated_at"),  # Not always present
-                    }
-                )
-
-            return {"title": doc_id, "sections": data}
-
+            document = load_document(doc_id, filter_json)
+            etag = _etag(document)
+            if _not_modified(request, etag):
+                return Response(status_code=304, headers=_cache_headers(etag))
+
+            sections, next_cursor = _page(document, cursor, limit)
+            payload = {
+                "title": doc_id,
+                "revision": document.revision,
+                "total": len(document.sections),
+                "next_cursor": next_cursor,
+                "sections": _section_dicts(sections),
+            }
+            return JSONResponse(payload, headers=_cache_headers(etag))
+
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error fetching longform: {e}", exc_info=True)
             raise HTTPException(status_code=500, detail=str(e)) from e
-        finally:
-            db.close()
+
+    @app.get("/api/longform/stream")
+    def stream_longform(
+        request: Request,
+        doc_id: str = "default",
+        filter_json: str | None = None,
+        cursor: str | None = None,
+        limit: int | None = Query(default=None, ge=1),
+    ) -> Response:
+        """
+        Stream the longform sequence as NDJSON.
+
+        The first line describes the document (title, revision, total); each
+        following line is one section, rendered in batches as it is sent.
+
+        Args:
+            request: The FastAPI request object (for If-None-Match).
+            doc_id: Document ID.
+            filter_json: Optional JSON string configuring filters.
+            cursor: ID of the section to resume after.
+            limit: Optional maximum number of sections.
+        """
+        try:
+            document = load_document(doc_id, filter_json)
+            etag = _etag(document)
+            if _not_modified(request, etag):
+                return Response(status_code=304, headers=_cache_headers(etag))
+            sections, next_cursor = _page(document, cursor, limit)
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Error streaming longform: {e}", exc_info=True)
+            raise HTTPException(status_code=500, detail=str(e)) from e
+
+        def lines() -> Iterator[str]:
+            """Yields the header line, then one line per section."""
+            header = {
+                "title": doc_id,
+                "revision": document.revision,
+                "total": len(document.sections),
+                "next_cursor": next_cursor,
+            }
+            yield json.dumps(header) + "\n"
+            for start in range(0, len(sections), STREAM_RENDER_BATCH):
+                batch = sections[start : start + STREAM_RENDER_BATCH]
+                for section in _section_dicts(batch):
+                    yield json.dumps(section) + "\n"
+
+        return StreamingResponse(
+            lines(), media_type="application/x-ndjson", headers=_cache_headers(etag)
+        )
 
     @app.get("/api/toc")
-    def get_toc(doc_id: str = "default") -> list[dict[str, Any]]:
+    def get_toc(request: Request, doc_id: str = "default") -> Response:
         """
         Get just the Table of Contents structure.
         """
-        db = get_db_service()
-        try:
-            assert db._connection is not None, "Database not connected"
-            sequence = build_longform_sequence(db._connection, doc_id=doc_id)
-            toc = []
-            for item in sequence:
-                toc.append(
-                    {
-                        "id": item["id"],
-                        "title": item["meta"].get("title_override") or item["name"],
-                        "level": item["heading_level"],
-                    }
-                )
-            return toc
-        finally:
-            db.close()
+        document = load_document(doc_id)
+        etag = _etag(document)
+        if _not_modified(request, etag):
+            return Response(status_code=304, headers=_cache_headers(etag))
+
+        toc = [
+            {
+                "id": section.id,
+                "title": section.title,
+                "level": section.heading_level,
+            }
+            for section in document.sections
+        ]
+        return JSONResponse(toc, headers=_cache_headers(etag))
 
     # -------------------------------------------------------------------------
     # HTML View
@@ -63,6 +63,8 @@ def mock_main_window(qapp):
     # Add all required methods
     window._on_events_ready = Mock()
     window._on_entities_ready = Mock()
+    window._on_events_patched = Mock()
+    window._on_entities_patched = Mock()
     window._on_suggestions_update = Mock()
     window._on_event_details_ready = Mock()
     window._on_entity_details_ready = Mock()
@@ -160,6 +162,7 @@ class TestConnectionManagerIntegration:
         # Test each method returns an int
         data_handler_failures = manager.connect_data_handler()
         assert isinstance(data_handler_failures, int)
+        assert data_handler_failures == 0
 
         unified_list_failures = manager.connect_unified_list()
         assert isinstance(unified_list_failures, int)
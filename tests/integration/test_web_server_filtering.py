@@ -125,3 +125,34 @@ def test_get_longform_invalid_filter_json(client):
     # -> returns all.
     data = response.json()
     assert len(data["sections"]) == 2
+
+
+def test_filter_resolved_only_on_cache_miss(client, monkeypatch):
+    from src.webserver import server
+
+    calls = []
+    original = DatabaseService.filter_ids_by_tags
+
+    def spy(self, *args, **kwargs):
+        calls.append(kwargs)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(DatabaseService, "filter_ids_by_tags", spy)
+
+    first = server.load_document(
+        "default", json.dumps({"include": ["A"], "include_mode": "any"})
+    )
+    assert [s.id for s in first.sections] == ["e1"]
+    assert len(calls) == 1
+
+    # The same filter with another key order is served from the cache
+    again = server.load_document(
+        "default", json.dumps({"include_mode": "any", "include": ["A"]})
+    )
+    assert again is first
+    assert len(calls) == 1
+
+    other = server.load_document("default", json.dumps({"include": ["B"]}))
+    assert [s.id for s in other.sections] == ["e2"]
+    assert other.revision != first.revision
+    assert len(calls) == 2
@@ -0,0 +1,186 @@
+"""
+Integration tests for the paginated, streaming and cached longform API.
+"""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.core.events import Event
+from src.services.db_service import DatabaseService
+from src.services.longform_builder import insert_or_update_longform_meta
+from src.webserver import server
+from src.webserver.config import ServerConfig
+from src.webserver.server import create_app
+
+SECTION_COUNT = 7
+
+
+@pytest.fixture
+def db_service(tmp_path):
+    service = DatabaseService(str(tmp_path / "longform_api.kraken"))
+    service.connect()
+    for index in range(SECTION_COUNT):
+        service.insert_event(
+            Event(
+                id=f"e{index}",
+                name=f"Event {index}",
+                description=f"Content **{index}**",
+                lore_date=float(index),
+            )
+        )
+        insert_or_update_longform_meta(
+            service._connection, "events", f"e{index}", position=100.0 * (index + 1)
+        )
+    yield service
+    service.close()
+
+
+@pytest.fixture
+def client(db_service):
+    app = create_app(ServerConfig(db_path=db_service.db_path))
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_longform_without_limit_returns_all_sections(client):
+    response = client.get("/api/longform")
+    assert response.status_code == 200
+    data = response.json()
+    assert [s["id"] for s in data["sections"]] == [
+        f"e{i}" for i in range(SECTION_COUNT)
+    ]
+    assert data["total"] == SECTION_COUNT
+    assert data["next_cursor"] is None
+    assert "<strong>0</strong>" in data["sections"][0]["html"]
+    assert response.headers["etag"] == f'"{data["revision"]}"'
+
+
+def test_longform_pages_follow_cursor(client):
+    ids = []
+    cursor = None
+    pages = 0
+    while True:
+        params = {"limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        data = client.get("/api/longform", params=params).json()
+        ids.extend(s["id"] for s in data["sections"])
+        pages += 1
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert ids == [f"e{i}" for i in range(SECTION_COUNT)]
+
+
+def test_longform_unknown_cursor_is_rejected(client):
+    response = client.get("/api/longform", params={"cursor": "gone", "limit": 2})
+    assert response.status_code == 400
+
+
+def test_longform_limit_is_bounded(client):
+    response = client.get("/api/longform", params={"limit": 0})
+    assert response.status_code == 422
+
+
+def test_longform_etag_revalidation(client, db_service):
+    first = client.get("/api/longform")
+    etag = first.headers["etag"]
+
+    unchanged = client.get("/api/longform", headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
+
+    # An edit from the application's own connection changes the revision
+    event = db_service.get_event("e3")
+    event.description = "Rewritten"
+    db_service.insert_event(event)
+
+    changed = client.get("/api/longform", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    before = {s["id"]: s["revision"] for s in first.json()["sections"]}
+    after = {s["id"]: s["revision"] for s in changed.json()["sections"]}
+    assert [i for i in before if before[i] != after[i]] == ["e3"]
+
+
+def test_longform_stream_ndjson(client):
+    response = client.get("/api/longform/stream", params={"cursor": "e1"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    header, sections = lines[0], lines[1:]
+    assert header["total"] == SECTION_COUNT
+    assert header["next_cursor"] is None
+    assert [s["id"] for s in sections] == [f"e{i}" for i in range(2, SECTION_COUNT)]
+    assert response.headers["etag"] == f'"{header["revision"]}"'
+
+    cached = client.get(
+        "/api/longform/stream", headers={"If-None-Match": response.headers["etag"]}
+    )
+    assert cached.status_code == 304
+
+
+def test_toc_uses_document_revision(client):
+    toc = client.get("/api/toc")
+    longform = client.get("/api/longform")
+    assert toc.headers["etag"] == longform.headers["etag"]
+    assert [item["id"] for item in toc.json()] == [
+        f"e{i}" for i in range(SECTION_COUNT)
+    ]
+
+
+def test_unindexed_items_are_added(client, db_service):
+    db_service.insert_event(
+        Event(id="new", name="Appendix", description="", lore_date=99.0)
+    )
+    data = client.get("/api/longform").json()
+    assert data["sections"][-1]["id"] == "new"
+
+
+def test_connections_are_pooled_read_only(client, db_service):
+    client.get("/api/longform")
+    client.get("/api/tags")
+    assert server._pooled_services
+    for service in server._pooled_services:
+        assert service.read_only
+
+    server.close_db_pool()
+    assert server._pooled_services == []
+    assert client.get("/api/longform").status_code == 200
+
+
+def test_renders_are_not_persisted_by_default(client, db_service):
+    client.get("/api/longform")
+    count = db_service._connection.execute(
+        "SELECT COUNT(*) FROM rendered_sections"
+    ).fetchone()[0]
+    assert count == 0
+
+
+def test_renders_are_persisted_when_enabled(db_service):
+    from src.services.render_cache import render_cache
+
+    render_cache.clear()
+    config = ServerConfig(db_path=db_service.db_path, persist_renders=True)
+    with TestClient(create_app(config)) as client:
+        client.get("/api/longform")
+    rows = db_service._connection.execute(
+        "SELECT object_id FROM rendered_sections ORDER BY object_id"
+    ).fetchall()
+    assert [row[0] for row in rows] == [f"e{i}" for i in range(SECTION_COUNT)]
+
+
+def test_edited_sections_are_rerendered(client, db_service):
+    client.get("/api/longform")
+
+    event = db_service.get_event("e0")
+    event.description = "Edited *content*"
+    db_service.insert_event(event)
+
+    section = client.get("/api/longform").json()["sections"][0]
+    assert "<em>content</em>" in section["html"]
@@ -6,7 +6,11 @@ import sqlite3
 
 import pytest
 
-from src.core.trajectory import Keyframe
+from src.core.trajectory import (
+    Keyframe,
+    interpolate_position,
+    keyframes_to_mfjson,
+)
 from src.services.repositories.trajectory_repository import TrajectoryRepository
 
 # Schema needed for testing (moving_features + markers + maps)
@@ -33,6 +37,21 @@ CREATE TABLE IF NOT EXISTS moving_features (
     created_at REAL,
     FOREIGN KEY(marker_id) REFERENCES markers(id) ON DELETE CASCADE
 );
+
+CREATE TABLE IF NOT EXISTS trajectory_keyframes (
+    id INTEGER PRIMARY KEY,
+    trajectory_id TEXT NOT NULL,
+    marker_id TEXT NOT NULL,
+    t REAL NOT NULL,
+    x REAL NOT NULL,
+    y REAL NOT NULL,
+    FOREIGN KEY(trajectory_id) REFERENCES moving_features(id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_trajectory_keyframes_trajectory_time
+    ON trajectory_keyframes(trajectory_id, t);
+CREATE INDEX IF NOT EXISTS idx_trajectory_keyframes_marker_time
+    ON trajectory_keyframes(marker_id, t);
 """
 
 
@@ -221,3 +240,219 @@ class TestTrajectoryRepository:
         assert keyframes[0].x == 0.1
         assert keyframes[1].t == 50.0
         assert keyframes[1].x == 0.5
+
+    def test_insert_stores_one_row_per_keyframe(self, repo, setup_data):
+        marker_id = setup_data["marker_id"]
+        trajectory = [Keyframe(t=float(i), x=i / 10, y=0.5) for i in range(5)]
+
+        traj_id = repo.insert(marker_id, trajectory)
+
+        rows = repo._connection.execute(
+            "SELECT marker_id, t FROM trajectory_keyframes "
+            "WHERE trajectory_id = ? ORDER BY t",
+            (traj_id,),
+        ).fetchall()
+        assert [row["t"] for row in rows] == [0.0, 1.0, 2.0, 3.0, 4.0]
+        assert {row["marker_id"] for row in rows} == {marker_id}
+
+    def test_add_keyframe_replaces_keyframe_within_epsilon(self, repo, setup_data):
+        marker_id = setup_data["marker_id"]
+        repo.insert(
+            marker_id, [Keyframe(t=10.0, x=0.1, y=0.1), Keyframe(t=50.0, x=0.5, y=0.5)]
+        )
+
+        repo.add_keyframe("map1", marker_id, Keyframe(t=30.0, x=0.3, y=0.3))
+        repo.add_keyframe("map1", marker_id, Keyframe(t=50.005, x=0.6, y=0.6))
+
+        fetched = repo.get_by_marker_db_id(marker_id)[0][1]
+        assert [(kf.t, kf.x) for kf in fetched] == [
+            (10.0, 0.1),
+            (30.0, 0.3),
+            (50.005, 0.6),
+        ]
+        row = repo._connection.execute(
+            "SELECT t_start, t_end FROM moving_features"
+        ).fetchone()
+        assert (row["t_start"], row["t_end"]) == (10.0, 50.005)
+
+    def test_delete_keyframe(self, repo, setup_data):
+        marker_id = setup_data["marker_id"]
+        traj_id = repo.insert(
+            marker_id,
+            [
+                Keyframe(t=10.0, x=0.1, y=0.1),
+                Keyframe(t=20.0, x=0.2, y=0.2),
+                Keyframe(t=30.0, x=0.3, y=0.3),
+            ],
+        )
+
+        assert repo.delete_keyframe("map1", marker_id, 10.0) == traj_id
+        fetched = repo.get_by_marker_db_id(marker_id)[0][1]
+        assert [kf.t for kf in fetched] == [20.0, 30.0]
+
+        with pytest.raises(ValueError, match="Keyframe at t=99.0 not found"):
+            repo.delete_keyframe("map1", marker_id, 99.0)
+
+        # Dropping below two keyframes removes the trajectory and its rows
+        assert repo.delete_keyframe("map1", marker_id, 20.0) is None
+        assert repo.get_by_marker_db_id(marker_id) == []
+        count = repo._connection.execute(
+            "SELECT COUNT(*) FROM trajectory_keyframes"
+        ).fetchone()[0]
+        assert count == 0
+
+    def test_edit_converts_legacy_json_trajectory(
+        self, repo, db_connection, setup_data
+    ):
+        """Editing a JSON-blob trajectory moves it into keyframe rows first."""
+        import json
+
+        from src.services.repositories.trajectory_repository import (
+            KEYFRAME_ROWS_STORAGE,
+        )
+
+        marker_id = setup_data["marker_id"]
+        mfjson = keyframes_to_mfjson(
+            [Keyframe(t=10.0, x=0.1, y=0.1), Keyframe(t=50.0, x=0.5, y=0.5)]
+        )
+        db_connection.execute(
+            """
+            INSERT INTO moving_features (id, marker_id, t_start, t_end, trajectory, properties)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            ("old-traj-id", marker_id, 10.0, 50.0, json.dumps(mfjson), "{}"),
+        )
+        db_connection.commit()
+
+        repo.update_keyframe_time("map1", marker_id, 50.0, 70.0)
+
+        row = db_connection.execute(
+            "SELECT trajectory, t_end FROM moving_features WHERE id = 'old-traj-id'"
+        ).fetchone()
+        assert row["trajectory"] == KEYFRAME_ROWS_STORAGE
+        assert row["t_end"] == 70.0
+        fetched = repo.get_by_marker_db_id(marker_id)[0][1]
+        assert [(kf.t, kf.x) for kf in fetched] == [(10.0, 0.1), (70.0, 0.5)]
+
+    def test_convert_json_trajectories(self, repo, db_connection, setup_data):
+        import json
+
+        marker_id = setup_data["marker_id"]
+        db_connection.executemany(
+            """
+            INSERT INTO moving_features (id, marker_id, t_start, t_end, trajectory, properties)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    "old",
+                    marker_id,
+                    0.0,
+                    5.0,
+                    json.dumps([[5, 0.5, 0.5], [0, 0, 0]]),
+                    "{}",
+                ),
+                ("corrupt", marker_id, 0.0, 1.0, "not json", "{}"),
+            ],
+        )
+        db_connection.commit()
+        repo.insert(marker_id, [Keyframe(t=0, x=0, y=0), Keyframe(t=1, x=1, y=1)])
+
+        assert repo.convert_json_trajectories() == 1
+        assert repo.convert_json_trajectories() == 0
+
+        rows = db_connection.execute(
+            "SELECT t FROM trajectory_keyframes WHERE trajectory_id = 'old' ORDER BY id"
+        ).fetchall()
+        assert [row["t"] for row in rows] == [0.0, 5.0]
+
+    def test_get_by_map_id_in_range(self, repo, db_connection, setup_data):
+        import json
+
+        marker_id = setup_data["marker_id"]
+        trajectory = [
+            Keyframe(t=float(t), x=t / 100, y=1 - t / 100) for t in range(0, 100, 10)
+        ]
+        traj_id = repo.insert(marker_id, list(trajectory))
+
+        db_connection.execute(
+            "INSERT INTO markers (id, map_id, object_id) VALUES ('m2', 'map1', 'obj2')"
+        )
+        db_connection.execute(
+            """
+            INSERT INTO moving_features (id, marker_id, t_start, t_end, trajectory, properties)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (
+                "legacy",
+                "m2",
+                0.0,
+                90.0,
+                json.dumps(keyframes_to_mfjson(trajectory)),
+                "{}",
+            ),
+        )
+        db_connection.commit()
+
+        results = {
+            object_id: (tid, kfs)
+            for object_id, tid, kfs in repo.get_by_map_id_in_range("map1", 35.0, 52.0)
+        }
+        assert results[marker_id][0] == traj_id
+        assert [kf.t for kf in results[marker_id][1]] == [30.0, 40.0, 50.0, 60.0]
+        assert [kf.t for kf in results["obj2"][1]] == [30.0, 40.0, 50.0, 60.0]
+
+        window = results[marker_id][1]
+        for t in (35.0, 41.5, 50.0, 52.0):
+            assert interpolate_position(window, t) == interpolate_position(
+                trajectory, t
+            )
+
+        # Windows past the end still return the last keyframe to clamp to
+        after = repo.get_by_map_id_in_range("map1", 200.0, 300.0)
+        assert [[kf.t for kf in kfs] for _, _, kfs in after] == [[90.0], [90.0]]
+
+    def test_map_keyframes_loaded_in_one_query(self, repo, db_connection, setup_data):
+        for i in range(5):
+            db_connection.execute(
+                "INSERT INTO markers (id, map_id, object_id) VALUES (?, 'map1', ?)",
+                (f"mk{i}", f"obj{i}"),
+            )
+            repo.insert(
+                f"mk{i}",
+                [Keyframe(t=float(t), x=i / 10, y=t / 100) for t in (20, 0, 10)],
+            )
+        db_connection.commit()
+
+        statements = []
+        db_connection.set_trace_callback(statements.append)
+        try:
+            full = repo.get_by_map_id("map1")
+            windowed = repo.get_by_map_id_in_range("map1", 5.0, 15.0)
+        finally:
+            db_connection.set_trace_callback(None)
+
+        keyframe_queries = [s for s in statements if "trajectory_keyframes" in s]
+        assert len(keyframe_queries) == 2
+
+        assert len(full) == 5
+        for object_id, _, kfs in full:
+            i = int(object_id[3:])
+            assert [kf.t for kf in kfs] == [0.0, 10.0, 20.0]
+            assert all(kf.x == i / 10 for kf in kfs)
+        assert [[kf.t for kf in kfs] for _, _, kfs in windowed] == [
+            [0.0, 10.0, 20.0]
+        ] * 5
+
+    def test_export_mfjson(self, repo, setup_data):
+        marker_id = setup_data["marker_id"]
+        trajectory = [Keyframe(t=10.0, x=0.1, y=0.2), Keyframe(t=0.0, x=0.3, y=0.4)]
+        traj_id = repo.insert(marker_id, trajectory)
+
+        assert repo.export_mfjson(traj_id) == {
+            "type": "MovingPoint",
+            "coordinates": [[0.3, 0.4], [0.1, 0.2]],
+            "datetimes": [0.0, 10.0],
+        }
+        with pytest.raises(ValueError, match="Trajectory not found"):
+            repo.export_mfjson("missing")
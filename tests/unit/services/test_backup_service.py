@@ -435,3 +435,120 @@ def test_backup_config_defaults():
     assert config.manual_retention_count == -1  # Unlimited
     assert config.verify_after_backup is True
     assert config.vacuum_before_backup is False
+
+
+@pytest.mark.unit
+def test_backup_includes_uncommitted_wal_content(backup_service, tmp_path):
+    """Test that a backup of an open WAL database includes its WAL pages."""
+    from src.core.events import Event
+
+    db_path = tmp_path / "live.kraken"
+    service = DatabaseService(str(db_path))
+    service.connect()
+    service.insert_event(Event(name="Live Event", lore_date=1.0))
+
+    try:
+        metadata = backup_service.create_backup(db_path=db_path)
+    finally:
+        service.close()
+
+    assert metadata is not None
+    restored_db = tmp_path / "restored.kraken"
+    assert backup_service.restore_backup(metadata.backup_path, restored_db)
+
+    restored = DatabaseService(str(restored_db))
+    restored.connect()
+    assert [e.name for e in restored.get_all_events()] == ["Live Event"]
+    restored.close()
+
+
+@pytest.mark.unit
+def test_backup_reports_page_progress(backup_service, temp_db):
+    """Test that create_backup reports copied/total pages."""
+    calls = []
+
+    metadata = backup_service.create_backup(
+        db_path=temp_db,
+        progress_callback=lambda done, total: calls.append((done, total)),
+    )
+
+    assert metadata is not None
+    assert calls
+    assert calls[-1][0] == calls[-1][1]
+
+
+@pytest.fixture
+def incremental_service(tmp_path):
+    """Creates a backup service storing incremental backups."""
+    config = BackupConfig(
+        backup_dir=tmp_path / "backups",
+        auto_save_retention_count=2,
+        verify_after_backup=True,
+        incremental_backup=True,
+    )
+    return BackupService(config)
+
+
+@pytest.mark.unit
+def test_incremental_backup_restore(incremental_service, temp_db, tmp_path):
+    """Test that an incremental backup is stored as a manifest and restores."""
+    metadata = incremental_service.create_backup(db_path=temp_db)
+
+    assert metadata is not None
+    assert metadata.backup_path.suffix == ".kmanifest"
+    assert metadata.size == temp_db.stat().st_size
+    assert len(metadata.checksum) == 64
+    assert incremental_service.verify_backup(metadata.backup_path)
+
+    restored_db = tmp_path / "restored.kraken"
+    assert incremental_service.restore_backup(metadata.backup_path, restored_db)
+    assert incremental_service._calculate_checksum(restored_db) == metadata.checksum
+
+    service = DatabaseService(str(restored_db))
+    service.connect()
+    assert [e.name for e in service.get_all_events()] == ["Test Event"]
+    service.close()
+
+
+@pytest.mark.unit
+def test_incremental_backup_corrupted_chunk(incremental_service, temp_db, tmp_path):
+    """Test that a damaged chunk fails verification and restore."""
+    metadata = incremental_service.create_backup(db_path=temp_db)
+    chunk_path = next((tmp_path / "backups" / "store" / "chunks").glob("*/*"))
+    chunk_path.write_bytes(b"corrupted")
+
+    assert incremental_service.verify_backup(metadata.backup_path) is False
+    assert (
+        incremental_service.restore_backup(
+            metadata.backup_path, tmp_path / "restored.kraken"
+        )
+        is False
+    )
+    assert not (tmp_path / "restored.kraken").exists()
+
+
+@pytest.mark.unit
+def test_incremental_retention_collects_chunks(incremental_service, temp_db):
+    """Test that chunks of expired incremental backups are deleted."""
+    from src.core.events import Event
+
+    for i in range(4):
+        service = DatabaseService(str(temp_db))
+        service.connect()
+        service.insert_event(Event(name=f"Event {i}", lore_date=float(i)))
+        service.close()
+        incremental_service.create_backup(
+            db_path=temp_db, backup_type=BackupType.AUTO_SAVE
+        )
+        time.sleep(1.1)  # Auto-save filenames have second resolution
+
+    backups = incremental_service.list_backups(BackupType.AUTO_SAVE)
+    assert len(backups) == 2
+
+    store = incremental_service._get_chunk_store()
+    live = set()
+    for backup in backups:
+        live.update(store.load_manifest(backup.backup_path)["chunks"])
+    stored = {p.name for p in (store.root / "chunks").glob("*/*")}
+    assert stored == live
+    assert all(incremental_service.verify_backup(b.backup_path) for b in backups)
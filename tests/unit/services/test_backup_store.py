@@ -0,0 +1,60 @@
+"""
+Unit tests for the incremental backup ChunkStore.
+"""
+
+import pytest
+
+from src.services.backup_store import ChunkStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Creates a chunk store with small chunks."""
+    return ChunkStore(tmp_path / "store", chunk_size=4096)
+
+
+@pytest.mark.unit
+def test_unchanged_chunks_are_shared(store, tmp_path):
+    """Test that a second snapshot only writes the chunks that changed."""
+    data = bytearray(b"".join(bytes([i]) * 4096 for i in range(8)))
+    snapshot = tmp_path / "snapshot.bin"
+    snapshot.write_bytes(data)
+    first = store.add_snapshot(snapshot, tmp_path / "first.kmanifest")
+
+    data[5 * 4096 + 10] ^= 0xFF
+    snapshot.write_bytes(data + b"tail")
+    second = store.add_snapshot(snapshot, tmp_path / "second.kmanifest")
+
+    assert len(first.new_chunks) == 8
+    assert len(second.chunks) == 9
+    assert second.new_chunks == [second.chunks[5], second.chunks[8]]
+    assert second.size == len(data) + 4
+
+
+@pytest.mark.unit
+def test_restore_reassembles_snapshot(store, tmp_path):
+    """Test that restore reproduces the original bytes."""
+    snapshot = tmp_path / "snapshot.bin"
+    snapshot.write_bytes(bytes(range(256)) * 100)
+    stored = store.add_snapshot(snapshot, tmp_path / "a.kmanifest")
+
+    target = tmp_path / "restored.bin"
+    store.restore(stored.manifest_path, target)
+
+    assert target.read_bytes() == snapshot.read_bytes()
+    assert store.verify(stored.manifest_path)
+    assert store.verify_chunks(stored.new_chunks)
+
+
+@pytest.mark.unit
+def test_collect_garbage_keeps_live_chunks(store, tmp_path):
+    """Test that only unreferenced chunks are deleted."""
+    snapshot = tmp_path / "snapshot.bin"
+    snapshot.write_bytes(b"a" * 4096 + b"b" * 4096)
+    old = store.add_snapshot(snapshot, tmp_path / "old.kmanifest")
+    snapshot.write_bytes(b"a" * 4096 + b"c" * 4096)
+    new = store.add_snapshot(snapshot, tmp_path / "new.kmanifest")
+
+    old.manifest_path.unlink()
+    assert store.collect_garbage([new.manifest_path]) == 1
+    assert store.verify(new.manifest_path)
@@ -0,0 +1,345 @@
+"""
+Tests for the IVF approximate nearest neighbour index.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pytest
+
+from src.core.entities import Entity
+from src.services.ann_index import IVFIndex, index_path
+from src.services.search_service import (
+    OBJECT_TYPE_CODES,
+    EmbeddingProvider,
+    SearchService,
+    clear_embedding_cache,
+    create_search_service,
+    default_index_dir,
+    embeddings_fingerprint,
+    normalize_vector,
+)
+
+
+class MockEmbeddingProvider(EmbeddingProvider):
+    """Deterministic provider hashing characters into a small vector."""
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), 32), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for i, char in enumerate(text):
+                vectors[row, (ord(char) + i) % 32] += 1.0
+        return vectors
+
+    def get_dimension(self) -> int:
+        return 32
+
+    def get_model_name(self) -> str:
+        return "mock:ann"
+
+
+def _clustered_vectors(n=600, dim=16, clusters=12, seed=1):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim))
+    points = centers[rng.integers(0, clusters, n)] + 0.1 * rng.normal(size=(n, dim))
+    points /= np.linalg.norm(points, axis=1, keepdims=True)
+    return points.astype(np.float32)
+
+
+FINGERPRINT = {"entity": (300, 1.0), "event": (300, 2.0)}
+
+
+@pytest.fixture
+def ivf_index():
+    vectors = _clustered_vectors()
+    ids = [f"emb-{i}" for i in range(len(vectors))]
+    type_codes = np.array(
+        [OBJECT_TYPE_CODES["entity" if i % 2 else "event"] for i in range(len(ids))],
+        dtype=np.int8,
+    )
+    return IVFIndex.build("mock", 16, vectors, ids, type_codes, fingerprint=FINGERPRINT)
+
+
+def test_build_partitions_all_vectors(ivf_index):
+    """Test that every vector lands in exactly one list."""
+    assert len(ivf_index) == 600
+    assert ivf_index.offsets[0] == 0
+    assert ivf_index.offsets[-1] == 600
+    assert np.all(np.diff(ivf_index.offsets) >= 0)
+    assert sorted(ivf_index.embedding_ids) == sorted(f"emb-{i}" for i in range(600))
+
+
+def test_search_exact_when_probing_all_lists(ivf_index):
+    """Test that probing every list matches brute force."""
+    query = ivf_index.vectors[0]
+    exact = np.argsort(-(ivf_index.vectors @ query))[:5]
+
+    hits = ivf_index.search(query, 5, n_probe=ivf_index.n_lists)
+
+    assert [eid for _, eid in hits] == [ivf_index.embedding_ids[i] for i in exact]
+
+
+def test_search_object_type_filter(ivf_index):
+    """Test that type filtering only returns matching rows."""
+    hits = ivf_index.search(ivf_index.vectors[3], 20, object_type="entity")
+
+    assert hits
+    for _, eid in hits:
+        assert int(eid.split("-")[1]) % 2 == 1
+
+
+def test_evaluate_reports_recall_and_latency(ivf_index):
+    """Test recall/latency reporting against brute force."""
+    stats = ivf_index.evaluate(top_k=5, n_queries=20, n_probe=ivf_index.n_lists)
+
+    assert stats["recall"] == pytest.approx(1.0)
+    assert stats["ann_ms"] >= 0.0
+    assert stats["brute_force_ms"] >= 0.0
+
+
+def test_save_and_load_memory_mapped(ivf_index, tmp_path):
+    """Test round-tripping an index through disk."""
+    path = index_path(tmp_path, "lmstudio:model/v1")
+    assert path.name == "lmstudio_model_v1.index"
+
+    ivf_index.save(path)
+    loaded = IVFIndex.load(path)
+
+    assert loaded is not None
+    assert isinstance(loaded.vectors, np.memmap)
+    assert loaded.fingerprint == FINGERPRINT
+    assert loaded.embedding_ids == ivf_index.embedding_ids
+    query = ivf_index.vectors[10]
+    assert loaded.search(query, 5) == ivf_index.search(query, 5)
+
+    meta = IVFIndex.read_metadata(path)
+    assert meta["count"] == 600
+    assert meta["n_lists"] == ivf_index.n_lists
+
+
+def test_save_replaces_legacy_metadata_file(ivf_index, tmp_path):
+    """Test that an old JSON-only index file is replaced."""
+    path = tmp_path / "mock.index"
+    path.write_text(json.dumps({"model": "mock", "count": 1}))
+
+    assert IVFIndex.load(path) is None
+    ivf_index.save(path)
+    assert IVFIndex.load(path) is not None
+
+
+def test_save_over_memory_mapped_index(ivf_index, tmp_path, monkeypatch):
+    """Test that saving never deletes data a loaded index still maps."""
+    path = tmp_path / "mock.index"
+    ivf_index.save(path)
+    mapped = IVFIndex.load(path)
+    query = ivf_index.vectors[10]
+    expected = mapped.search(query, 5)
+
+    # Emulate Windows, which refuses to delete memory-mapped files
+    def refuse(entry, *args, **kwargs):
+        raise PermissionError(f"in use: {entry}")
+
+    monkeypatch.setattr("src.services.ann_index.shutil.rmtree", refuse)
+    ivf_index.n_probe = 2
+    ivf_index.save(path)
+
+    assert mapped.search(query, 5) == expected
+    assert IVFIndex.load(path).n_probe == 2
+    assert len(list(path.iterdir())) == 3  # meta.json, old and new data
+
+    monkeypatch.undo()
+    ivf_index.save(path)
+    assert len(list(path.iterdir())) == 2
+    assert IVFIndex.load(path) is not None
+
+
+def test_build_rejects_empty():
+    """Test that building without vectors fails."""
+    with pytest.raises(ValueError):
+        IVFIndex.build(
+            "mock", 4, np.empty((0, 4), dtype=np.float32), [], np.empty(0, np.int8)
+        )
+
+
+@pytest.fixture
+def file_search_service(tmp_path):
+    """Create a search service on a file-backed database."""
+    conn = sqlite3.connect(str(tmp_path / "world.kraken"))
+    conn.row_factory = sqlite3.Row
+    conn.executescript(
+        """
+        CREATE TABLE entities (
+            id TEXT PRIMARY KEY, type TEXT NOT NULL, name TEXT NOT NULL,
+            description TEXT, attributes JSON DEFAULT '{}',
+            created_at REAL, modified_at REAL
+        );
+        CREATE TABLE tags (id TEXT PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+        CREATE TABLE entity_tags (entity_id TEXT, tag_id TEXT);
+        CREATE TABLE embeddings (
+            id TEXT PRIMARY KEY, object_type TEXT NOT NULL,
+            object_id TEXT NOT NULL, model TEXT NOT NULL, vector BLOB NOT NULL,
+            vector_dim INTEGER NOT NULL, text_snippet TEXT, text_hash TEXT,
+            metadata JSON DEFAULT '{}', created_at REAL NOT NULL
+        );
+        CREATE UNIQUE INDEX uq_embeddings_obj_model
+            ON embeddings(object_type, object_id, model);
+        """
+    )
+    service = SearchService(conn, MockEmbeddingProvider())
+    for i in range(40):
+        entity = Entity(name=f"Entity {i}" + "a" * i, type="test")
+        conn.execute(
+            "INSERT INTO entities (id, type, name, attributes) VALUES (?, ?, ?, ?)",
+            (entity.id, entity.type, entity.name, "{}"),
+        )
+        service.index_entity(entity.id)
+    conn.commit()
+    yield service
+    conn.close()
+    clear_embedding_cache()
+
+
+def test_search_service_uses_fresh_ann_index(file_search_service, tmp_path):
+    """Test that queries use a fresh on-disk index and skip stale ones."""
+    service = file_search_service
+    assert service.index_dir == tmp_path / "indexes"
+
+    index = service.build_ann_index(n_lists=4)
+    assert index is not None
+    assert service.get_ann_index_path().is_dir()
+
+    fingerprint = index.fingerprint
+    assert service._get_ann_index(service.model, fingerprint) is not None
+
+    # Results agree with exact search when every list is probed
+    index.n_probe = index.n_lists
+    query = normalize_vector(service.provider.embed(["Entity aaaa"])[0])
+    matrix = service._get_matrix(service.model)
+    assert index.search(query, 5) == matrix.search(query, 5)
+    assert len(service.query("Entity aaaa", top_k=5)) == 5
+
+    # A new embedding makes the index stale; queries fall back to exact search
+    entity = Entity(name="Late arrival", type="test")
+    service.conn.execute(
+        "INSERT INTO entities (id, type, name, attributes) VALUES (?, ?, ?, ?)",
+        (entity.id, entity.type, entity.name, "{}"),
+    )
+    service.index_entity(entity.id)
+
+    fingerprint = embeddings_fingerprint(service.conn, service.model)
+    assert service._get_ann_index(service.model, fingerprint) is None
+    results = service.query("Late arrival", top_k=50)
+    assert entity.id in {r["object_id"] for r in results}
+
+
+def test_created_services_use_the_world_index(
+    file_search_service, tmp_path, monkeypatch
+):
+    """Test that services from create_search_service find the world's index."""
+    monkeypatch.setattr(
+        "src.services.search_service.create_provider",
+        lambda provider_name, model: MockEmbeddingProvider(),
+    )
+    file_search_service.build_ann_index(n_lists=4)
+
+    service = create_search_service(file_search_service.conn)
+
+    assert service.index_dir == default_index_dir(str(tmp_path / "world.kraken"))
+    assert service.get_ann_index_path() == index_path(tmp_path / "indexes", "mock:ann")
+    fingerprint = embeddings_fingerprint(service.conn, service.model)
+    assert service._get_ann_index(service.model, fingerprint) is not None
+
+
+def test_ann_registry_is_bounded_and_drops_stale_indexes(
+    file_search_service, monkeypatch
+):
+    """Test that replaced, deleted and least recently used indexes are released."""
+    from src.services import search_service as module
+
+    service = file_search_service
+    service.build_ann_index(n_lists=4)
+    fingerprint = embeddings_fingerprint(service.conn, service.model)
+    key = str(service.get_ann_index_path())
+
+    first = service._get_ann_index(service.model, fingerprint)
+    assert module._ann_registry[key][1] is first
+
+    # A rebuilt index replaces the registry entry
+    service.build_ann_index(n_lists=4)
+    second = service._get_ann_index(service.model, fingerprint)
+    assert second is not first
+    assert list(module._ann_registry) == [key]
+
+    # A deleted index is dropped
+    (service.get_ann_index_path() / "meta.json").unlink()
+    assert service._get_ann_index(service.model, fingerprint) is None
+    assert key not in module._ann_registry
+
+    # Only the most recently used indexes stay mapped
+    monkeypatch.setattr(module, "MAX_CACHED_ANN_INDEXES", 2)
+    for name in ("a", "b", "c"):
+        service.index_dir = service.index_dir.parent / name
+        service.build_ann_index(n_lists=4)
+        service._get_ann_index(service.model, fingerprint)
+    assert [Path(p).parent.name for p in module._ann_registry] == ["b", "c"]
+
+
+def test_rebuild_survives_ann_build_failure(file_search_service, monkeypatch):
+    """Test that a failing index build does not fail the embedding rebuild."""
+    service = file_search_service
+    monkeypatch.setattr("src.services.search_service.ANN_MIN_VECTORS", 1)
+
+    def fail(*args, **kwargs):
+        raise PermissionError("index in use")
+
+    monkeypatch.setattr(service, "build_ann_index", fail)
+
+    counts = service.rebuild_index(object_types=["entity"])
+
+    assert counts == {"entity": 40}
+
+
+def _insert_raw_embedding(conn, object_type, model):
+    conn.execute(
+        """
+        INSERT INTO embeddings (id, object_type, object_id, model, vector,
+                                vector_dim, created_at)
+        VALUES (?, ?, ?, ?, x'00', 1, 99.0)
+        """,
+        (f"raw-{object_type}-{model}", object_type, "raw", model),
+    )
+    conn.commit()
+
+
+def test_ann_index_survives_unrelated_writes(
+    file_search_service, tmp_path, monkeypatch
+):
+    """Test that writes for other models or types keep the index in use."""
+    service = file_search_service
+    service.build_ann_index(n_lists=4)
+    searches = []
+    original_search = IVFIndex.search
+
+    def counting_search(self, *args, **kwargs):
+        searches.append(args)
+        return original_search(self, *args, **kwargs)
+
+    monkeypatch.setattr(IVFIndex, "search", counting_search)
+
+    # Another model's embedding does not touch this model's fingerprint
+    _insert_raw_embedding(service.conn, "entity", "other-model")
+    fingerprint = embeddings_fingerprint(service.conn, service.model)
+    assert service._get_ann_index(service.model, fingerprint) is not None
+    service.query("Entity aaaa", top_k=5)
+    assert len(searches) == 1
+
+    # An event embedding only invalidates queries that include events
+    _insert_raw_embedding(service.conn, "event", service.model)
+    fingerprint = embeddings_fingerprint(service.conn, service.model)
+    assert service._get_ann_index(service.model, fingerprint) is None
+    assert service._get_ann_index(service.model, fingerprint, "entity") is not None
+    service.query("Entity aaaa", object_type="entity", top_k=5)
+    assert len(searches) == 2
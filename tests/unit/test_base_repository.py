@@ -7,7 +7,11 @@ import sqlite3
 
 import pytest
 
-from src.services.repositories.base_repository import BaseRepository
+from src.services.repositories.base_repository import (
+    SQL_PARAM_BATCH,
+    BaseRepository,
+    param_batches,
+)
 
 
 @pytest.fixture
@@ -216,3 +220,14 @@ def test_roundtrip_json_serialization():
     deserialized = BaseRepository._deserialize_json(serialized)
 
     assert deserialized == original
+
+
+def test_param_batches_split_long_in_lists():
+    """Test that IN-list values are bound in batches of SQL_PARAM_BATCH."""
+    values = [str(i) for i in range(2 * SQL_PARAM_BATCH + 1)]
+
+    batches = list(param_batches(values))
+
+    assert [len(b) for b in batches] == [SQL_PARAM_BATCH, SQL_PARAM_BATCH, 1]
+    assert [v for b in batches for v in b] == values
+    assert list(param_batches([])) == []
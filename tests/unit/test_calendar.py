@@ -580,6 +580,71 @@ class TestCalendarConverterYearVariants:
 
         assert year7_day1 - year6_day1 == 360.0
 
+    def test_year_variant_far_from_epoch(self, year_variant_calendar: CalendarConfig):
+        """Test closed-form year starts around a variant and far past it."""
+        converter = CalendarConverter(year_variant_calendar)
+
+        # Years 1-11999 are 360 days except Year 5 (180 days)
+        expected = 11999 * 360.0 - 180.0
+        date = CalendarDate(year=12000, month=3, day=10, time_fraction=0.25)
+
+        float_val = converter.to_float(date)
+        result = converter.from_float(float_val)
+
+        assert float_val == expected + 60 + 9 + 0.25
+        assert (result.year, result.month, result.day) == (12000, 3, 10)
+        assert converter.from_float(1440.0).year == 5
+        assert converter.from_float(1619.5).year == 5
+        assert converter.from_float(1620.0).year == 6
+
+    def test_pre_epoch_variant(self, simple_calendar: CalendarConfig):
+        """Test a variant year before the Epoch shifts earlier years only."""
+        simple_calendar.year_variants = [
+            YearVariant(
+                year=-2,
+                months=[MonthDefinition(name="Short", abbreviation="S", days=10)],
+            )
+        ]
+        converter = CalendarConverter(simple_calendar)
+
+        assert converter.to_float(CalendarDate(year=-1, month=1, day=1)) == -720.0
+        assert converter.to_float(CalendarDate(year=-2, month=1, day=1)) == -730.0
+        assert converter.to_float(CalendarDate(year=-3, month=1, day=1)) == -1090.0
+
+        result = converter.from_float(-725.0)
+        assert (result.year, result.month, result.day) == (-2, 1, 6)
+        assert result.month_name == "Short"
+
+
+class TestCalendarConverterBulk:
+    """Tests for the vectorized to_float_many/from_float_many helpers."""
+
+    def test_many_matches_scalar(self, year_variant_calendar: CalendarConfig):
+        """Test that bulk conversion agrees with the scalar methods."""
+        converter = CalendarConverter(year_variant_calendar)
+        values = [-1000.5, -360.0, -1.0, 0.0, 1439.99, 1440.0, 1619.5, 1620.0]
+        values += [4321000.75]
+
+        dates = converter.from_float_many(values)
+        floats = converter.to_float_many(dates)
+
+        for value, date, float_val in zip(values, dates, floats):
+            scalar = converter.from_float(value)
+            assert (date.year, date.month, date.day) == (
+                scalar.year,
+                scalar.month,
+                scalar.day,
+            )
+            assert date.month_name == scalar.month_name
+            assert float_val == pytest.approx(value, abs=1e-6)
+
+    def test_many_empty(self, simple_calendar: CalendarConfig):
+        """Test that empty inputs produce empty outputs."""
+        converter = CalendarConverter(simple_calendar)
+
+        assert converter.from_float_many([]) == []
+        assert len(converter.to_float_many([])) == 0
+
 
 # ---------------------------------------------------------------------------
 # Format Date Tests
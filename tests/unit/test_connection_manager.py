@@ -62,6 +62,8 @@ def mock_main_window(qapp):
     window.load_entity_details = Mock()
     window._on_events_ready = Mock()
     window._on_entities_ready = Mock()
+    window._on_events_patched = Mock()
+    window._on_entities_patched = Mock()
     window._on_suggestions_update = Mock()
     window._on_event_details_ready = Mock()
     window._on_entity_details_ready = Mock()
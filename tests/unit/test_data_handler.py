@@ -8,7 +8,7 @@ instead of directly manipulating MainWindow.
 import pytest
 
 from src.app.data_handler import DataHandler
-from src.commands.base_command import CommandResult
+from src.commands.base_command import ChangeSet, CommandResult
 from src.core.entities import Entity
 from src.core.events import Event
 
@@ -234,6 +234,102 @@ class TestDataHandlerSignals:
         # Verify markers reload signal was emitted
         assert len(reload_markers_signal) == 1
 
+    def test_change_set_requests_incremental_load(self, data_handler, qtbot):
+        """Test that commands with a ChangeSet skip the full reloads."""
+        requested = []
+        reloads = []
+        data_handler.changes_requested.connect(requested.append)
+        data_handler.reload_events.connect(lambda: reloads.append("events"))
+        data_handler.reload_markers_for_current_map.connect(
+            lambda: reloads.append("markers")
+        )
+
+        changes = ChangeSet.single("updated", "event", "event1")
+        result = CommandResult(
+            success=True, command_name="UpdateEventCommand", changes=changes
+        )
+        data_handler.on_command_finished(result)
+
+        assert requested == [changes]
+        assert reloads == []
+
+    def test_changes_loaded_patches_cache_in_order(
+        self, data_handler, sample_events, qtbot
+    ):
+        """Test that changed rows are merged into the cache in date order."""
+        data_handler.on_events_loaded(sample_events)
+        patches = []
+        data_handler.events_patched.connect(
+            lambda all_, up, deleted: patches.append((all_, up, deleted))
+        )
+
+        moved = Event(id="event1", name="Event 1", lore_date=300.0)
+        created = Event(id="event3", name="Event 3", lore_date=150.0)
+        data_handler.on_changes_loaded(
+            {
+                "events": [moved, created],
+                "entities": [],
+                "deleted_events": [],
+                "deleted_entities": [],
+            }
+        )
+
+        assert [e.id for e in data_handler._cached_events] == [
+            "event3",
+            "event2",
+            "event1",
+        ]
+        assert patches[0][1] == [moved, created]
+
+    def test_changes_loaded_updates_marker_labels(
+        self, data_handler, sample_entities, qtbot
+    ):
+        """Test that renamed and deleted objects relabel their markers."""
+        data_handler.on_entities_loaded(sample_entities)
+        labels = []
+        data_handler.marker_labels_changed.connect(labels.extend)
+
+        renamed = Entity(id="entity1", name="Renamed", type="character")
+        data_handler.on_changes_loaded(
+            {
+                "events": [],
+                "entities": [renamed],
+                "deleted_events": [],
+                "deleted_entities": ["entity2"],
+            }
+        )
+
+        assert {d["object_id"]: d["label"] for d in labels} == {
+            "entity1": "Renamed",
+            "entity2": "Unknown",
+        }
+        assert [e.id for e in data_handler._cached_entities] == ["entity1"]
+
+    def test_pending_selection_after_patch(self, data_handler, qtbot):
+        """Test that a created item is selected once its patch arrives."""
+        selection_signal = []
+        data_handler.selection_requested.connect(
+            lambda t, i: selection_signal.append((t, i))
+        )
+
+        result = CommandResult(
+            success=True,
+            command_name="CreateEntityCommand",
+            data={"id": "entity9"},
+            changes=ChangeSet.single("created", "entity", "entity9"),
+        )
+        data_handler.on_command_finished(result)
+        data_handler.on_changes_loaded(
+            {
+                "events": [],
+                "entities": [Entity(id="entity9", name="New", type="character")],
+                "deleted_events": [],
+                "deleted_entities": [],
+            }
+        )
+
+        assert selection_signal == [("entity", "entity9")]
+
 
 class TestDataHandlerDecoupling:
     """Test that DataHandler is properly decoupled from MainWindow."""
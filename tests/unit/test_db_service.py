@@ -141,3 +141,36 @@ def test_get_tags_with_events(db_service):
     assert "EntityTag" in all_tag_names
     assert "SharedTag" in all_tag_names
     assert "UnusedTag" in all_tag_names
+
+
+def test_get_temporal_relations_single_query(db_service):
+    """Test that temporal relations for entities are loaded with event dates."""
+    hero = Entity(name="Hero", type="character")
+    villain = Entity(name="Villain", type="character")
+    battle = Event(name="Battle", lore_date=42.0)
+    db_service.insert_entity(hero)
+    db_service.insert_entity(villain)
+    db_service.insert_event(battle)
+
+    anchored = db_service.insert_relation(
+        battle.id,
+        hero.id,
+        "involved",
+        {"valid_from_event": True, "payload": {"status": "Wounded"}},
+    )
+    manual = db_service.insert_relation(
+        villain.id, villain.id, "self", {"valid_from": 10.0, "payload": {"a": 1}}
+    )
+    db_service.insert_relation(battle.id, villain.id, "involved", {})
+    db_service.insert_relation(hero.id, battle.id, "caused", {"valid_from": 1.0})
+
+    relations = db_service.get_temporal_relations()
+    by_id = {rel["id"]: rel for rel in relations}
+
+    assert set(by_id) == {anchored, manual}
+    assert by_id[anchored]["source_event_date"] == 42.0
+    assert by_id[manual]["attributes"]["payload"] == {"a": 1}
+
+    subset = db_service.get_temporal_relations([hero.id])
+    assert [rel["id"] for rel in subset] == [anchored]
+    assert db_service.get_temporal_relations([]) == []
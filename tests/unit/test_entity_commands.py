@@ -39,6 +39,7 @@ def test_create_entity_success(mock_db, sample_entity):
     inserted = mock_db.insert_entity.call_args[0][0]
     assert inserted.name == sample_entity.name
     assert cmd._is_executed is True
+    assert result.changes.upserted_ids("entity") == {inserted.id}
 
 
 def test_create_entity_undo(mock_db, sample_entity):
@@ -103,6 +104,7 @@ def test_delete_entity_success(mock_db, sample_entity):
     mock_db.delete_entity.assert_called_once_with(sample_entity.id)
     assert cmd._is_executed is True
     assert cmd._backup_entity == sample_entity
+    assert result.changes.deleted_ids("entity") == {sample_entity.id}
 
 
 def test_delete_entity_undo(mock_db, sample_entity):
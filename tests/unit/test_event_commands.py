@@ -41,6 +41,7 @@ def test_create_event_success(mock_db, sample_event):
     inserted_event = mock_db.insert_event.call_args[0][0]
     assert inserted_event.name == sample_event.name
     assert cmd._is_executed is True
+    assert result.changes.created == {"event": {inserted_event.id}}
 
 
 def test_create_event_failure(mock_db, sample_event):
@@ -176,6 +177,7 @@ def test_delete_event_success(mock_db, sample_event):
     mock_db.delete_event.assert_called_once_with(sample_event.id)
     assert cmd._is_executed is True
     assert cmd._backup_event == sample_event
+    assert result.changes.deleted_ids("event") == {sample_event.id}
 
 
 def test_delete_event_not_found(mock_db):
@@ -16,7 +16,7 @@ def list_widget(app):
     return widget
 
 
-def test_search_matches_description(list_widget):
+def test_search_matches_description(list_widget, qtbot):
     event = Event(
         name="Generic Event",
         lore_date=100.0,
@@ -25,40 +25,47 @@ def test_search_matches_description(list_widget):
     list_widget.set_data([event], [])
 
     list_widget.search_bar.setText("Secret")
-    assert list_widget.list_widget.count() == 1
+    qtbot.waitUntil(lambda: not list_widget._search_timer.isActive())
+    assert list_widget.proxy_model.rowCount() == 1
 
     list_widget.search_bar.setText("Nothing")
-    assert list_widget.list_widget.count() == 0
+    qtbot.waitUntil(lambda: not list_widget._search_timer.isActive())
+    assert list_widget.proxy_model.rowCount() == 0
 
 
-def test_search_matches_tags(list_widget):
+def test_search_matches_tags(list_widget, qtbot):
     event = Event(name="Tagged Event", lore_date=100.0)
     event.tags = ["urgent", "classified"]
     list_widget.set_data([event], [])
 
     list_widget.search_bar.setText("urgent")
-    assert list_widget.list_widget.count() == 1
+    qtbot.waitUntil(lambda: not list_widget._search_timer.isActive())
+    assert list_widget.proxy_model.rowCount() == 1
 
     list_widget.search_bar.setText("random")
-    assert list_widget.list_widget.count() == 0
+    qtbot.waitUntil(lambda: not list_widget._search_timer.isActive())
+    assert list_widget.proxy_model.rowCount() == 0
 
 
-def test_search_matches_attributes(list_widget):
+def test_search_matches_attributes(list_widget, qtbot):
     entity = Entity(name="Attrib Entity", type="character")
     entity.attributes = {"alias": "The Shadow", "power": 9000}
     list_widget.set_data([], [entity])
 
     list_widget.search_bar.setText("Shadow")
-    assert list_widget.list_widget.count() == 1
+    qtbot.waitUntil(lambda: not list_widget._search_timer.isActive())
+    assert list_widget.proxy_model.rowCount() == 1
 
     # Integers are not searched in current implementation
     list_widget.search_bar.setText("9000")
-    assert list_widget.list_widget.count() == 0
+    qtbot.waitUntil(lambda: not list_widget._search_timer.isActive())
+    assert list_widget.proxy_model.rowCount() == 0
 
 
-def test_search_matches_type(list_widget):
+def test_search_matches_type(list_widget, qtbot):
     entity = Entity(name="Dragon", type="monster")
     list_widget.set_data([], [entity])
 
     list_widget.search_bar.setText("monster")
-    assert list_widget.list_widget.count() == 1
+    qtbot.waitUntil(lambda: not list_widget._search_timer.isActive())
+    assert list_widget.proxy_model.rowCount() == 1
@@ -0,0 +1,146 @@
+"""
+Unit tests for the FTS5 full-text index and its sync triggers.
+"""
+
+import pytest
+
+from src.core.entities import Entity
+from src.core.events import Event
+from src.services.db_service import DatabaseService
+from src.services.fulltext_index import (
+    build_match_query,
+    fulltext_index_is_current,
+    rebuild_fulltext_index,
+    search_fulltext,
+)
+
+
+@pytest.fixture
+def db_service(tmp_path):
+    service = DatabaseService(str(tmp_path / "fulltext.kraken"))
+    service.connect()
+    yield service
+    service.close()
+
+
+def ids(results):
+    return [r["object_id"] for r in results]
+
+
+class TestBuildMatchQuery:
+    def test_words_become_prefix_terms(self):
+        assert build_match_query("iron cro") == '"iron"* AND "cro"*'
+
+    def test_quoted_phrases_are_kept(self):
+        assert build_match_query('"iron crown" king') == '"iron crown" AND "king"*'
+
+    def test_exact_any_terms(self):
+        assert (
+            build_match_query("iron crown", prefix=False, match_all=False)
+            == '"iron" OR "crown"'
+        )
+
+    def test_operators_are_escaped(self):
+        assert build_match_query('NOT a"b') == '"NOT"* AND "a""b"*'
+
+    def test_empty_input(self):
+        assert build_match_query('  "" ') == ""
+
+
+class TestFulltextIndex:
+    def test_indexes_name_description_and_attributes(self, db_service):
+        entity = Entity(
+            name="Aldric the Bold",
+            type="character",
+            description="Sworn knight of the Iron Crown.",
+            attributes={
+                "aliases": ["Old Wolf"],
+                "title": "Lord Commander",
+                "_longform": {"note": "hiddenword"},
+            },
+        )
+        db_service.insert_entity(entity)
+
+        assert ids(db_service.search_text("ald")) == [entity.id]
+        assert ids(db_service.search_text('"iron crown"')) == [entity.id]
+        assert ids(db_service.search_text("wolf")) == [entity.id]
+        assert ids(db_service.search_text("commander")) == [entity.id]
+        assert db_service.search_text("hiddenword") == []
+        assert db_service.search_text('"crown iron"') == []
+
+    def test_updates_and_deletes_are_synced(self, db_service):
+        event = Event(name="Siege of Harrow", lore_date=10.0)
+        db_service.insert_event(event)
+
+        event.name = "Fall of Harrow"
+        db_service.insert_event(event)
+        assert db_service.search_text("siege") == []
+        assert ids(db_service.search_text("fall", object_type="event")) == [event.id]
+
+        db_service.delete_event(event.id)
+        assert db_service.search_text("harrow") == []
+        assert fulltext_index_is_current(db_service._connection)
+
+    def test_tags_are_synced(self, db_service):
+        entity = Entity(name="Mira", type="character")
+        db_service.insert_entity(entity)
+
+        db_service.assign_tag_to_entity(entity.id, "Smuggler")
+        assert ids(db_service.search_text("smuggler")) == [entity.id]
+
+        db_service._connection.execute("UPDATE tags SET name = 'Privateer'")
+        db_service._connection.commit()
+        assert db_service.search_text("smuggler") == []
+        assert ids(db_service.search_text("privateer")) == [entity.id]
+
+        db_service.remove_tag_from_entity(entity.id, "Privateer")
+        assert db_service.search_text("privateer") == []
+
+    def test_name_matches_rank_first(self, db_service):
+        mention = Entity(name="Tower", type="place", description="Built for Vesna.")
+        named = Entity(name="Vesna", type="character")
+        db_service.insert_entity(mention)
+        db_service.insert_entity(named)
+
+        results = db_service.search_text("vesna")
+        assert ids(results) == [named.id, mention.id]
+        assert results[0]["score"] > results[1]["score"]
+
+    def test_object_type_filter_and_any_terms(self, db_service):
+        entity = Entity(name="Harrow Keep", type="place")
+        event = Event(name="Harrow Fair", lore_date=1.0)
+        db_service.insert_entity(entity)
+        db_service.insert_event(event)
+
+        assert ids(db_service.search_text("harrow", object_type="entity")) == [
+            entity.id
+        ]
+        assert db_service.search_text("keep fair") == []
+        assert set(ids(db_service.search_text("keep fair", match_all=False))) == {
+            entity.id,
+            event.id,
+        }
+
+    def test_missing_documents_are_indexed_on_connect(self, db_service):
+        entity = Entity(name="Corvin", type="character")
+        db_service.insert_entity(entity)
+        conn = db_service._connection
+        conn.execute("DELETE FROM search_fts")
+        conn.execute("DELETE FROM search_documents")
+        conn.commit()
+        assert not fulltext_index_is_current(conn)
+
+        db_service.close()
+        db_service.connect()
+        assert ids(db_service.search_text("corvin")) == [entity.id]
+
+    def test_rebuild_handles_invalid_attribute_json(self, db_service):
+        conn = db_service._connection
+        conn.execute(
+            "INSERT INTO entities (id, type, name, attributes) "
+            "VALUES ('broken', 'thing', 'Cracked Urn', '{not json')"
+        )
+        conn.commit()
+
+        assert rebuild_fulltext_index(conn) == 1
+        assert ids(search_fulltext(conn, "urn")) == ["broken"]
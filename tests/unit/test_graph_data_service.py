@@ -204,3 +204,49 @@ class TestGetAllRelationTypes:
         rel_types = service.get_all_relation_types(db_service)
 
         assert rel_types == []
+
+
+class TestGraphSnapshotCache:
+    """Tests for the world-version keyed snapshot cache."""
+
+    def test_filter_changes_reuse_snapshot(self, populated_db, monkeypatch):
+        """Filter-only changes are answered without touching the database."""
+        db = populated_db["db"]
+        service = GraphDataService()
+        snapshot = service.load_snapshot(db)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("snapshot should be cached")
+
+        monkeypatch.setattr(service, "_read_snapshot", fail)
+        nodes, edges = service.get_graph_data(db, include_tags=["major"])
+        assert {n["name"] for n in nodes} == {"Battle of X", "Treaty of Y"}
+        service.get_graph_data(db, include_rel_types=["caused"])
+        assert service.get_all_tags(db) == snapshot.tags
+        assert service.load_snapshot(db) is snapshot
+
+    def test_write_invalidates_snapshot(self, populated_db):
+        """A database write produces a fresh snapshot."""
+        db = populated_db["db"]
+        entities = populated_db["entities"]
+        service = GraphDataService()
+        before = service.load_snapshot(db)
+
+        db.insert_relation(entities[2].id, entities[1].id, "rules")
+
+        assert service.load_snapshot(db) is not before
+        assert "rules" in service.get_all_relation_types(db)
+
+    def test_attribute_keys_and_entity_types(self, db_service):
+        """Attribute keys skip internal keys; entity types are distinct."""
+        entity = Entity(name="A", type="character", attributes={"age": 30})
+        entity.tags = ["hero"]
+        db_service.insert_entity(entity)
+        db_service.insert_entity(Entity(name="B", type="character"))
+        db_service.insert_event(
+            Event(name="E", lore_date=1.0, attributes={"weather": "rain"})
+        )
+
+        service = GraphDataService()
+        assert service.get_all_attribute_keys(db_service) == ["age", "weather"]
+        assert service.get_all_entity_types(db_service) == ["character"]
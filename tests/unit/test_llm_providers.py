@@ -66,6 +66,8 @@ def mock_requests():
     with patch("src.services.providers.lmstudio_provider.requests") as mock:
         mock.exceptions.RequestException = requests.exceptions.RequestException
         mock.exceptions.Timeout = requests.exceptions.Timeout
+        # Route calls made through the provider's session to the same mock
+        mock.Session.return_value = mock
         yield mock
 
 
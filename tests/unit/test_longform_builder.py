@@ -697,3 +697,55 @@ def test_export_longform_to_markdown_title_override(mock_connection):
 
     assert "# Custom Title" in markdown
     assert "Original Name" not in markdown.split("<!--")[1]  # Not in heading
+
+
+def test_has_unindexed_items_matches_ensure_all_items_indexed(db_service):
+    """Test the SQL check agrees with what indexing would add."""
+    conn = db_service._connection
+    conn.executemany(
+        "INSERT INTO events (id, type, name, lore_date, attributes) "
+        "VALUES (?, 'generic', ?, 0, ?)",
+        [
+            ("e1", "Indexed", json.dumps({"_longform": {"default": {"position": 1}}})),
+            ("e2", "Other doc", json.dumps({"_longform": {"notes": {"position": 1}}})),
+        ],
+    )
+    conn.commit()
+    assert longform_builder.has_unindexed_items(conn, "notes")
+    assert longform_builder.has_unindexed_items(conn)
+
+    longform_builder.ensure_all_items_indexed(conn)
+    assert not longform_builder.has_unindexed_items(conn)
+
+    # Empty metadata and unparseable attributes count as missing
+    conn.execute(
+        "INSERT INTO entities (id, type, name, attributes) "
+        "VALUES ('n1', 'npc', 'Bad', 'not json')"
+    )
+    conn.commit()
+    assert longform_builder.has_unindexed_items(conn)
+    longform_builder.ensure_all_items_indexed(conn)
+    assert not longform_builder.has_unindexed_items(conn)
+
+    conn.execute(
+        "UPDATE entities SET attributes = ? WHERE id = 'n1'",
+        (json.dumps({"_longform": {"default": {}}}),),
+    )
+    conn.commit()
+    assert longform_builder.has_unindexed_items(conn)
+
+
+def test_build_longform_sequence_without_indexing(db_service):
+    """Test index_missing=False leaves unindexed items untouched."""
+    conn = db_service._connection
+    conn.execute(
+        "INSERT INTO events (id, type, name, lore_date) "
+        "VALUES ('e1', 'generic', 'New', 0)"
+    )
+    conn.commit()
+
+    assert longform_builder.build_longform_sequence(conn, index_missing=False) == []
+    assert longform_builder.has_unindexed_items(conn)
+    assert [item["id"] for item in longform_builder.build_longform_sequence(conn)] == [
+        "e1"
+    ]
@@ -0,0 +1,158 @@
+"""
+Unit tests for map tile pyramids and the TiledMapItem.
+"""
+
+import os
+
+import pytest
+from PySide6.QtCore import QRectF, Qt
+from PySide6.QtGui import QColor, QImage, QImageReader, QPainter, QPixmap
+from PySide6.QtWidgets import QGraphicsPixmapItem
+
+from src.gui.widgets.map.map_graphics_view import MapGraphicsView
+from src.gui.widgets.map.tile_pyramid import (
+    build_pyramid,
+    level_count,
+    load_pyramid,
+    pyramid_dir,
+)
+from src.gui.widgets.map.tiled_map_item import TileCache, TiledMapItem
+
+
+@pytest.fixture
+def map_image(tmp_path, qapp):
+    """Writes a 300x200 map with a distinct colour per quadrant."""
+    image = QImage(300, 200, QImage.Format.Format_RGB32)
+    image.fill(QColor("red"))
+    painter = QPainter(image)
+    painter.fillRect(150, 0, 150, 100, QColor("green"))
+    painter.fillRect(0, 100, 150, 100, QColor("blue"))
+    painter.fillRect(150, 100, 150, 100, QColor("white"))
+    painter.end()
+
+    path = tmp_path / "assets" / "maps" / "region.png"
+    path.parent.mkdir(parents=True)
+    image.save(str(path))
+    return path
+
+
+@pytest.mark.unit
+def test_level_count():
+    """Test that levels halve until the image fits one tile."""
+    assert level_count(256, 100) == 1
+    assert level_count(257, 100) == 2
+    assert level_count(16384, 16384) == 7
+
+
+@pytest.mark.unit
+def test_build_pyramid_writes_all_levels(map_image):
+    """Test that every tile of every level is written next to the image."""
+    info = build_pyramid(map_image, tile_size=64)
+
+    assert info.root == pyramid_dir(map_image)
+    assert info.root.parent == map_image.parent
+    assert info.levels == 4
+    for level in range(info.levels):
+        cols, rows = info.tile_grid(level)
+        tiles = sorted(p.name for p in (info.root / str(level)).iterdir())
+        assert len(tiles) == cols * rows
+    assert info.tile_grid(0) == (5, 4)
+    assert info.tile_grid(3) == (1, 1)
+
+    edge = QImage(str(info.tile_path(0, 4, 3)))
+    assert (edge.width(), edge.height()) == (44, 8)
+
+
+@pytest.mark.unit
+def test_build_pyramid_restores_allocation_limit(tmp_path, qapp):
+    """Test that the process-wide decode limit is only raised temporarily."""
+    image = QImage(1024, 1024, QImage.Format.Format_RGB32)
+    image.fill(QColor("red"))
+    path = tmp_path / "large.png"
+    image.save(str(path))
+
+    previous = QImageReader.allocationLimit()
+    QImageReader.setAllocationLimit(1)
+    try:
+        info = build_pyramid(path)
+        assert QImageReader.allocationLimit() == 1
+    finally:
+        QImageReader.setAllocationLimit(previous)
+
+    assert info.width == 1024
+
+
+@pytest.mark.unit
+def test_load_pyramid_detects_stale_source(map_image):
+    """Test that a pyramid is ignored after its source image changes."""
+    assert load_pyramid(map_image) is None
+    build_pyramid(map_image, tile_size=64)
+    assert load_pyramid(map_image) is not None
+
+    stat = map_image.stat()
+    os.utime(map_image, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert load_pyramid(map_image) is None
+
+
+@pytest.mark.unit
+def test_cancelled_build_leaves_no_pyramid(map_image):
+    """Test that cancelling discards the partial pyramid."""
+    assert build_pyramid(map_image, tile_size=64, is_cancelled=lambda: True) is None
+    assert load_pyramid(map_image) is None
+    assert not any(p.name.endswith(".tmp") for p in map_image.parent.iterdir())
+
+
+@pytest.mark.unit
+def test_tile_cache_evicts_least_recently_used(qapp):
+    """Test LRU eviction order."""
+    cache = TileCache(capacity=2)
+    cache.put((0, 0, 0), QPixmap(1, 1))
+    cache.put((0, 1, 0), QPixmap(1, 1))
+    cache.get((0, 0, 0))
+    cache.put((0, 2, 0), QPixmap(1, 1))
+
+    assert (0, 0, 0) in cache
+    assert (0, 1, 0) not in cache
+    assert len(cache) == 2
+
+
+@pytest.mark.unit
+def test_tiled_item_level_for_scale(map_image):
+    """Test that zooming out picks coarser levels."""
+    item = TiledMapItem(build_pyramid(map_image, tile_size=64))
+
+    assert item.level_for_scale(2.0) == 0
+    assert item.level_for_scale(1.0) == 0
+    assert item.level_for_scale(0.5) == 1
+    assert item.level_for_scale(0.3) == 1
+    assert item.level_for_scale(0.01) == 3
+
+
+@pytest.mark.unit
+def test_tiled_item_renders_visible_tiles(map_image, qtbot):
+    """Test that the view renders the map from tiles at full resolution."""
+    view = MapGraphicsView()
+    qtbot.addWidget(view)
+    assert view.load_map(str(map_image))
+    assert isinstance(view.pixmap_item, QGraphicsPixmapItem)
+    assert not view._pyramid_workers  # Too small to need tiles
+
+    info = build_pyramid(map_image, tile_size=64)
+    assert view.load_map(str(map_image))
+
+    item = view.pixmap_item
+    assert isinstance(item, TiledMapItem)
+    assert item.boundingRect() == QRectF(0, 0, 300, 200)
+    item.cache = TileCache()
+
+    # Render only the top-left quarter at 1:1
+    target = QImage(150, 100, QImage.Format.Format_RGB32)
+    target.fill(Qt.GlobalColor.black)
+    painter = QPainter(target)
+    view.scene.render(painter, QRectF(0, 0, 150, 100), QRectF(0, 0, 150, 100))
+    painter.end()
+
+    assert QColor(target.pixel(75, 50)) == QColor("red")
+    assert all(key[0] == 0 for key in item.cache._tiles)
+    cols, rows = info.tile_grid(0)
+    assert 0 < len(item.cache) < cols * rows
@@ -401,3 +401,47 @@ def test_mode_indicator_ui(map_widget, qtbot):
 
     assert map_widget.mode_indicator.text() == "Normal Mode"
     assert not map_widget.overlay_banner.isVisible()
+
+
+def test_trajectory_updates_only_push_moved_markers(map_widget):
+    """Markers whose interpolated position is unchanged are not re-pushed."""
+    from src.core.trajectory import Keyframe
+
+    setup_map_with_pixmap(map_widget.view)
+    map_widget.add_marker("moving", "entity", "Moving", 0.0, 0.0)
+    map_widget.add_marker("parked", "entity", "Parked", 0.5, 0.5)
+    map_widget.set_trajectories(
+        [
+            ("moving", "t1", [Keyframe(0, 0.0, 0.0), Keyframe(100, 1.0, 1.0)]),
+            ("parked", "t2", [Keyframe(0, 0.5, 0.5), Keyframe(10, 0.5, 0.5)]),
+        ]
+    )
+
+    map_widget.view.update_marker_position = MagicMock()
+    map_widget.on_time_changed(50.0)
+
+    map_widget.view.update_marker_position.assert_called_once_with("moving", 0.5, 0.5)
+
+
+def test_temporal_state_only_touches_changed_markers(map_view):
+    """Only markers crossing the playhead get their temporal state updated."""
+    setup_map_with_pixmap(map_view)
+    map_view.add_marker("early", "event", "Early", 0.1, 0.1, lore_date=10.0)
+    map_view.add_marker("late", "event", "Late", 0.2, 0.2, lore_date=100.0)
+    map_view.add_marker("timeless", "entity", "Timeless", 0.3, 0.3)
+
+    map_view.update_markers_temporal_state(50.0, 0.0)
+    assert map_view.markers["late"].is_future is True
+    assert map_view.markers["early"].is_past is True
+    assert map_view.markers["timeless"].is_future is False
+    assert map_view.markers["timeless"].is_past is False
+
+    for marker in map_view.markers.values():
+        marker.set_temporal_state = MagicMock()
+    map_view.update_markers_temporal_state(150.0, 0.0)
+
+    map_view.markers["late"].set_temporal_state.assert_called_once_with(
+        is_future=False, is_past=True
+    )
+    map_view.markers["early"].set_temporal_state.assert_not_called()
+    map_view.markers["timeless"].set_temporal_state.assert_not_called()
@@ -0,0 +1,151 @@
+"""
+Unit tests for the render cache and the section renderer.
+"""
+
+import sqlite3
+
+import pytest
+
+from src.core.events import Event
+from src.services.db_service import DatabaseService
+from src.services.render_cache import (
+    RenderCache,
+    load_renders,
+    prune_renders,
+    store_renders,
+)
+from src.webserver.documents import (
+    LongformSection,
+    SectionRenderer,
+    render_section_html,
+)
+
+
+def make_section(index: int, content: str = "") -> LongformSection:
+    content = content or f"Body *{index}*"
+    return LongformSection(
+        id=f"e{index}",
+        table="events",
+        title=f"Event {index}",
+        heading_level=2,
+        content=content,
+        revision=f"rev-{index}-{content}",
+    )
+
+
+@pytest.fixture
+def db_service(tmp_path):
+    service = DatabaseService(str(tmp_path / "renders.kraken"))
+    service.connect()
+    yield service
+    service.close()
+
+
+class TestRenderCache:
+    def test_get_returns_put_value(self):
+        cache = RenderCache()
+        cache.put("e1", "h1", "<p>1</p>")
+        assert cache.get("e1", "h1") == "<p>1</p>"
+        assert cache.get("e1", "h2") is None
+
+    def test_evicts_least_recently_used(self):
+        cache = RenderCache(capacity=2)
+        cache.put("a", "h", "A")
+        cache.put("b", "h", "B")
+        cache.get("a", "h")
+        cache.put("c", "h", "C")
+        assert len(cache) == 2
+        assert cache.get("b", "h") is None
+        assert cache.get("a", "h") == "A"
+
+    def test_invalidate_drops_all_revisions_of_object(self):
+        cache = RenderCache()
+        cache.put("a", "h1", "A1")
+        cache.put("a", "h2", "A2")
+        cache.put("b", "h1", "B")
+        cache.invalidate("a")
+        assert len(cache) == 1
+        assert cache.get("b", "h1") == "B"
+
+    def test_renderer_version_is_part_of_key(self):
+        old = RenderCache(renderer_version=1)
+        old.put("a", "h", "old")
+        new = RenderCache(renderer_version=2)
+        new._entries = old._entries
+        assert new.get("a", "h") is None
+
+
+class TestPersistedRenders:
+    def test_store_and_load_roundtrip(self, db_service):
+        conn = db_service._connection
+        store_renders(conn, {("e1", "h1"): "<p>1</p>", ("e2", "h2"): "<p>2</p>"})
+        found = load_renders(conn, [("e1", "h1"), ("e2", "stale"), ("e3", "h3")])
+        assert found == {("e1", "h1"): "<p>1</p>"}
+
+    def test_store_replaces_older_render_of_object(self, db_service):
+        conn = db_service._connection
+        store_renders(conn, {("e1", "h1"): "old"})
+        store_renders(conn, {("e1", "h2"): "new"})
+        rows = conn.execute(
+            "SELECT content_hash, html FROM rendered_sections"
+        ).fetchall()
+        assert [tuple(row) for row in rows] == [("h2", "new")]
+
+    def test_prune_removes_other_versions_and_deleted_objects(self, db_service):
+        db_service.insert_event(Event(id="e1", name="One", lore_date=1.0))
+        conn = db_service._connection
+        store_renders(conn, {("e1", "h1"): "kept", ("gone", "h"): "orphan"})
+        with conn:
+            conn.execute(
+                "INSERT INTO rendered_sections VALUES ('e1', 'h0', 0, 'v0', 0)"
+            )
+        assert prune_renders(conn) == 2
+        assert load_renders(conn, [("e1", "h1")]) == {("e1", "h1"): "kept"}
+
+
+class TestSectionRenderer:
+    def test_renders_and_caches(self):
+        cache = RenderCache()
+        renderer = SectionRenderer(cache=cache)
+        sections = [make_section(i) for i in range(3)]
+        html = renderer.render(sections)
+        assert html == [s.render_html() for s in sections]
+        assert len(cache) == 3
+
+        cache.put("e0", sections[0].revision, "from cache")
+        assert renderer.render(sections[:1]) == ["from cache"]
+
+    def test_persisted_renders_survive_restart(self, db_service):
+        section = make_section(1)
+        first = SectionRenderer(cache=RenderCache(), db_path=db_service.db_path)
+        first.render([section], db_service._connection)
+
+        cache = RenderCache()
+        second = SectionRenderer(cache=cache, db_path=db_service.db_path)
+        store_renders(
+            db_service._connection,
+            {("e1", section.revision): "persisted"},
+        )
+        assert second.render([section], db_service._connection) == ["persisted"]
+        assert cache.get("e1", section.revision) == "persisted"
+
+    def test_persist_errors_fall_back_to_rendering(self, tmp_path):
+        conn = sqlite3.connect(":memory:")
+        renderer = SectionRenderer(
+            cache=RenderCache(), db_path=str(tmp_path / "missing" / "x.kraken")
+        )
+        section = make_section(1)
+        assert renderer.render([section], conn) == [section.render_html()]
+
+    def test_parallel_rendering_matches_serial(self):
+        renderer = SectionRenderer(
+            cache=RenderCache(), parallel_threshold=4, max_workers=2
+        )
+        sections = [make_section(i, f"[[Target|Link {i}]] text") for i in range(10)]
+        try:
+            html = renderer.render(sections)
+        finally:
+            renderer.shutdown()
+        assert html == [
+            render_section_html(s.title, s.heading_level, s.content) for s in sections
+        ]
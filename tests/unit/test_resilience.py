@@ -2,6 +2,7 @@
 Tests for the CircuitBreaker resilience utility.
 """
 
+import threading
 import time
 from unittest.mock import Mock
 
@@ -253,3 +254,56 @@ def test_circuit_breaker_preserves_exception_type():
 
     with pytest.raises(TypeError):
         cb.call(raise_type_error)
+
+
+def test_circuit_breaker_half_open_allows_single_trial():
+    """Test only one concurrent trial call is let through while half-open."""
+    cb = CircuitBreaker(failure_threshold=1, timeout=0.1)
+    with pytest.raises(ValueError):
+        cb.call(Mock(side_effect=ValueError("error")))
+
+    time.sleep(0.2)
+
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_trial():
+        started.set()
+        release.wait(timeout=5)
+        return "ok"
+
+    results = []
+    trial = threading.Thread(target=lambda: results.append(cb.call(slow_trial)))
+    trial.start()
+    started.wait(timeout=5)
+
+    # A concurrent caller is rejected while the trial is in flight
+    with pytest.raises(Exception, match="Circuit breaker is OPEN"):
+        cb.call(lambda: "second")
+
+    release.set()
+    trial.join(timeout=5)
+
+    assert results == ["ok"]
+    assert cb.state == "closed"
+
+
+def test_circuit_breaker_counts_concurrent_failures():
+    """Test failures from many threads are all counted."""
+    cb = CircuitBreaker(failure_threshold=1000)
+
+    def fail():
+        raise ValueError("error")
+
+    def worker():
+        for _ in range(50):
+            with pytest.raises(ValueError):
+                cb.call(fail)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert cb.failures == 400
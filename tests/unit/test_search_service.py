@@ -6,6 +6,8 @@ Tests text building, vector operations, indexing, and querying.
 
 import json
 import sqlite3
+import threading
+import time
 from typing import List
 
 import numpy as np
@@ -13,15 +15,21 @@ import pytest
 
 from src.core.entities import Entity
 from src.core.events import Event
+from src.services.fulltext_index import FULLTEXT_SCHEMA_SQL
 from src.services.search_service import (
+    EmbeddingMatrix,
     EmbeddingProvider,
     SearchService,
     build_text_for_entity,
     build_text_for_event,
     deserialize_vector,
+    embeddings_fingerprint,
     normalize_vector,
+    normalize_vectors,
+    reciprocal_rank_fusion,
     serialize_vector,
     text_sha256,
+    top_k_indices,
     top_k_streaming,
 )
 
@@ -689,3 +697,492 @@ def test_model_dimension_filtering(search_service, search_db):
     # (In this case, we have 2 embeddings for the same object but different models)
     # The query should filter to only the current model
     assert len(results) >= 1
+
+
+# =============================================================================
+# Test Embedding Matrix Cache
+# =============================================================================
+
+
+def _insert_entity(conn, entity):
+    conn.execute(
+        """
+        INSERT INTO entities (id, type, name, description, attributes, created_at, modified_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            entity.id,
+            entity.type,
+            entity.name,
+            entity.description,
+            json.dumps(entity.attributes),
+            entity.created_at,
+            entity.modified_at,
+        ),
+    )
+    conn.commit()
+
+
+def test_top_k_indices():
+    """Test partial-sort top-k selection."""
+    scores = np.array([0.1, 0.5, 0.3, 0.9, 0.2, 0.7], dtype=np.float32)
+
+    top = top_k_indices(scores, 3)
+
+    assert list(top) == [3, 5, 1]
+    assert len(top_k_indices(scores, 10)) == 6
+    assert len(top_k_indices(scores, 0)) == 0
+
+
+def test_embedding_matrix_upsert_remove_search():
+    """Test in-place matrix maintenance and search."""
+    matrix = EmbeddingMatrix("mock", 2)
+    matrix.upsert("e1", "entity", "a", np.array([1.0, 0.0], dtype=np.float32))
+    matrix.upsert("e2", "event", "b", np.array([0.0, 1.0], dtype=np.float32))
+    matrix.upsert("e3", "entity", "c", np.array([0.6, 0.8], dtype=np.float32))
+    assert len(matrix) == 3
+
+    query = np.array([1.0, 0.0], dtype=np.float32)
+    hits = matrix.search(query, top_k=2)
+    assert [eid for _, eid in hits] == ["e1", "e3"]
+
+    # Type filter only considers matching rows
+    hits = matrix.search(query, top_k=5, object_type="event")
+    assert [eid for _, eid in hits] == ["e2"]
+
+    # Upsert of an existing object keeps its row ID and replaces the vector
+    matrix.upsert("new-id", "entity", "a", np.array([0.0, 1.0], dtype=np.float32))
+    assert len(matrix) == 3
+    assert matrix.search(query, top_k=1)[0][1] == "e3"
+
+    # Removal compacts storage and keeps masks consistent
+    matrix.remove("entity", "c")
+    assert len(matrix) == 2
+    hits = matrix.search(query, top_k=5, object_type="entity")
+    assert [eid for _, eid in hits] == ["e1"]
+
+
+def test_query_matches_brute_force(search_service, search_db):
+    """Test that matrix scoring ranks results like per-row scoring."""
+    for name in ["Gandalf", "Frodo", "Aragorn", "Legolas", "Gimli", "Sam"]:
+        entity = Entity(name=name, type="character", description=f"{name} here")
+        _insert_entity(search_db, entity)
+        search_service.index_entity(entity.id)
+
+    query_vec = normalize_vector(search_service.provider.embed(["a query"])[0])
+    rows = search_db.execute("SELECT object_id, vector, vector_dim FROM embeddings")
+    expected = top_k_streaming(
+        (
+            (float(np.dot(query_vec, deserialize_vector(r[1], r[2]))), r[0])
+            for r in rows
+        ),
+        k=3,
+    )
+
+    results = search_service.query("a query", top_k=3)
+
+    assert [r["object_id"] for r in results] == [oid for _, oid in expected]
+    assert np.allclose([r["score"] for r in results], [s for s, _ in expected])
+
+
+def test_query_cache_tracks_index_and_delete(search_service, search_db):
+    """Test that index/delete keep the in-memory matrix in sync."""
+    first = Entity(name="First", type="test")
+    _insert_entity(search_db, first)
+    search_service.index_entity(first.id)
+
+    # Build the matrix
+    assert len(search_service.query("x", top_k=10)) == 1
+    matrix = search_service._get_matrix(search_service.model)
+
+    second = Entity(name="Second", type="test")
+    _insert_entity(search_db, second)
+    search_service.index_entity(second.id)
+
+    # Patched in place rather than reloaded
+    assert search_service._get_matrix(search_service.model) is matrix
+    assert {r["object_id"] for r in search_service.query("x", top_k=10)} == {
+        first.id,
+        second.id,
+    }
+
+    search_service.delete_index_for_object("entity", first.id)
+
+    assert search_service._get_matrix(search_service.model) is matrix
+    results = search_service.query("x", top_k=10)
+    assert [r["object_id"] for r in results] == [second.id]
+
+
+def test_query_cache_reloads_after_external_write(search_service, search_db):
+    """Test that writes bypassing the service invalidate the matrix."""
+    entity = Entity(name="Test", type="test")
+    _insert_entity(search_db, entity)
+    search_service.index_entity(entity.id)
+    assert len(search_service.query("x", top_k=10)) == 1
+
+    # Simulate a write from another connection/service
+    search_db.execute("DELETE FROM embeddings")
+    search_db.commit()
+
+    assert search_service.query("x", top_k=10) == []
+
+
+def _write_embedding(conn, object_id, created_at, model="m"):
+    conn.execute(
+        """
+        INSERT INTO embeddings (id, object_type, object_id, model, vector,
+                                vector_dim, created_at)
+        VALUES (?, 'entity', ?, ?, x'00', 1, ?)
+        ON CONFLICT(object_type, object_id, model) DO UPDATE SET
+            created_at = excluded.created_at
+        """,
+        (f"{object_id}-{model}", object_id, model, created_at),
+    )
+    conn.commit()
+
+
+def test_embeddings_fingerprint_reads_change_counters(db_service):
+    """Test that the counters track inserts, upserts and deletes."""
+    conn = db_service._connection
+    assert embeddings_fingerprint(conn, "m") == {}
+
+    _write_embedding(conn, "a", 1.0)
+    inserted = embeddings_fingerprint(conn, "m")["entity"]
+    _write_embedding(conn, "a", 1.0)  # Upsert with an unchanged timestamp
+    upserted = embeddings_fingerprint(conn, "m")["entity"]
+    _write_embedding(conn, "a", 1.0, model="other")
+    assert embeddings_fingerprint(conn, "m")["entity"] == upserted
+    conn.execute("DELETE FROM embeddings")
+    conn.commit()
+
+    assert inserted[0] == upserted[0] == 1
+    assert upserted != inserted
+    assert embeddings_fingerprint(conn, "m")["entity"][0] == 0
+
+
+def test_embedding_counters_are_backfilled(tmp_path):
+    """Test that embeddings written before the counters existed are counted."""
+    from src.services.db_service import DatabaseService
+
+    db_path = str(tmp_path / "world.kraken")
+    service = DatabaseService(db_path)
+    service.connect()
+    _write_embedding(service._connection, "a", 1.0)
+    _write_embedding(service._connection, "b", 2.0)
+    service._connection.execute("DELETE FROM embedding_stats")
+    service._connection.commit()
+    service.close()
+
+    service = DatabaseService(db_path)
+    service.connect()
+    try:
+        assert embeddings_fingerprint(service._connection, "m")["entity"][0] == 2
+    finally:
+        service.close()
+
+
+# =============================================================================
+# Test Batched Rebuild
+# =============================================================================
+
+
+class CountingProvider(MockEmbeddingProvider):
+    """Mock provider that records the batch size of each embed call."""
+
+    def __init__(self, dimension: int = 384):
+        super().__init__(dimension)
+        self.calls: List[int] = []
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        self.calls.append(len(texts))
+        return super().embed(texts)
+
+
+def _add_tag(conn, entity_id, tag_name):
+    tag_id = f"tag-{tag_name}"
+    conn.execute(
+        "INSERT OR IGNORE INTO tags (id, name, created_at) VALUES (?, ?, 0)",
+        (tag_id, tag_name),
+    )
+    conn.execute(
+        "INSERT INTO entity_tags (entity_id, tag_id, created_at) VALUES (?, ?, 0)",
+        (entity_id, tag_id),
+    )
+    conn.commit()
+
+
+def test_rebuild_index_batches_embed_calls(search_db):
+    """Test that rebuild sends batched texts and skips unchanged objects."""
+    provider = CountingProvider()
+    service = SearchService(search_db, provider)
+    entities = [Entity(name=f"Entity{i}", type="test") for i in range(5)]
+    for entity in entities:
+        _insert_entity(search_db, entity)
+    _add_tag(search_db, entities[0].id, "hero")
+
+    progress = []
+    counts = service.rebuild_index(
+        object_types=["entity"],
+        batch_size=2,
+        progress_callback=lambda done, total: progress.append((done, total)),
+    )
+
+    assert counts == {"entity": 5}
+    assert provider.calls == [2, 2, 1]
+    assert progress[-1] == (5, 5)
+    stats = service.last_rebuild_stats
+    assert (stats.processed, stats.embedded, stats.skipped) == (5, 5, 0)
+    assert stats.objects_per_second > 0
+
+    # Tags are joined in bulk into the embedded text
+    snippet = search_db.execute(
+        "SELECT text_snippet FROM embeddings WHERE object_id = ?", (entities[0].id,)
+    ).fetchone()[0]
+    assert "Tags: hero" in snippet
+
+    # Second run skips everything via the text hash lookup
+    provider.calls.clear()
+    service.rebuild_index(object_types=["entity"], batch_size=2)
+    assert provider.calls == []
+    assert service.last_rebuild_stats.skipped == 5
+
+    # Single-object indexing builds the same text, so it is skipped too
+    service.index_entity(entities[0].id)
+    assert provider.calls == []
+
+
+def test_rebuild_index_counts_failed_batches(search_db):
+    """Test that a failing provider batch is counted, not raised."""
+
+    class FailingProvider(MockEmbeddingProvider):
+        def embed(self, texts):
+            raise RuntimeError("backend down")
+
+    service = SearchService(search_db, FailingProvider())
+    for i in range(3):
+        _insert_entity(search_db, Entity(name=f"Entity{i}", type="test"))
+
+    counts = service.rebuild_index(object_types=["entity"], batch_size=2)
+
+    assert counts == {"entity": 3}
+    assert service.last_rebuild_stats.failed == 3
+    assert search_db.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0] == 0
+
+
+def test_rebuild_index_cancel(search_db):
+    """Test that a cancelled rebuild keeps written batches and stops early."""
+    cancel = threading.Event()
+
+    class CancellingProvider(CountingProvider):
+        def embed(self, texts):
+            cancel.set()
+            return super().embed(texts)
+
+    provider = CancellingProvider()
+    service = SearchService(search_db, provider)
+    for i in range(10):
+        _insert_entity(search_db, Entity(name=f"Entity{i}", type="test"))
+
+    counts = service.rebuild_index(
+        object_types=["entity"], batch_size=2, max_workers=1, cancel_event=cancel
+    )
+
+    stats = service.last_rebuild_stats
+    assert stats.cancelled
+    assert provider.calls == [2]
+    assert counts["entity"] < 10
+    assert search_db.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0] == 2
+
+    # A later rebuild skips the stored objects and embeds the rest
+    cancel.clear()
+    provider.calls.clear()
+    service.rebuild_index(object_types=["entity"], batch_size=8)
+    assert provider.calls == [8]
+    assert service.last_rebuild_stats.skipped == 2
+
+
+def test_normalize_vectors_rows():
+    """Test row-wise normalization keeps zero rows unchanged."""
+    M = np.array([[3.0, 4.0], [0.0, 0.0]], dtype=np.float32)
+
+    result = normalize_vectors(M)
+
+    assert np.allclose(result[0], [0.6, 0.8])
+    assert np.allclose(result[1], [0.0, 0.0])
+
+
+def test_rebuild_index_concurrent_workers(search_db):
+    """Test that concurrent embed calls produce the same index as sequential."""
+
+    class SlowProvider(CountingProvider):
+        def embed(self, texts):
+            self.threads.add(threading.get_ident())
+            time.sleep(0.01)
+            return super().embed(texts)
+
+    provider = SlowProvider()
+    provider.threads = set()
+    service = SearchService(search_db, provider)
+    for i in range(10):
+        _insert_entity(search_db, Entity(name=f"Entity{i}", type="test"))
+
+    counts = service.rebuild_index(object_types=["entity"], batch_size=2, max_workers=3)
+
+    assert counts == {"entity": 10}
+    assert sorted(provider.calls) == [2, 2, 2, 2, 2]
+    assert service.last_rebuild_stats.embedded == 10
+    # Embedding ran off the calling thread; writes stayed on it
+    assert threading.get_ident() not in provider.threads
+    assert search_db.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0] == 10
+    assert len(service.query("Entity3", top_k=10)) == 10
+
+
+def test_lmstudio_embedding_provider_reuses_session(monkeypatch):
+    """Test LM Studio embeddings go through one persistent session."""
+    import requests
+
+    from src.services.search_service import LMStudioEmbeddingProvider
+
+    class FakeResponse:
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {"data": [{"embedding": [0.1, 0.2]}]}
+
+    posts = []
+
+    def fake_post(self, url, **kwargs):
+        posts.append(self)
+        return FakeResponse()
+
+    monkeypatch.setattr(requests.Session, "post", fake_post)
+    provider = LMStudioEmbeddingProvider(model="test-model")
+
+    provider.embed(["a"])
+    provider.embed(["b"])
+
+    assert posts == [provider.session, provider.session]
+    assert provider.circuit_breaker.state == "closed"
+
+
+def test_lmstudio_embedding_server_errors_open_circuit(monkeypatch):
+    """Test HTTP 5xx responses count as circuit breaker failures."""
+    import requests
+
+    from src.services.search_service import LMStudioEmbeddingProvider
+
+    class ErrorResponse:
+        def raise_for_status(self):
+            raise requests.exceptions.HTTPError("500 Server Error")
+
+    monkeypatch.setattr(requests.Session, "post", lambda *a, **k: ErrorResponse())
+    provider = LMStudioEmbeddingProvider(model="test-model")
+
+    for _ in range(provider.circuit_breaker.failure_threshold):
+        with pytest.raises(Exception, match="Failed to connect"):
+            provider.embed(["a"])
+
+    assert provider.circuit_breaker.state == "open"
+
+
+# =============================================================================
+# Test Hybrid (BM25 + Embedding) Ranking
+# =============================================================================
+
+
+def test_reciprocal_rank_fusion():
+    """Test that items ranked by both rankings beat single-ranking items."""
+    fused = reciprocal_rank_fusion(
+        [
+            [("entity", "a"), ("entity", "b"), ("entity", "c")],
+            [("entity", "c"), ("event", "d")],
+        ]
+    )
+    keys = [key for key, _ in fused]
+    assert keys[0] == ("entity", "c")
+    assert set(keys) == {
+        ("entity", "a"),
+        ("entity", "b"),
+        ("entity", "c"),
+        ("event", "d"),
+    }
+    assert fused[0][1] == pytest.approx(1 / 63 + 1 / 61)
+
+
+@pytest.fixture
+def hybrid_db(search_db):
+    """Search schema plus the full-text index."""
+    search_db.executescript(FULLTEXT_SCHEMA_SQL)
+    return search_db
+
+
+class TargetBlindProvider(MockEmbeddingProvider):
+    """Embeds the query like the filler objects and unlike the target."""
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            is_target = text.startswith("Name: Xylophar")
+            vectors[row, 1 if is_target else 0] = 1.0
+        return vectors
+
+
+def test_hybrid_query_finds_exact_name(hybrid_db):
+    """Test that hybrid ranking surfaces an exact name the embeddings miss."""
+    service = SearchService(hybrid_db, TargetBlindProvider())
+    target = Entity(name="Xylophar", type="character", description="Short.")
+    _insert_entity(hybrid_db, target)
+    for i in range(30):
+        _insert_entity(
+            hybrid_db,
+            Entity(name=f"Filler{i}", type="place", description="word " * i),
+        )
+    service.rebuild_index(object_types=["entity"])
+
+    semantic = service.query("Who is Xylophar?", top_k=3)
+    assert target.id not in {r["object_id"] for r in semantic}
+
+    results = service.query("Who is Xylophar?", top_k=3, hybrid=True)
+    by_id = {r["object_id"]: r for r in results}
+    assert len(results) == 3
+    assert by_id[target.id]["name"] == "Xylophar"
+    assert "Short." in by_id[target.id]["text_content"]
+
+
+def test_hybrid_query_includes_objects_without_embeddings(hybrid_db, mock_provider):
+    """Test that keyword matches not yet embedded are still returned."""
+    service = SearchService(hybrid_db, mock_provider)
+    entity = Entity(name="Quillon", type="weapon", description="A blade.")
+    _insert_entity(hybrid_db, entity)
+
+    results = service.query("quillon", top_k=5, hybrid=True)
+
+    assert [r["object_id"] for r in results] == [entity.id]
+    assert results[0]["id"] is None
+    assert "Description: A blade." in results[0]["text_content"]
+
+
+def test_hybrid_query_falls_back_to_keywords(hybrid_db):
+    """Test that a failing embedding provider leaves the keyword ranking."""
+
+    class FailingProvider(MockEmbeddingProvider):
+        def embed(self, texts):
+            raise RuntimeError("backend down")
+
+    service = SearchService(hybrid_db, FailingProvider())
+    entity = Entity(name="Quillon", type="weapon")
+    _insert_entity(hybrid_db, entity)
+
+    results = service.query("quillon", hybrid=True)
+    assert [r["object_id"] for r in results] == [entity.id]
+
+
+def test_hybrid_query_without_fulltext_index(search_service, search_db):
+    """Test that databases without the full-text index use embeddings only."""
+    entity = Entity(name="Quillon", type="weapon")
+    _insert_entity(search_db, entity)
+    search_service.rebuild_index(object_types=["entity"])
+
+    results = search_service.query("quillon", hybrid=True)
+    assert [r["object_id"] for r in results] == [entity.id]
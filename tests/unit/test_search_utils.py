@@ -221,3 +221,33 @@ def test_matches_search_priority():
     # Even if type would also match
     obj2 = MockEntity(name="Dragon", type="Monster")
     assert SearchUtils.matches_search(obj2, "Dragon") is True
+
+
+def test_search_key_agrees_with_matches_search():
+    """Test that a normalized term is in the search key iff it matches."""
+    obj = MockEntity(
+        name="Dragon Lord",
+        type="Monster",
+        description="Breathes FIRE",
+        tags=["boss"],
+        attributes={"lair": "Mount Doom", "level": 42, "_tags": ["boss"]},
+    )
+    key = SearchUtils.search_key(obj)
+
+    for term in ["dragon", " LORD ", "monster", "fire", "boss", "doom", "42", "x"]:
+        expected = SearchUtils.matches_search(obj, term)
+        assert (SearchUtils.normalize_term(term) in key) is expected
+
+
+def test_search_key_terms_do_not_span_fields():
+    """Test that a term cannot match across two fields of the key."""
+    obj = MockEntity(name="Red", type="Dragon")
+
+    assert SearchUtils.normalize_term("reddragon") not in SearchUtils.search_key(obj)
+
+
+def test_search_key_is_casefolded():
+    """Test that search keys fold case beyond lowercasing."""
+    obj = {"name": "Straße"}
+
+    assert SearchUtils.normalize_term("STRASSE") in SearchUtils.search_key(obj)
@@ -0,0 +1,148 @@
+"""
+Unit tests for SearchWorker.
+
+Covers search coalescing and error reporting, and progress and
+cancellation of index rebuilds, against a mocked SearchService.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.services.search_service import RebuildStats
+from src.services.search_worker import SearchWorker
+
+
+@pytest.fixture
+def search_service():
+    """Provides a mocked SearchService that echoes query arguments."""
+    service = MagicMock()
+    service.query.side_effect = lambda text, object_type, top_k: [
+        {"name": text, "object_type": object_type, "top_k": top_k}
+    ]
+    return service
+
+
+@pytest.fixture
+def worker(search_service):
+    """Provides a SearchWorker wired to the mocked search service."""
+    worker = SearchWorker("test.db")
+    worker.search_service = search_service
+    return worker
+
+
+@pytest.mark.unit
+def test_search_emits_results_with_request_id(worker, search_service):
+    """Test that results are emitted with the ID of their request."""
+    results_spy = MagicMock()
+    worker.results_ready.connect(results_spy)
+
+    request_id = worker.submit_search("dragon", "entity", 5)
+
+    search_service.query.assert_called_once_with(
+        text="dragon", object_type="entity", top_k=5
+    )
+    results_spy.assert_called_once_with(
+        request_id, [{"name": "dragon", "object_type": "entity", "top_k": 5}]
+    )
+
+
+@pytest.mark.unit
+def test_queued_searches_are_coalesced(worker, search_service):
+    """Test that only the latest of several queued searches runs."""
+    # Hold queued work back, as a busy worker thread would
+    worker._search_queued.disconnect(worker._run_pending_search)
+    results_spy = MagicMock()
+    worker.results_ready.connect(results_spy)
+
+    worker.submit_search("d", None, 10)
+    worker.submit_search("dr", None, 10)
+    last_id = worker.submit_search("dragon", None, 10)
+
+    worker._run_pending_search()
+    worker._run_pending_search()
+
+    search_service.query.assert_called_once_with(
+        text="dragon", object_type=None, top_k=10
+    )
+    assert results_spy.call_args[0][0] == last_id
+
+
+@pytest.mark.unit
+def test_search_failure_is_reported(worker, search_service):
+    """Test that a failing search emits search_failed."""
+    search_service.query.side_effect = RuntimeError("backend down")
+    failed_spy = MagicMock()
+    worker.search_failed.connect(failed_spy)
+
+    request_id = worker.submit_search("dragon", None, 10)
+
+    failed_spy.assert_called_once_with(request_id, "backend down")
+
+
+@pytest.mark.unit
+def test_rebuild_streams_progress(worker, search_service, monkeypatch):
+    """Test that a rebuild reports progress with rate and ETA."""
+
+    def rebuild_index(progress_callback, cancel_event, **kwargs):
+        progress_callback(5, 10)
+        progress_callback(10, 10)
+        search_service.last_rebuild_stats = RebuildStats(processed=10)
+        return {"entity": 10}
+
+    search_service.rebuild_index.side_effect = rebuild_index
+    monkeypatch.setattr(
+        "src.services.search_service.create_search_service",
+        lambda conn: search_service,
+    )
+    worker.db_service = MagicMock()
+    progress_spy = MagicMock()
+    finished_spy = MagicMock()
+    worker.rebuild_progress.connect(progress_spy)
+    worker.rebuild_finished.connect(finished_spy)
+
+    worker.start_rebuild(["entity"], [])
+
+    assert [c[0][:2] for c in progress_spy.call_args_list] == [(5, 10), (10, 10)]
+    done, total, rate, eta = progress_spy.call_args_list[0][0]
+    assert rate > 0 and eta > 0
+    finished_spy.assert_called_once_with({"entity": 10}, False)
+
+
+@pytest.mark.unit
+def test_cancelled_rebuild_reports_cancellation(worker, search_service, monkeypatch):
+    """Test that cancelling a running rebuild reports it as cancelled."""
+
+    def rebuild_index(progress_callback, cancel_event, **kwargs):
+        worker.cancel_rebuild()
+        assert cancel_event.is_set()
+        search_service.last_rebuild_stats = RebuildStats(processed=3, cancelled=True)
+        return {"entity": 3}
+
+    search_service.rebuild_index.side_effect = rebuild_index
+    monkeypatch.setattr(
+        "src.services.search_service.create_search_service",
+        lambda conn: search_service,
+    )
+    worker.db_service = MagicMock()
+    finished_spy = MagicMock()
+    worker.rebuild_finished.connect(finished_spy)
+
+    worker.start_rebuild(["entity"], [])
+
+    finished_spy.assert_called_once_with({"entity": 3}, True)
+
+
+@pytest.mark.unit
+def test_rebuild_cancelled_before_start_does_not_run(worker, search_service):
+    """Test that a rebuild cancelled while queued never starts."""
+    worker._rebuild_queued.disconnect(worker._run_rebuild)
+    finished_spy = MagicMock()
+    worker.rebuild_finished.connect(finished_spy)
+
+    worker.start_rebuild(["entity"], [])
+    worker.cancel_rebuild()
+    worker._run_rebuild(["entity"], [])
+
+    search_service.rebuild_index.assert_not_called()
+    finished_spy.assert_called_once_with({}, True)
@@ -534,3 +534,88 @@ class TestTagFilter:
 
         assert len(results) == 1
         assert ("entity", e1.id) in results
+
+
+@pytest.mark.unit
+class TestTagIndex:
+    """Tests for the in-memory tag index behind filter_ids_by_tags."""
+
+    def test_index_tracks_incremental_changes(self, db_service):
+        """Test that tag and object changes after the first query are seen."""
+        e1 = Entity(name="Entity1", type="character")
+        ev1 = Event(name="Event1", lore_date=100.0)
+        db_service.insert_entity(e1)
+        db_service.insert_event(ev1)
+        db_service.assign_tag_to_entity(e1.id, "important")
+
+        assert db_service.filter_ids_by_tags(include=["important"]) == [
+            ("entity", e1.id)
+        ]
+        assert db_service.tag_index.is_built
+
+        db_service.assign_tag_to_event(ev1.id, "Important")
+        db_service.remove_tag_from_entity(e1.id, "important")
+        assert db_service.filter_ids_by_tags(include=["important"]) == [
+            ("event", ev1.id)
+        ]
+
+        ev2 = Event(name="Event2", lore_date=200.0)
+        db_service.insert_event(ev2)
+        db_service.delete_event(ev1.id)
+        results = db_service.filter_ids_by_tags(exclude=["important"])
+        assert set(results) == {("entity", e1.id), ("event", ev2.id)}
+
+        db_service.delete_tag("Important")
+        assert db_service.filter_ids_by_tags(include=["important"]) == []
+
+    def test_index_matches_sql_clause(self, db_service):
+        """Test that the index agrees with the SQL TagClause."""
+        tags = ["a", "B", "b", "c"]
+        for i in range(8):
+            entity = Entity(name=f"Entity{i}", type="character")
+            event = Event(name=f"Event{i}", lore_date=float(i))
+            db_service.insert_entity(entity)
+            db_service.insert_event(event)
+            for j, tag in enumerate(tags):
+                if (i >> j) & 1 or (i + j) % 5 == 0:
+                    db_service.assign_tag_to_entity(entity.id, tag)
+                    db_service.assign_tag_to_event(event.id, tag)
+
+        for include_mode in ("any", "all"):
+            for case_sensitive in (True, False):
+                kwargs = {
+                    "include": ["a", "b"],
+                    "include_mode": include_mode,
+                    "exclude": ["c"],
+                    "case_sensitive": case_sensitive,
+                }
+                assert db_service.filter_ids_by_tags(
+                    **kwargs
+                ) == tag_filter.filter_object_ids(db_service._connection, **kwargs)
+
+    def test_index_rebuilds_after_external_write(self, tmp_path):
+        """Test that commits from another connection invalidate the index."""
+        import sqlite3
+
+        from src.services.db_service import DatabaseService
+
+        db_path = str(tmp_path / "world.kraken")
+        service = DatabaseService(db_path)
+        service.connect()
+        try:
+            e1 = Entity(name="Entity1", type="character")
+            service.insert_entity(e1)
+            service.assign_tag_to_entity(e1.id, "important")
+            assert service.filter_ids_by_tags(include=["important"]) == [
+                ("entity", e1.id)
+            ]
+
+            other = sqlite3.connect(db_path)
+            other.execute("PRAGMA foreign_keys = ON")
+            other.execute("DELETE FROM entity_tags")
+            other.commit()
+            other.close()
+
+            assert service.filter_ids_by_tags(include=["important"]) == []
+        finally:
+            service.close()
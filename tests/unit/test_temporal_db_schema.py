@@ -105,3 +105,59 @@ def test_moving_feature_deleted_on_marker_delete(db_service):
     result = cursor.fetchone()
     assert result is not None
     assert result["cnt"] == 0
+
+
+def test_json_trajectories_migrated_to_keyframe_rows(tmp_path):
+    """Test that reopening a database moves JSON trajectories into rows."""
+    from src.core.trajectory import Keyframe
+    from src.services.db_service import DatabaseService
+    from src.services.repositories.trajectory_repository import (
+        KEYFRAME_ROWS_STORAGE,
+    )
+
+    db_path = str(tmp_path / "world.kraken")
+    service = DatabaseService(db_path)
+    service.connect()
+    cursor = service._connection.cursor()
+    cursor.execute(
+        "INSERT INTO maps (id, name, image_path, created_at) VALUES (?, ?, ?, ?)",
+        ("map1", "Test Map", "/path/to/img.png", 0.0),
+    )
+    cursor.execute(
+        "INSERT INTO markers "
+        "(id, map_id, object_id, object_type, x, y, created_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        ("marker1", "map1", "obj1", "entity", 0.5, 0.5, 0.0),
+    )
+    cursor.execute(
+        "INSERT INTO moving_features "
+        "(id, marker_id, t_start, t_end, trajectory, created_at) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        ("mf1", "marker1", 0.0, 10.0, "[[0, 0.5, 0.5], [10, 0.6, 0.6]]", 0.0),
+    )
+    service._connection.commit()
+    service.close()
+
+    service.connect()
+    try:
+        row = service._connection.execute(
+            "SELECT trajectory FROM moving_features WHERE id = 'mf1'"
+        ).fetchone()
+        assert row["trajectory"] == KEYFRAME_ROWS_STORAGE
+        assert service.get_trajectories_by_map("map1") == [
+            ("obj1", "mf1", [Keyframe(0, 0.5, 0.5), Keyframe(10, 0.6, 0.6)])
+        ]
+        assert service.export_trajectory_mfjson("mf1") == {
+            "type": "MovingPoint",
+            "coordinates": [[0.5, 0.5], [0.6, 0.6]],
+            "datetimes": [0.0, 10.0],
+        }
+
+        # Keyframe rows follow their marker on delete
+        service._connection.execute("DELETE FROM markers WHERE id = 'marker1'")
+        count = service._connection.execute(
+            "SELECT COUNT(*) FROM trajectory_keyframes"
+        ).fetchone()[0]
+        assert count == 0
+    finally:
+        service.close()
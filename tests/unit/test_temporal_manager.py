@@ -80,10 +80,11 @@ def test_caching_behavior(manager, mock_db_service):
     manager.get_entity_state_at("e1", time=150.0)
     assert mock_db_service.get_incoming_relations.call_count == 1
 
-    # Different time - might need re-resolve depending on cache granularity.
-    # For MVP, checking if it naively caches by (id, time).
+    # Different time - the cached timeline covers every time point
+    state = manager.get_entity_state_at("e1", time=50.0)
+    assert state["status"] == "Base"
     manager.get_entity_state_at("e1", time=200.0)
-    # If caching is (id, time), this is a miss.
+    assert mock_db_service.get_incoming_relations.call_count == 1
 
 
 def test_invalidation_on_signal(manager, mock_db_service, signal_source):
@@ -171,7 +172,7 @@ def test_multiple_time_points_invalidated(manager, mock_db_service, signal_sourc
     manager.get_entity_state_at("e1", time=100.0)
     manager.get_entity_state_at("e1", time=200.0)
     manager.get_entity_state_at("e1", time=300.0)
-    assert mock_db_service.get_incoming_relations.call_count == 3
+    assert mock_db_service.get_incoming_relations.call_count == 1
 
     # Invalidate
     signal_source.relation_changed.emit("r1", "evt1", "e1")
@@ -180,7 +181,7 @@ def test_multiple_time_points_invalidated(manager, mock_db_service, signal_sourc
     manager.get_entity_state_at("e1", time=100.0)
     manager.get_entity_state_at("e1", time=200.0)
     manager.get_entity_state_at("e1", time=300.0)
-    assert mock_db_service.get_incoming_relations.call_count == 6
+    assert mock_db_service.get_incoming_relations.call_count == 2
 
 
 def test_nuclear_clear_cache(manager, mock_db_service):
@@ -243,3 +244,41 @@ def test_nonexistent_entity_does_not_crash(manager, mock_db_service):
 
     # Should return empty dict
     assert state == {}
+
+
+def test_lru_evicts_least_recently_used_entity(mock_db_service):
+    """Test that the timeline cache evicts the least recently used entity."""
+    mgr = TemporalManager(db_service=mock_db_service, max_entities=2)
+
+    mgr.get_entity_state_at("e1", time=100.0)
+    mgr.get_entity_state_at("e2", time=100.0)
+    mgr.get_entity_state_at("e1", time=150.0)  # e1 becomes most recent
+    mgr.get_entity_state_at("e3", time=100.0)  # evicts e2
+    assert mock_db_service.get_incoming_relations.call_count == 3
+
+    mgr.get_entity_state_at("e1", time=120.0)
+    assert mock_db_service.get_incoming_relations.call_count == 3
+
+    mgr.get_entity_state_at("e2", time=100.0)
+    assert mock_db_service.get_incoming_relations.call_count == 4
+
+
+def test_world_state_uses_single_relation_query(mock_db_service):
+    """Test that bulk resolution loads relations once for all entities."""
+    e1 = Entity(id="e1", name="A", type="generic", attributes={"status": "Base"})
+    e2 = Entity(id="e2", name="B", type="generic", attributes={"status": "Base"})
+    mock_db_service.get_all_entities.return_value = [e1, e2]
+    mock_db_service.get_temporal_relations.return_value = [
+        {
+            "id": "r1",
+            "target_id": "e2",
+            "attributes": {"valid_from": 100, "payload": {"status": "Moved"}},
+        }
+    ]
+    mgr = TemporalManager(db_service=mock_db_service)
+
+    states = mgr.get_world_state_at(150.0)
+
+    assert states == {"e1": {"status": "Base"}, "e2": {"status": "Moved"}}
+    mock_db_service.get_temporal_relations.assert_called_once_with(None)
+    mock_db_service.get_incoming_relations.assert_not_called()
@@ -216,3 +216,101 @@ def test_multi_edge_relations(resolver, base_entity):
     state = resolver.resolve_entity_state(base_entity, relations, 100)
     assert state["rank"] == "Commander"
     assert state["status"] == "Busy"
+
+
+def test_build_timeline_matches_resolve(resolver, base_entity):
+    """Test that timeline lookups agree with direct resolution at any time."""
+    relations = [
+        {
+            "id": "rel_1",
+            "attributes": {
+                "valid_from": 10.0,
+                "valid_to": 30.0,
+                "payload": {"status": "Captured"},
+            },
+        },
+        {
+            "id": "rel_2",
+            "attributes": {"valid_from": 20.0, "payload": {"location": "Wall"}},
+        },
+        {
+            "id": "rel_3",
+            "source_event_date": 25.0,
+            "attributes": {
+                "valid_from_event": True,
+                "priority": "manual",
+                "payload": {"rank": "Lord Commander"},
+            },
+        },
+        {"id": "rel_4", "attributes": {"payload": {"status": "Ignored"}}},
+    ]
+
+    timeline = resolver.build_timeline(base_entity, relations)
+
+    assert timeline.boundaries == [10.0, 20.0, 25.0, 30.0]
+    for t in [0.0, 10.0, 15.0, 20.0, 24.9, 25.0, 29.9, 30.0, 100.0]:
+        expected = resolver.resolve_entity_state(base_entity, relations, time=t)
+        assert timeline.state_at(t) == expected
+
+
+def test_build_timeline_interval_at(resolver, base_entity):
+    """Test that interval_at returns the range where the state is constant."""
+    relations = [
+        {
+            "id": "rel_1",
+            "attributes": {
+                "valid_from": 10.0,
+                "valid_to": 30.0,
+                "payload": {"status": "Captured"},
+            },
+        }
+    ]
+
+    timeline = resolver.build_timeline(base_entity, relations)
+
+    assert timeline.interval_at(5.0) == (float("-inf"), 10.0)
+    assert timeline.interval_at(10.0) == (10.0, 30.0)
+    assert timeline.interval_at(30.0) == (30.0, float("inf"))
+
+
+def test_resolve_world_state_matches_per_entity(resolver, base_entity):
+    """Test that the bulk sweep agrees with per-entity resolution."""
+    other = Entity(id="entity_2", name="Arya", type="character", attributes={})
+    relations = [
+        {
+            "id": "rel_1",
+            "target_id": "entity_1",
+            "attributes": {"valid_from": 50.0, "payload": {"status": "Dead"}},
+        },
+        {
+            "id": "rel_2",
+            "target_id": "entity_1",
+            "attributes": {
+                "valid_from": 10.0,
+                "valid_to": 40.0,
+                "payload": {"location": "Wall"},
+            },
+        },
+        {
+            "id": "rel_3",
+            "target_id": "entity_2",
+            "source_event_date": 20.0,
+            "attributes": {
+                "valid_from_event": True,
+                "payload": {"location": "Braavos"},
+            },
+        },
+        {
+            "id": "rel_4",
+            "target_id": "unknown",
+            "attributes": {"valid_from": 0.0, "payload": {"x": 1}},
+        },
+    ]
+
+    for t in [0.0, 15.0, 40.0, 60.0]:
+        states = resolver.resolve_world_state([base_entity, other], relations, t)
+        assert set(states) == {"entity_1", "entity_2"}
+        for entity in (base_entity, other):
+            own = [r for r in relations if r["target_id"] == entity.id]
+            expected = resolver.resolve_entity_state(entity, own, time=t)
+            assert states[entity.id] == expected
@@ -1,3 +1,5 @@
+from PySide6.QtGui import QFont
+
 from src.core.events import Event
 from src.gui.widgets.timeline import EventItem, TimelineWidget
 
@@ -38,6 +40,31 @@ def test_set_events(qapp):
     assert event_items[1].x() == 200.0 * 20.0
 
 
+def test_apply_event_changes_patches_scene(qapp):
+    """Test that patching keeps unchanged items and updates changed ones."""
+    widget = TimelineWidget()
+    a = Event(name="Event A", lore_date=100.0)
+    b = Event(name="Event B", lore_date=200.0)
+    widget.set_events([a, b])
+    item_a = next(
+        i
+        for i in widget.view.scene.items()
+        if isinstance(i, EventItem) and i.event.id == a.id
+    )
+
+    moved_b = Event(id=b.id, name="Event B", lore_date=50.0)
+    c = Event(name="Event C", lore_date=300.0)
+    widget.apply_event_changes([moved_b, c], [a.id])
+
+    items = {
+        i.event.id: i for i in widget.view.scene.items() if isinstance(i, EventItem)
+    }
+    assert set(items) == {b.id, c.id}
+    assert items[b.id].x() == 50.0 * 20.0
+    assert [e.id for e in widget.view.events] == [b.id, c.id]
+    assert item_a.scene() is None
+
+
 def test_lane_layout_logic(qapp):
     """Test that smart lane packing works correctly."""
     widget = TimelineWidget()
@@ -69,6 +96,21 @@ def test_lane_layout_logic(qapp):
     assert y1 == y3, "Non-overlapping events should reuse lanes"
 
 
+def test_font_change_remeasures_lanes(qapp):
+    """Test that a new view font is handed to the lane packer."""
+    widget = TimelineWidget()
+    widget.set_events([Event(name="Event A", lore_date=100.0)])
+    packer = widget.view._lane_packer
+
+    font = QFont(widget.view.font())
+    font.setPointSize(font.pointSize() + 6)
+    widget.view.setFont(font)
+
+    assert packer.font.pointSize() == font.pointSize()
+    assert packer.font.bold()
+    assert (packer.font.key(), "Event A") in packer._text_widths
+
+
 def test_focus_event(qapp):
     """Test that focus_event finds items and selects them."""
     widget = TimelineWidget()
@@ -132,3 +174,93 @@ def test_gravity_packing(qapp):
     # E3 should reuse E1's lane (Lane 0) because of Gravity
 
     assert e3_y == e1_y, "E3 should fall to Lane 0 (Gravity), not Lane 1"
+
+
+def _virtualized_widget(count=1000, threshold=10):
+    """Returns a TimelineWidget with many events and virtualization forced on."""
+    widget = TimelineWidget()
+    widget.view.VIRTUALIZE_THRESHOLD = threshold
+    widget.view.resize(400, 300)
+    events = [Event(name=f"E{i}", lore_date=i * 10.0) for i in range(count)]
+    widget.set_events(events)
+    return widget, events
+
+
+def _materialized_ids(view):
+    return {i.event.id for i in view.scene.items() if isinstance(i, EventItem)}
+
+
+def test_virtualized_timeline_materializes_visible_range(qapp):
+    """Test that only events near the viewport get scene items."""
+    widget, events = _virtualized_widget()
+    view = widget.view
+
+    view.centerOn(100 * 10.0 * view.scale_factor, 100)
+    view._sync_visible_items()
+    lo, hi = view._materialized_range()
+    ids = _materialized_ids(view)
+
+    assert 0 < len(ids) < len(events)
+    assert ids == {e.id for e in events[lo:hi]}
+    assert ids == set(view._event_items)
+    assert set(view._drop_lines) == ids
+
+    # Panning far away swaps the materialized set
+    view.centerOn(900 * 10.0 * view.scale_factor, 100)
+    view._sync_visible_items()
+    panned = _materialized_ids(view)
+    assert events[900].id in panned
+    assert not panned & ids
+
+    # Newly materialized items land in their packed lanes
+    item = view._event_items[events[900].id]
+    assert item.y() == view._event_y[events[900].id]
+
+
+def test_virtualized_timeline_falls_back_to_density(qapp):
+    """Test that too many events in range are drawn as a histogram."""
+    widget, events = _virtualized_widget()
+    view = widget.view
+    view.LOD_ITEM_BUDGET = 50
+
+    view._apply_zoom(0.01)
+
+    assert not _materialized_ids(view)
+    assert view._density_item.isVisible()
+    lo, hi = view._materialized_range()
+    assert sum(view._density_item.counts) == hi - lo
+
+    view._apply_zoom(1.0)
+    assert _materialized_ids(view)
+    assert not view._density_item.isVisible()
+
+
+def test_virtualized_focus_event_materializes_item(qapp):
+    """Test that focusing an off-screen event creates and selects its item."""
+    widget, events = _virtualized_widget()
+    view = widget.view
+    view.centerOn(0, 100)
+    view._sync_visible_items()
+    target = events[-1]
+    assert target.id not in view._event_items
+
+    widget.focus_event(target.id)
+
+    item = view._event_items[target.id]
+    assert item.isSelected()
+
+    # Selected items survive panning away
+    view.centerOn(0, 100)
+    view._sync_visible_items()
+    assert target.id in _materialized_ids(view)
+
+
+def test_bin_counts():
+    """Test bucketing sorted dates into equal-width bins."""
+    from src.gui.widgets.timeline.density_histogram_item import bin_counts
+
+    dates = [0.0, 1.0, 1.5, 4.0, 9.9, 10.0]
+
+    assert bin_counts(dates, 0.0, 10.0, 5) == [3, 0, 1, 0, 1]
+    assert bin_counts(dates, 0.0, 10.0, 0) == []
+    assert bin_counts(dates, 5.0, 5.0, 3) == []
@@ -561,3 +561,44 @@ class TestTimelineGrouping:
         # "All events" should be last
         assert len(metadata) == 3
         assert metadata[-1]["tag_name"] == "All events"
+
+    def test_duplicate_mode_hydrates_each_event_once(self, db_service):
+        """
+        Test that an event in several groups is one shared Event object.
+        """
+        event = Event(name="Coronation", lore_date=800.0)
+        db_service.insert_event(event)
+        db_service.assign_tag_to_event(event.id, "royal")
+        db_service.assign_tag_to_event(event.id, "ceremony")
+
+        result = db_service.get_events_grouped_by_tags(
+            tag_order=["royal", "ceremony"], mode="DUPLICATE"
+        )
+
+        royal, ceremony = (g["events"] for g in result["groups"])
+        assert royal[0] is ceremony[0]
+        assert result["remaining"] == []
+
+    @pytest.mark.parametrize("mode", ["DUPLICATE", "FIRST_MATCH"])
+    def test_single_query_grouping_matches_per_tag_loop(self, db_service, mode):
+        """
+        Test that the single-query engine agrees with the per-tag baseline.
+        """
+        from src.cli.timeline import _grouping_ids, _per_tag_grouping
+
+        tags = ["a", "b", "c"]
+        for i in range(12):
+            event = Event(name=f"E{i}", lore_date=float(i % 5))
+            db_service.insert_event(event)
+            for j, tag in enumerate(tags):
+                if (i >> j) & 1:
+                    db_service.assign_tag_to_event(event.id, tag)
+
+        tag_order = ["c", "a", "b"]
+        grouped = db_service.get_events_grouped_by_tags(tag_order, mode=mode)
+        reference = _per_tag_grouping(db_service, tag_order, mode)
+
+        assert _grouping_ids(grouped) == _grouping_ids(reference)
+        for group in grouped["groups"]:
+            dates = [e.lore_date for e in group["events"]]
+            assert dates == sorted(dates)
@@ -4,6 +4,10 @@ Unit tests for TimelineLanePacker.
 Tests the lane packing algorithm in isolation.
 """
 
+import random
+
+from PySide6.QtGui import QFont, QFontMetrics
+
 from src.core.events import Event
 from src.gui.widgets.timeline_lane_packer import TimelineLanePacker
 
@@ -126,3 +130,137 @@ class TestTimelineLanePacker:
         # (though this depends on exact font metrics)
         assert events[0].id in assignments
         assert events[1].id in assignments
+
+    def test_lane_index_matches_linear_first_fit(self):
+        """The tree lookup must pick the same lane as a linear scan."""
+        packer = TimelineLanePacker(scale_factor=10.0)
+        rng = random.Random(7)
+        events = sorted(
+            (
+                Event(
+                    name=f"E{i}",
+                    lore_date=rng.uniform(0, 500),
+                    lore_duration=rng.choice([0, 0, rng.uniform(1, 40)]),
+                )
+                for i in range(400)
+            ),
+            key=lambda e: e.lore_date,
+        )
+
+        assignments, lane_heights = packer.pack_events(events)
+
+        lane_ends = []
+        for event in events:
+            start = event.lore_date
+            end = start + packer._calculate_visual_duration(event)
+            end += packer.GAP_PIXELS / packer.scale_factor
+            lane = next((i for i, e in enumerate(lane_ends) if e <= start), None)
+            if lane is None:
+                lane_ends.append(end)
+                lane = len(lane_ends) - 1
+            else:
+                lane_ends[lane] = end
+            assert assignments[event.id] == lane
+        assert len(lane_heights) == len(lane_ends)
+
+    def test_incremental_repack_matches_full_pack(self):
+        """Repacking after edits must equal packing from scratch."""
+        packer = TimelineLanePacker(scale_factor=10.0)
+        packer.CHECKPOINT_INTERVAL = 16
+        rng = random.Random(3)
+        events = [
+            Event(name=f"E{i}", lore_date=i * 2.0, lore_duration=rng.choice([0, 9]))
+            for i in range(300)
+        ]
+        packer.pack_events(events)
+
+        for _ in range(20):
+            index = rng.randrange(len(events))
+            action = rng.choice(["move", "insert", "delete"])
+            if action == "move":
+                old = events[index]
+                events[index] = Event(
+                    id=old.id, name=old.name + "!", lore_date=old.lore_date
+                )
+            elif action == "insert":
+                events.insert(
+                    index, Event(name="New", lore_date=events[index].lore_date)
+                )
+            else:
+                del events[index]
+
+            incremental = packer.pack_events(events)
+            fresh = TimelineLanePacker(scale_factor=10.0).pack_events(events)
+            assert incremental == fresh
+
+    def test_small_zoom_in_reuses_layout(self):
+        """A small zoom-in keeps the previous layout, a zoom-out repacks."""
+        packer = TimelineLanePacker(scale_factor=10.0)
+        events = [
+            Event(name="E1", lore_date=10, lore_duration=30),
+            Event(name="E2", lore_date=20, lore_duration=30),
+        ]
+        first = packer.pack_events(events)
+
+        packer.update_scale_factor(11.0)
+        packer._calculate_visual_duration = None  # Must not be called
+        assert packer.pack_events(events) == first
+
+        del packer._calculate_visual_duration
+        packer.update_scale_factor(5.0)
+        assert packer.pack_events(events) == first
+        assert packer._runs[None].scale_factor == 5.0
+
+    def test_text_widths_are_cached(self):
+        """Label widths are measured once per name."""
+        packer = TimelineLanePacker(scale_factor=10.0)
+        events = [Event(name="Same", lore_date=i * 100.0) for i in range(5)]
+
+        packer.pack_events(events)
+
+        assert packer._text_widths == {
+            (packer.font.key(), "Same"): packer.fm.horizontalAdvance("Same")
+        }
+
+    def test_font_change_remeasures_labels(self):
+        """Widths are cached per font, and a new font drops previous packs."""
+        packer = TimelineLanePacker(scale_factor=10.0)
+        events = [Event(name="Label", lore_date=0.0)]
+        packer.pack_events(events)
+        assert None in packer._runs
+
+        font = QFont(packer.font)
+        font.setPointSize(font.pointSize() * 3)
+        packer.set_font(font)
+        assert not packer._runs
+
+        packer.pack_events(events)
+        assert packer._text_widths[(font.key(), "Label")] == QFontMetrics(
+            font
+        ).horizontalAdvance("Label")
+        assert len(packer._text_widths) == 2
+
+    def test_text_width_cache_is_bounded(self, monkeypatch):
+        """The width cache starts over instead of growing without limit."""
+        monkeypatch.setattr(TimelineLanePacker, "MAX_CACHED_TEXT_WIDTHS", 3)
+        packer = TimelineLanePacker(scale_factor=10.0)
+        events = [Event(name=f"E{i}", lore_date=i * 100.0) for i in range(7)]
+
+        packer.pack_events(events)
+
+        assert len(packer._text_widths) <= 3
+
+    def test_cached_layouts_are_bounded(self):
+        """Only the most recently used layouts keep their last pack."""
+        packer = TimelineLanePacker(scale_factor=10.0)
+        events = [Event(name="E", lore_date=0.0)]
+        limit = TimelineLanePacker.MAX_CACHED_LAYOUTS
+
+        for band in range(limit + 5):
+            packer.pack_events(events, layout_key=("group", band))
+            packer.pack_events(events, layout_key=("group", 0))
+
+        assert len(packer._runs) == limit
+        assert ("group", 0) in packer._runs
+        assert ("group", 1) not in packer._runs
+        assert ("group", limit + 4) in packer._runs
@@ -153,6 +153,46 @@ class TestInterpolatePosition:
         assert result[0] == pytest.approx(0.50005, rel=1e-4)
 
 
+class TestKeyframesInWindow:
+    """Tests for keyframes_in_window."""
+
+    def test_includes_bracketing_keyframes(self) -> None:
+        from src.core.trajectory import keyframes_in_window
+
+        keyframes = [Keyframe(float(t), t / 100, 0.0) for t in range(0, 100, 10)]
+
+        assert [kf.t for kf in keyframes_in_window(keyframes, 35, 52)] == [
+            30.0,
+            40.0,
+            50.0,
+            60.0,
+        ]
+        assert [kf.t for kf in keyframes_in_window(keyframes, 40, 50)] == [
+            30.0,
+            40.0,
+            50.0,
+            60.0,
+        ]
+        assert [kf.t for kf in keyframes_in_window(keyframes, -20, -10)] == [0.0]
+        assert [kf.t for kf in keyframes_in_window(keyframes, 120, 130)] == [90.0]
+        assert keyframes_in_window([], 0, 10) == []
+
+    def test_interpolation_matches_full_trajectory(self) -> None:
+        from src.core.trajectory import keyframes_in_window
+
+        keyframes = [
+            Keyframe(0, 0.0, 0.0),
+            Keyframe(10, 0.2, 0.4),
+            Keyframe(10, 0.3, 0.5),
+            Keyframe(25, 0.9, 0.1),
+            Keyframe(40, 0.5, 0.5),
+        ]
+        window = keyframes_in_window(keyframes, 10, 30)
+        assert [kf.t for kf in window] == [0, 10, 10, 25, 40]
+        for t in (10, 12.5, 25, 29.9, 30):
+            assert interpolate_position(window, t) == interpolate_position(keyframes, t)
+
+
 class TestMFJSONSerialization:
     """Tests for MF-JSON serialization helpers (TDD - tests written before impl)."""
 
@@ -237,3 +277,43 @@ class TestMFJSONSerialization:
         }
         with pytest.raises(ValueError, match="mismatch"):
             mfjson_to_keyframes(mfjson)
+
+
+class TestTrajectoryStore:
+    """Tests for batched interpolation with TrajectoryStore."""
+
+    def test_matches_interpolate_position(self) -> None:
+        """Batched positions equal interpolate_position for every marker."""
+        from src.core.trajectory import TrajectoryStore
+
+        trajectories = {
+            "a": [Keyframe(0, 0.0, 0.0), Keyframe(100, 1.0, 1.0)],
+            "b": [
+                Keyframe(-10, 0.5, 0.5),
+                Keyframe(20, 0.2, 0.8),
+                Keyframe(20, 0.3, 0.9),
+                Keyframe(50, 0.9, 0.1),
+            ],
+            "single": [Keyframe(5, 0.4, 0.4)],
+            "c": [Keyframe(20, 0.1, 0.1), Keyframe(30, 0.6, 0.7)],
+        }
+        store = TrajectoryStore(trajectories)
+
+        assert store.marker_ids == ["a", "b", "c"]
+        assert store.index_of("single") is None
+        for t in (-20.0, -10.0, 0.0, 12.5, 20.0, 25.0, 50.0, 99.9, 100.0, 500.0):
+            xs, ys = store.positions_at(t)
+            for marker_id in store.marker_ids:
+                row = store.index_of(marker_id)
+                expected = interpolate_position(trajectories[marker_id], t)
+                assert (xs[row], ys[row]) == expected
+
+    def test_empty_store(self) -> None:
+        """A store without trajectories returns empty arrays."""
+        from src.core.trajectory import TrajectoryStore
+
+        store = TrajectoryStore({"single": [Keyframe(0, 0.1, 0.1)]})
+        xs, ys = store.positions_at(0.0)
+
+        assert len(store) == 0
+        assert len(xs) == 0 and len(ys) == 0
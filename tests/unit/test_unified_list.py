@@ -1,5 +1,5 @@
 import pytest
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QPersistentModelIndex, Qt
 
 from src.core.entities import Entity
 from src.core.events import Event
@@ -15,7 +15,7 @@ def unified_list(qtbot):
 
 
 def test_init(unified_list):
-    assert unified_list.list_widget.count() == 0
+    assert unified_list.proxy_model.rowCount() == 0
     assert not unified_list.empty_label.isHidden()
     # Check default filter
     assert unified_list.filter_combo.currentText() == "All Items"
@@ -27,22 +27,49 @@ def test_set_data(unified_list):
 
     unified_list.set_data(events, entities)
 
-    assert unified_list.list_widget.count() == 2
+    assert unified_list.proxy_model.rowCount() == 2
     assert unified_list.empty_label.isHidden()
 
     # Check items
     # Entity should be first based on logic (Entities loop first)
-    item0 = unified_list.list_widget.item(0)
-    assert "Entity 1" in item0.text()
+    item0 = unified_list.proxy_model.index(0)
+    assert "Entity 1" in item0.data()
     assert item0.data(Qt.UserRole) == "n1"
     assert item0.data(Qt.UserRole + 1) == "entity"
 
-    item1 = unified_list.list_widget.item(1)
-    assert "Event 1" in item1.text()
+    item1 = unified_list.proxy_model.index(1)
+    assert "Event 1" in item1.data()
     assert item1.data(Qt.UserRole) == "e1"
     assert item1.data(Qt.UserRole + 1) == "event"
 
 
+def test_apply_changes_patches_rows(unified_list):
+    events = [
+        Event(id="e1", name="Event 1", lore_date=10.0),
+        Event(id="e2", name="Event 2", lore_date=20.0),
+    ]
+    entities = [Entity(id="n1", name="Entity 1", type="Person")]
+    unified_list.set_data(events, entities)
+    untouched = QPersistentModelIndex(unified_list.proxy_model.index(2))
+
+    moved = Event(id="e1", name="Event 1", lore_date=30.0)
+    unified_list.apply_changes("event", [events[1], moved], [moved], [])
+    created = Entity(id="n0", name="Entity 0", type="Person")
+    unified_list.apply_changes("entity", [created, entities[0]], [created], [])
+
+    ids = [
+        unified_list.proxy_model.index(i).data(Qt.UserRole)
+        for i in range(unified_list.proxy_model.rowCount())
+    ]
+    assert ids == ["n0", "n1", "e2", "e1"]
+    # Rows that did not change are moved, not reset
+    assert untouched.isValid()
+    assert untouched.row() == 2
+
+    unified_list.apply_changes("entity", [entities[0]], [], ["n0"])
+    assert unified_list.proxy_model.rowCount() == 3
+
+
 def test_filtering(unified_list):
     events = [Event(id="e1", name="Event 1", lore_date=10.0)]
     entities = [Entity(id="n1", name="Entity 1", type="Person")]
@@ -50,17 +77,17 @@ def test_filtering(unified_list):
 
     # Filter Events Only
     unified_list.filter_combo.setCurrentText("Events Only")
-    assert unified_list.list_widget.count() == 1
-    assert "Event 1" in unified_list.list_widget.item(0).text()
+    assert unified_list.proxy_model.rowCount() == 1
+    assert "Event 1" in unified_list.proxy_model.index(0).data()
 
     # Filter Entities Only
     unified_list.filter_combo.setCurrentText("Entities Only")
-    assert unified_list.list_widget.count() == 1
-    assert "Entity 1" in unified_list.list_widget.item(0).text()
+    assert unified_list.proxy_model.rowCount() == 1
+    assert "Entity 1" in unified_list.proxy_model.index(0).data()
 
     # Filter All
     unified_list.filter_combo.setCurrentText("All Items")
-    assert unified_list.list_widget.count() == 2
+    assert unified_list.proxy_model.rowCount() == 2
 
 
 def test_selection_signal(unified_list, qtbot):
@@ -68,7 +95,7 @@ def test_selection_signal(unified_list, qtbot):
     unified_list.set_data(events, [])
 
     with qtbot.waitSignal(unified_list.item_selected) as blocker:
-        unified_list.list_widget.setCurrentRow(0)
+        unified_list.list_widget.setCurrentIndex(unified_list.proxy_model.index(0))
 
     assert blocker.args == ["event", "e1"]
     assert unified_list.btn_delete.isEnabled()
@@ -77,7 +104,7 @@ def test_selection_signal(unified_list, qtbot):
 def test_delete_signal(unified_list, qtbot):
     events = [Event(id="e1", name="Event 1", lore_date=10.0)]
     unified_list.set_data(events, [])
-    unified_list.list_widget.setCurrentRow(0)
+    unified_list.list_widget.setCurrentIndex(unified_list.proxy_model.index(0))
 
     with qtbot.waitSignal(unified_list.delete_requested) as blocker:
         unified_list.btn_delete.click()
@@ -105,3 +132,85 @@ def test_create_signals(unified_list, qtbot):
 def test_refresh_signal(unified_list, qtbot):
     with qtbot.waitSignal(unified_list.refresh_requested):
         unified_list.btn_refresh.click()
+
+
+def test_search_is_debounced(unified_list, qtbot):
+    events = [
+        Event(id="e1", name="Alpha", lore_date=10.0),
+        Event(id="e2", name="Beta", lore_date=20.0),
+    ]
+    unified_list.set_data(events, [])
+
+    unified_list.search_bar.setText("Alpha")
+    # Nothing is filtered until typing pauses
+    assert unified_list.proxy_model.rowCount() == 2
+
+    qtbot.waitUntil(lambda: unified_list.proxy_model.rowCount() == 1)
+
+    # Clearing the search applies at once
+    unified_list.search_bar.setText("")
+    assert unified_list.proxy_model.rowCount() == 2
+
+
+def test_extended_search_narrows_previous_result(unified_list, monkeypatch):
+    events = [
+        Event(id="e1", name="Dragon", lore_date=10.0),
+        Event(id="e2", name="Dragonfly", lore_date=20.0),
+        Event(id="e3", name="Wyvern", lore_date=30.0),
+    ]
+    unified_list.set_data(events, [])
+    unified_list.search_bar.setText("drag")
+    unified_list._apply_search()
+
+    checked = []
+    original = unified_list.proxy_model._accepted_rows
+
+    def accepted_rows(rows):
+        rows = list(rows)
+        checked.append(rows)
+        return original(rows)
+
+    monkeypatch.setattr(unified_list.proxy_model, "_accepted_rows", accepted_rows)
+
+    unified_list.search_bar.setText("dragonf")
+    unified_list._apply_search()
+
+    assert checked == [[0, 1]]
+    assert unified_list.proxy_model.index(0).data(Qt.UserRole) == "e2"
+
+    # A different term scans every row again
+    unified_list.search_bar.setText("wyv")
+    unified_list._apply_search()
+
+    assert checked[-1] == [0, 1, 2]
+    assert unified_list.proxy_model.rowCount() == 1
+
+
+def test_apply_changes_respects_filters_and_selection(unified_list, qtbot):
+    events = [
+        Event(id="e1", name="Alpha", lore_date=10.0),
+        Event(id="e2", name="Beta", lore_date=20.0),
+    ]
+    unified_list.set_data(events, [])
+    unified_list.search_bar.setText("alpha")
+    unified_list._apply_search()
+    unified_list.select_item("event", "e1")
+
+    renamed = Event(id="e1", name="Alpha Prime", lore_date=10.0)
+    created = Event(id="e3", name="Gamma", lore_date=30.0)
+    with qtbot.assertNotEmitted(unified_list.item_selected):
+        unified_list.apply_changes(
+            "event", [renamed, events[1], created], [renamed, created], []
+        )
+
+    assert unified_list.proxy_model.rowCount() == 1
+    assert unified_list.proxy_model.index(0).data().endswith("Alpha Prime")
+    assert unified_list._selected_key() == ("event", "e1")
+    assert unified_list.btn_delete.isEnabled()
+
+    unified_list.search_bar.setText("")
+    ids = [
+        unified_list.proxy_model.index(i).data(Qt.UserRole)
+        for i in range(unified_list.proxy_model.rowCount())
+    ]
+    assert ids == ["e1", "e2", "e3"]
@@ -28,15 +28,15 @@ class TestUnifiedListAdvancedFiltering:
         list_widget.set_advanced_filter(config)
 
         # Should only show e1
-        assert list_widget.list_widget.count() == 1
-        assert list_widget.list_widget.item(0).text().endswith("In")
+        assert list_widget.proxy_model.rowCount() == 1
+        assert list_widget.proxy_model.index(0).data().endswith("In")
 
         # 2. Test Exclude
         config = {"exclude": ["B"]}
         list_widget.set_advanced_filter(config)
         # Should only show e2 (e1 has B)
-        assert list_widget.list_widget.count() == 1
-        assert list_widget.list_widget.item(0).text().endswith("Out")
+        assert list_widget.proxy_model.rowCount() == 1
+        assert list_widget.proxy_model.index(0).data().endswith("Out")
 
     def test_filter_persists_on_update(self, list_widget, qtbot):
         """
@@ -48,7 +48,7 @@ class TestUnifiedListAdvancedFiltering:
         list_widget.set_data([e1, e2], [])
         list_widget.set_advanced_filter({"include": ["T"]})
 
-        assert list_widget.list_widget.count() == 1
+        assert list_widget.proxy_model.rowCount() == 1
 
         # Reload data
         e3 = Event(name="New Target", lore_date=300, attributes={"_tags": ["T"]})
@@ -56,8 +56,8 @@ class TestUnifiedListAdvancedFiltering:
 
         # Filter should still be active: Target + New Target = 2 items
         items = [
-            list_widget.list_widget.item(i).text()
-            for i in range(list_widget.list_widget.count())
+            list_widget.proxy_model.index(i).data()
+            for i in range(list_widget.proxy_model.rowCount())
         ]
         assert len(items) == 2
         assert any("Target" in x for x in items)
@@ -71,8 +71,8 @@ class TestUnifiedListAdvancedFiltering:
         e1 = Event(name="A", lore_date=1, attributes={"_tags": ["A"]})
         list_widget.set_data([e1], [])
         list_widget.set_advanced_filter({"include": ["B"]})
-        assert list_widget.list_widget.count() == 0
+        assert list_widget.proxy_model.rowCount() == 0
 
         # Set empty config
         list_widget.set_advanced_filter({})
-        assert list_widget.list_widget.count() == 1
+        assert list_widget.proxy_model.rowCount() == 1
@@ -22,10 +22,11 @@ class TestUnifiedListFilterPersistence:
 
         # 2. Apply Filter (Search "Alpha")
         list_widget.search_bar.setText("Alpha")
+        qtbot.waitUntil(lambda: not list_widget._search_timer.isActive())
 
         # Verify filtering worked
-        assert list_widget.list_widget.count() == 1
-        assert list_widget.list_widget.item(0).text().endswith("Alpha Event")
+        assert list_widget.proxy_model.rowCount() == 1
+        assert list_widget.proxy_model.index(0).data().endswith("Alpha Event")
 
         # 3. Simulate "Save" -> Reload Data
         # User changes e2 (Beta) -> e2_updated
@@ -37,8 +38,8 @@ class TestUnifiedListFilterPersistence:
         # 4. Verify Filter is STILL applied
         # Should still only show Alpha
         # If bug exists: might show both (filter lost)
-        assert list_widget.list_widget.count() == 1
-        assert list_widget.list_widget.item(0).text().endswith("Alpha Event")
+        assert list_widget.proxy_model.rowCount() == 1
+        assert list_widget.proxy_model.index(0).data().endswith("Alpha Event")
 
         # Verify search bar text is preserved
         assert list_widget.search_bar.text() == "Alpha"
@@ -55,15 +56,16 @@ class TestUnifiedListFilterPersistence:
 
         # Filter "Alpha"
         list_widget.search_bar.setText("Alpha")
-        assert list_widget.list_widget.count() == 1
+        qtbot.waitUntil(lambda: not list_widget._search_timer.isActive())
+        assert list_widget.proxy_model.rowCount() == 1
 
         # Try to select filtered-out "Beta" (e2)
         list_widget.select_item("event", "e2")
 
         # Assert selection is cleared (Fix 1 verification)
-        assert len(list_widget.list_widget.selectedItems()) == 0
+        assert len(list_widget.list_widget.selectionModel().selectedIndexes()) == 0
 
         # Assert filter is still active (Fix 2 check)
         # Should still only count 1 item (Alpha)
-        assert list_widget.list_widget.count() == 1
-        assert list_widget.list_widget.item(0).text().endswith("Alpha")
+        assert list_widget.proxy_model.rowCount() == 1
+        assert list_widget.proxy_model.index(0).data().endswith("Alpha")
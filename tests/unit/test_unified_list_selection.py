@@ -25,9 +25,11 @@ class TestUnifiedListSelection:
 
         # 1. Select the event (should succeed)
         list_widget.select_item("event", "e1")
-        assert len(list_widget.list_widget.selectedItems()) == 1
+        assert len(list_widget.list_widget.selectionModel().selectedIndexes()) == 1
         assert (
-            list_widget.list_widget.selectedItems()[0].data(Qt.ItemDataRole.UserRole)
+            list_widget.list_widget.selectionModel()
+            .selectedIndexes()[0]
+            .data(Qt.ItemDataRole.UserRole)
             == "e1"
         )
 
@@ -51,25 +53,26 @@ class TestUnifiedListSelection:
         # Let's try search filter
         list_widget.filter_combo.setCurrentText("All Items")
         list_widget.search_bar.setText("Entity")  # Matches Entity 1, hides Event 1
+        qtbot.waitUntil(lambda: not list_widget._search_timer.isActive())
 
         # Verify event is gone from list
         items = [
-            list_widget.list_widget.item(i).text()
-            for i in range(list_widget.list_widget.count())
+            list_widget.proxy_model.index(i).data()
+            for i in range(list_widget.proxy_model.rowCount())
         ]
         assert any("Entity 1" in t for t in items)
         assert not any("Event 1" in t for t in items)
 
         # Pre-condition: Select entity to have *some* selection (simulating jump target)
         list_widget.select_item("entity", "ent1")
-        assert len(list_widget.list_widget.selectedItems()) == 1
+        assert len(list_widget.list_widget.selectionModel().selectedIndexes()) == 1
 
         # 4. Try to select the hidden Event
         list_widget.select_item("event", "e1")
 
         # 5. Assert Selection is CLEARED (Fix check)
         # Without fix, it might have stayed on "ent1" or just done nothing (if not cleared)
-        assert len(list_widget.list_widget.selectedItems()) == 0
+        assert len(list_widget.list_widget.selectionModel().selectedIndexes()) == 0
 
     def test_selection_switches_filter_if_needed(self, list_widget, qtbot):
         """
@@ -80,11 +83,11 @@ class TestUnifiedListSelection:
 
         # Set to Entities Only
         list_widget.filter_combo.setCurrentText("Entities Only")
-        assert list_widget.list_widget.count() == 0
+        assert list_widget.proxy_model.rowCount() == 0
 
         # Try to select event
         list_widget.select_item("event", "e1")
 
         # Should have switched to All Items (or Events Only) and selected it
         assert list_widget.filter_combo.currentText() == "All Items"
-        assert len(list_widget.list_widget.selectedItems()) == 1
+        assert len(list_widget.list_widget.selectionModel().selectedIndexes()) == 1
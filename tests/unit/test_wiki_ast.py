@@ -256,6 +256,106 @@ class TestCursorMapper:
         # The 'B' should be mapped to position inside <strong> tag
         assert html_pos >= 0  # Basic sanity check
 
+    def test_indexed_lookup_matches_document_order_scan(self):
+        """Test bisect lookups agree with a linear scan over the leaves."""
+        parser = WikiASTParser()
+        serializer = WikiASTSerializer()
+
+        md = "# Title\nSee [[Page|the page]] and **bold *it***.\n\nEnd [[Other]]"
+        ast = parser.parse(md)
+        _, ast = serializer.to_plaintext(ast)
+        mapper = CursorMapper(ast)
+
+        for span_attr, index in (
+            ("md_span", mapper._md_index),
+            ("html_span", mapper._html_index),
+        ):
+            for pos in range(len(md) + 1):
+                expected = next(
+                    (
+                        leaf
+                        for leaf in mapper._leaf_nodes
+                        if getattr(leaf, span_attr).contains(pos)
+                    ),
+                    None,
+                )
+                assert mapper._find_leaf(index, span_attr, pos) is expected
+
+    def test_html_to_md_accounts_for_blank_lines(self):
+        """Test source spans map past blank lines between paragraphs."""
+        parser = WikiASTParser()
+        serializer = WikiASTSerializer()
+
+        md = "First\n\nSecond"
+        ast = parser.parse(md)
+        plain, ast = serializer.to_plaintext(ast)
+        mapper = CursorMapper(ast)
+
+        assert plain == "First\nSecond"
+        assert mapper.html_to_md(plain.index("Second")) == md.index("Second")
+        assert mapper.md_to_html(md.index("Second")) == plain.index("Second")
+
+
+def _spans(node):
+    """Nested (type, md span, html span) tuples for comparing trees."""
+    return (
+        node.node_type,
+        (node.md_span.start, node.md_span.end) if node.md_span else None,
+        (node.html_span.start, node.html_span.end) if node.html_span else None,
+        [_spans(child) for child in node.children],
+    )
+
+
+class TestIncrementalReparse:
+    """Tests for WikiASTParser.reparse and WikiASTSerializer.update_plaintext."""
+
+    OLD = "# Title\nFirst **para**\n\nSecond [[Link|label]]\n## Sub\nLast one"
+
+    def _assert_matches_fresh_parse(self, old, new):
+        parser = WikiASTParser()
+        serializer = WikiASTSerializer()
+        ast = parser.parse(old)
+        serializer.to_plaintext(ast)
+
+        ast, changed = parser.reparse(ast, old, new)
+        serializer.update_plaintext(ast, changed)
+
+        fresh = parser.parse(new)
+        serializer.to_plaintext(fresh)
+        assert _spans(ast) == _spans(fresh)
+        return ast, changed
+
+    def test_edit_in_middle_paragraph(self):
+        new = self.OLD.replace("Second", "Second edited")
+        ast, changed = self._assert_matches_fresh_parse(self.OLD, new)
+        assert changed == range(2, 3)
+
+    def test_edit_first_and_last_lines(self):
+        self._assert_matches_fresh_parse(self.OLD, "Intro\n" + self.OLD)
+        self._assert_matches_fresh_parse(self.OLD, self.OLD + " extended")
+
+    def test_insert_and_delete_lines(self):
+        self._assert_matches_fresh_parse(
+            self.OLD, self.OLD.replace("\n\n", "\nNew *line*\n\n")
+        )
+        self._assert_matches_fresh_parse(self.OLD, self.OLD.replace("## Sub\n", ""))
+        self._assert_matches_fresh_parse(self.OLD, "")
+        self._assert_matches_fresh_parse("", self.OLD)
+
+    def test_unchanged_blocks_are_reused(self):
+        parser = WikiASTParser()
+        ast = parser.parse(self.OLD)
+        before = list(ast.children)
+
+        ast, changed = parser.reparse(
+            ast, self.OLD, self.OLD.replace("First", "Changed")
+        )
+
+        assert changed == range(1, 2)
+        assert ast.children[0] is before[0]
+        assert ast.children[1] is not before[1]
+        assert all(a is b for a, b in zip(ast.children[2:], before[2:]))
+
 
 class TestIntegration:
     """Integration tests for the full AST pipeline."""
@@ -212,3 +212,40 @@ def test_process_wiki_links_to_events(db_service, source_id):
 
     # Since we store formatted strings like "Name (Type)" in valid_links
     assert "Big Bang (Event)" in result.data["valid_links"]
+
+
+def test_process_uses_name_index_without_loading_world(
+    db_service, source_id, monkeypatch
+):
+    """Test links resolve through the name index, tracking renames and deletes."""
+    target_entity = Entity(name="Gandalf the Grey", type="Character")
+    db_service.insert_entity(target_entity)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("world should not be hydrated")
+
+    monkeypatch.setattr(db_service, "get_all_entities", fail)
+    monkeypatch.setattr(db_service, "get_all_events", fail)
+    monkeypatch.setattr(db_service, "get_entity", fail)
+    monkeypatch.setattr(db_service, "get_event", fail)
+
+    text = "Meet [[Mithrandir]] and [[Gandalf the Grey]]."
+    result = ProcessWikiLinksCommand(source_id, text).execute(db_service)
+    assert result.data["valid_count"] == 1
+    assert db_service.name_index.is_loaded
+
+    # Rename and add an alias after the index is loaded
+    target_entity.name = "Gandalf the White"
+    target_entity.attributes = {"aliases": ["Mithrandir"]}
+    db_service.insert_entity(target_entity)
+
+    result = ProcessWikiLinksCommand(source_id, text).execute(db_service)
+    assert result.data["valid_count"] == 1
+    assert result.data["broken_count"] == 1
+    assert "Gandalf the White (Entity)" in result.data["valid_links"]
+
+    db_service.delete_entity(target_entity.id)
+    result = ProcessWikiLinksCommand(
+        source_id, f"[[id:{target_entity.id}|Gandalf]]"
+    ).execute(db_service)
+    assert result.data["broken_count"] == 1
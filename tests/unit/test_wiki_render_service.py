@@ -0,0 +1,124 @@
+"""
+Unit tests for the wiki render service.
+"""
+
+import threading
+
+import pytest
+
+from src.services import wiki_render_service
+from src.services.wiki_render_service import (
+    LinkTargets,
+    WikiRenderService,
+    render_wiki_html,
+)
+
+CSS = "body { color: white; }"
+
+
+@pytest.fixture
+def service():
+    service = WikiRenderService(capacity=2)
+    yield service
+    service.shutdown()
+
+
+def test_render_marks_broken_links():
+    targets = LinkTargets.from_names(["Gandalf"], ["uuid-1"])
+
+    html = render_wiki_html(
+        "[[gandalf]] met [[id:uuid-1|Frodo]] and [[Sauron]]", CSS, targets
+    )
+
+    assert '<a href="gandalf">gandalf</a>' in html
+    assert '<a href="id:uuid-1">Frodo</a>' in html
+    assert '<a href="Sauron" style="color: red;">Sauron</a>' in html
+    assert f"<style>{CSS}</style>" in html
+
+
+def test_render_without_targets_keeps_all_links_valid():
+    html = render_wiki_html("[[Anyone]]", CSS, None)
+
+    assert '<a href="Anyone">Anyone</a>' in html
+
+
+def test_cache_key_covers_text_targets_and_theme():
+    targets = LinkTargets.from_names(["A"])
+    key = WikiRenderService.cache_key("text", CSS, targets)
+
+    assert key == WikiRenderService.cache_key(
+        "text", CSS, LinkTargets.from_names(["a"])
+    )
+    assert key != WikiRenderService.cache_key("other", CSS, targets)
+    assert key != WikiRenderService.cache_key("text", CSS, LinkTargets.from_names([]))
+    assert key != WikiRenderService.cache_key("text", "p {}", targets)
+
+
+def test_render_uses_lru_cache(service, monkeypatch):
+    calls = []
+
+    def counting_render(text, css, targets):
+        calls.append(text)
+        return text
+
+    monkeypatch.setattr(wiki_render_service, "render_wiki_html", counting_render)
+
+    service.render("a", CSS, None)
+    service.render("b", CSS, None)
+    service.render("a", CSS, None)  # Hit; "b" becomes least recently used
+    service.render("c", CSS, None)  # Evicts "b"
+    service.render("a", CSS, None)
+    service.render("b", CSS, None)
+
+    assert calls == ["a", "b", "c", "b"]
+
+
+def test_submit_delivers_result(service, qtbot):
+    with qtbot.waitSignal(service.finished) as blocker:
+        request_id = service.submit(1, "# Title", CSS, None)
+
+    assert blocker.args[0] == request_id
+    assert "<h1>Title</h1>" in blocker.args[1]
+    # Background renders fill the cache
+    assert service.get(service.cache_key("# Title", CSS, None)) == blocker.args[1]
+
+
+def test_superseded_request_is_not_reported(service, qtbot, monkeypatch):
+    gate = threading.Event()
+
+    def blocked_render(text, css, targets):
+        gate.wait(5)
+        return text
+
+    monkeypatch.setattr(wiki_render_service, "render_wiki_html", blocked_render)
+    reported = []
+    service.finished.connect(lambda request_id, html: reported.append(html))
+
+    service.submit(1, "old", CSS, None)
+    latest = service.submit(1, "new", CSS, None)
+
+    with qtbot.waitSignal(service.finished) as blocker:
+        gate.set()
+    qtbot.wait(50)
+
+    assert blocker.args == [latest, "new"]
+    assert reported == ["new"]
+
+
+def test_cancel_drops_pending_request(service, qtbot, monkeypatch):
+    gate = threading.Event()
+
+    def blocked_render(text, css, targets):
+        gate.wait(5)
+        return text
+
+    monkeypatch.setattr(wiki_render_service, "render_wiki_html", blocked_render)
+    reported = []
+    service.finished.connect(lambda request_id, html: reported.append(html))
+
+    service.submit(1, "text", CSS, None)
+    service.cancel(1)
+    gate.set()
+    qtbot.wait(100)
+
+    assert reported == []
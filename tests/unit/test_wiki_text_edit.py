@@ -3,6 +3,7 @@ Unit tests for WikiTextEdit.
 """
 
 import contextlib
+import uuid
 
 import pytest
 from PySide6.QtCore import Qt
@@ -704,3 +705,51 @@ def test_empty_lines_manual_entry(qtbot):
 
     expected = "Line 1\n\nLine 2"
     assert widget.get_wiki_text() == expected
+
+
+def test_long_text_renders_in_background(qtbot):
+    """Test that long texts are rendered off the UI thread."""
+    widget = WikiTextEdit()
+    qtbot.addWidget(widget)
+    text = f"# Chronicle {uuid.uuid4()}\n\n" + "Long lore text. " * 1000
+
+    with qtbot.waitSignal(widget.render_finished):
+        widget.set_wiki_text(text)
+        # Until the HTML arrives the editor is empty and read-only
+        assert widget.is_render_pending()
+        assert widget.isReadOnly()
+        assert widget.get_wiki_text() == text
+
+    assert not widget.is_render_pending()
+    assert not widget.isReadOnly()
+    assert widget.toPlainText().startswith("Chronicle")
+
+
+def test_stale_background_render_is_discarded(qtbot):
+    """Test that a render finishing after the text changed is not shown."""
+    widget = WikiTextEdit()
+    qtbot.addWidget(widget)
+    long_text = f"# Old {uuid.uuid4()}\n\n" + "Long lore text. " * 1000
+
+    widget.set_wiki_text(long_text)
+    assert widget.is_render_pending()
+    widget.set_wiki_text("Short **note**")
+
+    assert not widget.is_render_pending()
+    qtbot.wait(300)
+    assert widget.toPlainText() == "Short note"
+
+
+def test_cached_render_is_shown_synchronously(qtbot):
+    """Test that switching back to a rendered text needs no background work."""
+    widget = WikiTextEdit()
+    qtbot.addWidget(widget)
+    text = f"# Cached {uuid.uuid4()}\n\n" + "Long lore text. " * 1000
+
+    with qtbot.waitSignal(widget.render_finished):
+        widget.set_wiki_text(text)
+    widget.set_wiki_text("Other")
+    widget.set_wiki_text(text)
+
+    assert not widget.is_render_pending()
+    assert widget.toPlainText().startswith("Cached")
@@ -2,7 +2,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.commands.base_command import CommandResult
+from src.commands.base_command import ChangeSet, CommandResult
 from src.services.worker import DatabaseWorker
 
 
@@ -100,6 +100,33 @@ def test_load_entities(worker, mock_db_service):
     spy.assert_called_once_with(["entity1"])
 
 
+def test_load_changes_fetches_only_changed_rows(worker, mock_db_service):
+    worker.db_service = mock_db_service
+    event = MagicMock(id="ev1")
+    mock_db_service.get_objects_by_ids.return_value = ([event], [])
+
+    changes = ChangeSet.single("updated", "event", "ev1")
+    changes.record("updated", "entity", "gone")
+    changes.record("deleted", "entity", "en2")
+
+    spy = MagicMock()
+    worker.changes_loaded.connect(spy)
+
+    worker.load_changes(changes)
+
+    requested = mock_db_service.get_objects_by_ids.call_args[0][0]
+    assert sorted(requested) == [("entity", "gone"), ("event", "ev1")]
+    mock_db_service.get_all_events.assert_not_called()
+    spy.assert_called_once_with(
+        {
+            "events": [event],
+            "entities": [],
+            "deleted_events": [],
+            "deleted_entities": ["en2", "gone"],
+        }
+    )
+
+
 def test_run_command_success(worker, mock_db_service):
     worker.db_service = mock_db_service
 
@@ -120,6 +147,40 @@ def test_run_command_success(worker, mock_db_service):
     assert result.command_name == "TestCommand"
 
 
+def test_run_command_invalidates_renders_of_changed_objects(worker, mock_db_service):
+    from src.services.render_cache import render_cache
+
+    worker.db_service = mock_db_service
+    render_cache.put("ev1", "h1", "cached")
+    render_cache.put("other", "h1", "cached")
+
+    command = MagicMock()
+    command.__class__.__name__ = "UpdateEventCommand"
+    command.execute.return_value = CommandResult(
+        success=True,
+        message="ok",
+        changes=ChangeSet.single("updated", "event", "ev1"),
+    )
+
+    worker.run_command(command)
+
+    assert render_cache.get("ev1", "h1") is None
+    assert render_cache.get("other", "h1") == "cached"
+    render_cache.clear()
+
+
+def test_run_command_is_registered_as_slot(worker):
+    meta = worker.metaObject()
+    signatures = {
+        bytes(meta.method(i).methodSignature()).decode()
+        for i in range(meta.methodOffset(), meta.methodCount())
+    }
+
+    # Queued cross-thread connections from the WorkerManager need the slot
+    assert "run_command(PyObject,PyObject)" in signatures
+    assert not any(sig.startswith("_invalidate_renders") for sig in signatures)
+
+
 def test_run_command_failure(worker, mock_db_service):
     worker.db_service = mock_db_service
 